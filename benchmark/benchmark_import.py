@@ -0,0 +1,38 @@
+"""
+Benchmark the time it takes to start an interpreter and import openmdao.api.
+"""
+import subprocess
+import sys
+import time
+import unittest
+
+# startup budget in seconds for 'import openmdao.api' in a fresh interpreter
+IMPORT_BUDGET = 1.0
+
+
+def _time_import(stmt, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', stmt], check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class BenchImport(unittest.TestCase):
+
+    def benchmark_import_api(self):
+        elapsed = _time_import('import openmdao.api')
+        self.assertLess(elapsed, IMPORT_BUDGET,
+                        f"'import openmdao.api' took {elapsed:.3f} sec, which exceeds the "
+                        f"startup budget of {IMPORT_BUDGET} sec.")
+
+    def benchmark_import_problem(self):
+        _time_import('import openmdao.api as om; om.Problem')
+
+
+if __name__ == '__main__':
+    print(f"import openmdao.api: {_time_import('import openmdao.api'):.3f} sec")
+    print(f"import openmdao.api + Problem: "
+          f"{_time_import('import openmdao.api as om; om.Problem'):.3f} sec")
@@ -1,3 +1,32 @@
 __version__ = '3.25.1-dev'
 
 INF_BOUND = 1.0E30
+
+
+def __getattr__(name):
+    """
+    Import a submodule of openmdao the first time it is accessed as an attribute.
+
+    This allows e.g. ``import openmdao; openmdao.api.Problem`` without importing openmdao.api
+    (or anything else) when the package itself is imported.
+
+    Parameters
+    ----------
+    name : str
+        Name of the submodule.
+
+    Returns
+    -------
+    module
+        The submodule.
+    """
+    import importlib
+
+    if not name.startswith('_'):
+        try:
+            return importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as err:
+            if err.name != f'{__name__}.{name}':
+                raise
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,127 +1,204 @@
-"""Key OpenMDAO classes can be imported from here."""
-
-# Core
-from openmdao.core.problem import Problem
-from openmdao.core.group import Group
-from openmdao.core.parallel_group import ParallelGroup
-from openmdao.core.explicitcomponent import ExplicitComponent
-from openmdao.core.implicitcomponent import ImplicitComponent
-from openmdao.core.indepvarcomp import IndepVarComp
-from openmdao.core.analysis_error import AnalysisError
-
-
-# Components
-from openmdao.components.add_subtract_comp import AddSubtractComp
-from openmdao.components.balance_comp import BalanceComp
-from openmdao.components.cross_product_comp import CrossProductComp
-from openmdao.components.demux_comp import DemuxComp
-from openmdao.components.dot_product_comp import DotProductComp
-from openmdao.components.eq_constraint_comp import EQConstraintComp
-from openmdao.components.exec_comp import ExecComp
-from openmdao.components.explicit_func_comp import ExplicitFuncComp
-from openmdao.components.implicit_func_comp import ImplicitFuncComp
-from openmdao.components.external_code_comp import ExternalCodeComp
-from openmdao.components.external_code_comp import ExternalCodeImplicitComp
-from openmdao.components.ks_comp import KSComp
-from openmdao.components.linear_system_comp import LinearSystemComp
-from openmdao.components.matrix_vector_product_comp import MatrixVectorProductComp
-from openmdao.components.meta_model_structured_comp import MetaModelStructuredComp
-from openmdao.components.meta_model_semi_structured_comp import MetaModelSemiStructuredComp
-from openmdao.components.meta_model_unstructured_comp import MetaModelUnStructuredComp
-from openmdao.components.spline_comp import SplineComp
-from openmdao.components.multifi_meta_model_unstructured_comp \
-    import MultiFiMetaModelUnStructuredComp
-from openmdao.components.mux_comp import MuxComp
-from openmdao.components.vector_magnitude_comp import VectorMagnitudeComp
-
-
-# Solvers
-from openmdao.solvers.linear.linear_block_gs import LinearBlockGS
-from openmdao.solvers.linear.linear_block_jac import LinearBlockJac
-from openmdao.solvers.linear.direct import DirectSolver
-from openmdao.solvers.linear.petsc_ksp import PETScKrylov
-from openmdao.solvers.linear.linear_runonce import LinearRunOnce
-from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov
-from openmdao.solvers.linear.user_defined import LinearUserDefined
-from openmdao.solvers.linesearch.backtracking import ArmijoGoldsteinLS
-from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
-from openmdao.solvers.nonlinear.broyden import BroydenSolver
-from openmdao.solvers.nonlinear.nonlinear_block_gs import NonlinearBlockGS
-from openmdao.solvers.nonlinear.nonlinear_block_jac import NonlinearBlockJac
-from openmdao.solvers.nonlinear.newton import NewtonSolver
-from openmdao.solvers.nonlinear.nonlinear_runonce import NonlinearRunOnce
-
-# Surrogate Models
-from openmdao.surrogate_models.kriging import KrigingSurrogate
-from openmdao.surrogate_models.multifi_cokriging import MultiFiCoKrigingSurrogate
-from openmdao.surrogate_models.nearest_neighbor import NearestNeighbor
-from openmdao.surrogate_models.response_surface import ResponseSurface
-from openmdao.surrogate_models.surrogate_model import SurrogateModel, \
-    MultiFiSurrogateModel
-
-from openmdao.utils.indexer import slicer, indexer
-from openmdao.utils.find_cite import print_citations
-from openmdao.utils.spline_distributions import cell_centered
-from openmdao.utils.spline_distributions import sine_distribution
-from openmdao.utils.spline_distributions import node_centered
-
-# Vectors
-from openmdao.vectors.default_vector import DefaultVector
-try:
-    from openmdao.vectors.petsc_vector import PETScVector
-except ImportError:  # pragma: no cover
-    PETScVector = None
-
-# Drivers
-from openmdao.drivers.pyoptsparse_driver import pyOptSparseDriver
-from openmdao.drivers.scipy_optimizer import ScipyOptimizeDriver
-from openmdao.drivers.genetic_algorithm_driver import SimpleGADriver
-from openmdao.drivers.differential_evolution_driver import DifferentialEvolutionDriver
-from openmdao.drivers.doe_driver import DOEDriver
-from openmdao.drivers.doe_generators import ListGenerator, CSVGenerator, UniformGenerator, \
-    FullFactorialGenerator, PlackettBurmanGenerator, BoxBehnkenGenerator, LatinHypercubeGenerator, \
-    GeneralizedSubsetGenerator
-
-# System-Building Tools
-from openmdao.utils.options_dictionary import OptionsDictionary
-
-# Recorders
-from openmdao.recorders.sqlite_recorder import SqliteRecorder
-from openmdao.recorders.case_reader import CaseReader
-
-# Visualizations
-from openmdao.visualization.n2_viewer.n2_viewer import n2
-from openmdao.visualization.connection_viewer.viewconns import view_connections
-from openmdao.visualization.partial_deriv_plot import partial_deriv_plot
-from openmdao.visualization.timing_viewer.timer import timing_context
-from openmdao.visualization.timing_viewer.timing_viewer import view_timing, view_timing_dump, \
-    view_MPI_timing
-from openmdao.visualization.options_widget import OptionsWidget
-from openmdao.visualization.case_viewer.case_viewer import CaseViewer
-from openmdao.visualization.tables.table_builder import generate_table
-
-# Notebook Utils
-from openmdao.utils.notebook_utils import notebook_mode, display_source, show_options_table, cite
-
-# Units
-from openmdao.utils.units import convert_units, unit_conversion
-
-# Warning Options
-from openmdao.utils.om_warnings import issue_warning, reset_warnings, OpenMDAOWarning, \
-    SetupWarning, DistributedComponentWarning, CaseRecorderWarning,\
-    DriverWarning, CacheWarning, PromotionWarning, UnusedOptionWarning, DerivativesWarning, \
-    MPIWarning, UnitsWarning, SolverWarning, OMDeprecationWarning, \
-    OMInvalidCheckDerivativesOptionsWarning
-
-# Utils
+"""
+Key OpenMDAO classes can be imported from here.
+
+The names listed in _lazy_attrs are only imported the first time they are accessed, so importing
+this module doesn't pay the cost of importing every component, driver and visualization module
+(and their dependencies) up front.
+"""
+import os
+import importlib as _importlib
+
 from openmdao.utils.general_utils import wing_dbg, env_truthy
-from openmdao.utils.array_utils import shape_to_len
 
-# Reports System
-from openmdao.utils.reports_system import register_report, unregister_report, get_reports_dir, \
-    list_reports, clear_reports
+# maps each public name to the module it is imported from on first access
+_lazy_attrs = {
+    # Core
+    'Problem': 'openmdao.core.problem',
+    'Group': 'openmdao.core.group',
+    'ParallelGroup': 'openmdao.core.parallel_group',
+    'ExplicitComponent': 'openmdao.core.explicitcomponent',
+    'ImplicitComponent': 'openmdao.core.implicitcomponent',
+    'IndepVarComp': 'openmdao.core.indepvarcomp',
+    'AnalysisError': 'openmdao.core.analysis_error',
+
+    # Components
+    'AddSubtractComp': 'openmdao.components.add_subtract_comp',
+    'BalanceComp': 'openmdao.components.balance_comp',
+    'CrossProductComp': 'openmdao.components.cross_product_comp',
+    'DemuxComp': 'openmdao.components.demux_comp',
+    'DotProductComp': 'openmdao.components.dot_product_comp',
+    'EQConstraintComp': 'openmdao.components.eq_constraint_comp',
+    'ExecComp': 'openmdao.components.exec_comp',
+    'ExplicitFuncComp': 'openmdao.components.explicit_func_comp',
+    'ImplicitFuncComp': 'openmdao.components.implicit_func_comp',
+    'ExternalCodeComp': 'openmdao.components.external_code_comp',
+    'ExternalCodeImplicitComp': 'openmdao.components.external_code_comp',
+    'KSComp': 'openmdao.components.ks_comp',
+    'LinearSystemComp': 'openmdao.components.linear_system_comp',
+    'MatrixVectorProductComp': 'openmdao.components.matrix_vector_product_comp',
+    'MetaModelStructuredComp': 'openmdao.components.meta_model_structured_comp',
+    'MetaModelSemiStructuredComp': 'openmdao.components.meta_model_semi_structured_comp',
+    'MetaModelUnStructuredComp': 'openmdao.components.meta_model_unstructured_comp',
+    'SplineComp': 'openmdao.components.spline_comp',
+    'MultiFiMetaModelUnStructuredComp': 'openmdao.components.multifi_meta_model_unstructured_comp',
+    'MuxComp': 'openmdao.components.mux_comp',
+    'VectorMagnitudeComp': 'openmdao.components.vector_magnitude_comp',
+
+    # Solvers
+    'LinearBlockGS': 'openmdao.solvers.linear.linear_block_gs',
+    'LinearBlockJac': 'openmdao.solvers.linear.linear_block_jac',
+    'DirectSolver': 'openmdao.solvers.linear.direct',
+    'PETScKrylov': 'openmdao.solvers.linear.petsc_ksp',
+    'LinearRunOnce': 'openmdao.solvers.linear.linear_runonce',
+    'ScipyKrylov': 'openmdao.solvers.linear.scipy_iter_solver',
+    'LinearUserDefined': 'openmdao.solvers.linear.user_defined',
+    'ArmijoGoldsteinLS': 'openmdao.solvers.linesearch.backtracking',
+    'BoundsEnforceLS': 'openmdao.solvers.linesearch.backtracking',
+    'BroydenSolver': 'openmdao.solvers.nonlinear.broyden',
+    'NonlinearBlockGS': 'openmdao.solvers.nonlinear.nonlinear_block_gs',
+    'NonlinearBlockJac': 'openmdao.solvers.nonlinear.nonlinear_block_jac',
+    'NewtonSolver': 'openmdao.solvers.nonlinear.newton',
+    'NonlinearRunOnce': 'openmdao.solvers.nonlinear.nonlinear_runonce',
+
+    # Surrogate Models
+    'KrigingSurrogate': 'openmdao.surrogate_models.kriging',
+    'MultiFiCoKrigingSurrogate': 'openmdao.surrogate_models.multifi_cokriging',
+    'NearestNeighbor': 'openmdao.surrogate_models.nearest_neighbor',
+    'ResponseSurface': 'openmdao.surrogate_models.response_surface',
+    'SurrogateModel': 'openmdao.surrogate_models.surrogate_model',
+    'MultiFiSurrogateModel': 'openmdao.surrogate_models.surrogate_model',
+    'slicer': 'openmdao.utils.indexer',
+    'indexer': 'openmdao.utils.indexer',
+    'print_citations': 'openmdao.utils.find_cite',
+    'cell_centered': 'openmdao.utils.spline_distributions',
+    'sine_distribution': 'openmdao.utils.spline_distributions',
+    'node_centered': 'openmdao.utils.spline_distributions',
+
+    # Vectors
+    'DefaultVector': 'openmdao.vectors.default_vector',
+    'PETScVector': 'openmdao.vectors.petsc_vector',
+    'CompactVector': 'openmdao.vectors.compact_vector',
+
+    # Drivers
+    'pyOptSparseDriver': 'openmdao.drivers.pyoptsparse_driver',
+    'ScipyOptimizeDriver': 'openmdao.drivers.scipy_optimizer',
+    'SimpleGADriver': 'openmdao.drivers.genetic_algorithm_driver',
+    'DifferentialEvolutionDriver': 'openmdao.drivers.differential_evolution_driver',
+    'DOEDriver': 'openmdao.drivers.doe_driver',
+    'ListGenerator': 'openmdao.drivers.doe_generators',
+    'CSVGenerator': 'openmdao.drivers.doe_generators',
+    'UniformGenerator': 'openmdao.drivers.doe_generators',
+    'FullFactorialGenerator': 'openmdao.drivers.doe_generators',
+    'PlackettBurmanGenerator': 'openmdao.drivers.doe_generators',
+    'BoxBehnkenGenerator': 'openmdao.drivers.doe_generators',
+    'LatinHypercubeGenerator': 'openmdao.drivers.doe_generators',
+    'GeneralizedSubsetGenerator': 'openmdao.drivers.doe_generators',
+
+    # System-Building Tools
+    'OptionsDictionary': 'openmdao.utils.options_dictionary',
+
+    # Recorders
+    'SqliteRecorder': 'openmdao.recorders.sqlite_recorder',
+    'CaseReader': 'openmdao.recorders.case_reader',
+
+    # Visualizations
+    'n2': 'openmdao.visualization.n2_viewer.n2_viewer',
+    'view_connections': 'openmdao.visualization.connection_viewer.viewconns',
+    'partial_deriv_plot': 'openmdao.visualization.partial_deriv_plot',
+    'timing_context': 'openmdao.visualization.timing_viewer.timer',
+    'view_timing': 'openmdao.visualization.timing_viewer.timing_viewer',
+    'view_timing_dump': 'openmdao.visualization.timing_viewer.timing_viewer',
+    'view_MPI_timing': 'openmdao.visualization.timing_viewer.timing_viewer',
+    'OptionsWidget': 'openmdao.visualization.options_widget',
+    'CaseViewer': 'openmdao.visualization.case_viewer.case_viewer',
+    'generate_table': 'openmdao.visualization.tables.table_builder',
+
+    # Notebook Utils
+    'notebook_mode': 'openmdao.utils.notebook_utils',
+    'display_source': 'openmdao.utils.notebook_utils',
+    'show_options_table': 'openmdao.utils.notebook_utils',
+    'cite': 'openmdao.utils.notebook_utils',
+
+    # Units
+    'convert_units': 'openmdao.utils.units',
+    'unit_conversion': 'openmdao.utils.units',
+
+    # Warning Options
+    'issue_warning': 'openmdao.utils.om_warnings',
+    'reset_warnings': 'openmdao.utils.om_warnings',
+    'OpenMDAOWarning': 'openmdao.utils.om_warnings',
+    'SetupWarning': 'openmdao.utils.om_warnings',
+    'DistributedComponentWarning': 'openmdao.utils.om_warnings',
+    'CaseRecorderWarning': 'openmdao.utils.om_warnings',
+    'DriverWarning': 'openmdao.utils.om_warnings',
+    'CacheWarning': 'openmdao.utils.om_warnings',
+    'PromotionWarning': 'openmdao.utils.om_warnings',
+    'UnusedOptionWarning': 'openmdao.utils.om_warnings',
+    'DerivativesWarning': 'openmdao.utils.om_warnings',
+    'MPIWarning': 'openmdao.utils.om_warnings',
+    'UnitsWarning': 'openmdao.utils.om_warnings',
+    'SolverWarning': 'openmdao.utils.om_warnings',
+    'OMDeprecationWarning': 'openmdao.utils.om_warnings',
+    'OMInvalidCheckDerivativesOptionsWarning': 'openmdao.utils.om_warnings',
+
+    # Utils
+    'shape_to_len': 'openmdao.utils.array_utils',
+
+    # Reports System
+    'register_report': 'openmdao.utils.reports_system',
+    'unregister_report': 'openmdao.utils.reports_system',
+    'get_reports_dir': 'openmdao.utils.reports_system',
+    'list_reports': 'openmdao.utils.reports_system',
+    'clear_reports': 'openmdao.utils.reports_system',
+}
+
+# these may be missing if their optional dependencies aren't installed
+_optional_attrs = {'PETScVector'}
+
+__all__ = ['wing_dbg', 'env_truthy'] + list(_lazy_attrs)
+
+
+def __getattr__(name):
+    """
+    Import and return the named attribute the first time it is accessed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute.
+
+    Returns
+    -------
+    object
+        The attribute.
+    """
+    try:
+        modname = _lazy_attrs[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+    try:
+        val = getattr(_importlib.import_module(modname), name)
+    except ImportError:  # pragma: no cover
+        if name not in _optional_attrs:
+            raise
+        val = None
+
+    globals()[name] = val
+    return val
+
+
+def __dir__():
+    """
+    Return the names in this module, including those that haven't been imported yet.
+
+    Returns
+    -------
+    list of str
+        The names.
+    """
+    return sorted(set(globals()).union(_lazy_attrs))
 
-import os
 
 wing_dbg()
 
@@ -1,10 +1,12 @@
 """Base class used to define the interface for derivative approximation schemes."""
+import multiprocessing
 import time
 import numpy as np
 
 from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.array_utils import get_input_idx_split
 import openmdao.utils.coloring as coloring_mod
+from openmdao.utils.concurrent import concurrent_eval_pool
 from openmdao.utils.general_utils import _convert_auto_ivc_to_conn_name, LocalRangeIterable
 from openmdao.utils.mpi import check_mpi_env
 
@@ -538,11 +540,236 @@ class ApproximationScheme(object):
         # This will either generate new approx groups or use cached ones
         approx_groups, colored_approx_groups = self._get_approx_groups(system, under_cs)
 
+        if self._can_batch(system, approx_groups, colored_approx_groups):
+            yield from self._batch_column_iter(system, approx_groups, colored_approx_groups)
+            return
+
+        if system._num_fd_workers > 1 and system.comm.size == 1 and not self._progress_out \
+                and not multiprocessing.current_process().daemon:
+            yield from self._pool_column_iter(system, approx_groups, colored_approx_groups)
+            return
+
         if colored_approx_groups:
             yield from self._colored_column_iter(system, colored_approx_groups)
 
         yield from self._uncolored_column_iter(system, approx_groups)
 
+    def _can_batch(self, system, approx_groups, colored_approx_groups):
+        """
+        Return True if all approximations can be computed using batched calls to the system.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        approx_groups : list of tuples
+            Info for all uncolored approximation groups.
+        colored_approx_groups : list of tuples
+            Info for all colored approximation groups.
+
+        Returns
+        -------
+        bool
+            True if batched evaluation can be used.
+        """
+        if not getattr(system, '_has_compute_batch', False) or system.comm.size > 1 or \
+                system._has_output_scaling or system._has_resid_scaling or \
+                system._var_discrete['input'] or system._var_discrete['output'] or \
+                self._progress_out:
+            return False
+
+        inputs = system._inputs
+        for tup in approx_groups:
+            _, data, _, vec, _, directional, _ = tup
+            if directional or vec is not inputs or not self._can_batch_data(data):
+                return False
+
+        for data, _, vec_ind_list, _ in colored_approx_groups:
+            if not self._can_batch_data(data) or \
+                    any(vec is not inputs for vec, _ in vec_ind_list):
+                return False
+
+        return True
+
+    def _can_batch_data(self, data):
+        """
+        Return True if the given approximation data can be used for batched evaluation.
+
+        Parameters
+        ----------
+        data : object
+            Metadata needed to perform cs or fd.
+
+        Returns
+        -------
+        bool
+            True if batched evaluation can be used.
+        """
+        return False
+
+    def _run_batch(self, system, idxs_list, data):
+        """
+        Perturb the inputs at each of the given indices and evaluate all points in one call.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+        idxs_list : list
+            Input vector indices perturbed for each point.
+        data : object
+            Metadata needed to perform cs or fd.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (len(idxs_list), len(residuals)) containing the result for each point.
+        """
+        raise NotImplementedError("_run_batch has not been implemented")
+
+    def _batch_column_iter(self, system, approx_groups, colored_approx_groups):
+        """
+        Perform batched approximations and yield (column_index, column) for each jac column.
+
+        All colors are evaluated in a single batch and each uncolored 'wrt' variable is
+        evaluated in its own batch.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        approx_groups : list of tuples
+            Info for all uncolored approximation groups.
+        colored_approx_groups : list of tuples
+            Info for all colored approximation groups.
+
+        Yields
+        ------
+        int
+            column index
+        ndarray
+            solution array corresponding to the jacobian column at the given column index
+        """
+        if colored_approx_groups:
+            data = colored_approx_groups[0][0]
+            idxs_list = [np.concatenate([idxs for _, idxs in vec_ind_list])
+                         for _, _, vec_ind_list, _ in colored_approx_groups]
+            results = self._transform_result(self._run_batch(system, idxs_list, data))
+            mult = self._get_multiplier(data)
+            if mult != 1.0:
+                results *= mult
+
+            scratch = np.empty(results.shape[1])
+            for res, (_, jcols, _, nzrows) in zip(results, colored_approx_groups):
+                for i, col in enumerate(jcols):
+                    scratch[:] = 0.0
+                    scratch[nzrows[i]] = res[nzrows[i]]
+                    yield col, scratch
+
+        for _, data, jcol_idxs, _, vec_idxs, _, _ in approx_groups:
+            results = self._transform_result(self._run_batch(system, list(vec_idxs), data))
+            mult = self._get_multiplier(data)
+            if mult != 1.0:
+                results *= mult
+
+            for jinds, res in zip(jcol_idxs, results):
+                yield jinds, res
+
+    def _pool_column_iter(self, system, approx_groups, colored_approx_groups):
+        """
+        Perform approximations in worker processes and yield (column_index, column) for each col.
+
+        Each colored group and each uncolored column is evaluated as a separate case in a pool of
+        processes forked from the current one, so the workers start from the current state of
+        the system.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        approx_groups : list of tuples
+            Info for all uncolored approximation groups.
+        colored_approx_groups : list of tuples
+            Info for all colored approximation groups.
+
+        Yields
+        ------
+        int
+            column index
+        ndarray
+            solution array corresponding to the jacobian column at the given column index
+        """
+        total = system.pathname == ''
+        total_or_semi = _is_group(system)
+
+        if total:
+            tot_result = np.zeros(sum([end - start for _, start, end, _, _
+                                       in system._jac_of_iter()]))
+            scratch = tot_result.copy()
+        else:
+            scratch = np.empty(len(system._outputs))
+
+        vec = system._outputs if total_or_semi else system._residuals
+        results_array = vec.asarray(True)
+
+        def run_case(icolor, igroup, vecidxs):
+            if icolor is not None:
+                data, _, vec_ind_list, _ = colored_approx_groups[icolor]
+                result = self._run_point(system, vec_ind_list, data, results_array,
+                                         total_or_semi)
+                scale = self._get_multiplier(data) != 1.0
+            else:
+                _, data, jcol_idxs, vec, _, _, direction = approx_groups[igroup]
+                app_data = data if direction is None else self.apply_directional(data,
+                                                                                 direction)
+                result = self._run_point(system, [(vec, vecidxs)], app_data, results_array,
+                                         total_or_semi, jcol_idxs)
+                scale = direction is not None or self._get_multiplier(data) != 1.0
+
+            result = self._transform_result(result)
+            if scale:
+                result *= self._get_multiplier(data)
+
+            if total:
+                result = self._get_total_result(result, tot_result)
+
+            return result
+
+        def setup_worker():
+            # only the parent process records cases
+            for s in system.system_iter(include_self=True, recurse=True):
+                for obj in (s, s.nonlinear_solver, s.linear_solver):
+                    if obj is not None:
+                        obj._rec_mgr._recorders = []
+
+        cases = [((i, None, None), None) for i in range(len(colored_approx_groups))]
+        columns = [None] * len(cases)
+        for igroup, tup in enumerate(approx_groups):
+            _, _, jcol_idxs, _, vec_idxs, directional, _ = tup
+            icount = 0
+            for vecidxs in vec_idxs:
+                if vecidxs is None and not total_or_semi:
+                    continue  # non-local partial jac column
+                jinds = jcol_idxs[icount]
+                icount += 1
+                columns.append(jinds[0] if directional else jinds)
+                cases.append(((None, igroup, vecidxs), None))
+
+        for icase, result, err in concurrent_eval_pool(run_case, cases, system._num_fd_workers,
+                                                       initializer=setup_worker):
+            if err is not None:
+                raise RuntimeError(f"{system.msginfo}: Approximation of derivatives failed in a "
+                                   f"worker process:\n{err}")
+
+            if columns[icase] is None:
+                _, jcols, _, nzrows = colored_approx_groups[icase]
+                for i, col in enumerate(jcols):
+                    scratch[:] = 0.0
+                    scratch[nzrows[i]] = result[nzrows[i]]
+                    yield col, scratch
+            else:
+                yield columns[icase], result
+
     def _get_total_result(self, outarr, totarr):
         """
         Convert output array into a column array that matches the size of the total jacobian.
@@ -218,6 +218,48 @@ class ComplexStep(ApproximationScheme):
 
         return result_array
 
+    def _can_batch_data(self, delta):
+        """
+        Return True if the given approximation data can be used for batched evaluation.
+
+        Parameters
+        ----------
+        delta : complex
+            Perturbation amount.
+
+        Returns
+        -------
+        bool
+            True if batched evaluation can be used.
+        """
+        return True
+
+    def _run_batch(self, system, idxs_list, delta):
+        """
+        Perturb the inputs at each of the given indices and evaluate all points in one call.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+        idxs_list : list
+            Input vector indices perturbed for each point.
+        delta : complex
+            Perturbation amount.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (len(idxs_list), len(residuals)) containing the residuals of each
+            perturbed point.
+        """
+        in_data = np.empty((len(idxs_list), len(system._inputs)), dtype=complex)
+        in_data[:] = system._inputs.asarray()
+        for i, idxs in enumerate(idxs_list):
+            in_data[i, idxs] += delta
+
+        return system._apply_nonlinear_batch(in_data)
+
     def apply_directional(self, data, direction):
         """
         Apply stepsize to direction and embed into approximation data.
@@ -421,6 +421,59 @@ class FiniteDifference(ApproximationScheme):
 
         return self._results_tmp
 
+    def _can_batch_data(self, data):
+        """
+        Return True if the given approximation data can be used for batched evaluation.
+
+        Parameters
+        ----------
+        data : tuple
+            Tuple of the form (deltas, coeffs, current_coeff).
+
+        Returns
+        -------
+        bool
+            True if batched evaluation can be used.
+        """
+        # 'rel_element' steps differ for each element, so they aren't batched
+        return np.ndim(data[0]) == 1
+
+    def _run_batch(self, system, idxs_list, data):
+        """
+        Perturb the inputs at each of the given indices and evaluate all points in one call.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+        idxs_list : list
+            Input vector indices perturbed for each point.
+        data : tuple
+            Tuple of the form (deltas, coeffs, current_coeff).
+
+        Returns
+        -------
+        ndarray
+            Array of shape (len(idxs_list), len(residuals)) containing the finite difference
+            of each point.
+        """
+        deltas, coeffs, current_coeff = data
+        npts = len(idxs_list)
+        inarr = system._inputs.asarray()
+
+        in_data = np.empty((len(deltas) * npts, inarr.size), dtype=inarr.dtype)
+        in_data[:] = inarr
+        for j, delta in enumerate(deltas):
+            for i, idxs in enumerate(idxs_list):
+                in_data[j * npts + i, idxs] += delta
+
+        resids = system._apply_nonlinear_batch(in_data).reshape(len(deltas), npts, -1)
+        results = np.tensordot(coeffs, resids, axes=1)
+        if current_coeff:
+            results += current_coeff * system._residuals.asarray()
+
+        return results
+
     def apply_directional(self, data, direction):
         """
         Apply stepsize to direction and embed into approximation data.
@@ -1,4 +1,6 @@
 """Define the ExecComp class, a component that evaluates an expression."""
+import ast
+import operator
 import re
 import time
 from itertools import product
@@ -29,7 +31,7 @@ _allowed_meta = {'value', 'val', 'shape', 'units', 'res_units', 'desc',
 
 # Names that are not allowed for input or output variables (keywords for options)
 _disallowed_names = {'has_diag_partials', 'units', 'shape', 'shape_by_conn', 'run_root_only',
-                     'constant', 'do_coloring'}
+                     'constant', 'do_coloring', 'derivs_method'}
 
 
 def check_option(option, value):
@@ -118,6 +120,9 @@ class ExecComp(ExplicitComponent):
     _viewdict : dict or None
         If using internal CS, this maps input, output, and constant names to their corresponding
         views/values.
+    _expr_derivs : _ExprDerivs or None
+        If the 'derivs_method' option is 'analytic', this computes the partials of all of the
+        expressions in a single pass.
     """
 
     def __init__(self, exprs=[], **kwargs):
@@ -245,6 +250,7 @@ class ExecComp(ExplicitComponent):
         self._outarray = None
         self._indict = None
         self._viewdict = None
+        self._expr_derivs = None
 
     def initialize(self):
         """
@@ -274,6 +280,13 @@ class ExecComp(ExplicitComponent):
                              desc='If True (the default), compute the partial jacobian '
                              'coloring for this component.')
 
+        self.options.declare('derivs_method', values=['cs', 'analytic'], default='cs',
+                             desc="Method used to compute partials when they haven't been "
+                                  "declared manually. If 'analytic', the expressions are "
+                                  "differentiated during setup and all partials are computed "
+                                  "in a single pass. Complex step is used instead if any of the "
+                                  "expressions can't be differentiated analytically.")
+
     @classmethod
     def register(cls, name, callable_obj, complex_safe):
         """
@@ -668,7 +681,7 @@ class ExecComp(ExplicitComponent):
         Coloring or None
             Coloring object, possible loaded from a file or dynamically generated, or None
         """
-        if self.options['do_coloring']:
+        if self.options['do_coloring'] and self._expr_derivs is None:
             return super()._get_coloring()
 
     def _setup_partials(self):
@@ -676,8 +689,12 @@ class ExecComp(ExplicitComponent):
         Check that all partials are declared.
         """
         has_diag_partials = self.options['has_diag_partials']
+        self._expr_derivs = derivs = None
         if not self._manual_decl_partials:
-            if self.options['do_coloring'] and not has_diag_partials:
+            if self.options['derivs_method'] == 'analytic':
+                derivs = self._setup_expr_derivs()
+
+            if self.options['do_coloring'] and not has_diag_partials and derivs is None:
                 rank = self.comm.rank
                 sizes = self._var_sizes
                 if not self._has_distrib_vars and (sum(sizes['input'][rank]) > 1 and
@@ -712,6 +729,16 @@ class ExecComp(ExplicitComponent):
                             else:
                                 inds = None
                             decl_partials(of=out, wrt=inp, rows=inds, cols=inds)
+                        elif derivs is not None:
+                            if inp not in derivs[out]:
+                                continue  # partial is structurally zero
+                            deriv = derivs[out][inp]
+                            if isinstance(deriv, _Diag) and deriv.val.size > 1 and \
+                                    deriv.val.size == meta[out]['size']:
+                                inds = np.arange(deriv.val.size, dtype=INT_DTYPE)
+                                decl_partials(of=out, wrt=inp, rows=inds, cols=inds)
+                            else:
+                                decl_partials(of=out, wrt=inp)
                         else:
                             decl_partials(of=out, wrt=inp)
 
@@ -735,6 +762,34 @@ class ExecComp(ExplicitComponent):
                               f"declared so they are assumed to be zero: [{undeclared}].",
                               prefix=self.msginfo, category=DerivativesWarning)
 
+    def _setup_expr_derivs(self):
+        """
+        Differentiate our expressions so that partials can be computed analytically.
+
+        Returns
+        -------
+        dict or None
+            Derivatives of each output with respect to each input, evaluated at the initial
+            variable values, or None if the expressions could not be differentiated.
+        """
+        meta = self._var_rel2meta
+        innames = self._var_rel_names['input']
+        try:
+            expr_derivs = _ExprDerivs(self._exprs, innames, self._constants)
+        except NotImplementedError as err:
+            issue_warning(f"Partials can't be computed analytically because {err}, so complex "
+                          "step will be used instead.", prefix=self.msginfo,
+                          category=DerivativesWarning)
+            return None
+
+        env = {n: np.atleast_1d(meta[n]['val']) for n in innames}
+        env.update(self._constants)
+        with np.errstate(all='ignore'):
+            derivs = expr_derivs.compute(env)
+
+        self._expr_derivs = expr_derivs
+        return derivs
+
     def _setup_vectors(self, root_vectors):
         """
         Compute all vectors for all vec names.
@@ -864,7 +919,8 @@ class ExecComp(ExplicitComponent):
                          perturb_size=_DEFAULT_COLORING_META['perturb_size'],
                          min_improve_pct=_DEFAULT_COLORING_META['min_improve_pct'],
                          show_summary=_DEFAULT_COLORING_META['show_summary'],
-                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity']):
+                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity'],
+                         probe_sparsity=_DEFAULT_COLORING_META['probe_sparsity']):
         """
         Set options for deriv coloring of a set of wrt vars matching the given pattern(s).
 
@@ -900,10 +956,13 @@ class ExecComp(ExplicitComponent):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        probe_sparsity : bool
+            If True, determine the sparsity of the partial jacobian using a few random
+            directional derivatives rather than computing every column num_full_jacs times.
         """
         super().declare_coloring(wrt, method, form, step, per_instance, num_full_jacs,
                                  tol, orders, perturb_size, min_improve_pct,
-                                 show_summary, show_sparsity)
+                                 show_summary, show_sparsity, probe_sparsity)
         self._coloring_declared = True
         self._manual_decl_partials = True
 
@@ -978,7 +1037,20 @@ class ExecComp(ExplicitComponent):
         # use special sparse jacobian to collect sparsity info
         jac = _ColSparsityJac(self, info)
 
-        for i in range(info['num_full_jacs']):
+        if info['probe_sparsity']:
+            point = starting_inputs + in_offsets * get_random_arr(in_offsets.size, self.comm)
+
+            def jvp(direction):
+                inarr[:] = point + step * direction
+                self._exec()
+                return imag(oarr * inv_stepsize)
+
+            jac.probe(self, jvp, info['num_full_jacs'])
+            num_full_jacs = 0
+        else:
+            num_full_jacs = info['num_full_jacs']
+
+        for i in range(num_full_jacs):
             inarr[:] = starting_inputs + in_offsets * get_random_arr(in_offsets.size, self.comm)
 
             for i in range(inarr.size):
@@ -1071,6 +1143,10 @@ class ExecComp(ExplicitComponent):
         if self._manual_decl_partials:
             return
 
+        if self._expr_derivs is not None:
+            self._compute_analytic_partials(inputs, partials)
+            return
+
         if self.under_complex_step:
             raise RuntimeError(f"{self.msginfo}: Can't compute complex step partials when higher "
                                "level system is using complex step unless you manually call "
@@ -1122,6 +1198,30 @@ class ExecComp(ExplicitComponent):
                     # restore old input value
                     ival[idx] -= step
 
+    def _compute_analytic_partials(self, inputs, partials):
+        """
+        Use the differentiated expressions to update the given Jacobian.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Vector containing parameters (p).
+        partials : `Jacobian`
+            Contains sub-jacobians.
+        """
+        env = {n: inputs[n] for n in self._var_rel_names['input']}
+        env.update(self._constants)
+        meta = self._var_rel2meta
+        declared = self._declared_partials
+
+        for out, derivs in self._expr_derivs.compute(env).items():
+            nrows = meta[out]['size']
+            for inp, deriv in derivs.items():
+                key = (out, inp)
+                if key in declared:
+                    partials[key] = _deriv2subjac(deriv, nrows,
+                                                  declared[key].get('rows') is not None)
+
 
 class _ViewDict(object):
     def __init__(self, dct):
@@ -1328,6 +1428,398 @@ _expr_dict['np'] = _NumpyMsg('np')
 _expr_dict['numpy'] = _NumpyMsg('numpy')
 
 
+class _Diag(object):
+    """
+    Diagonal derivative of an array with respect to an input having the same shape.
+
+    Parameters
+    ----------
+    val : ndarray
+        Diagonal entries of the derivative, having the shape of the input.
+
+    Attributes
+    ----------
+    val : ndarray
+        Diagonal entries of the derivative, having the shape of the input.
+    """
+
+    __slots__ = ['val']
+
+    def __init__(self, val):
+        """
+        Store the diagonal entries.
+        """
+        self.val = val
+
+    def dense(self):
+        """
+        Return the dense form of this derivative.
+
+        Returns
+        -------
+        ndarray
+            Array having the shape of the input plus a trailing axis for the flattened input.
+        """
+        val = self.val
+        size = val.size
+        dense = np.zeros(val.shape + (size,), dtype=val.dtype)
+        idxs = np.arange(size)
+        dense.reshape(size, size)[idxs, idxs] = val.ravel()
+        return dense
+
+
+def _scale_deriv(deriv, factor, shape):
+    """
+    Multiply a derivative elementwise by the given factor and broadcast it to the given shape.
+
+    Parameters
+    ----------
+    deriv : _Diag or ndarray
+        The derivative.  Dense derivatives have a trailing axis for the flattened input.
+    factor : ndarray, float or None
+        Factor broadcastable to shape.  None means 1.
+    shape : tuple
+        Shape of the value the derivative belongs to.
+
+    Returns
+    -------
+    _Diag or ndarray
+        The scaled derivative.
+    """
+    if isinstance(deriv, _Diag):
+        if deriv.val.shape == shape:
+            return deriv if factor is None else _Diag(deriv.val * factor)
+        deriv = deriv.dense()
+
+    if factor is not None:
+        deriv = np.asarray(factor)[..., np.newaxis] * deriv
+
+    if deriv.shape[:-1] != shape:
+        deriv = np.broadcast_to(deriv, shape + deriv.shape[-1:])
+
+    return deriv
+
+
+def _combine_derivs(terms, shape):
+    """
+    Apply the chain rule for a value computed elementwise from other values.
+
+    Parameters
+    ----------
+    terms : list of (dict, ndarray or float or None)
+        Derivatives of each argument, keyed by input name, along with the derivative of the
+        value with respect to that argument.
+    shape : tuple
+        Shape of the value.
+
+    Returns
+    -------
+    dict
+        Derivatives of the value keyed by input name.
+    """
+    result = {}
+    for derivs, factor in terms:
+        for name, deriv in derivs.items():
+            deriv = _scale_deriv(deriv, factor, shape)
+            if name in result:
+                old = result[name]
+                if isinstance(old, _Diag) and isinstance(deriv, _Diag):
+                    deriv = _Diag(old.val + deriv.val)
+                else:
+                    if isinstance(old, _Diag):
+                        old = old.dense()
+                    elif isinstance(deriv, _Diag):
+                        deriv = deriv.dense()
+                    deriv = old + deriv
+            result[name] = deriv
+
+    return result
+
+
+def _deriv2subjac(deriv, nrows, diag):
+    """
+    Convert a derivative into the value of a sub-jacobian.
+
+    Parameters
+    ----------
+    deriv : _Diag or ndarray
+        The derivative.
+    nrows : int
+        Size of the output.
+    diag : bool
+        If True, the sub-jacobian was declared as diagonal.
+
+    Returns
+    -------
+    ndarray
+        The sub-jacobian value.
+    """
+    if isinstance(deriv, _Diag):
+        if diag:
+            return deriv.val.ravel()
+        deriv = deriv.dense()
+
+    deriv = deriv.reshape(-1, deriv.shape[-1])
+    if deriv.shape[0] != nrows:
+        # value was broadcast into the output
+        deriv = np.broadcast_to(deriv, (nrows, deriv.shape[1]))
+
+    return np.diagonal(deriv) if diag else deriv
+
+
+def _max_deriv(a, b, val):
+    return np.real(a) >= np.real(b)
+
+
+def _min_deriv(a, b, val):
+    return np.real(a) <= np.real(b)
+
+
+# functions of the form (a, b, val) returning the derivatives of binary operations with
+# respect to each argument.  None indicates a derivative of 1.
+_binary_derivs = {
+    ast.Add: (operator.add, None, None),
+    ast.Sub: (operator.sub, None, lambda a, b, val: -1.),
+    ast.Mult: (operator.mul, lambda a, b, val: b, lambda a, b, val: a),
+    ast.Div: (operator.truediv, lambda a, b, val: 1. / b, lambda a, b, val: -val / b),
+    ast.Pow: (operator.pow, lambda a, b, val: b * a ** (b - 1), lambda a, b, val: val * np.log(a)),
+    'power': (None, lambda a, b, val: b * a ** (b - 1), lambda a, b, val: val * np.log(a)),
+    'arctan2': (None, lambda a, b, val: b / (a**2 + b**2), lambda a, b, val: -a / (a**2 + b**2)),
+    'maximum': (None, _max_deriv, lambda a, b, val: 1. - _max_deriv(a, b, val)),
+    'fmax': (None, _max_deriv, lambda a, b, val: 1. - _max_deriv(a, b, val)),
+    'minimum': (None, _min_deriv, lambda a, b, val: 1. - _min_deriv(a, b, val)),
+    'fmin': (None, _min_deriv, lambda a, b, val: 1. - _min_deriv(a, b, val)),
+}
+
+# functions of the form (x, val) returning the derivatives of elementwise functions.
+_unary_derivs = {
+    'sin': lambda x, val: np.cos(x),
+    'cos': lambda x, val: -np.sin(x),
+    'tan': lambda x, val: 1. / np.cos(x)**2,
+    'arcsin': lambda x, val: 1. / np.sqrt(1. - x**2),
+    'arccos': lambda x, val: -1. / np.sqrt(1. - x**2),
+    'arctan': lambda x, val: 1. / (1. + x**2),
+    'sinh': lambda x, val: np.cosh(x),
+    'cosh': lambda x, val: np.sinh(x),
+    'tanh': lambda x, val: 1. - val**2,
+    'arcsinh': lambda x, val: 1. / np.sqrt(x**2 + 1.),
+    'arccosh': lambda x, val: 1. / np.sqrt(x**2 - 1.),
+    'exp': lambda x, val: val,
+    'expm1': lambda x, val: val + 1.,
+    'log': lambda x, val: 1. / x,
+    'log10': lambda x, val: 1. / (x * np.log(10.)),
+    'log1p': lambda x, val: 1. / (1. + x),
+    'abs': lambda x, val: np.sign(np.real(x)),
+    'erf': lambda x, val: 2. / np.sqrt(np.pi) * np.exp(-x**2),
+    'erfc': lambda x, val: -2. / np.sqrt(np.pi) * np.exp(-x**2),
+}
+
+for _name, _alias in [('arcsin', 'asin'), ('arccos', 'acos'), ('arctan', 'atan'),
+                      ('arcsinh', 'asinh'), ('arccosh', 'acosh')]:
+    _unary_derivs[_alias] = _unary_derivs[_name]
+
+
+class _ExprDerivs(object):
+    """
+    Forward mode differentiation of ExecComp expressions.
+
+    Each expression is parsed into an AST and converted into a tree of functions that compute
+    the value of each node along with its derivatives with respect to the inputs, so that all
+    partials are computed in one vectorized pass.  Derivatives of values having the same shape
+    as an input are kept diagonal for as long as possible.
+
+    Parameters
+    ----------
+    exprs : list of str
+        The expressions.
+    innames : list of str
+        Names of the inputs.
+    constants : dict
+        Constants used in the expressions, keyed by name.
+
+    Attributes
+    ----------
+    _innames : set of str
+        Names of the inputs.
+    _funcs : list of (str, function)
+        Output name and the function computing its value and derivatives for each expression.
+    """
+
+    def __init__(self, exprs, innames, constants):
+        """
+        Differentiate the expressions.
+        """
+        self._innames = set(innames)
+        self._funcs = []
+
+        for expr in exprs:
+            body = ast.parse(expr).body
+            if len(body) != 1 or not isinstance(body[0], ast.Assign) or \
+                    len(body[0].targets) != 1 or not isinstance(body[0].targets[0], ast.Name):
+                raise NotImplementedError(f"'{expr}' is not a simple assignment")
+
+            rhs = body[0].value
+            for node in ast.walk(rhs):
+                if isinstance(node, ast.Name) and not (node.id in self._innames or
+                                                       node.id in constants or
+                                                       node.id in _expr_dict):
+                    raise NotImplementedError(f"'{node.id}' in '{expr}' is not an input")
+
+            self._funcs.append((body[0].targets[0].id, self._build(rhs, expr)))
+
+    def compute(self, env):
+        """
+        Compute the derivatives of each output with respect to the inputs.
+
+        Parameters
+        ----------
+        env : dict
+            Values of the inputs and constants keyed by name.
+
+        Returns
+        -------
+        dict
+            Dict of derivatives keyed by input name for each output.
+        """
+        return {out: func(env)[1] for out, func in self._funcs}
+
+    def _depends_on_inputs(self, node):
+        return any(isinstance(n, ast.Name) and n.id in self._innames for n in ast.walk(node))
+
+    def _build(self, node, expr):
+        """
+        Return a function that computes the value and derivatives of the given node.
+
+        Parameters
+        ----------
+        node : ast.AST
+            The node.
+        expr : str
+            The expression containing the node.
+
+        Returns
+        -------
+        function
+            Function taking a dict of variable values and returning the value of the node and
+            a dict of its derivatives keyed by input name.
+        """
+        if not self._depends_on_inputs(node):
+            code = compile(ast.Expression(body=node), expr, 'eval')
+
+            def const_func(env):
+                return eval(code, _expr_dict, env), {}  # nosec: limited to _expr_dict
+
+            return const_func
+
+        if isinstance(node, ast.Name):
+            name = node.id
+
+            def input_func(env):
+                val = env[name]
+                return val, {name: _Diag(np.ones(val.shape))}
+
+            return input_func
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self._build(node.operand, expr)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+
+            def neg_func(env):
+                val, derivs = operand(env)
+                val = -val
+                return val, _combine_derivs([(derivs, -1.)], np.shape(val))
+
+            return neg_func
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _binary_derivs:
+            return self._build_binary(_binary_derivs[type(node.op)],
+                                      self._build(node.left, expr),
+                                      self._build(node.right, expr))
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and \
+                not node.keywords and not any(isinstance(a, ast.Starred) for a in node.args):
+            fname = node.func.id
+            args = [self._build(a, expr) for a in node.args]
+
+            if len(args) == 1 and fname in _unary_derivs:
+                return self._build_unary(_expr_dict[fname], _unary_derivs[fname], args[0])
+
+            if len(args) == 2 and fname in _binary_derivs:
+                op, dfda, dfdb = _binary_derivs[fname]
+                return self._build_binary((_expr_dict[fname], dfda, dfdb), args[0], args[1])
+
+            if len(args) == 1 and fname == 'sum':
+                return self._build_sum(args[0])
+
+            raise NotImplementedError(f"function '{fname}' in '{expr}' is not supported")
+
+        if isinstance(node, ast.Subscript) and not self._depends_on_inputs(node.slice) and \
+                not any(getattr(n, 'value', None) is Ellipsis for n in ast.walk(node.slice)):
+            return self._build_subscript(node, expr)
+
+        raise NotImplementedError(f"{type(node).__name__} expressions in '{expr}' are not "
+                                  "supported")
+
+    def _build_unary(self, f, dfdx, arg):
+        def unary_func(env):
+            x, derivs = arg(env)
+            val = f(x)
+            return val, _combine_derivs([(derivs, dfdx(x, val))], np.shape(val))
+
+        return unary_func
+
+    def _build_binary(self, rule, left, right):
+        op, dfda, dfdb = rule
+
+        def binary_func(env):
+            a, da = left(env)
+            b, db = right(env)
+            val = op(a, b)
+            terms = []
+            if da:
+                terms.append((da, None if dfda is None else dfda(a, b, val)))
+            if db:
+                terms.append((db, None if dfdb is None else dfdb(a, b, val)))
+            return val, _combine_derivs(terms, np.shape(val))
+
+        return binary_func
+
+    def _build_sum(self, arg):
+        def sum_func(env):
+            x, derivs = arg(env)
+            sums = {}
+            for name, deriv in derivs.items():
+                if isinstance(deriv, _Diag):
+                    sums[name] = deriv.val.ravel()
+                else:
+                    sums[name] = deriv.reshape(-1, deriv.shape[-1]).sum(axis=0)
+            return np.sum(x), sums
+
+        return sum_func
+
+    def _build_subscript(self, node, expr):
+        value = self._build(node.value, expr)
+
+        # apply the same index to the value and to the leading axes of its derivatives
+        sub = ast.Expression(body=ast.Subscript(value=ast.Name(id='__arr__', ctx=ast.Load()),
+                                                slice=node.slice, ctx=ast.Load()))
+        code = compile(ast.fix_missing_locations(sub), expr, 'eval')
+
+        def subscript_func(env):
+            arr, derivs = value(env)
+            scope = env.copy()
+            scope['__arr__'] = arr
+            val = eval(code, _expr_dict, scope)  # nosec: limited to _expr_dict
+            subderivs = {}
+            for name, deriv in derivs.items():
+                scope['__arr__'] = deriv.dense() if isinstance(deriv, _Diag) else deriv
+                subderivs[name] = eval(code, _expr_dict, scope)  # nosec: limited to _expr_dict
+            return val, subderivs
+
+        return subscript_func
+
+
 @contextmanager
 def _temporary_expr_dict():
     """
@@ -133,7 +133,9 @@ class ExplicitFuncComp(ExplicitComponent):
         """
         if self.options['use_jax']:
             self._check_first_linearize()
-            self._jax_linearize()
+            if not self._lin_point_is_current():
+                self._jax_linearize()
+                self._save_lin_point()
         else:
             super()._linearize(jac, sub_do_ln)
 
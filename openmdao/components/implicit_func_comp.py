@@ -215,9 +215,11 @@ class ImplicitFuncComp(ImplicitComponent):
         """
         if self.options['use_jax']:
             self._check_first_linearize()
-            self._jax_linearize()
+            if not self._lin_point_is_current():
+                self._jax_linearize()
+                self._save_lin_point()
             if (jac is None or jac is self._assembled_jac) and self._assembled_jac is not None:
-                self._assembled_jac._update(self)
+                self._update_assembled_jac()
         else:
             super()._linearize(jac, sub_do_ln)
 
@@ -4,8 +4,13 @@ Base class for interpolation methods.  New methods should inherit from this clas
 import numpy as np
 
 from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
+from openmdao.core.constants import INT_DTYPE
+from openmdao.utils.class_util import overrides_method
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+# Maximum number of table values gathered at once during vectorized evaluation.
+_MAX_GATHER_SIZE = 2 ** 20
+
 
 class InterpAlgorithm(object):
     """
@@ -111,7 +116,143 @@ class InterpAlgorithm(object):
         bool
             Returns True if this table can be run vectorized.
         """
-        return self._vectorized
+        if self._vectorized:
+            return True
+
+        # Tables whose dimensions all provide interpolation weights can be evaluated as a
+        # tensor product for all points at once.
+        table = self
+        while table is not None:
+            if not overrides_method('_vectorized_weights', table, InterpAlgorithm):
+                return False
+            table = table.subtable
+
+        return np.ndim(x) == 2 and self.values.ndim == x.shape[1]
+
+    def _vectorized_weights(self, x):
+        """
+        Compute the interpolation weights in this dimension for multiple points.
+
+        Methods whose interpolated value is a weighted sum of neighboring table values can
+        override this so that all points are evaluated at once by evaluate_vectorized.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of the independent in this dimension for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point in the stencil of each point.
+        ndarray
+            Weights of each grid point in the stencil, having shape (len(x), stencil_size).
+        ndarray
+            Derivatives of the weights with respect to x.
+        """
+        raise NotImplementedError()
+
+    def _vectorized_bracket(self, x):
+        """
+        Locate the intervals of multiple independents, matching the results of bracket.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of the independent in this dimension for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Grid interval index that contains each x.
+        """
+        idx = np.searchsorted(self.grid, x.real, side='left') - 1
+        return np.clip(idx, 0, len(self.grid) - 1)
+
+    def evaluate_vectorized(self, x, slice_idx=None):
+        """
+        Interpolate across all table dimensions for multiple points at once.
+
+        The value at each point is the sum of the table values in its stencil weighted by the
+        product of the weights in each dimension.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at, having shape (n_points, n_dims).
+        slice_idx : None
+            Only needed for API compatibility.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to the independents.
+        ndarray or None
+            Derivative of interpolated values with respect to the table values, if requested.
+        None
+            Derivatives with respect to the grid are not computed here.
+        """
+        n_nodes, ndim = x.shape
+        dtype = np.result_type(x, self.values)
+
+        starts = []
+        weights = []
+        dweights = []
+        table = self
+        for i in range(ndim):
+            start, w, dw = table._vectorized_weights(x[:, i])
+            starts.append(start)
+            weights.append(w)
+            dweights.append(dw)
+            table = table.subtable
+
+        sizes = [w.shape[1] for w in weights]
+        block = max(1, _MAX_GATHER_SIZE // int(np.prod(sizes)))
+
+        result = np.empty(n_nodes, dtype=dtype)
+        d_dx = np.empty((n_nodes, ndim), dtype=dtype)
+        if self._compute_d_dvalues:
+            d_dvalues = np.zeros((n_nodes, ) + self.values.shape, dtype=dtype)
+        else:
+            d_dvalues = None
+
+        for lo in range(0, n_nodes, block):
+            hi = min(lo + block, n_nodes)
+
+            # gather the stencil values of each point into shape (nblock, k_0, ..., k_ndim-1)
+            idx = []
+            for i, k in enumerate(sizes):
+                shape = [hi - lo] + [1] * ndim
+                shape[i + 1] = k
+                idx.append((starts[i][lo:hi, np.newaxis] + np.arange(k)).reshape(shape))
+            val = self.values[tuple(idx)]
+
+            if d_dvalues is not None:
+                # each stencil value contributes with the product of its weights
+                dval = np.ones(val.shape, dtype=dtype)
+                for i, k in enumerate(sizes):
+                    shape = [hi - lo] + [1] * ndim
+                    shape[i + 1] = k
+                    dval = dval * weights[i][lo:hi].reshape(shape)
+                nodes = np.arange(lo, hi).reshape([hi - lo] + [1] * ndim)
+                d_dvalues[(nodes, ) + tuple(idx)] = dval
+
+            # contract one dimension at a time starting with the last one
+            derivs = []
+            for i in range(ndim - 1, -1, -1):
+                shape = (hi - lo,) + (1,) * i + (sizes[i],)
+                w = weights[i][lo:hi].reshape(shape)
+                derivs = [np.sum(d * w, axis=-1) for d in derivs]
+                derivs.insert(0, np.sum(val * dweights[i][lo:hi].reshape(shape), axis=-1))
+                val = np.sum(val * w, axis=-1)
+
+            result[lo:hi] = val
+            for i, d in enumerate(derivs):
+                d_dx[lo:hi, i] = d
+
+        return result, d_dx, d_dvalues, None
 
     def bracket(self, x):
         """
@@ -258,6 +399,223 @@ class InterpAlgorithm(object):
         raise NotImplementedError()
 
 
+def _lagrange_weights(x, nodes):
+    """
+    Compute Lagrange polynomial basis functions and their derivatives.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points where the basis functions are evaluated.
+    nodes : ndarray
+        Interpolation nodes of each point, having shape (len(x), k).
+
+    Returns
+    -------
+    ndarray
+        Value of each basis function at each point, having shape (len(x), k).
+    ndarray
+        Derivative of each basis function at each point, having shape (len(x), k).
+    """
+    k = nodes.shape[1]
+    dx = x[:, np.newaxis] - nodes
+    weights = np.empty(nodes.shape, dtype=np.result_type(x, nodes))
+    dweights = np.zeros(nodes.shape, dtype=weights.dtype)
+
+    for j in range(k):
+        others = [m for m in range(k) if m != j]
+        denom = np.prod(nodes[:, [j]] - nodes[:, others], axis=1)
+        weights[:, j] = np.prod(dx[:, others], axis=1) / denom
+        for m in others:
+            rest = [r for r in others if r != m]
+            dweights[:, j] += np.prod(dx[:, rest], axis=1)
+        dweights[:, j] /= denom
+
+    return weights, dweights
+
+
+class _CellCoeffCache(object):
+    """
+    Cache of the interpolation coefficients of the cells in a fixed-dimension table.
+
+    If the coefficients of every cell fit within max_bytes, they are stored in a dense array
+    indexed by cell.  Otherwise, a fixed number of slots is allocated and the slots are reused in
+    least recently used order.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the cell index space.
+    coeff_shape : tuple of int
+        Shape of the coefficients of a single cell.
+    dtype : dtype
+        Dtype of the cached coefficients.
+    max_bytes : int or None
+        Maximum size in bytes of the cached coefficients, or None for no limit.
+
+    Attributes
+    ----------
+    cell_of_slot : ndarray or None
+        Flat index of the cell stored in each slot, or -1 if the slot is empty.
+    coeff_shape : tuple of int
+        Shape of the coefficients of a single cell.
+    coeffs : ndarray
+        Cached coefficients, indexed by cell when dense, otherwise by slot.
+    dense : bool
+        True if all cells can be cached at once.
+    dtype : dtype
+        Dtype of the cached coefficients.
+    hits : int
+        Number of points whose cell coefficients were found in the cache.
+    is_cached : ndarray or None
+        Flag for each cell indicating if its coefficients are in the dense cache.
+    last_used : ndarray or None
+        Counter value at the most recent use of each slot, or -1 if the slot is empty.
+    misses : int
+        Number of points whose cell coefficients had to be computed.
+    shape : tuple of int
+        Shape of the cell index space.
+    slot_of_cell : ndarray or None
+        Slot holding the coefficients of each cell, or -1 if the cell is not cached.
+    tick : int
+        Counter incremented on each lookup, used to find the least recently used slots.
+    """
+
+    def __init__(self, shape, coeff_shape, dtype, max_bytes):
+        """
+        Initialize the cache storage.
+        """
+        self.shape = shape
+        self.coeff_shape = coeff_shape
+        self.dtype = dtype
+        self.hits = 0
+        self.misses = 0
+        self.tick = 0
+
+        ncells = int(np.prod(shape))
+        cell_bytes = int(np.prod(coeff_shape)) * np.dtype(dtype).itemsize
+        self.dense = max_bytes is None or ncells * cell_bytes <= max_bytes
+
+        if self.dense:
+            self.coeffs = np.empty((ncells, ) + coeff_shape, dtype=dtype)
+            self.is_cached = np.zeros(ncells, dtype=bool)
+            self.slot_of_cell = self.cell_of_slot = self.last_used = None
+        else:
+            nslots = max_bytes // cell_bytes
+            self.coeffs = np.empty((nslots, ) + coeff_shape, dtype=dtype)
+            self.is_cached = None
+            self.slot_of_cell = np.full(ncells, -1, dtype=INT_DTYPE)
+            self.cell_of_slot = np.full(nslots, -1, dtype=INT_DTYPE)
+            self.last_used = np.full(nslots, -1, dtype=INT_DTYPE)
+
+    def info(self):
+        """
+        Return usage statistics for this cache.
+
+        Returns
+        -------
+        dict
+            Statistics keyed by 'hits', 'misses', 'cells' (number of cells currently cached),
+            'max_cells' (capacity) and 'nbytes' (size of the coefficient storage).
+        """
+        if self.dense:
+            ncached = np.count_nonzero(self.is_cached)
+        else:
+            ncached = np.count_nonzero(self.cell_of_slot >= 0)
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'cells': int(ncached),
+            'max_cells': len(self.coeffs),
+            'nbytes': self.coeffs.nbytes,
+        }
+
+    def fill(self, cells, compute):
+        """
+        Compute and store the coefficients of the given cells without counting a lookup.
+
+        Parameters
+        ----------
+        cells : ndarray
+            Flat indices of unique cells.
+        compute : function
+            Function that takes an array of flat cell indices and returns their coefficients.
+        """
+        if self.dense:
+            self.coeffs[cells] = compute(cells)
+            self.is_cached[cells] = True
+
+    def get(self, cells, compute):
+        """
+        Return the coefficients of the given cells, computing any that aren't cached.
+
+        Parameters
+        ----------
+        cells : ndarray
+            Flat index of the cell of each point.
+        compute : function
+            Function that takes an array of flat cell indices and returns their coefficients.
+
+        Returns
+        -------
+        ndarray
+            Coefficients of the cell of each point.
+        """
+        if self.dense:
+            missing = ~self.is_cached[cells]
+            nmiss = np.count_nonzero(missing)
+            if nmiss > 0:
+                new = np.unique(cells[missing])
+                self.coeffs[new] = compute(new)
+                self.is_cached[new] = True
+
+            self.misses += nmiss
+            self.hits += cells.size - nmiss
+            return self.coeffs[cells]
+
+        self.tick += 1
+        uniq, inv = np.unique(cells, return_inverse=True)
+        slots = self.slot_of_cell[uniq]
+        hit = slots >= 0
+        self.last_used[slots[hit]] = self.tick
+
+        nhit = np.count_nonzero(hit[inv])
+        self.hits += nhit
+        self.misses += cells.size - nhit
+
+        if nhit == cells.size:
+            return self.coeffs[slots[inv]]
+
+        new = uniq[~hit]
+        new_coeffs = compute(new)
+
+        coeffs = np.empty((len(uniq), ) + self.coeff_shape, dtype=self.dtype)
+        coeffs[hit] = self.coeffs[slots[hit]]
+        coeffs[~hit] = new_coeffs
+
+        # Store as many of the new cells as possible in the least recently used slots, leaving
+        # alone any slots that were just used for this lookup.
+        nslots = len(self.coeffs)
+        nnew = min(len(new), nslots)
+        if nnew > 0:
+            if nnew < nslots:
+                victims = np.argpartition(self.last_used, nnew - 1)[:nnew]
+            else:
+                victims = np.arange(nslots)
+            victims = victims[self.last_used[victims] < self.tick]
+            nnew = len(victims)
+
+            old = self.cell_of_slot[victims]
+            self.slot_of_cell[old[old >= 0]] = -1
+            self.slot_of_cell[new[:nnew]] = victims
+            self.cell_of_slot[victims] = new[:nnew]
+            self.last_used[victims] = self.tick
+            self.coeffs[victims] = new_coeffs[:nnew]
+
+        return coeffs[inv]
+
+
 class InterpAlgorithmFixed(object):
     """
     Base class for interpolation over data on a table with a fixed dimension.
@@ -287,6 +645,8 @@ class InterpAlgorithmFixed(object):
         Dictionary with general pyoptsparse options.
     values : ndarray
         Array containing the table values.
+    _coeff_cache : _CellCoeffCache or None
+        Cache of the cell coefficients used when running vectorized.
     _compute_d_dvalues : bool
         When set to True, compute gradients with respect to the grid values.
     _compute_d_dx : bool
@@ -318,6 +678,7 @@ class InterpAlgorithmFixed(object):
         self._compute_d_dvalues = False
         self._supports_d_dvalues = False
         self._compute_d_dx = True
+        self._coeff_cache = None
 
     def initialize(self):
         """
@@ -325,7 +686,73 @@ class InterpAlgorithmFixed(object):
 
         Override to add options.
         """
-        pass
+        self.options.declare('coeff_cache', values=['lazy', 'precompute'], default='lazy',
+                             desc="How cell coefficients are cached when running vectorized. "
+                                  "With 'lazy', the coefficients of a cell are computed the "
+                                  "first time it is visited. With 'precompute', the "
+                                  "coefficients of every cell are computed at the first "
+                                  "evaluation.")
+        self.options.declare('coeff_cache_max_bytes', types=int, default=None,
+                             allow_none=True, lower=0,
+                             desc="Maximum size in bytes of the cached cell coefficients. If "
+                                  "the coefficients of every cell don't fit, only the most "
+                                  "recently used cells are kept and 'precompute' behaves like "
+                                  "'lazy'. The default of None means no limit.")
+
+    def coeff_cache_info(self):
+        """
+        Return usage statistics for the cache of cell coefficients.
+
+        Returns
+        -------
+        dict or None
+            Statistics keyed by 'hits', 'misses', 'cells' (number of cells currently cached),
+            'max_cells' (capacity) and 'nbytes' (size of the coefficient storage), or None if
+            no vectorized evaluation has been performed yet.
+        """
+        if self._coeff_cache is not None:
+            return self._coeff_cache.info()
+
+    def _cell_coeffs(self, idx, coeff_shape, first=0, end_offset=1):
+        """
+        Return the coefficients of the cell containing each point, computing them as needed.
+
+        Parameters
+        ----------
+        idx : tuple of ndarray
+            Cell index of each point in each dimension.
+        coeff_shape : tuple of int
+            Shape of the coefficients of a single cell.
+        first : int
+            Lowest valid cell index in each dimension.
+        end_offset : int
+            Number of grid points at the end of each dimension that don't start a valid cell.
+
+        Returns
+        -------
+        ndarray
+            Coefficients of the cell of each point, having shape (n_points, ) + coeff_shape.
+        """
+        shape = self.values.shape
+
+        # The coefficients only depend on the table values, so they are cached in the dtype of
+        # the values. A complex step in the inputs doesn't change them.
+        values_dtype = np.result_type(self.values, float)
+
+        def compute(cells):
+            return self.compute_coeffs_vectorized(np.unravel_index(cells, shape), values_dtype)
+
+        cache = self._coeff_cache
+        if cache is None or cache.dtype != values_dtype:
+            cache = self._coeff_cache = _CellCoeffCache(shape, coeff_shape, values_dtype,
+                                                        self.options['coeff_cache_max_bytes'])
+
+            if cache.dense and self.options['coeff_cache'] == 'precompute':
+                valid = np.ix_(*[np.arange(first, n - end_offset) for n in shape])
+                cells = np.ravel_multi_index(valid, shape).ravel()
+                cache.fill(cells, compute)
+
+        return cache.get(np.ravel_multi_index(idx, shape), compute)
 
     def check_config(self):
         """
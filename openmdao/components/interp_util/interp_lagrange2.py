@@ -6,7 +6,7 @@ Based on NPSS implementation.
 import numpy as np
 
 from openmdao.components.interp_util.interp_algorithm import InterpAlgorithm, \
-    InterpAlgorithmSemi, InterpAlgorithmFixed
+    InterpAlgorithmSemi, InterpAlgorithmFixed, _lagrange_weights
 
 
 class InterpLagrange2(InterpAlgorithm):
@@ -126,6 +126,32 @@ class InterpLagrange2(InterpAlgorithm):
 
         return xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2, derivs, None, None
 
+    def _vectorized_weights(self, x):
+        """
+        Compute the interpolation weights in this dimension for multiple points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of the independent in this dimension for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point in the stencil of each point.
+        ndarray
+            Weights of each grid point in the stencil, having shape (len(x), 3).
+        ndarray
+            Derivatives of the weights with respect to x.
+        """
+        # Extrapolate high
+        idx = np.minimum(self._vectorized_bracket(x), len(self.grid) - 3)
+
+        nodes = self.grid[idx[:, np.newaxis] + np.arange(3)]
+        weights, dweights = _lagrange_weights(x, nodes)
+
+        return idx, weights, dweights
+
 
 class InterpLagrange2Semi(InterpAlgorithmSemi):
     """
@@ -316,17 +342,14 @@ class Interp3DLagrange2(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 3
         self.dim = 3
         self.last_index = [0] * self.dim
@@ -581,20 +604,7 @@ class Interp3DLagrange2(InterpAlgorithmFixed):
         else:
             dtype = x_vec.dtype
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            grid = self.grid
-            self.vec_coeff = np.empty((nx, ny, nz, 3, 3, 3), dtype=dtype)
-
-        needed = set(zip(i_x, i_y, i_z))
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc[:, 0], unc[:, 1], unc[:, 2])
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc[:, 0], unc[:, 1], unc[:, 2], ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, i_y, i_z, :]
+        a = self._cell_coeffs((i_x, i_y, i_z), (3, 3, 3), end_offset=2)
 
         # Taking powers of the "deltas" instead of the actual table inputs eliminates numerical
         # problems that arise from the scaling of each axis.
@@ -781,17 +791,14 @@ class Interp2DLagrange2(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 3
         self.dim = 2
         self.last_index = [0] * self.dim
@@ -1013,20 +1020,7 @@ class Interp2DLagrange2(InterpAlgorithmFixed):
         else:
             dtype = x_vec.dtype
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            grid = self.grid
-            self.vec_coeff = np.empty((nx, ny, 3, 3), dtype=dtype)
-
-        needed = set(zip(i_x, i_y))
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc[:, 0], unc[:, 1])
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc[:, 0], unc[:, 1], ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, i_y, :]
+        a = self._cell_coeffs((i_x, i_y), (3, 3), end_offset=2)
 
         # Taking powers of the "deltas" instead of the actual table inputs eliminates numerical
         # problems that arise from the scaling of each axis.
@@ -1177,17 +1171,14 @@ class Interp1DLagrange2(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 3
         self.dim = 1
         self.last_index = [0] * self.dim
@@ -1365,19 +1356,7 @@ class Interp1DLagrange2(InterpAlgorithmFixed):
         else:
             dtype = x_vec.dtype
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            grid = self.grid
-            self.vec_coeff = np.empty((nx, 3), dtype=dtype)
-
-        needed = set(i_x)
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            uncached_idx = np.array(list(uncached))
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[uncached_idx, ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, :]
+        a = self._cell_coeffs((i_x, ), (3, ), end_offset=2)
 
         # Taking powers of the "deltas" instead of the actual table inputs eliminates numerical
         # problems that arise from the scaling of each axis.
@@ -1422,6 +1401,7 @@ class Interp1DLagrange2(InterpAlgorithmFixed):
         """
         grid = self.grid
         values = self.values
+        idx = idx[0]
         a = np.zeros((3, ), dtype=dtype)
 
         vec_size = len(idx)
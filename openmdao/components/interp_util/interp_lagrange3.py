@@ -6,7 +6,7 @@ Based on NPSS implementation.
 import numpy as np
 
 from openmdao.components.interp_util.interp_algorithm import InterpAlgorithm, \
-    InterpAlgorithmSemi, InterpAlgorithmFixed
+    InterpAlgorithmSemi, InterpAlgorithmFixed, _lagrange_weights
 
 
 class InterpLagrange3(InterpAlgorithm):
@@ -147,6 +147,32 @@ class InterpLagrange3(InterpAlgorithm):
         return xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3, \
             derivs, None, None
 
+    def _vectorized_weights(self, x):
+        """
+        Compute the interpolation weights in this dimension for multiple points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of the independent in this dimension for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point in the stencil of each point.
+        ndarray
+            Weights of each grid point in the stencil, having shape (len(x), 4).
+        ndarray
+            Derivatives of the weights with respect to x.
+        """
+        # Shift if we don't have 2 points on each side.
+        idx = np.clip(self._vectorized_bracket(x), 1, len(self.grid) - 3) - 1
+
+        nodes = self.grid[idx[:, np.newaxis] + np.arange(4)]
+        weights, dweights = _lagrange_weights(x, nodes)
+
+        return idx, weights, dweights
+
 
 class InterpLagrange3Semi(InterpAlgorithmSemi):
     """
@@ -382,17 +408,14 @@ class Interp3DLagrange3(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 4
         self.dim = 3
         self.last_index = [0] * self.dim
@@ -684,20 +707,7 @@ class Interp3DLagrange3(InterpAlgorithmFixed):
         else:
             dtype = x_vec.dtype
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            grid = self.grid
-            self.vec_coeff = np.empty((nx, ny, nz, 4, 4, 4), dtype=dtype)
-
-        needed = set(zip(i_x, i_y, i_z))
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc[:, 0], unc[:, 1], unc[:, 2])
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc[:, 0], unc[:, 1], unc[:, 2], ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, i_y, i_z, :]
+        a = self._cell_coeffs((i_x, i_y, i_z), (4, 4, 4), first=1, end_offset=2)
 
         # Taking powers of the "deltas" instead of the actual table inputs eliminates numerical
         # problems that arise from the scaling of each axis.
@@ -930,17 +940,14 @@ class Interp2DLagrange3(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 4
         self.dim = 2
         self.last_index = [0] * self.dim
@@ -1187,20 +1194,7 @@ class Interp2DLagrange3(InterpAlgorithmFixed):
         else:
             dtype = x_vec.dtype
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            grid = self.grid
-            self.vec_coeff = np.empty((nx, ny, 4, 4), dtype=dtype)
-
-        needed = set(zip(i_x, i_y))
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc[:, 0], unc[:, 1])
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc[:, 0], unc[:, 1], ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, i_y, :]
+        a = self._cell_coeffs((i_x, i_y), (4, 4), first=1, end_offset=2)
 
         # Taking powers of the "deltas" instead of the actual table inputs eliminates numerical
         # problems that arise from the scaling of each axis.
@@ -1382,17 +1376,14 @@ class Interp1DLagrange3(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 4
         self.dim = 1
         self.last_index = [0] * self.dim
@@ -1582,19 +1573,7 @@ class Interp1DLagrange3(InterpAlgorithmFixed):
         else:
             dtype = x_vec.dtype
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            grid = self.grid
-            self.vec_coeff = np.empty((nx, 4), dtype=dtype)
-
-        needed = set(i_x)
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            uncached_idx = np.array(list(uncached))
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[uncached_idx, ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, :]
+        a = self._cell_coeffs((i_x, ), (4, ), first=1, end_offset=2)
 
         # Taking powers of the "deltas" instead of the actual table inputs eliminates numerical
         # problems that arise from the scaling of each axis.
@@ -1641,6 +1620,7 @@ class Interp1DLagrange3(InterpAlgorithmFixed):
         """
         grid = self.grid
         values = self.values
+        idx = idx[0]
         a = np.zeros((4, ), dtype=dtype)
 
         vec_size = len(idx)
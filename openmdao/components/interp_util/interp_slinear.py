@@ -102,6 +102,37 @@ class InterpLinear(InterpAlgorithm):
             return values[..., idx] + (x - grid[idx]) * slope, slope[..., None], \
                 None, None
 
+    def _vectorized_weights(self, x):
+        """
+        Compute the interpolation weights in this dimension for multiple points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of the independent in this dimension for each point.
+
+        Returns
+        -------
+        ndarray of int
+            Index of the first grid point in the stencil of each point.
+        ndarray
+            Weights of each grid point in the stencil, having shape (len(x), 2).
+        ndarray
+            Derivatives of the weights with respect to x.
+        """
+        grid = self.grid
+
+        # Extrapolate high
+        idx = np.minimum(self._vectorized_bracket(x), len(grid) - 2)
+
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        t = (x - grid[idx]) * h
+
+        weights = np.column_stack((1.0 - t, t))
+        dweights = np.column_stack((-h, h))
+
+        return idx, weights, dweights
+
 
 class InterpLinearSemi(InterpAlgorithmSemi):
     """
@@ -239,17 +270,14 @@ class Interp1DSlinear(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 2
         self.dim = 1
         self.last_index = [0] * self.dim
@@ -396,19 +424,7 @@ class Interp1DSlinear(InterpAlgorithmFixed):
         nx = self.values.shape[0]
         i_x[i_x == nx - 1] = nx - 2
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            self.vec_coeff = np.empty((nx, 2), dtype=dtype)
-
-        needed = set([item for item in i_x])
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc, )
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc, ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, :]
+        a = self._cell_coeffs((i_x, ), (2, ))
 
         val = a[:, 0] + a[:, 1] * (x - grid[i_x])
 
@@ -472,17 +488,14 @@ class Interp2DSlinear(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 2
         self.dim = 2
         self.last_index = [0] * self.dim
@@ -651,19 +664,7 @@ class Interp2DSlinear(InterpAlgorithmFixed):
         i_x[i_x == nx - 1] = nx - 2
         i_y[i_y == ny - 1] = ny - 2
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            self.vec_coeff = np.empty((nx, ny, 4), dtype=dtype)
-
-        needed = set([item for item in zip(i_x, i_y)])
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc[:, 0], unc[:, 1])
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc[:, 0], unc[:, 1], ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, i_y, :]
+        a = self._cell_coeffs((i_x, i_y), (4, ))
 
         val = a[:, 0] + (a[:, 1] + a[:, 3] * y) * x + a[:, 2] * y
 
@@ -740,17 +741,14 @@ class Interp3DSlinear(InterpAlgorithmFixed):
     ----------
     coeffs : dict of ndarray
         Cache of all computed coefficients.
-    vec_coeff : None or ndarray
-        Cache of all computed coefficients when running vectorized.
     """
 
     def __init__(self, grid, values, interp, **kwargs):
         """
         Initialize table and subtables.
         """
-        super().__init__(grid, values, interp)
+        super().__init__(grid, values, interp, **kwargs)
         self.coeffs = {}
-        self.vec_coeff = None
         self.k = 2
         self.dim = 3
         self.last_index = [0] * self.dim
@@ -992,19 +990,7 @@ class Interp3DSlinear(InterpAlgorithmFixed):
         i_y[i_y == ny - 1] = ny - 2
         i_z[i_z == nz - 1] = nz - 2
 
-        if self.vec_coeff is None:
-            self.coeffs = set()
-            self.vec_coeff = np.empty((nx, ny, nz, 8), dtype=dtype)
-
-        needed = set([item for item in zip(i_x, i_y, i_z)])
-        uncached = needed.difference(self.coeffs)
-        if len(uncached) > 0:
-            unc = np.array(list(uncached))
-            uncached_idx = (unc[:, 0], unc[:, 1], unc[:, 2])
-            a = self.compute_coeffs_vectorized(uncached_idx, dtype)
-            self.vec_coeff[unc[:, 0], unc[:, 1], unc[:, 2], ...] = a
-            self.coeffs.update(uncached)
-        a = self.vec_coeff[i_x, i_y, i_z, :]
+        a = self._cell_coeffs((i_x, i_y, i_z), (8, ))
 
         val = a[:, 0] + \
             (a[:, 1] + (a[:, 4] + a[:, 7] * z) * y) * x + \
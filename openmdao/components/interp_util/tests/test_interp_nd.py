@@ -3,6 +3,7 @@ Unit tests for the standalone interpolator.
 """
 from copy import deepcopy
 import unittest
+import warnings
 
 import numpy as np
 
@@ -837,6 +838,48 @@ class TestInterpNDPython(unittest.TestCase):
         assert_near_equal(dval3 - dval1, np.array([[0.0]]))
         assert_near_equal(dval5 - dval1, np.array([[0.0]]))
 
+    def test_vectorized_nd(self):
+        # The general N-D methods that are tensor products of 1D weights are evaluated for all
+        # points at once. Compare with the recursive per-point evaluation.
+        rng = np.random.default_rng(11)
+        grids = [np.sort(rng.random(n)) * 10 for n in (5, 7, 6, 8)]
+        values = rng.random([len(g) for g in grids])
+        x = np.column_stack([rng.uniform(-1., 11., 50) for g in grids])
+
+        for method in ('slinear', 'lagrange2', 'lagrange3'):
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grids, values=values, extrapolate=True)
+                self.assertTrue(interp.table.vectorized(x))
+                f, df_dx = interp.interpolate(x, compute_derivative=True)
+
+                for j in range(x.shape[0]):
+                    val, d_dx, _, _ = interp.table.evaluate(x[j])
+                    assert_near_equal(f[j], val, 1e-12)
+                    assert_near_equal(df_dx[j], d_dx.ravel(), 1e-12)
+
+                # complex step
+                xc = x.astype(complex)
+                xc[:, 2] += 1e-30j
+                fc = interp.interpolate(xc)
+                assert_near_equal(fc.imag * 1e30, df_dx[:, 2], 1e-12)
+
+    def test_vectorized_nd_training_gradients(self):
+        rng = np.random.default_rng(11)
+        grids = [np.sort(rng.random(n)) * 10 for n in (5, 7, 6)]
+        values = rng.random([len(g) for g in grids])
+        x = np.column_stack([rng.uniform(-1., 11., 20) for g in grids])
+
+        for method in ('slinear', 'lagrange2', 'lagrange3'):
+            with self.subTest(method=method):
+                interp = InterpND(method=method, points=grids, values=values, extrapolate=True)
+                interp._compute_d_dvalues = True
+                interp.interpolate(x)
+                self.assertTrue(interp.table.vectorized(x))
+
+                for j in range(x.shape[0]):
+                    assert_near_equal(interp._d_dvalues[j].ravel(),
+                                      interp.training_gradients(x[j]).ravel(), 1e-12)
+
     def test_cs_across_interpND(self):
         p1 = np.linspace(0, 100, 5)
         p2 = np.linspace(-10, 10, 5)
@@ -1281,7 +1324,108 @@ class TestInterpNDFixedPython(unittest.TestCase):
             f, df_dx = interp.interpolate(x_i, compute_derivative=True)
 
             assert_near_equal(f, f_base[j], 2e-10)
-            assert_near_equal(df_dx[0], df_dx_base[j, :], 2e-10)
+            assert_near_equal(df_dx[0], df_dx_base[j, :], 3e-10)
+
+    def test_coeff_cache(self):
+        p1 = np.linspace(0, 100, 25)
+        p2 = np.linspace(-10, 10, 15)
+        p3 = np.linspace(0, 1, 12)
+
+        P1, P2, P3 = np.meshgrid(p1, p2, p3, indexing='ij')
+        f_p = np.sqrt(P1) + P2 * P3
+
+        np.random.seed(11)
+        x = np.random.uniform(size=(200, 3)) * [104, 22, 1.4] - [2, 11, 0.2]
+
+        for method, ncells, cell_bytes in [('3D-slinear', 24 * 14 * 11, 64),
+                                           ('3D-lagrange2', 23 * 13 * 10, 216),
+                                           ('3D-lagrange3', 22 * 12 * 9, 512)]:
+            with self.subTest(method=method):
+                interp_base = InterpND(points=(p1, p2, p3), values=f_p, method=method,
+                                       extrapolate=True)
+                f_base, df_dx_base = interp_base.interpolate(x, compute_derivative=True)
+
+                info = interp_base.table.coeff_cache_info()
+                self.assertEqual(info['hits'] + info['misses'], 200)
+                f_base, df_dx_base = interp_base.interpolate(x, compute_derivative=True)
+                info2 = interp_base.table.coeff_cache_info()
+                self.assertEqual(info2['hits'], info['hits'] + 200)
+                self.assertEqual(info2['misses'], info['misses'])
+                self.assertEqual(info2['cells'], info['cells'])
+
+                # every valid cell computed up front
+                interp = InterpND(points=(p1, p2, p3), values=f_p, method=method,
+                                  extrapolate=True, coeff_cache='precompute')
+                f, df_dx = interp.interpolate(x, compute_derivative=True)
+                assert_near_equal(f, f_base, 1e-14)
+                assert_near_equal(df_dx, df_dx_base, 1e-14)
+                info = interp.table.coeff_cache_info()
+                self.assertEqual(info['cells'], ncells)
+                self.assertEqual(info['misses'], 0)
+                self.assertEqual(info['hits'], 200)
+
+                # bounded cache that can only hold a few cells, smaller than a single evaluation
+                interp = InterpND(points=(p1, p2, p3), values=f_p, method=method,
+                                  extrapolate=True, coeff_cache_max_bytes=10 * cell_bytes)
+                for i in range(3):
+                    f, df_dx = interp.interpolate(x, compute_derivative=True)
+                    assert_near_equal(f, f_base, 1e-14)
+                    assert_near_equal(df_dx, df_dx_base, 1e-14)
+
+                    f, df_dx = interp.interpolate(x[i * 5:i * 5 + 5], compute_derivative=True)
+                    assert_near_equal(f, f_base[i * 5:i * 5 + 5], 1e-14)
+                    assert_near_equal(df_dx, df_dx_base[i * 5:i * 5 + 5], 1e-14)
+
+                info = interp.table.coeff_cache_info()
+                self.assertEqual(info['max_cells'], 10)
+                self.assertEqual(info['cells'], 10)
+                self.assertEqual(info['nbytes'], 10 * cell_bytes)
+                self.assertEqual(info['hits'] + info['misses'], 3 * 205)
+
+                # cells used by the most recent evaluation stay cached
+                hits = info['hits']
+                interp.interpolate(x[10:15])
+                self.assertEqual(interp.table.coeff_cache_info()['hits'], hits + 5)
+
+    def test_coeff_cache_complex_step(self):
+        p1 = np.linspace(0, 100, 25)
+        p2 = np.linspace(-10, 10, 15)
+        p3 = np.linspace(0, 1, 12)
+
+        P1, P2, P3 = np.meshgrid(p1, p2, p3, indexing='ij')
+        f_p = np.sqrt(P1) + P2 * P3
+
+        np.random.seed(11)
+        x = np.random.uniform(size=(20, 3)) * [104, 22, 1.4] - [2, 11, 0.2]
+
+        for method, cell_bytes in [('3D-slinear', 64), ('3D-lagrange2', 216),
+                                   ('3D-lagrange3', 512)]:
+            with self.subTest(method=method):
+                interp = InterpND(points=(p1, p2, p3), values=f_p, method=method,
+                                  extrapolate=True, coeff_cache_max_bytes=10 * cell_bytes)
+
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error')
+
+                    f_base, df_dx_base = interp.interpolate(x, compute_derivative=True)
+                    self.assertEqual(f_base.dtype, np.float64)
+
+                    # complex step in the first input
+                    x_cs = x.astype(complex)
+                    x_cs[:, 0] += 1e-40j
+                    f_cs = interp.interpolate(x_cs)
+                    self.assertEqual(f_cs.dtype, np.complex128)
+                    assert_near_equal(f_cs.real, f_base, 1e-14)
+                    assert_near_equal(f_cs.imag * 1e40, df_dx_base[:, 0], 1e-10)
+
+                    # the cached coefficients stay real
+                    f, df_dx = interp.interpolate(x, compute_derivative=True)
+                    self.assertEqual(f.dtype, np.float64)
+                    self.assertEqual(df_dx.dtype, np.float64)
+                    assert_near_equal(f, f_base, 1e-14)
+                    assert_near_equal(df_dx, df_dx_base, 1e-14)
+
+                self.assertEqual(interp.table.coeff_cache_info()['nbytes'], 10 * cell_bytes)
 
     def test_deprecated_methods(self):
 
@@ -71,6 +71,9 @@ class MetaModelStructuredComp(ExplicitComponent):
                              desc='Number of points to evaluate at once.')
         self.options.declare('method', values=TABLE_METHODS, default='scipy_cubic',
                              desc='Spline interpolation method to use for all outputs.')
+        self.options.declare('interp_options', types=dict, default={},
+                             desc='Dict contains the name and value of options specific to the '
+                             'chosen interpolation method.')
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -145,13 +148,11 @@ class MetaModelStructuredComp(ExplicitComponent):
         """
         interp_method = self.options['method']
 
-        opts = {}
-        if 'interp_options' in self.options:
-            opts = self.options['interp_options']
+        opts = self.options['interp_options']
         for name, train_data in self.training_outputs.items():
             self.interps[name] = InterpND(method=interp_method,
                                           points=self.inputs, values=train_data,
-                                          extrapolate=self.options['extrapolate'])
+                                          extrapolate=self.options['extrapolate'], **opts)
 
         if self.options['training_data_gradients']:
             self.grad_shape = tuple([self.options['vec_size']] + [i.size for i in self.inputs])
@@ -110,6 +110,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         self.options.declare('vec_size', types=int, default=1, lower=1,
                              desc='Number of points that will be simultaneously predicted by '
                                   'the surrogate.')
+        self.options.declare('incremental_training', types=bool, default=False,
+                             desc='If True, when the training data only has new points appended '
+                                  'to the data that the surrogates were last trained with, '
+                                  'surrogates that support it add the new points with their '
+                                  'update method instead of retraining from scratch.')
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -371,12 +376,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
             elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
+                outputs[name] = np.reshape(predicted, outputs[name].shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
@@ -443,15 +447,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         arr = np.zeros((vec_size, self._input_size))
 
-        for row in range(vec_size):
-            idx = 0
-            for name, sz in self._surrogate_input_names:
-                val = vec[name]
-                if array_real and np.issubdtype(val.dtype, np.complexfloating):
-                    array_real = False
-                    arr = arr.astype(np.complexfloating)
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            val = vec[name]
+            if array_real and np.issubdtype(val.dtype, np.complexfloating):
+                array_real = False
+                arr = arr.astype(np.complexfloating)
+            arr[:, idx:idx + sz] = val.reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -529,7 +532,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
-            if vec_size > 1:
+            if vec_size > 1 and overrides_method('vectorized_linearize', surrogate,
+                                                 SurrogateModel):
+                derivs = surrogate.vectorized_linearize(flat_inputs)
+                idx = 0
+                for in_name, sz in self._surrogate_input_names:
+                    partials[out_name, in_name] = derivs[:, :, idx:idx + sz].ravel()
+                    idx += sz
+            elif vec_size > 1:
                 out_size = shape_to_len(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
@@ -574,6 +584,9 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             raise RuntimeError(f"{self.msginfo}: The following training data sets must be "
                                f"provided as options: {missing_training_data}")
 
+        old_inputs = self._training_input
+        old_outputs = self._training_output.copy()
+
         inputs = np.zeros((num_sample, self._input_size))
         self._training_input = inputs
 
@@ -590,6 +603,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
                     inputs[row_idx, idx:idx + sz] = v.flat
                 idx += sz
 
+        # Points previously trained on must be unchanged for an incremental update.
+        n_old = len(old_inputs)
+        incremental = (self.options['incremental_training'] and 0 < n_old < num_sample and
+                       np.array_equal(inputs[:n_old], old_inputs))
+
         # Assemble output data and train each output.
         for name, shape in self._surrogate_output_names:
             output_size = shape_to_len(shape)
@@ -609,6 +627,10 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             surrogate = self._metadata(name).get('surrogate')
             if surrogate is None:
                 raise RuntimeError(f"{self.msginfo}: No surrogate specified for output '{name}'")
+            elif (incremental and surrogate.trained and
+                  overrides_method('update', surrogate, SurrogateModel) and
+                  np.array_equal(outputs[:n_old], old_outputs[name])):
+                surrogate.update(inputs[n_old:], outputs[n_old:])
             else:
                 surrogate.train(self._training_input,
                                 self._training_output[name])
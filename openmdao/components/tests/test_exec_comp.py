@@ -21,7 +21,8 @@ import openmdao.api as om
 from openmdao.components.exec_comp import _expr_dict, _temporary_expr_dict
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_warning
 from openmdao.utils.general_utils import env_truthy
-from openmdao.utils.om_warnings import OMDeprecationWarning, SetupWarning
+from openmdao.utils.om_warnings import OMDeprecationWarning, SetupWarning, DerivativesWarning
+from openmdao.utils.testing_utils import use_tempdirs
 
 _ufunc_test_data = {
     'min': {
@@ -1930,6 +1931,90 @@ class TestFunctionRegistrationColoring(unittest.TestCase):
             self.assertTrue(np.all(comp._coloring_info['coloring'].get_dense_sparsity() == _MASK))
 
 
+@use_tempdirs
+class TestExecCompAnalyticDerivs(unittest.TestCase):
+
+    @parameterized.expand([
+        (['y=2*x**2+sin(x)*z'], dict(x=np.ones(5)*.3, z=np.ones(5)*.7, y=np.ones(5)),
+         {('y', 'x'): True, ('y', 'z'): True}),
+        (['y=sum(x*z)+exp(z[1])'], dict(x=np.ones(5)*.3, z=np.ones(5)*.7, y=1.),
+         {('y', 'x'): False, ('y', 'z'): False}),
+        (['y=x/z - s**x'], dict(x=np.arange(1, 4.), z=np.ones(3)*.7, s=2., y=np.ones(3)),
+         {('y', 'x'): True, ('y', 'z'): True, ('y', 's'): False}),
+        (['y=x[::2]*3', 'w=arctan2(x, s)+maximum(x, 2.)'],
+         dict(x=np.arange(1, 5.), s=.5, y=np.ones(2), w=np.ones(4)),
+         {('y', 'x'): False, ('w', 'x'): True, ('w', 's'): False}),
+        (['y=tanh(x) + 3.'], dict(x=np.ones(4), y=np.ones(4)), {('y', 'x'): True}),
+        (['y=a*x + 3.'], dict(x=np.ones(4), y=np.ones(4), a={'val': 2., 'constant': True}),
+         {('y', 'x'): True}),
+    ], name_func=lambda f, n, p: 'test_analytic_' + str(n))
+    def test_analytic(self, exprs, kwargs, diags):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp(exprs, derivs_method='analytic',
+                                                            **kwargs))
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        declared = {key: meta.get('rows') is not None
+                    for key, meta in comp._declared_partials.items()}
+        self.assertEqual(declared, diags)
+
+        data = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(data, atol=1e-10, rtol=1e-10)
+
+    def test_structurally_zero(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp('y=2*x + 0*z',
+                                                            derivs_method='analytic'))
+        prob.setup()
+        prob.final_setup()
+
+        # partials multiplied by a constant zero are still declared
+        self.assertEqual(sorted(comp._declared_partials), [('y', 'x'), ('y', 'z')])
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp(['y=2*x', 'w=z**2'],
+                                                            derivs_method='analytic'))
+        prob.setup()
+        prob.final_setup()
+        self.assertEqual(sorted(comp._declared_partials), [('w', 'z'), ('y', 'x')])
+
+    def test_fallback_to_cs(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y=-x.dot(x)', x=np.arange(1, 5.),
+                                                     derivs_method='analytic'))
+
+        msg = ("'comp' <class ExecComp>: Partials can't be computed analytically because Call "
+               "expressions in 'y=-x.dot(x)' are not supported, so complex step will be used "
+               "instead.")
+        prob.setup(force_alloc_complex=True)
+        with assert_warning(DerivativesWarning, msg):
+            prob.final_setup()
+
+        prob.run_model()
+        J = prob.compute_totals('comp.y', 'comp.x')
+        assert_near_equal(J['comp.y', 'comp.x'], -2. * np.arange(1, 5.)[np.newaxis, :])
+
+    def test_under_complex_step(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', om.ExecComp('y=3*x**2 + z', x=np.ones(3), z=np.ones(3),
+                                                y=np.ones(3), derivs_method='analytic'))
+        model.add_subsystem('comp2', om.ExecComp('w=sum(y)', y=np.ones(3),
+                                                 derivs_method='analytic'))
+        model.connect('comp.y', 'comp2.y')
+        model.approx_totals(method='cs')
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('comp.x', [1., 2., 3.])
+        prob.run_model()
+
+        totals = prob.check_totals(of=['comp2.w'], wrt=['comp.x', 'comp.z'], method='fd',
+                                   out_stream=None)
+        for key, data in totals.items():
+            assert_near_equal(data['rel error'][0], 0., 1e-5)
+
+
 class TestExecCompParameterized(unittest.TestCase):
 
     @parameterized.expand(itertools.product([
@@ -1304,6 +1304,42 @@ class TestMetaModelStructuredPython(unittest.TestCase):
         # Derivatives have large magniudes, so tols are high.
         assert_check_totals(totals, atol=1e3, rtol=1e-4)
 
+    def test_interp_options_coeff_cache(self):
+        prob = om.Problem()
+        model = prob.model
+
+        mapdata = SampleMap()
+
+        params = mapdata.param_data
+        outs = mapdata.output_data
+
+        comp = om.MetaModelStructuredComp(method='3D-lagrange3', extrapolate=True, vec_size=3,
+                                          interp_options={'coeff_cache': 'precompute'})
+
+        for param in params:
+            comp.add_input(param['name'], np.array([param['default'], param['default'], param['default']]),
+                           param['values'], units=param['units'])
+
+        for out in outs:
+            comp.add_output(out['name'], np.array([out['default'], out['default'], out['default']]),
+                            out['values'])
+
+        model.add_subsystem('comp', comp, promotes=["*"])
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('x', np.array([1.0, 10.0, 90.0]))
+        prob.set_val('y', np.array([0.75, 0.81, 1.2]))
+        prob.set_val('z', np.array([-1.7, 1.1, 2.1]))
+
+        prob.run_model()
+
+        info = comp.interps['f'].table.coeff_cache_info()
+        self.assertEqual(info['misses'], 0)
+        self.assertEqual(info['hits'], 3)
+
+        totals = prob.check_totals(of='f', wrt=['x', 'y', 'z'], out_stream=None)
+        assert_check_totals(totals, atol=1e3, rtol=1e-4)
+
     def test_deprecated(self):
         # Make sure deprecated methods are still in the table_methods list.
         om.MetaModelStructuredComp(method='trilinear')
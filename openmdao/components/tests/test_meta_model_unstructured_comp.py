@@ -625,6 +625,101 @@ class MetaModelTestCase(unittest.TestCase):
 
         assert_check_partials(data, atol=1e-11, rtol=1e-11)
 
+    def test_vectorized_surrogates(self):
+        vec_size = 7
+        rng = np.random.RandomState(3)
+
+        train_x = rng.rand(30, 2)
+        train_y = np.sin(3. * train_x[:, :1]) * train_x[:, 1:] + train_x[:, :1] ** 2
+        train_y = np.hstack([train_y, train_y ** 2])
+        x = rng.rand(vec_size, 1) * .8 + .1
+        xx = rng.rand(vec_size) * .8 + .1
+
+        surrogates = {
+            'kriging': om.KrigingSurrogate(eval_rmse=True),
+            'response_surface': om.ResponseSurface(),
+            'linear': om.NearestNeighbor(interpolant_type='linear'),
+            'weighted': om.NearestNeighbor(interpolant_type='weighted'),
+            'rbf': om.NearestNeighbor(interpolant_type='rbf', num_neighbors=8),
+        }
+
+        for name, surrogate in surrogates.items():
+            with self.subTest(surrogate=name):
+                mm = om.MetaModelUnStructuredComp(vec_size=vec_size,
+                                                  default_surrogate=surrogate)
+                mm.add_input('x', np.zeros((vec_size, 1)), training_data=train_x[:, :1])
+                mm.add_input('xx', np.zeros(vec_size), training_data=train_x[:, 1])
+                mm.add_output('y', np.zeros((vec_size, 2)), training_data=train_y)
+
+                prob = om.Problem()
+                prob.model.add_subsystem('mm', mm)
+                prob.setup()
+
+                prob.set_val('mm.x', x)
+                prob.set_val('mm.xx', xx)
+                prob.run_model()
+
+                # the vectorized predictions and derivatives must match the point by point ones
+                surrogate = mm._metadata('y')['surrogate']
+                pts = np.hstack([x, xx[:, np.newaxis]])
+                expected_y = []
+                for pt in pts:
+                    pred = surrogate.predict(pt.copy())
+                    if isinstance(pred, tuple):  # rmse option
+                        pred = pred[0]
+                    expected_y.append(np.ravel(pred))
+                assert_near_equal(prob.get_val('mm.y'), expected_y, 1e-10)
+
+                expected_jac = np.array([surrogate.linearize(pt.copy()) for pt in pts])
+                J = prob.compute_totals(of=['mm.y'], wrt=['mm.x', 'mm.xx'],
+                                        return_format='array')
+                for i in range(vec_size):
+                    assert_near_equal(J[2 * i:2 * i + 2, i], expected_jac[i, :, 0], 1e-10)
+                    assert_near_equal(J[2 * i:2 * i + 2, vec_size + i], expected_jac[i, :, 1],
+                                      1e-10)
+
+    def test_incremental_training(self):
+        rng = np.random.RandomState(5)
+        train_x = rng.rand(25, 2)
+        train_y = np.sin(3. * train_x[:, 0]) * train_x[:, 1]
+        new_x = rng.rand(3, 2)
+        new_y = np.sin(3. * new_x[:, 0]) * new_x[:, 1]
+
+        for incremental in (True, False):
+            with self.subTest(incremental_training=incremental):
+                mm = om.MetaModelUnStructuredComp(incremental_training=incremental)
+                mm.add_input('x', 0., training_data=train_x[:, 0])
+                mm.add_input('xx', 0., training_data=train_x[:, 1])
+                mm.add_output('y', 0., training_data=train_y,
+                              surrogate=om.KrigingSurrogate(training_method='cholesky'))
+
+                prob = om.Problem()
+                prob.model.add_subsystem('mm', mm)
+                prob.setup()
+                prob.run_model()
+
+                surrogate = mm._metadata('y')['surrogate']
+                thetas = surrogate.thetas.copy()
+
+                # append new training points and retrain
+                mm.options['train_x'] = np.concatenate((train_x[:, 0], new_x[:, 0]))
+                mm.options['train_xx'] = np.concatenate((train_x[:, 1], new_x[:, 1]))
+                mm.options['train_y'] = np.concatenate((train_y, new_y))
+                mm.train = True
+
+                prob.set_val('mm.x', new_x[1, 0])
+                prob.set_val('mm.xx', new_x[1, 1])
+                prob.run_model()
+
+                self.assertEqual(surrogate.n_samples, 28)
+                assert_near_equal(prob.get_val('mm.y'), new_y[1], 1e-4)
+
+                # an update keeps the hyper-parameters, a full training searches for new ones
+                if incremental:
+                    assert_near_equal(surrogate.thetas, thetas, 1e-15)
+                else:
+                    self.assertFalse(np.allclose(surrogate.thetas, thetas))
+
     def test_metamodel_feature_vector(self):
         # Like simple sine example, but with input of length n instead of scalar
         # The expected behavior is that the output is also of length n, with
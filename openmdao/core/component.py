@@ -1209,7 +1209,8 @@ class Component(System):
                          perturb_size=_DEFAULT_COLORING_META['perturb_size'],
                          min_improve_pct=_DEFAULT_COLORING_META['min_improve_pct'],
                          show_summary=_DEFAULT_COLORING_META['show_summary'],
-                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity']):
+                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity'],
+                         probe_sparsity=_DEFAULT_COLORING_META['probe_sparsity']):
         """
         Set options for deriv coloring of a set of wrt vars matching the given pattern(s).
 
@@ -1245,11 +1246,14 @@ class Component(System):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        probe_sparsity : bool
+            If True, determine the sparsity of the partial jacobian using a few random
+            directional derivatives rather than computing every column num_full_jacs times.
         """
         super().declare_coloring(wrt, method, form, step, per_instance,
                                  num_full_jacs,
                                  tol, orders, perturb_size, min_improve_pct,
-                                 show_summary, show_sparsity)
+                                 show_summary, show_sparsity, probe_sparsity)
 
         # create approx partials for all matches
         meta = self.declare_partials('*', wrt, method=method, step=step, form=form)
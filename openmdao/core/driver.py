@@ -1075,7 +1075,8 @@ class Driver(object):
                          perturb_size=coloring_mod._DEF_COMP_SPARSITY_ARGS['perturb_size'],
                          min_improve_pct=coloring_mod._DEF_COMP_SPARSITY_ARGS['min_improve_pct'],
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
-                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity']):
+                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
+                         use_cache=False, num_workers=1):
         """
         Set options for total deriv coloring.
 
@@ -1096,6 +1097,13 @@ class Driver(object):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        use_cache : bool
+            If True, save the generated coloring to a file in the coloring directory whose name
+            is based on a hash of the model structure, design variables and responses, and reuse
+            it instead of computing a new coloring whenever that hash matches in later runs.
+        num_workers : int
+            Number of forked worker processes used to compute the num_full_jacs total jacobians
+            of the sparsity computation concurrently when running on a single process.
         """
         self._coloring_info['num_full_jacs'] = num_full_jacs
         self._coloring_info['tol'] = tol
@@ -1109,6 +1117,8 @@ class Driver(object):
         self._coloring_info['coloring'] = None
         self._coloring_info['show_summary'] = show_summary
         self._coloring_info['show_sparsity'] = show_sparsity
+        self._coloring_info['use_cache'] = use_cache
+        self._coloring_info['num_workers'] = num_workers
 
     def use_fixed_coloring(self, coloring=coloring_mod._STD_COLORING_FNAME):
         """
@@ -23,6 +23,8 @@ class ExplicitComponent(Component):
     ----------
     _has_compute_partials : bool
         If True, the instance overrides compute_partials.
+    _has_compute_batch : bool
+        If True, the instance overrides compute_batch.
     """
 
     def __init__(self, **kwargs):
@@ -32,8 +34,23 @@ class ExplicitComponent(Component):
         super().__init__(**kwargs)
 
         self._has_compute_partials = overrides_method('compute_partials', self, ExplicitComponent)
+        self._has_compute_batch = overrides_method('compute_batch', self, ExplicitComponent)
         self.options.undeclare('assembled_jac_type')
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('skip_if_inputs_unchanged', types=bool, default=False,
+                             desc='If True, skip calling compute when neither the inputs nor '
+                                  'the outputs have changed since the last call.')
+        self.options.declare('skip_inputs_tol', types=float, default=0., lower=0.,
+                             desc='Tolerance used when comparing inputs and outputs to those '
+                                  'of the last call if skip_if_inputs_unchanged is True. '
+                                  'Values are compared exactly if this is 0.')
+
     @property
     def nonlinear_solver(self):
         """
@@ -303,14 +320,56 @@ class ExplicitComponent(Component):
 
         self.iter_count_apply += 1
 
+    def _apply_nonlinear_batch(self, in_data):
+        """
+        Compute residuals for a batch of input points with a single call to compute_batch.
+
+        Parameters
+        ----------
+        in_data : ndarray
+            Array of shape (npoints, len(inputs)) containing the input vector data of each point.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (npoints, len(outputs)) containing the residual data of each point.
+        """
+        npts = in_data.shape[0]
+        meta = self._var_rel2meta
+        plen = len(self.pathname) + 1 if self.pathname else 0
+
+        inputs = {}
+        for abs_name, slc in self._inputs.get_slice_dict().items():
+            name = abs_name[plen:]
+            inputs[name] = in_data[:, slc].reshape((npts,) + meta[name]['shape'])
+
+        out_slices = {abs_name[plen:]: slc
+                      for abs_name, slc in self._outputs.get_slice_dict().items()}
+        outputs = {name: np.zeros((npts,) + meta[name]['shape'], dtype=in_data.dtype)
+                   for name in out_slices}
+
+        self.compute_batch(inputs, outputs)
+        self.iter_count_apply += 1
+
+        # residuals have the same sign as in _apply_nonlinear
+        resids = np.empty((npts, len(self._outputs)), dtype=in_data.dtype)
+        for name, slc in out_slices.items():
+            resids[:, slc] = np.reshape(outputs[name], (npts, -1))
+        resids -= self._outputs.asarray()
+
+        return resids
+
     def _solve_nonlinear(self):
         """
         Compute outputs. The model is assumed to be in a scaled state.
         """
         with Recording(self.pathname + '._solve_nonlinear', self.iter_count, self):
-            with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
-                self._residuals.set_val(0.0)
-                self._compute_wrapper()
+            if not self._can_skip_solve_nonlinear():
+                with self._unscaled_context(outputs=[self._outputs],
+                                            residuals=[self._residuals]):
+                    self._residuals.set_val(0.0)
+                    self._compute_wrapper()
+                self._save_skip_cache()
 
             # Iteration counter is incremented in the Recording context manager at exit.
 
@@ -510,6 +569,9 @@ class ExplicitComponent(Component):
 
         self._check_first_linearize()
 
+        if self._lin_point_is_current():
+            return
+
         with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
             # Computing the approximation before the call to compute_partials allows users to
             # override FD'd values.
@@ -520,6 +582,8 @@ class ExplicitComponent(Component):
                 # We used to negate the jacobian here, and then re-negate after the hook.
                 self._compute_partials_wrapper()
 
+        self._save_lin_point()
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Compute outputs given inputs. The model is assumed to be in an unscaled state.
@@ -537,6 +601,26 @@ class ExplicitComponent(Component):
         """
         pass
 
+    def compute_batch(self, inputs, outputs):
+        """
+        Compute outputs for a batch of input points at once.
+
+        If this is overridden, partials approximated using 'cs' or 'fd' are computed by calling
+        this once for all perturbed points of each 'wrt' variable (or once for all colors if
+        approx coloring is active) rather than calling compute once per point.  It is not used
+        if the component has discrete variables, output scaling or is running under MPI.
+
+        Parameters
+        ----------
+        inputs : dict
+            Input values keyed by name, each having a leading batch axis followed by the shape
+            of the variable.
+        outputs : dict
+            Output arrays keyed by name, each having a leading batch axis followed by the shape
+            of the variable.  Values may be set in place or replaced.
+        """
+        pass
+
     def compute_partials(self, inputs, partials, discrete_inputs=None):
         """
         Compute sub-jacobian parts. The model is assumed to be in an unscaled state.
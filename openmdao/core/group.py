@@ -10,7 +10,6 @@ from fnmatch import fnmatchcase
 from difflib import get_close_matches
 
 import numpy as np
-import networkx as nx
 
 from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
 from openmdao.core.system import System, collect_errors
@@ -129,6 +128,14 @@ class _PromotesInfo(object):
         return mismatches
 
 
+def _run_apply_nonlinear(subsys):
+    subsys._apply_nonlinear()
+
+
+def _linearize_linear_solver(subsys):
+    subsys._linear_solver._linearize()
+
+
 class Group(System):
     """
     Class used to group systems together; instantiate or inherit.
@@ -181,6 +188,8 @@ class Group(System):
         Dynamic shape dependency graph, or None.
     _shape_knowns : set
         Set of shape dependency graph nodes with known (non-dynamic) shapes.
+    _thread_pool : _ThreadPool or None
+        Pool used to run local subsystems concurrently.  Only set by a ParallelGroup.
     """
 
     def __init__(self, **kwargs):
@@ -207,6 +216,7 @@ class Group(System):
         self._order_set = False
         self._shapes_graph = None
         self._shape_knowns = None
+        self._thread_pool = None
 
         # TODO: we cannot set the solvers with property setters at the moment
         # because our lint check thinks that we are defining new attributes
@@ -216,6 +226,21 @@ class Group(System):
         if not self._linear_solver:
             self._linear_solver = LinearRunOnce()
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('skip_if_inputs_unchanged', types=bool, default=False,
+                             desc='If True, skip running the nonlinear solver of this group when '
+                                  'neither its inputs nor its outputs have changed since the '
+                                  'last run.')
+        self.options.declare('skip_inputs_tol', types=float, default=0., lower=0.,
+                             desc='Tolerance used when comparing inputs and outputs to those '
+                                  'of the last run if skip_if_inputs_unchanged is True. '
+                                  'Values are compared exactly if this is 0.')
+
     def setup(self):
         """
         Build this group.
@@ -1689,6 +1714,8 @@ class Group(System):
                     rev[src] = [tgt]
             return rev
 
+        import networkx as nx
+
         self._shapes_graph = graph = nx.Graph()
         self._shape_knowns = knowns = set()
         dist_sz = {}  # local distrib sizes
@@ -2523,11 +2550,24 @@ class Group(System):
         """
         self._transfer('nonlinear', 'fwd')
         # Apply recursion
-        for subsys in self._subsystems_myproc:
-            subsys._apply_nonlinear()
+        self._map_subsystems(_run_apply_nonlinear, self._subsystems_myproc)
 
         self.iter_count_apply += 1
 
+    def _map_subsystems(self, func, subsystems):
+        """
+        Call the given function on each of the given local subsystems.
+
+        Parameters
+        ----------
+        func : function
+            Function taking a subsystem as its only argument.
+        subsystems : list of System
+            Local subsystems to pass to func.
+        """
+        for subsys in subsystems:
+            func(subsys)
+
     def _solve_nonlinear(self):
         """
         Compute outputs. The model is assumed to be in a scaled state.
@@ -2535,7 +2575,9 @@ class Group(System):
         name = self.pathname if self.pathname else 'root'
 
         with Recording(name + '._solve_nonlinear', self.iter_count, self):
-            self._nonlinear_solver._solve_with_cache_check()
+            if not self._can_skip_solve_nonlinear():
+                self._nonlinear_solver._solve_with_cache_check()
+                self._save_skip_cache()
 
         # Iteration counter is incremented in the Recording context manager at exit.
 
@@ -2653,9 +2695,12 @@ class Group(System):
                             # zero out dvecs of irrelevant subsystems
                             s._dresiduals.set_val(0.0)
 
-            for subsys in self._subsystems_myproc:
-                if rel_systems is None or subsys.pathname in rel_systems:
-                    subsys._apply_linear(jac, rel_systems, mode, scope_out, scope_in)
+            def apply_linear(subsys):
+                subsys._apply_linear(jac, rel_systems, mode, scope_out, scope_in)
+
+            self._map_subsystems(apply_linear,
+                                 [s for s in self._subsystems_myproc
+                                  if rel_systems is None or s.pathname in rel_systems])
 
             if mode == 'rev':
                 self._transfer('linear', mode)
@@ -2731,6 +2776,8 @@ class Group(System):
 
         # Group finite difference
         if self._owns_approx_jac:
+            # the approximated jacobian depends on the requested totals, so always recompute it
+            self._problem_meta['linearize_count'] += 1
 
             jac = self._jacobian
             if self.pathname == "":
@@ -2747,24 +2794,27 @@ class Group(System):
             if self._assembled_jac is not None:
                 jac = self._assembled_jac
 
+            def linearize(subsys):
+                do_ln = sub_do_ln and (subsys._linear_solver is not None and
+                                       subsys._linear_solver._linearize_children())
+                if len(subsys._subsystems_allprocs) > 0:
+                    subsys._linearize(jac, sub_do_ln=do_ln, rel_systems=rel_systems)
+                else:
+                    subsys._linearize(jac, sub_do_ln=do_ln)
+
             # Only linearize subsystems if we aren't approximating the derivs at this level.
-            for subsys in self._subsystems_myproc:
-                if subsys.pathname in rel_systems:
-                    do_ln = sub_do_ln and (subsys._linear_solver is not None and
-                                           subsys._linear_solver._linearize_children())
-                    if len(subsys._subsystems_allprocs) > 0:
-                        subsys._linearize(jac, sub_do_ln=do_ln, rel_systems=rel_systems)
-                    else:
-                        subsys._linearize(jac, sub_do_ln=do_ln)
+            self._map_subsystems(linearize, [s for s in self._subsystems_myproc
+                                             if s.pathname in rel_systems])
 
             # Update jacobian
             if self._assembled_jac is not None:
-                self._assembled_jac._update(self)
+                self._update_assembled_jac()
 
             if sub_do_ln:
-                for subsys in self._subsystems_myproc:
-                    if subsys._linear_solver is not None and subsys.pathname in rel_systems:
-                        subsys._linear_solver._linearize()
+                self._map_subsystems(_linearize_linear_solver,
+                                     [s for s in self._subsystems_myproc
+                                      if s._linear_solver is not None and
+                                      s.pathname in rel_systems])
 
     def _check_first_linearize(self):
         if self._first_call_to_linearize:
@@ -3194,6 +3244,8 @@ class Group(System):
             A directed graph containing names of subsystems and their connections.
         """
         input_srcs = self._conn_global_abs_in2out
+        import networkx as nx
+
         glen = len(self.pathname.split('.')) if self.pathname else 0
         graph = nx.DiGraph()
 
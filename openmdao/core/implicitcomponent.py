@@ -346,16 +346,19 @@ class ImplicitComponent(Component):
         """
         self._check_first_linearize()
 
-        with self._unscaled_context(outputs=[self._outputs]):
-            # Computing the approximation before the call to compute_partials allows users to
-            # override FD'd values.
-            for approximation in self._approx_schemes.values():
-                approximation.compute_approximations(self, jac=self._jacobian)
+        if not self._lin_point_is_current():
+            with self._unscaled_context(outputs=[self._outputs]):
+                # Computing the approximation before the call to compute_partials allows users to
+                # override FD'd values.
+                for approximation in self._approx_schemes.values():
+                    approximation.compute_approximations(self, jac=self._jacobian)
+
+                self._linearize_wrapper()
 
-            self._linearize_wrapper()
+            self._save_lin_point()
 
         if (jac is None or jac is self._assembled_jac) and self._assembled_jac is not None:
-            self._assembled_jac._update(self)
+            self._update_assembled_jac()
 
     def add_output(self, name, val=1.0, **kwargs):
         """
@@ -1,12 +1,103 @@
 """Define the ParallelGroup class."""
 
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from openmdao.core.group import Group
+from openmdao.utils.om_warnings import issue_warning
+
+
+class _ThreadPool(object):
+    """
+    Pool of threads that is started on first use in each process.
+
+    Worker threads aren't copied into a child process created by fork (e.g. the worker pools of
+    DOEDriver or of approximated derivatives), so an executor inherited from the parent would
+    never run the calls submitted to it.  A new executor is started whenever the pool is used
+    from a process other than the one that started the current executor.
+
+    Parameters
+    ----------
+    num_threads : int
+        Number of threads in the pool.
+    name : str
+        Prefix of the names of the threads.
+
+    Attributes
+    ----------
+    _executor : ThreadPoolExecutor or None
+        Executor running the calls, or None if not started.
+    _finalizer : weakref.finalize or None
+        Finalizer that shuts down the executor when the pool is garbage collected.
+    _name : str
+        Prefix of the names of the threads.
+    _num_threads : int
+        Number of threads in the pool.
+    _pid : int or None
+        Id of the process that started the executor.
+    """
+
+    def __init__(self, num_threads, name):
+        """
+        Initialize attributes.
+        """
+        self._num_threads = num_threads
+        self._name = name
+        self._executor = None
+        self._finalizer = None
+        self._pid = None
+
+    def submit(self, func, *args):
+        """
+        Schedule func(*args) to run in the pool, starting the pool's threads if needed.
+
+        Parameters
+        ----------
+        func : function
+            Function to run.
+        *args : list
+            Arguments passed to func.
+
+        Returns
+        -------
+        Future
+            Future holding the result of the call.
+        """
+        if self._pid != os.getpid():
+            if self._finalizer is not None:
+                # inherited from the parent process, where its threads still live
+                self._finalizer.detach()
+            self._executor = ThreadPoolExecutor(max_workers=self._num_threads,
+                                                thread_name_prefix=self._name)
+            self._finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
+            self._pid = os.getpid()
+
+        return self._executor.submit(func, *args)
+
+    def shutdown(self):
+        """
+        Stop the threads of the pool.  They are started again if the pool is used again.
+        """
+        if self._finalizer is not None and self._pid == os.getpid():
+            self._finalizer()
+        self._executor = self._finalizer = self._pid = None
 
 
 class ParallelGroup(Group):
     """
     Class used to group systems together to be executed in parallel.
 
+    When running on a single process, setting the 'num_threads' option to a value greater
+    than 1 runs the local subsystems concurrently in a pool of threads during
+    solve_nonlinear, apply_nonlinear, linearize, apply_linear and solve_linear.  As when
+    running under MPI, all data transfers into the subsystems happen before any of them
+    run, so the subsystems should not depend on each other.  The subsystems must also be
+    thread safe, meaning that they may not modify any shared state (for example module level
+    globals or objects shared between subsystems) while running.  Only code that releases
+    the GIL, e.g. numpy/BLAS calls or external processes, will actually run in parallel.
+    Case recording and solver iteration printing below the group may interleave.
+
     Parameters
     ----------
     **kwargs : dict
@@ -20,6 +111,17 @@ class ParallelGroup(Group):
         super().__init__(**kwargs)
         self._mpi_proc_allocator.parallel = True
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run local subsystems concurrently '
+                                  'when this group runs on a single process. Subsystems run '
+                                  'in threads must be thread safe.')
+
     def _configure(self):
         """
         Configure our model recursively to assign any children settings.
@@ -29,3 +131,65 @@ class ParallelGroup(Group):
         super()._configure()
         if self.comm.size > 1:
             self._has_guess = any(self.comm.allgather(self._has_guess))
+
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+        nthreads = min(self.options['num_threads'], len(self._subsystems_myproc))
+        if nthreads > 1 and self.comm.size == 1:
+            self._thread_pool = _ThreadPool(nthreads, self.pathname)
+            for s in self.system_iter(recurse=True):
+                if s._rec_mgr.has_recorders() or \
+                        any(solver is not None and solver._rec_mgr.has_recorders()
+                            for solver in (s._nonlinear_solver, s._linear_solver)):
+                    issue_warning("Subsystems are run in multiple threads, so the iteration "
+                                  "coordinates of cases recorded below this group may be "
+                                  "incorrect.", prefix=self.msginfo)
+                    break
+
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+
+    def _setup_connections(self):
+        """
+        Compute dict of all connections owned by this Group.
+        """
+        super()._setup_connections()
+
+        if self._thread_pool is not None and self._conn_abs_in2out:
+            conns = ', '.join(f"'{src}' -> '{tgt}'"
+                              for tgt, src in sorted(self._conn_abs_in2out.items()))
+            issue_warning("Subsystems are run concurrently in multiple threads, so data passed "
+                          f"between them through connections [{conns}] will lag by one "
+                          "iteration.", prefix=self.msginfo)
+
+    def _map_subsystems(self, func, subsystems):
+        """
+        Call the given function on each of the given local subsystems.
+
+        If a thread pool is active, the calls are made concurrently.
+
+        Parameters
+        ----------
+        func : function
+            Function taking a subsystem as its only argument.
+        subsystems : list of System
+            Local subsystems to pass to func.
+        """
+        if self._thread_pool is None or len(subsystems) < 2:
+            super()._map_subsystems(func, subsystems)
+            return
+
+        futures = [self._thread_pool.submit(func, subsys) for subsys in subsystems]
+        wait(futures)
+
+        # re-raise the first exception (if any) after all of the subsystems have finished
+        for future in futures:
+            future.result()
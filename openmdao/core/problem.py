@@ -275,6 +275,17 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('lazy_linearization', types=bool, default=False,
+                             desc='If True, systems whose inputs and outputs have not changed '
+                                  'since their partial derivatives were last computed will not '
+                                  'recompute them when linearized. Partial derivatives must '
+                                  'then depend only on the values of inputs and outputs.')
+        self.options.declare('setup_cache_dir', types=str, default=None, allow_none=True,
+                             desc='If set, data computed during setup that depends only on the '
+                                  'structure of the model, like derivative relevance and transfer '
+                                  'indices, is stored in this directory and reused by later '
+                                  'setups of an identical model. Only used when not running '
+                                  'under MPI.')
         self.options.update(options)
 
         # Case recording options
@@ -944,6 +955,11 @@ class Problem(object):
             'reports_dir': self.get_reports_dir(),  # directory where reports will be written
             'saved_errors': [],  # store setup errors here until after final_setup
             'checking': False,  # True if check_totals or check_partials is running
+            'lazy_linearization': self.options['lazy_linearization'],  # skip linearization of
+                                                                        # unchanged systems
+            'linearize_count': 0,  # number of times partials have been computed in any system
+            'setup_cache_dir': self.options['setup_cache_dir'],  # dir for cached setup data
+            'setup_cache': None,  # SetupCache for this model, created during setup if enabled
         }
         model._setup(model_comm, mode, self._metadata)
 
@@ -984,6 +1000,9 @@ class Problem(object):
         if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
             self.model._final_setup(self.comm)
 
+            if self._metadata['setup_cache'] is not None:
+                self._metadata['setup_cache'].save()
+
         # If set_solver_print is called after an initial run, in a multi-run scenario,
         #  this part of _final_setup still needs to happen so that change takes effect
         #  in subsequent runs
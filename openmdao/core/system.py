@@ -15,7 +15,6 @@ from fnmatch import fnmatchcase
 from numbers import Integral
 
 import numpy as np
-import networkx as nx
 
 from openmdao.core.configinfo import _ConfigInfo
 from openmdao.core.constants import _DEFAULT_OUT_STREAM, _UNDEFINED, INT_DTYPE, INF_BOUND, \
@@ -30,6 +29,9 @@ from openmdao.utils.units import is_compatible, unit_conversion, simplify_unit
 from openmdao.utils.variable_table import write_var_table
 from openmdao.utils.array_utils import evenly_distrib_idxs, shape_to_len
 from openmdao.utils.name_maps import name2abs_name, name2abs_names
+from openmdao.utils.relevance import get_relevance
+from openmdao.utils.setup_cache import SetupCache, _get_setup_cache_key
+from openmdao.utils.concurrent import _fork_supported
 from openmdao.utils.coloring import _compute_coloring, Coloring, \
     _STD_COLORING_FNAME, _DEF_COMP_SPARSITY_ARGS, _ColSparsityJac
 import openmdao.utils.coloring as coloring_mod
@@ -66,6 +68,7 @@ _DEFAULT_COLORING_META = {
     'dynamic': False,  # True if dynamic coloring is being used
     'static': None,  # either _STD_COLORING_FNAME, a filename, or a Coloring object
     # if use_fixed_coloring was called
+    'probe_sparsity': False,  # if True, find sparsity using random directional probes
 }
 
 _DEFAULT_COLORING_META.update(_DEF_COMP_SPARSITY_ARGS)
@@ -194,6 +197,9 @@ class System(object):
     ----------
     num_par_fd : int
         If FD is active, number of concurrent FD solves.
+    num_fd_workers : int
+        If FD or CS is active and this system is not running under MPI, number of forked worker
+        processes used to evaluate perturbations concurrently.
     **kwargs : dict of keyword arguments
         Keyword arguments that will be mapped into the System options.
 
@@ -226,11 +232,22 @@ class System(object):
     iter_count_without_approx : int
         Counts the number of times the system has iterated but excludes any that occur during
         approximation of derivatives.
+    iter_count_skipped : int
+        Counts the number of times _solve_nonlinear reused the results of the previous
+        evaluation because the 'skip_if_inputs_unchanged' option is set and nothing changed.
     cite : str
         Listing of relevant citations that should be referenced when
         publishing work that uses this class.
     _full_comm : MPI.Comm or None
         MPI communicator object used when System's comm is split for parallel FD.
+    _lin_point : tuple or None
+        The jacobian along with copies of the input and output arrays at the point where
+        partials were last computed, used when the Problem 'lazy_linearization' option is set.
+    _asm_jac_lin_count : int or None
+        Value of the problem level linearize count when our assembled jacobian was last updated.
+    _skip_cache : tuple of ndarray or None
+        Copies of the input, output, and residual arrays saved after the last evaluation, used
+        to detect when an evaluation can be skipped.
     _solver_print_cache : list
         Allows solver iprints to be set to requested values after setup calls.
     _subsystems_allprocs : dict
@@ -389,6 +406,9 @@ class System(object):
     _num_par_fd : int
         If FD is active, and the value is > 1, turns on parallel FD and specifies the number of
         concurrent FD solves.
+    _num_fd_workers : int
+        If FD or CS is active, and the value is > 1, number of forked worker processes used to
+        evaluate perturbations concurrently when not running under MPI.
     _par_fd_id : int
         ID used to determine which columns in the jacobian will be computed when using parallel FD.
     _has_approx : bool
@@ -410,7 +430,7 @@ class System(object):
     _output_solver_options : dict
     """
 
-    def __init__(self, num_par_fd=1, **kwargs):
+    def __init__(self, num_par_fd=1, num_fd_workers=1, **kwargs):
         """
         Initialize all attributes.
         """
@@ -449,9 +469,13 @@ class System(object):
         self.iter_count = 0
         self.iter_count_apply = 0
         self.iter_count_without_approx = 0
+        self.iter_count_skipped = 0
 
         self.cite = ""
 
+        self._skip_cache = None
+        self._lin_point = None
+        self._asm_jac_lin_count = None
         self._solver_print_cache = []
 
         self._subsystems_allprocs = {}
@@ -522,6 +546,7 @@ class System(object):
         self._scope_cache = {}
 
         self._num_par_fd = num_par_fd
+        self._num_fd_workers = num_fd_workers
 
         self._declare_options()
         self.initialize()
@@ -1677,7 +1702,8 @@ class System(object):
                          perturb_size=_DEFAULT_COLORING_META['perturb_size'],
                          min_improve_pct=_DEFAULT_COLORING_META['min_improve_pct'],
                          show_summary=_DEFAULT_COLORING_META['show_summary'],
-                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity']):
+                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity'],
+                         probe_sparsity=_DEFAULT_COLORING_META['probe_sparsity']):
         """
         Set options for deriv coloring of a set of wrt vars matching the given pattern(s).
 
@@ -1713,6 +1739,10 @@ class System(object):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        probe_sparsity : bool
+            If True, determine the sparsity of a component's partial jacobian using a few
+            random directional derivatives rather than computing every column num_full_jacs
+            times.
         """
         if method not in ('fd', 'cs', 'jax'):
             raise RuntimeError(
@@ -1743,6 +1773,7 @@ class System(object):
         options['min_improve_pct'] = min_improve_pct
         options['show_summary'] = show_summary
         options['show_sparsity'] = show_sparsity
+        options['probe_sparsity'] = probe_sparsity
         options['coloring'] = self._coloring_info['coloring']
         if form is not None:
             options['form'] = form
@@ -1946,7 +1977,17 @@ class System(object):
 
         starting_resids = self._residuals.asarray(copy=True)
 
-        for i in range(info['num_full_jacs']):
+        if info['probe_sparsity'] and not (use_jax or is_total) and self.comm.size == 1:
+            self._inputs.set_val(starting_inputs + in_offsets * np.random.random(in_offsets.size))
+            if not is_explicit:
+                self._outputs.set_val(starting_outputs +
+                                      out_offsets * np.random.random(out_offsets.size))
+            self._probe_sparsity(info)
+            num_full_jacs = 0
+        else:
+            num_full_jacs = info['num_full_jacs']
+
+        for i in range(num_full_jacs):
             # randomize inputs (and outputs if implicit)
             if i > 0:
                 self._inputs.set_val(starting_inputs +
@@ -2004,6 +2045,58 @@ class System(object):
 
         return [coloring]
 
+    def _probe_sparsity(self, info):
+        """
+        Collect the sparsity of our partial jacobian using random directional derivatives.
+
+        Parameters
+        ----------
+        info : dict
+            Coloring metadata dict.
+        """
+        under_cs = info['method'] == 'cs' and not self.under_complex_step
+        if under_cs:
+            step = ComplexStep.DEFAULT_OPTIONS['step']
+        else:
+            step = FiniteDifference.DEFAULT_OPTIONS['step']
+        if info['method'] == ('cs' if under_cs else 'fd'):
+            step = info.get('step', step)
+        delta = step * 1j if under_cs else step
+
+        wrt_slices = []
+        for wrt, start, end, vec, _, _ in self._jac_wrt_iter(info['wrt_matches']):
+            wrt_slices.append((vec, vec.get_slice_dict()[wrt], slice(start, end)))
+
+        saved_inputs = self._inputs.asarray(copy=True)
+        saved_outputs = self._outputs.asarray(copy=True)
+
+        if under_cs:
+            self._set_complex_step_mode(True)
+            # clear out any leftover imaginary parts
+            self._inputs.set_val(saved_inputs)
+            self._outputs.set_val(saved_outputs)
+        else:
+            self.run_apply_nonlinear()
+            baseline = self._residuals.asarray(copy=True)
+
+        def jvp(direction):
+            for vec, vslice, jslice in wrt_slices:
+                vec.iadd(delta * direction[jslice], vslice)
+            self.run_apply_nonlinear()
+            if under_cs:
+                result = self._residuals.asarray().imag * (1.0 / step)
+            else:
+                result = (self._residuals.asarray() - baseline) * (1.0 / step)
+            self._inputs.set_val(saved_inputs)
+            self._outputs.set_val(saved_outputs)
+            return result
+
+        try:
+            self._jacobian.probe(self, jvp, info['num_full_jacs'])
+        finally:
+            if under_cs:
+                self._set_complex_step_mode(False)
+
     def _setup_approx_coloring(self):
         pass
 
@@ -2213,6 +2306,8 @@ class System(object):
         self.pathname = pathname
         self._set_problem_meta(prob_meta)
         self._first_call_to_linearize = True
+        self._lin_point = None
+        self._asm_jac_lin_count = None
         self._is_local = True
         self._vectors = {}
         self._full_comm = None
@@ -2220,6 +2315,12 @@ class System(object):
 
         self.options._parent_name = self.msginfo
         self.recording_options._parent_name = self.msginfo
+
+        if self._num_fd_workers > 1 and not _fork_supported():
+            issue_warning(f"num_fd_workers = {self._num_fd_workers}, but worker processes can't "
+                          "be forked on this platform. Derivative approximations will be computed "
+                          "serially.", prefix=self.msginfo, category=DerivativesWarning)
+            self._num_fd_workers = 1
         self._mode = mode
         self._design_vars = {}
         self._responses = {}
@@ -2305,10 +2406,29 @@ class System(object):
             responses = self.get_responses(recurse=True, get_sizes=False, use_prom_ivc=False)
 
             responses = self._check_alias_overlaps(responses)
+        else:
+            desvars = responses = {}
+
+        # The cache also holds data that doesn't depend on derivatives (e.g. transfer indices),
+        # so it is created whether or not the relevance is computed.
+        cache = None
+        cache_dir = self._problem_meta['setup_cache_dir']
+        if cache_dir is not None and self.comm.size == 1:
+            key = _get_setup_cache_key(self, desvars, responses, mode)
+            self._problem_meta['setup_cache'] = cache = SetupCache(cache_dir, key)
 
+        if not self._use_derivatives:
+            return {'@all': ({'input': ContainsAll(), 'output': ContainsAll()}, ContainsAll())}
+
+        if cache is None:
             return self.get_relevant_vars(desvars, responses, mode)
 
-        return {'@all': ({'input': ContainsAll(), 'output': ContainsAll()}, ContainsAll())}
+        relevant = cache.get('relevant')
+        if relevant is None:
+            relevant = self.get_relevant_vars(desvars, responses, mode)
+            cache.set('relevant', relevant)
+
+        return relevant
 
     def _check_alias_overlaps(self, responses):
         # If you have response aliases, check for overlapping indices.  Also adds aliased
@@ -4984,6 +5104,7 @@ class System(object):
             s.iter_count = 0
             s.iter_count_apply = 0
             s.iter_count_without_approx = 0
+            s.iter_count_skipped = 0
 
             if s._linear_solver:
                 s._linear_solver._iter_count = 0
@@ -4993,6 +5114,120 @@ class System(object):
                 if hasattr(nl, 'linesearch') and nl.linesearch:
                     nl.linesearch._iter_count = 0
 
+    def _can_skip_solve_nonlinear(self):
+        """
+        Return True if the results of the previous evaluation can be reused.
+
+        This is the case when the 'skip_if_inputs_unchanged' option is set and neither the
+        inputs nor the outputs have changed, within 'skip_inputs_tol', since the last
+        evaluation.  If so, the residuals from that evaluation are restored.
+
+        Returns
+        -------
+        bool
+            True if the evaluation can be skipped.
+        """
+        cache = self._skip_cache
+        if cache is None or not self.options['skip_if_inputs_unchanged'] or \
+                self.under_complex_step or self._discrete_inputs or self._discrete_outputs:
+            return False
+
+        tol = self.options['skip_inputs_tol']
+        same = True
+        for vec, old in zip((self._inputs, self._outputs), cache):
+            new = vec.asarray()
+            if new.shape != old.shape:
+                same = False
+            elif tol > 0.:
+                same = np.allclose(new, old, rtol=tol, atol=tol)
+            else:
+                same = np.array_equal(new, old)
+            if not same:
+                break
+
+        if self.comm.size > 1:
+            # all procs must agree, otherwise some of them would skip collective operations
+            same = all(self.comm.allgather(same))
+
+        if same:
+            self._residuals.set_val(cache[2])
+            self.iter_count_skipped += 1
+
+        return same
+
+    def _save_skip_cache(self):
+        """
+        Save the current inputs, outputs, and residuals if evaluations may be skipped.
+        """
+        if self.under_complex_step:
+            # the real parts of our vectors are compared on the next evaluation, so there's
+            # no need to discard the cache here
+            return
+
+        if self.options['skip_if_inputs_unchanged']:
+            self._skip_cache = (self._inputs.asarray(copy=True),
+                                self._outputs.asarray(copy=True),
+                                self._residuals.asarray(copy=True))
+        else:
+            self._skip_cache = None
+
+    def _lin_point_is_current(self):
+        """
+        Return True if the partials computed during the last linearization are still valid.
+
+        This is only the case when the Problem 'lazy_linearization' option is set and neither
+        the inputs nor the outputs of this system have changed since the partials were computed.
+
+        Returns
+        -------
+        bool
+            True if computation of partials can be skipped.
+        """
+        lazy = self._problem_meta['lazy_linearization']
+        point = self._lin_point
+        current = lazy and point is not None and not self.under_complex_step
+        if current:
+            jac, inputs, outputs = point
+            current = jac is self._jacobian and np.array_equal(self._inputs.asarray(), inputs) \
+                and np.array_equal(self._outputs.asarray(), outputs)
+
+        if lazy and self.comm.size > 1:
+            # all procs must agree, otherwise some of them would skip collective operations
+            current = all(self.comm.allgather(current))
+
+        return current
+
+    def _save_lin_point(self):
+        """
+        Record the point where partials were just computed.
+        """
+        meta = self._problem_meta
+        meta['linearize_count'] += 1
+        if meta['lazy_linearization'] and not (self.under_complex_step or self._discrete_inputs
+                                               or self._discrete_outputs):
+            self._lin_point = (self._jacobian, self._inputs.asarray(copy=True),
+                               self._outputs.asarray(copy=True))
+        else:
+            self._lin_point = None
+
+    def _update_assembled_jac(self):
+        """
+        Update our assembled jacobian unless no partials have been computed since the last update.
+        """
+        meta = self._problem_meta
+        jac = self._assembled_jac
+        if meta['lazy_linearization'] and self._asm_jac_lin_count == meta['linearize_count'] \
+                and jac._randgen is None and not self.under_complex_step:
+            return
+
+        jac._update(self)
+
+        if jac._randgen is None and not self.under_complex_step:
+            self._asm_jac_lin_count = meta['linearize_count']
+        else:
+            # the matrix doesn't match the partials, so force an update next time
+            self._asm_jac_lin_count = None
+
     def get_reports_dir(self):
         """
         Get the path to the directory where the report files should go.
@@ -6106,6 +6341,10 @@ class System(object):
 
         Both vars are assumed to be outputs (either design vars or responses).
 
+        Unless parallel derivative coloring is used, reachability is computed with a compiled
+        relevance index and the entry for each (design var, response) pair is only built when
+        it is first accessed.
+
         Parameters
         ----------
         desvars : dict
@@ -6122,12 +6361,19 @@ class System(object):
             keyed by design vars and responses.
         """
         conns = self._conn_global_abs_in2out
+
+        if not any(meta['parallel_deriv_color']
+                   for meta in chain(desvars.values(), responses.values())):
+            return get_relevance(conns, desvars, responses, mode)
+
         relevant = defaultdict(dict)
 
         # Create a hybrid graph with components and all connected vars.  If a var is connected,
         # also connect it to its corresponding component.  This results in a smaller graph
         # (fewer edges) than would be the case for a pure variable graph where all inputs
         # to a particular component would have to be connected to all outputs from that component.
+        import networkx as nx
+
         graph = nx.DiGraph()
         for tgt, src in conns.items():
             if src not in graph:
@@ -1,6 +1,8 @@
 """ Testing for group finite differencing."""
+import multiprocessing
 import time
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -17,7 +19,7 @@ from openmdao.test_suite.parametric_suite import parametric_suite
 from openmdao.utils.assert_utils import assert_near_equal, assert_warnings, assert_check_partials, assert_warning
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.utils.mpi import MPI
-from openmdao.utils.om_warnings import OMDeprecationWarning
+from openmdao.utils.om_warnings import OMDeprecationWarning, DerivativesWarning
 from openmdao.utils.testing_utils import use_tempdirs
 
 try:
@@ -2032,6 +2034,225 @@ class TestComponentComplexStep(unittest.TestCase):
 
 
 
+class BatchComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('method', default='cs')
+        self.options.declare('coloring', default=False)
+        self.options.declare('ref', default=1.0)
+
+    def setup(self):
+        self.add_input('x', np.ones(4))
+        self.add_input('a', 2.0)
+        self.add_output('y', np.ones(4), ref=self.options['ref'])
+        self.add_output('z', 1.0)
+
+        self.declare_partials('*', '*', method=self.options['method'])
+        if self.options['coloring']:
+            self.declare_coloring(wrt='*', method=self.options['method'])
+
+        self.ncompute = 0
+        self.nbatch = 0
+
+    def compute(self, inputs, outputs):
+        self.ncompute += 1
+        outputs['y'] = inputs['a'] * np.sin(inputs['x']) + inputs['x'] ** 2
+        outputs['z'] = inputs['x'][0] ** 3 * inputs['a']
+
+
+class BatchCompVectorized(BatchComp):
+
+    def compute_batch(self, inputs, outputs):
+        self.nbatch += 1
+        x = inputs['x']
+        a = inputs['a']
+        outputs['y'] = a * np.sin(x) + x ** 2
+        outputs['z'][:] = x[:, :1] ** 3 * a
+
+
+@use_tempdirs
+class TestBatchedApprox(unittest.TestCase):
+
+    def _check(self, method, coloring, nbatch):
+        comps = []
+        for klass in (BatchComp, BatchCompVectorized):
+            prob = om.Problem()
+            comp = prob.model.add_subsystem('comp', klass(method=method, coloring=coloring))
+            prob.setup(force_alloc_complex=True)
+            prob.set_val('comp.x', np.array([.5, 1., 1.5, 2.]))
+            prob.run_model()
+            prob.compute_totals(['comp.y', 'comp.z'], ['comp.x', 'comp.a'])
+            # count calls after any coloring has been computed
+            comp.nbatch = comp.ncompute = 0
+            J = prob.compute_totals(['comp.y', 'comp.z'], ['comp.x', 'comp.a'])
+            comps.append((comp, J))
+
+        (comp, J), (bcomp, bJ) = comps
+        for key in J:
+            assert_near_equal(bJ[key], J[key], 1e-6 if method == 'fd' else 1e-12)
+
+        self.assertEqual(bcomp.nbatch, nbatch)
+        self.assertEqual(bcomp.ncompute, 0)
+        self.assertEqual(comp.nbatch, 0)
+
+        x = np.array([.5, 1., 1.5, 2.])
+        assert_near_equal(bJ['comp.y', 'comp.x'], np.diag(2. * np.cos(x) + 2 * x), 1e-6)
+        assert_near_equal(bJ['comp.z', 'comp.a'], x[:1, np.newaxis] ** 3, 1e-6)
+
+    def test_batch_cs(self):
+        # one batch for each wrt variable
+        self._check('cs', False, 2)
+
+    def test_batch_fd(self):
+        self._check('fd', False, 2)
+
+    def test_batch_cs_colored(self):
+        # one batch for all colors
+        self._check('cs', True, 1)
+
+    def test_check_partials(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', BatchCompVectorized(method='cs'))
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+        data = prob.check_partials(method='fd', out_stream=None)
+        assert_check_partials(data, atol=1e-4, rtol=1e-5)
+
+    def test_not_batched_with_scaling(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', BatchCompVectorized(method='cs', ref=2.))
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+        J = prob.compute_totals(['comp.y'], ['comp.x'])
+
+        x = np.ones(4)
+        assert_near_equal(J['comp.y', 'comp.x'], np.diag(2. * np.cos(x) + 2 * x), 1e-12)
+        self.assertEqual(comp.nbatch, 0)
+
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "requires the 'fork' multiprocessing start method")
+@use_tempdirs
+class TestApproxWorkerPool(unittest.TestCase):
+
+    def _check(self, method, coloring):
+        jacs = []
+        for num_fd_workers in (1, 3):
+            prob = om.Problem()
+            comp = prob.model.add_subsystem('comp', BatchComp(method=method, coloring=coloring,
+                                                              num_fd_workers=num_fd_workers))
+            prob.setup(force_alloc_complex=True)
+            prob.set_val('comp.x', np.array([.5, 1., 1.5, 2.]))
+            prob.run_model()
+            prob.compute_totals(['comp.y', 'comp.z'], ['comp.x', 'comp.a'])
+            comp.ncompute = 0
+            jacs.append(prob.compute_totals(['comp.y', 'comp.z'], ['comp.x', 'comp.a']))
+
+        J, pool_J = jacs
+        for key in J:
+            assert_near_equal(pool_J[key], J[key], 1e-12)
+
+        # all perturbed points were evaluated in the workers
+        self.assertEqual(comp.ncompute, 0)
+
+        x = np.array([.5, 1., 1.5, 2.])
+        assert_near_equal(pool_J['comp.y', 'comp.x'], np.diag(2. * np.cos(x) + 2 * x), 1e-6)
+        assert_near_equal(pool_J['comp.z', 'comp.a'], x[:1, np.newaxis] ** 3, 1e-6)
+
+    def test_fd(self):
+        self._check('fd', False)
+
+    def test_cs(self):
+        self._check('cs', False)
+
+    def test_fd_colored(self):
+        self._check('fd', True)
+
+    def test_cs_colored(self):
+        self._check('cs', True)
+
+    def test_approx_totals(self):
+        prob = om.Problem(model=om.Group(num_fd_workers=2))
+        prob.model.add_subsystem('parab', Paraboloid(), promotes=['*'])
+        prob.model.approx_totals(method='cs')
+        prob.setup()
+        prob.set_val('x', 3.0)
+        prob.set_val('y', -4.0)
+        prob.run_model()
+
+        J = prob.compute_totals(['f_xy'], ['x', 'y'])
+        assert_near_equal(J['f_xy', 'x'], [[-4.0]], 1e-12)
+        assert_near_equal(J['f_xy', 'y'], [[3.0]], 1e-12)
+
+    def test_approx_totals_threaded_parallel_group(self):
+        prob = om.Problem(model=om.Group(num_fd_workers=2))
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.array([1., 2.])))
+        par = model.add_subsystem('par', om.ParallelGroup(num_threads=2))
+        par.add_subsystem('c1', om.ExecComp('y = 2.0 * x ** 2', x=np.ones(2), y=np.ones(2)))
+        par.add_subsystem('c2', om.ExecComp('y = 3.0 * x ** 3', x=np.ones(2), y=np.ones(2)))
+        model.connect('ivc.x', ['par.c1.x', 'par.c2.x'])
+        model.approx_totals(method='cs')
+        prob.setup()
+
+        # runs the threads of the parallel group before the approximation workers are forked
+        prob.run_model()
+        J = prob.compute_totals(['par.c1.y', 'par.c2.y'], ['ivc.x'])
+        assert_near_equal(J['par.c1.y', 'ivc.x'], np.diag([4., 8.]), 1e-12)
+        assert_near_equal(J['par.c2.y', 'ivc.x'], np.diag([9., 36.]), 1e-12)
+        prob.cleanup()
+
+
+@use_tempdirs
+class TestApproxWorkerPoolNoFork(unittest.TestCase):
+
+    def test_no_fork_warning(self):
+        prob = om.Problem(model=om.Group(num_fd_workers=2))
+        prob.model.add_subsystem('parab', Paraboloid(), promotes=['*'])
+        prob.model.approx_totals(method='cs')
+
+        msg = "<model> <class Group>: num_fd_workers = 2, but worker processes can't be forked " \
+              "on this platform. Derivative approximations will be computed serially."
+        with mock.patch('multiprocessing.get_all_start_methods', return_value=['spawn']):
+            with assert_warning(DerivativesWarning, msg):
+                prob.setup()
+
+            prob.set_val('x', 3.0)
+            prob.set_val('y', -4.0)
+            prob.run_model()
+            J = prob.compute_totals(['f_xy'], ['x', 'y'])
+
+        self.assertEqual(prob.model._num_fd_workers, 1)
+        assert_near_equal(J['f_xy', 'x'], [[-4.0]], 1e-12)
+        assert_near_equal(J['f_xy', 'y'], [[3.0]], 1e-12)
+
+    def test_worker_error(self):
+
+        class FailComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 1.0)
+                self.add_output('y', 1.0)
+                self.declare_partials('y', 'x', method='fd')
+
+            def compute(self, inputs, outputs):
+                if inputs['x'] > 1.0:
+                    raise ValueError("x is too big")
+                outputs['y'] = 2.0 * inputs['x']
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', FailComp(num_fd_workers=2))
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(['comp.y'], ['comp.x'])
+
+        msg = str(cm.exception)
+        self.assertTrue(msg.startswith("'comp' <class FailComp>: Approximation of derivatives "
+                                       "failed in a worker process:"))
+        self.assertIn("ValueError: x is too big", msg)
+
+
 class ApproxTotalsFeature(unittest.TestCase):
 
     def test_basic(self):
@@ -2,9 +2,11 @@
 import os
 import sys
 import itertools
+import multiprocessing
 import pickle
 
 import unittest
+from unittest import mock
 import numpy as np
 
 from io import StringIO
@@ -168,8 +170,12 @@ def run_opt(driver_class, mode, assemble_type=None, color_info=None, derivs=True
     if 'min_improve_pct' in options:
         del options['min_improve_pct']
 
+    use_coloring_cache = options.pop('use_coloring_cache', False)
+    coloring_num_workers = options.pop('coloring_num_workers', 1)
+
     if 'dynamic_total_coloring' in options:
-        p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct)
+        p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct,
+                                  use_cache=use_coloring_cache, num_workers=coloring_num_workers)
         del options['dynamic_total_coloring']
 
     p.driver.options.update(options)
@@ -745,6 +751,113 @@ class SimulColoringScipyTestCase(unittest.TestCase):
         self.assertEqual(p.model._solve_count, 21)
         self.assertEqual(p_color.model._solve_count, 5)
 
+    def test_dynamic_total_coloring_cache(self):
+        import openmdao.utils.coloring as coloring_mod
+
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True, use_coloring_cache=True)
+        coloring = p.driver._coloring_info['coloring']
+
+        coloring_dir = p.options['coloring_dir']
+        cache_files = [f for f in os.listdir(coloring_dir) if f.startswith('total_coloring_')]
+        self.assertEqual(len(cache_files), 1)
+
+        # a second run of the same model reuses the cached coloring
+        with mock.patch.object(coloring_mod, 'compute_total_coloring',
+                               wraps=coloring_mod.compute_total_coloring) as compute:
+            p_cached = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                               dynamic_total_coloring=True, use_coloring_cache=True)
+            self.assertEqual(compute.call_count, 0)
+
+            assert_almost_equal(p_cached['circle.area'], np.pi, decimal=7)
+            cached = p_cached.driver._coloring_info['coloring']
+            self.assertEqual(cached.get_row_var_coloring('r_con.g'),
+                             coloring.get_row_var_coloring('r_con.g'))
+            self.assertEqual(cached.total_solves(), coloring.total_solves())
+
+            p_cached.model._solve_count = 0
+            p_cached.driver._compute_totals()
+            self.assertEqual(p_cached.model._solve_count, 5)
+
+            # changing the responses creates a new cache entry
+            run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True, use_coloring_cache=True,
+                    has_lin_constraint=False)
+            self.assertEqual(compute.call_count, 1)
+
+        cache_files = [f for f in os.listdir(coloring_dir) if f.startswith('total_coloring_')]
+        self.assertEqual(len(cache_files), 2)
+
+    def test_dynamic_total_coloring_cache_partials(self):
+        import openmdao.utils.coloring as coloring_mod
+
+        def run(expr, diag):
+            p = om.Problem()
+            model = p.model
+            model.add_subsystem('comp', om.ExecComp(expr, x=np.ones(4), y=np.ones(4),
+                                                    has_diag_partials=diag))
+            model.add_subsystem('obj', om.ExecComp('f = sum(y)', y=np.ones(4)))
+            model.connect('comp.y', 'obj.y')
+            model.add_design_var('comp.x')
+            model.add_constraint('comp.y', lower=0.)
+            model.add_objective('obj.f')
+            p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+            p.driver.declare_coloring(use_cache=True, show_summary=False)
+            p.setup(mode='rev')
+            p.final_setup()
+            return coloring_mod.dynamic_total_coloring(p.driver)
+
+        def ncache_files():
+            return len([f for f in os.listdir('coloring_files')
+                        if f.startswith('total_coloring_')])
+
+        with mock.patch.object(coloring_mod, 'compute_total_coloring',
+                               wraps=coloring_mod.compute_total_coloring) as compute:
+            coloring = run('y = 2.0*x', False)
+            self.assertEqual(coloring.total_solves(), 2)
+            run('y = 2.0*x', False)
+            self.assertEqual(compute.call_count, 1)
+            self.assertEqual(ncache_files(), 1)
+
+            # new declared partial sparsity
+            run('y = 2.0*x', True)
+            self.assertEqual(compute.call_count, 2)
+
+            # a new expression that makes the jacobian of y dense
+            coloring = run('y = 2.0*x + sum(x)', False)
+            self.assertEqual(compute.call_count, 3)
+            self.assertEqual(coloring.total_solves(), 5)
+            self.assertEqual(ncache_files(), 3)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                         "requires the 'fork' multiprocessing start method")
+    def test_total_coloring_num_workers(self):
+        import openmdao.utils.coloring as coloring_mod
+
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
+        coloring = compute_total_coloring(p)
+
+        with mock.patch.object(coloring_mod, 'concurrent_eval_pool',
+                               wraps=coloring_mod.concurrent_eval_pool) as pool:
+            pool_coloring = compute_total_coloring(p, num_workers=2)
+        self.assertEqual(pool.call_count, 1)
+
+        np.testing.assert_array_equal(pool_coloring.get_dense_sparsity(),
+                                      coloring.get_dense_sparsity())
+        self.assertEqual(pool_coloring.total_solves(), coloring.total_solves())
+        self.assertEqual(pool_coloring._meta['num_full_jacs'], 3)
+
+        # the driver passes num_workers through to the sparsity computation
+        with mock.patch.object(coloring_mod, 'concurrent_eval_pool',
+                               wraps=coloring_mod.concurrent_eval_pool) as pool:
+            p_color = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                              dynamic_total_coloring=True, coloring_num_workers=2)
+        self.assertEqual(pool.call_count, 1)
+        np.testing.assert_array_equal(
+            p_color.driver._coloring_info['coloring'].get_dense_sparsity(),
+            coloring.get_dense_sparsity())
+        assert_almost_equal(p_color['circle.area'], np.pi, decimal=7)
+
     def test_min_improve_pct(self):
         # first, run w/o coloring
         p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
@@ -1159,6 +1159,63 @@ class ExplCompTestCase(unittest.TestCase):
         self.assertEqual(cm.exception.args[0],
                          "<class RectangleComp>: Explicit components don't support nonlinear solvers.")
 
+    def test_skip_if_inputs_unchanged(self):
+        class CountingComp(RectangleComp):
+            def initialize(self):
+                self.ncompute = 0
+
+            def compute(self, inputs, outputs):
+                self.ncompute += 1
+                super().compute(inputs, outputs)
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', CountingComp(skip_if_inputs_unchanged=True),
+                                        promotes=['*'])
+        prob.model.add_design_var('length')
+        prob.model.add_objective('area')
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val('length', 3.)
+        prob.set_val('width', 2.)
+        prob.run_model()
+        prob.run_model(reset_iter_counts=False)
+        self.assertEqual(comp.ncompute, 1)
+        self.assertEqual(comp.iter_count, 2)
+        self.assertEqual(comp.iter_count_skipped, 1)
+        assert_near_equal(prob.get_val('area'), 6.)
+
+        # changed input
+        prob.set_val('length', 4.)
+        prob.run_model()
+        self.assertEqual(comp.ncompute, 2)
+        assert_near_equal(prob.get_val('area'), 8.)
+
+        # an output changed by someone else must be recomputed
+        prob.set_val('area', 0.)
+        prob.run_model()
+        self.assertEqual(comp.ncompute, 3)
+        assert_near_equal(prob.get_val('area'), 8.)
+
+        # derivatives computed with complex step are not affected by skipping
+        totals = prob.check_totals(method='cs', out_stream=None)
+        assert_near_equal(totals['comp.area', 'length']['J_fd'], [[2.]], 1e-12)
+        assert_near_equal(prob.get_val('area'), 8.)
+
+        # changes within the tolerance are ignored
+        comp.options['skip_inputs_tol'] = 1e-8
+        prob.run_model()
+        ncompute = comp.ncompute
+        prob.set_val('length', 4. + 1e-12)
+        prob.run_model()
+        self.assertEqual(comp.ncompute, ncompute)
+        assert_near_equal(prob.get_val('area'), 8.)
+
+        prob.set_val('length', 5.)
+        prob.run_model()
+        self.assertEqual(comp.ncompute, ncompute + 1)
+        assert_near_equal(prob.get_val('area'), 10.)
+
+
 
 @unittest.skipUnless(MPI, "MPI is required.")
 class TestMPIExplComp(unittest.TestCase):
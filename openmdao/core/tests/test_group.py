@@ -1453,6 +1453,39 @@ class TestGroup(unittest.TestCase):
         msg = ("\nCollected errors for problem 'set_input_def_key_error':\n"
                "   <model> <class Group>: The following group inputs, passed to set_input_defaults(), could not be found: ['bad_name'].")
         self.assertEqual(cm.exception.args[0], msg)
+    def test_skip_if_inputs_unchanged(self):
+        from openmdao.test_suite.components.sellar import SellarDis1
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        cycle = model.add_subsystem('cycle', om.Group(skip_if_inputs_unchanged=True),
+                                    promotes=['*'])
+        cycle.add_subsystem('d1', SellarDis1(), promotes=['*'])
+        cycle.add_subsystem('d2', SellarDis2(), promotes=['*'])
+        cycle.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12, iprint=-1)
+
+        prob.setup()
+        prob.run_model()
+        y1 = prob.get_val('y1').copy()
+        nl_iters = cycle.nonlinear_solver._iter_count
+        self.assertGreater(nl_iters, 1)
+        self.assertEqual(cycle.iter_count_skipped, 0)
+
+        prob.run_model()
+        self.assertEqual(cycle.iter_count_skipped, 1)
+        self.assertEqual(cycle.nonlinear_solver._iter_count, 0)
+        self.assertEqual(cycle.d1.iter_count, 0)
+        assert_near_equal(prob.get_val('y1'), y1)
+
+        prob.set_val('x', 2.0)
+        prob.run_model()
+        self.assertEqual(cycle.iter_count_skipped, 0)
+        self.assertEqual(cycle.d1.iter_count, nl_iters)
+        assert_near_equal(prob.get_val('y1'), 26.56909563, 1e-6)
+
 
 @unittest.skipUnless(MPI, "MPI is required.")
 class TestGroupMPISlice(unittest.TestCase):
@@ -0,0 +1,77 @@
+"""Tests for the lazy loading of openmdao.api."""
+import subprocess
+import sys
+import json
+import unittest
+
+import openmdao
+import openmdao.api as om
+
+
+# modules that must not be imported as a side effect of 'import openmdao.api'
+_heavy_modules = [
+    'networkx',
+    'IPython',
+    'matplotlib',
+    'scipy.stats',
+    'openmdao.core.problem',
+    'openmdao.drivers.genetic_algorithm_driver',
+    'openmdao.visualization.n2_viewer.n2_viewer',
+    'openmdao.visualization.case_viewer.case_viewer',
+    'openmdao.visualization.tables.table_builder',
+]
+
+
+def _loaded_modules(stmt):
+    code = f"import sys, json\n{stmt}\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return set(json.loads(out.stdout.strip().splitlines()[-1]))
+
+
+class TestLazyAPI(unittest.TestCase):
+
+    def test_no_heavy_imports(self):
+        loaded = _loaded_modules('import openmdao.api')
+        self.assertIn('openmdao.api', loaded)
+        self.assertEqual([m for m in _heavy_modules if m in loaded], [])
+
+    def test_package_import(self):
+        loaded = _loaded_modules('import openmdao')
+        self.assertNotIn('openmdao.api', loaded)
+
+        loaded = _loaded_modules('import openmdao\nopenmdao.api.IndepVarComp')
+        self.assertIn('openmdao.core.indepvarcomp', loaded)
+
+    def test_attr_access(self):
+        loaded = _loaded_modules('import openmdao.api as om\nom.ExecComp')
+        self.assertIn('openmdao.components.exec_comp', loaded)
+        self.assertNotIn('openmdao.visualization.n2_viewer.n2_viewer', loaded)
+
+    def test_all_names(self):
+        from openmdao.core.problem import Problem
+        from openmdao.components.exec_comp import ExecComp
+
+        self.assertIs(om.Problem, Problem)
+        self.assertIs(om.ExecComp, ExecComp)
+        self.assertIs(openmdao.api, om)
+
+        for name in om.__all__:
+            self.assertIn(name, dir(om))
+            val = getattr(om, name)
+            if name != 'PETScVector':
+                self.assertIsNotNone(val, name)
+
+    def test_bad_name(self):
+        with self.assertRaises(AttributeError) as cm:
+            om.NotAClass
+
+        self.assertEqual(str(cm.exception), "module 'openmdao.api' has no attribute 'NotAClass'")
+
+        with self.assertRaises(AttributeError) as cm:
+            openmdao.not_a_module
+
+        self.assertEqual(str(cm.exception), "module 'openmdao' has no attribute 'not_a_module'")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@
 
 import unittest
 import itertools
+import multiprocessing
+import threading
 
 from collections.abc import Iterable
 
@@ -24,8 +26,9 @@ except ImportError:
 from openmdao.test_suite.groups.parallel_groups import \
     FanOutGrouped, FanInGrouped2, Diamond, ConvergeDiverge
 
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.logger_utils import TestLogger
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.error_checking.check_config import _default_checks
 
 
@@ -628,6 +631,154 @@ class TestTheoryDocExample(unittest.TestCase):
         model.add_subsystem('C1', I1O1Comp())
 
 
+class ThreadedComp(om.ExplicitComponent):
+    def initialize(self):
+        self.options.declare('mult', types=float, default=1.0)
+        self.options.declare('barrier', default=None)
+        self.options.declare('fail', types=bool, default=False)
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        ar = np.arange(3)
+        self.declare_partials('y', 'x', rows=ar, cols=ar)
+        self.thread_names = set()
+
+    def compute(self, inputs, outputs):
+        self.thread_names.add(threading.current_thread().name)
+        if self.options['barrier'] is not None:
+            # this will time out unless all siblings are running at the same time
+            self.options['barrier'].wait()
+        if self.options['fail']:
+            raise om.AnalysisError(f"{self.pathname} failed.")
+        outputs['y'] = self.options['mult'] * inputs['x'] ** 2
+
+    def compute_partials(self, inputs, partials):
+        partials['y', 'x'] = 2.0 * self.options['mult'] * inputs['x']
+
+
+@use_tempdirs
+class TestParallelGroupThreads(unittest.TestCase):
+
+    def build_model(self, num_threads, barrier=None, fail=False):
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.array([1., 2., 3.])))
+        par = model.add_subsystem('par', om.ParallelGroup(num_threads=num_threads))
+        for i in range(4):
+            par.add_subsystem(f'c{i}', ThreadedComp(mult=i + 1., barrier=barrier,
+                                                    fail=fail and i == 2))
+            model.connect('ivc.x', f'par.c{i}.x')
+        model.add_subsystem('total', om.ExecComp('z = sum(y0 + 2*y1 + 3*y2 + 4*y3)',
+                                                 y0=np.ones(3), y1=np.ones(3), y2=np.ones(3),
+                                                 y3=np.ones(3)))
+        for i in range(4):
+            model.connect(f'par.c{i}.y', f'total.y{i}')
+        return p
+
+    def test_threaded_matches_serial(self):
+        results = []
+        for num_threads in (1, 4):
+            p = self.build_model(num_threads)
+            for mode in ('fwd', 'rev'):
+                p.setup(mode=mode)
+                p.run_model()
+                J = p.compute_totals(of=['total.z', 'par.c3.y'], wrt=['ivc.x'])
+                results.append((p.get_val('total.z'), J['total.z', 'ivc.x'],
+                                J['par.c3.y', 'ivc.x']))
+            self.assertEqual(p.model.par._thread_pool is not None, num_threads > 1)
+
+        expected = results[0]
+        for res in results[1:]:
+            for val, exp in zip(res, expected):
+                np.testing.assert_allclose(val, exp, rtol=1e-15)
+        np.testing.assert_allclose(expected[1], 60. * np.array([[1., 2., 3.]]), rtol=1e-15)
+
+    def test_threaded_concurrent(self):
+        p = self.build_model(4, barrier=threading.Barrier(4, timeout=10))
+        p.setup()
+        p.run_model()
+
+        for i in range(4):
+            comp = p.model.par._get_subsystem(f'c{i}')
+            for name in comp.thread_names:
+                self.assertTrue(name.startswith('par_'), name)
+        names = set().union(*[p.model.par._get_subsystem(f'c{i}').thread_names
+                              for i in range(4)])
+        self.assertEqual(len(names), 4)
+
+    def test_threaded_error(self):
+        p = self.build_model(4, fail=True)
+        p.setup()
+        with self.assertRaises(om.AnalysisError) as cm:
+            p.run_model()
+        self.assertEqual(str(cm.exception),
+                         "'par.c2' <class ThreadedComp>: Error calling compute(), par.c2 failed.")
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                         "requires the 'fork' multiprocessing start method")
+    def test_threaded_doe_workers(self):
+        # the barrier makes sure that all of the threads have been started in the parent
+        p = self.build_model(4, barrier=threading.Barrier(4, timeout=10))
+        p.model.add_design_var('ivc.x')
+        p.model.add_objective('total.z')
+        samples = [[('ivc.x', np.array([1., 2., 3.]) * (i + 1))] for i in range(4)]
+        p.driver = om.DOEDriver(om.ListGenerator(samples), num_workers=2)
+        p.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+        p.setup()
+
+        # start the threads before the DOE workers are forked
+        p.run_model()
+        p.run_driver()
+        p.cleanup()
+
+        cr = om.CaseReader('cases.sql')
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 4)
+        for name in cases:
+            case = cr.get_case(name)
+            x = case.outputs['ivc.x']
+            assert_near_equal(case.outputs['total.z'], 30. * np.sum(x ** 2), 1e-15)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                         "requires the 'fork' multiprocessing start method")
+    def test_threaded_fd_workers(self):
+        # the barrier makes sure that all of the threads have been started in the parent
+        barrier = threading.Barrier(4, timeout=10)
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.array([1., 2., 3.])))
+        par = model.add_subsystem('par', om.ParallelGroup(num_threads=4, num_fd_workers=2))
+        for i in range(4):
+            par.add_subsystem(f'c{i}', ThreadedComp(mult=i + 1., barrier=barrier))
+            model.connect('ivc.x', f'par.c{i}.x')
+        par.approx_totals(method='cs')
+        p.setup()
+
+        # start the threads before the approximation workers are forked
+        p.run_model()
+        J = p.compute_totals(of=[f'par.c{i}.y' for i in range(4)], wrt=['ivc.x'])
+        for i in range(4):
+            assert_near_equal(J[f'par.c{i}.y', 'ivc.x'],
+                              np.diag(2. * (i + 1.) * np.array([1., 2., 3.])), 1e-15)
+
+        p.cleanup()
+        self.assertIsNone(par._thread_pool._executor)
+
+    def test_threaded_coupled_warning(self):
+        p = om.Problem()
+        par = p.model.add_subsystem('par', om.ParallelGroup(num_threads=2))
+        par.add_subsystem('c1', om.ExecComp('y = 2.0*x'))
+        par.add_subsystem('c2', om.ExecComp('y = 3.0*x'))
+        par.connect('c1.y', 'c2.x')
+
+        msg = "'par' <class ParallelGroup>: Subsystems are run concurrently in multiple " \
+              "threads, so data passed between them through connections " \
+              "['par.c1.y' -> 'par.c2.x'] will lag by one iteration."
+        with assert_warning(om.OpenMDAOWarning, msg):
+            p.setup()
+
+
 if __name__ == "__main__":
     from openmdao.utils.mpi import mpirun_tests
     mpirun_tests()
@@ -398,6 +398,44 @@ class TestColoringExplicit(unittest.TestCase):
         jac = comp._jacobian._subjacs_info
         _check_partial_matrix(comp, jac, sparsity, method)
 
+    @parameterized.expand(itertools.product(
+        ['fd', 'cs'],
+        [1,7],
+        [1,5],
+        ), name_func=_test_func_name
+    )
+    def test_partials_explicit_probe(self, method, isplit, osplit):
+        prob = Problem(coloring_dir=self.tempdir)
+        model = prob.model
+
+        sparsity = setup_sparsity(_BIGMASK)
+        indeps, conns = setup_indeps(isplit, _BIGMASK.shape[1], 'indeps', 'comp')
+        model.add_subsystem('indeps', indeps)
+        comp = model.add_subsystem('comp', SparseCompExplicit(sparsity, method,
+                                                              isplit=isplit, osplit=osplit))
+        comp.declare_coloring('x*', method=method, probe_sparsity=True)
+
+        for conn in conns:
+            model.connect(*conn)
+
+        prob.setup(mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        start_nruns = comp._nruns
+        comp.run_linearize()
+        # computing the full jacobian num_full_jacs times would take 3 runs per column
+        self.assertLess(comp._nruns - start_nruns, 3 * _BIGMASK.shape[1])
+        np.testing.assert_array_equal(comp._coloring_info['coloring'].get_dense_sparsity(),
+                                      _BIGMASK.astype(bool))
+
+        prob.run_model()
+        start_nruns = comp._nruns
+        comp.run_linearize()
+        self.assertEqual(comp._nruns - start_nruns, 10)
+        jac = comp._jacobian._subjacs_info
+        _check_partial_matrix(comp, jac, sparsity, method)
+
     @parameterized.expand(itertools.product(
         ['fd', 'cs'],
         [1,2,7,19],
@@ -535,6 +573,38 @@ class TestColoringImplicit(unittest.TestCase):
         jac = comp._jacobian._subjacs_info
         _check_partial_matrix(comp, jac, sparsity, method)
 
+    @parameterized.expand(itertools.product(
+        ['fd', 'cs'],
+        [1,7],
+        [1,5],
+        ), name_func=_test_func_name
+    )
+    def test_partials_implicit_probe(self, method, isplit, osplit):
+        prob = Problem(coloring_dir=self.tempdir)
+        model = prob.model
+
+        sparsity = setup_sparsity(_BIGMASK)
+        indeps, conns = setup_indeps(isplit, _BIGMASK.shape[1], 'indeps', 'comp')
+        model.add_subsystem('indeps', indeps)
+        comp = model.add_subsystem('comp', SparseCompImplicit(sparsity, method,
+                                                              isplit=isplit, osplit=osplit))
+        comp.declare_coloring('x*', method=method, probe_sparsity=True)
+
+        for conn in conns:
+            model.connect(*conn)
+
+        prob.setup(check=False, mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        comp.run_linearize()
+        prob.run_model()
+        start_nruns = comp._nruns
+        comp.run_linearize()
+        self.assertEqual(comp._nruns - start_nruns, 10 + sparsity.shape[0])
+        jac = comp._jacobian._subjacs_info
+        _check_partial_matrix(comp, jac, sparsity, method)
+
     @parameterized.expand(itertools.product(
         ['fd', 'cs'],
         [1,2,7,19],
@@ -846,6 +916,34 @@ class TestColoring(unittest.TestCase):
         jac = comp._jacobian._subjacs_info
         _check_partial_matrix(comp, jac, sparsity, method)
 
+    def test_exec_comp_probe_sparsity(self):
+        n = 50
+        prob = Problem(coloring_dir=self.tempdir)
+        for name, probe in [('full', False), ('probe', True)]:
+            comp = prob.model.add_subsystem(name, ExecComp(['y = x**2 * z', 'w = 3.0 * z[::-1]'],
+                                                           x=np.ones(n), z=np.ones(n),
+                                                           y=np.ones(n), w=np.ones(n)))
+            comp.declare_coloring(method='cs', probe_sparsity=probe, show_summary=False)
+        prob.setup(mode='fwd')
+        for name in ('full', 'probe'):
+            prob.set_val(f'{name}.x', np.arange(n) + 1.)
+            prob.set_val(f'{name}.z', np.arange(n) + 2.)
+        prob.run_model()
+        prob.model.full._linearize()
+        prob.model.probe._linearize()
+
+        expected = prob.model.full._coloring_info['coloring']
+        coloring = prob.model.probe._coloring_info['coloring']
+        np.testing.assert_array_equal(coloring.get_dense_sparsity(),
+                                      expected.get_dense_sparsity())
+        self.assertEqual(coloring.total_solves(), 2)
+
+        x = prob.get_val('probe.x')
+        z = prob.get_val('probe.z')
+        J = prob.model.probe._jacobian._subjacs_info
+        assert_near_equal(np.diag(J['probe.y', 'probe.x']['val']), 2. * x * z, 1e-12)
+        assert_near_equal(prob.get_val('probe.y'), x**2 * z, 1e-12)
+
     def test_partials_min_improvement(self):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
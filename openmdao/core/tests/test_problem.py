@@ -2396,5 +2396,88 @@ class SystemInTwoProblemsTestCase(unittest.TestCase):
         np.testing.assert_allclose(prob['C2.y'], 3.0)
 
 
+@use_tempdirs
+class LazyLinearizationTestCase(unittest.TestCase):
+
+    def _setup_sellar(self, lazy):
+        prob = om.Problem(SellarDerivatives(nonlinear_solver=om.NewtonSolver(solve_subsystems=False),
+                                            linear_solver=om.DirectSolver(assemble_jac=True)),
+                          lazy_linearization=lazy, reports=False)
+        model = prob.model
+        model.add_design_var('x', lower=0., upper=10.)
+        model.add_design_var('z', lower=np.array([-10., 0.]), upper=np.array([10., 10.]))
+        model.add_objective('obj')
+        model.add_constraint('con1', upper=0.)
+        model.add_constraint('con2', upper=0.)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        counts = defaultdict(int)
+
+        def counting(comp):
+            compute_partials = comp.compute_partials
+
+            def wrapper(*args, **kwargs):
+                counts[comp.name] += 1
+                compute_partials(*args, **kwargs)
+
+            return wrapper
+
+        for comp in (model.d1, model.d2):
+            comp.compute_partials = counting(comp)
+
+        return prob, counts
+
+    def test_skip_unchanged(self):
+        prob, counts = self._setup_sellar(True)
+        ref, ref_counts = self._setup_sellar(False)
+
+        for x in (1., 2.):
+            for p in (prob, ref):
+                p.set_val('x', x)
+                p.run_model()
+
+            J = prob.compute_totals()
+            d1_count = counts['d1']
+            ref_d1_count = ref_counts['d1']
+
+            # nothing changed, so the partials and the assembled jacobian are reused
+            J2 = prob.compute_totals()
+            self.assertEqual(counts['d1'], d1_count)
+
+            Jref = ref.compute_totals()
+            ref.compute_totals()
+            self.assertEqual(ref_counts['d1'], ref_d1_count + 2)
+
+            for key, val in Jref.items():
+                np.testing.assert_allclose(J[key], val, rtol=1e-12)
+                np.testing.assert_allclose(J2[key], val, rtol=1e-12)
+
+    def test_total_coloring(self):
+        from openmdao.utils.coloring import compute_total_coloring
+
+        prob = om.Problem(lazy_linearization=True, reports=False)
+        model = prob.model
+        model.add_subsystem('comp', om.ExecComp('y = c * x', x=np.ones(3), y=np.ones(3),
+                                                c=np.array([1., 0., 1.])))
+        model.linear_solver = om.DirectSolver(assemble_jac=True)
+        model.add_design_var('comp.x')
+        model.add_objective('comp.y', index=0)
+        model.add_constraint('comp.y', indices=[1, 2], alias='con', upper=0.)
+        prob.setup()
+        prob.run_model()
+        prob.compute_totals()
+
+        # the partials are reused, but the assembled jacobian must still be randomized in order
+        # to detect the structurally nonzero entry whose current value is zero.
+        coloring = compute_total_coloring(prob)
+        np.testing.assert_array_equal(coloring.get_dense_sparsity(), np.eye(3, dtype=bool))
+
+        # the randomized matrix must not be reused afterwards
+        J = prob.compute_totals(return_format='array')
+        np.testing.assert_allclose(J, np.diag([1., 0., 1.]))
+
+
 if __name__ == "__main__":
     unittest.main()
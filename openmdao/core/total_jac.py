@@ -1409,10 +1409,16 @@ class _TotalJacInfo(object):
 
         self.J[:] = 0.0
 
+        rhs_block = self._get_rhs_block_size()
+
         # Main loop over columns (fwd) or rows (rev) of the jacobian
         for mode in self.modes:
             for key, idx_info in self.idx_iter_dict[mode].items():
                 imeta, idx_iter = idx_info
+                if rhs_block > 1 and idx_iter != self.par_deriv_iter:
+                    self._compute_totals_multi_rhs(imeta, idx_iter, mode, rhs_block)
+                    continue
+
                 for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
                     rel_systems, vec_names, cache_key = input_setter(inds, itermeta, mode)
 
@@ -1466,6 +1472,98 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _get_rhs_block_size(self):
+        """
+        Return the number of right hand sides to solve at once with the model's linear solver.
+
+        Returns
+        -------
+        int
+            Number of right hand sides per linear solve. 1 means no block solves.
+        """
+        model = self.model
+        ln_solver = model._linear_solver
+        if (ln_solver is None or not ln_solver.supports['multi_rhs'] or self.debug_print or
+                self.comm.size > 1 or model._owns_approx_jac):
+            return 1
+
+        return ln_solver.options['max_rhs_block']
+
+    def _compute_totals_multi_rhs(self, imeta, idx_iter, mode, rhs_block):
+        """
+        Compute the jacobian columns (fwd) or rows (rev) by solving several seeds at once.
+
+        Parameters
+        ----------
+        imeta : dict
+            Dictionary of iteration metadata.
+        idx_iter : method
+            Iterator over the index lists, input setters and jac setters.
+        mode : str
+            Direction of derivative solution.
+        rhs_block : int
+            Maximum number of seeds solved at once.
+        """
+        model = self.model
+        ln_solver = model._linear_solver
+        in_arr = self.input_vec[mode].asarray()
+        out_arr = self.output_vec[mode].asarray()
+        save_cache = not self.has_lin_cons and self.mode == mode
+
+        rhs = None
+        block = []
+
+        for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
+            _, _, cache_key = input_setter(inds, itermeta, mode)
+
+            if rhs is None:
+                rhs = np.empty((in_arr.size, rhs_block), dtype=in_arr.dtype)
+
+            with model._scaled_context_all():
+                rhs[:, len(block)] = in_arr
+
+            block.append((inds, jac_setter, cache_key))
+
+            if len(block) == rhs_block:
+                self._multi_rhs_jac_setter(rhs, block, mode, imeta, save_cache)
+                block = []
+
+        if block:
+            self._multi_rhs_jac_setter(rhs[:, :len(block)], block, mode, imeta, save_cache)
+
+    def _multi_rhs_jac_setter(self, rhs, block, mode, imeta, save_cache):
+        """
+        Solve for a block of seeds and set the corresponding parts of the total jacobian.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Scaled seeds, one per column.
+        block : list of tuple
+            Index list, jac setter and linear solution cache key for each seed.
+        mode : str
+            Direction of derivative solution.
+        imeta : dict
+            Dictionary of iteration metadata.
+        save_cache : bool
+            If True, save the solution of seeds that have a cache key.
+        """
+        model = self.model
+        out_arr = self.output_vec[mode].asarray()
+
+        with model._scaled_context_all():
+            sol = model._linear_solver._solve_multi_rhs(mode, rhs)
+
+        self._zero_vecs(mode)
+
+        for i, (inds, jac_setter, cache_key) in enumerate(block):
+            with model._scaled_context_all():
+                out_arr[:] = sol[:, i]
+                if cache_key is not None and save_cache:
+                    self.lin_sol_cache[cache_key] = out_arr.copy()
+
+            jac_setter(inds, mode, imeta)
+
     def compute_totals_approx(self, initialize=False, progress_out_stream=None):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
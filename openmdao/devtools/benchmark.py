@@ -0,0 +1,534 @@
+"""
+Run unittest-style benchmarks, time the phases of each run and compare against a baseline.
+
+Benchmarks are the methods whose names start with 'benchmark' in the unittest.TestCase classes
+found in 'benchmark_*.py' files.
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import fnmatch
+import platform
+import tempfile
+import shutil
+import unittest
+import importlib.util
+from datetime import datetime
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+import scipy
+
+from openmdao import __version__
+
+
+# minimum number of samples in both the baseline and the new results needed to apply the
+# Mann-Whitney U test.  Fewer samples can't reach a useful significance level.
+_MIN_STAT_SAMPLES = 5
+
+
+def _get_phase_methods():
+    """
+    Return the methods that mark the start and end of each timed phase.
+
+    Returns
+    -------
+    list of (class, str, str)
+        Class, method name and phase name for each timed method.
+    """
+    from openmdao.core.problem import Problem
+    from openmdao.core.group import Group
+    from openmdao.core.explicitcomponent import ExplicitComponent
+    from openmdao.core.implicitcomponent import ImplicitComponent
+    from openmdao.core.indepvarcomp import IndepVarComp
+    from openmdao.core.total_jac import _TotalJacInfo
+    from openmdao.recorders.case_recorder import CaseRecorder
+
+    return [
+        (Problem, 'setup', 'setup'),
+        (Problem, 'final_setup', 'final_setup'),
+        (Problem, 'run_model', 'run_model'),
+        (Problem, 'run_driver', 'run_driver'),
+        # totals computed by drivers don't go through Problem.compute_totals
+        (_TotalJacInfo, 'compute_totals', 'compute_totals'),
+        (_TotalJacInfo, 'compute_totals_approx', 'compute_totals'),
+        (Group, '_linearize', 'linearize'),
+        (ExplicitComponent, '_linearize', 'linearize'),
+        (ImplicitComponent, '_linearize', 'linearize'),
+        (IndepVarComp, '_linearize', 'linearize'),
+        (CaseRecorder, 'record_iteration', 'recording'),
+        (CaseRecorder, 'record_derivatives', 'recording'),
+    ]
+
+
+class _PhaseTimer(object):
+    """
+    Accumulate the time spent in each phase of a benchmark.
+
+    Phases nest, e.g. linearize inside of compute_totals, and time is charged to the innermost
+    active phase only, so the phase times of a run add up to no more than its total time.
+
+    Attributes
+    ----------
+    times : dict
+        Time in seconds spent in each phase that was entered, keyed by phase name.
+    _stack : list of str
+        Names of the active phases, innermost last.
+    _tstart : float
+        Time when the innermost active phase was last resumed.
+    """
+
+    def __init__(self):
+        """
+        Initialize all attributes.
+        """
+        self.times = {}
+        self._stack = []
+        self._tstart = 0.
+
+    def reset(self):
+        """
+        Clear all accumulated times.
+        """
+        self.times = {}
+        self._stack = []
+
+    def _enter(self, phase):
+        now = time.perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self.times[outer] += now - self._tstart
+        self._stack.append(phase)
+        if phase not in self.times:
+            self.times[phase] = 0.
+        self._tstart = now
+
+    def _exit(self):
+        now = time.perf_counter()
+        self.times[self._stack.pop()] += now - self._tstart
+        self._tstart = now
+
+    def _wrap(self, func, phase):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            self._enter(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit()
+
+        return wrapper
+
+    @contextmanager
+    def active(self):
+        """
+        Time the phase methods while the context is active.
+
+        Yields
+        ------
+        None
+        """
+        patched = []
+        try:
+            for klass, name, phase in _get_phase_methods():
+                if name in klass.__dict__:
+                    func = klass.__dict__[name]
+                    setattr(klass, name, self._wrap(func, phase))
+                    patched.append((klass, name, func))
+            yield
+        finally:
+            for klass, name, func in patched:
+                setattr(klass, name, func)
+
+
+def _load_module(fname):
+    """
+    Import the python file with the given name.
+
+    Parameters
+    ----------
+    fname : str
+        Absolute path of the python file.
+
+    Returns
+    -------
+    module
+        The imported module.
+    """
+    modname = '_om_benchmark_' + os.path.splitext(os.path.basename(fname))[0]
+    spec = importlib.util.spec_from_file_location(modname, fname)
+    mod = importlib.util.module_from_spec(spec)
+
+    sys.path.insert(0, os.path.dirname(fname))
+    try:
+        spec.loader.exec_module(mod)
+    finally:
+        sys.path.pop(0)
+
+    return mod
+
+
+def find_benchmarks(paths, patterns=None):
+    """
+    Find all benchmark methods in the given files and directories.
+
+    Parameters
+    ----------
+    paths : list of str
+        Benchmark files and directories containing 'benchmark_*.py' files.
+    patterns : list of str or None
+        If given, only keep benchmarks whose id matches one of these glob patterns.
+
+    Returns
+    -------
+    list of (str, class, str)
+        Id, TestCase class and method name of each benchmark, sorted by id.  Ids have the form
+        '<file name>.<class name>.<method name>'.
+    """
+    fnames = []
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            fnames.extend(os.path.join(path, f) for f in sorted(os.listdir(path))
+                          if fnmatch.fnmatch(f, 'benchmark_*.py'))
+        elif os.path.isfile(path):
+            fnames.append(path)
+        else:
+            raise FileNotFoundError(f"Benchmark file or directory '{path}' doesn't exist.")
+
+    found = []
+    for fname in fnames:
+        mod = _load_module(fname)
+        modname = os.path.splitext(os.path.basename(fname))[0]
+        for cname, klass in vars(mod).items():
+            if not (isinstance(klass, type) and issubclass(klass, unittest.TestCase) and
+                    klass.__module__ == mod.__name__):
+                continue
+            for mname in dir(klass):
+                if mname.startswith('benchmark') and callable(getattr(klass, mname)):
+                    bid = f"{modname}.{cname}.{mname}"
+                    if patterns is None or any(fnmatch.fnmatchcase(bid, p) for p in patterns):
+                        found.append((bid, klass, mname))
+
+    return sorted(found, key=lambda x: x[0])
+
+
+def _run_benchmark(klass, mname, warmup, repeat, timer):
+    """
+    Run a single benchmark and time each repetition.
+
+    Parameters
+    ----------
+    klass : class
+        The TestCase class of the benchmark.
+    mname : str
+        Name of the benchmark method.
+    warmup : int
+        Number of untimed runs before the timed ones.
+    repeat : int
+        Number of timed runs.
+    timer : _PhaseTimer
+        The timer that collects phase times.
+
+    Returns
+    -------
+    dict
+        Result entry containing 'status' and either 'times' or 'message'.
+    """
+    n_procs = getattr(klass, 'N_PROCS', 1)
+    if n_procs > 1:
+        return {'status': 'skipped', 'message': f"requires {n_procs} procs"}
+
+    times = {}
+    case = klass(mname)
+    try:
+        klass.setUpClass()
+        try:
+            for i in range(warmup + repeat):
+                gc.collect()
+                case.setUp()
+                try:
+                    timer.reset()
+                    start = time.perf_counter()
+                    getattr(case, mname)()
+                    total = time.perf_counter() - start
+                finally:
+                    case.tearDown()
+
+                if i >= warmup:
+                    run_times = {'total': total}
+                    run_times.update(timer.times)
+                    # a phase may be entered in some runs only
+                    for phase in run_times:
+                        times.setdefault(phase, [0.] * (i - warmup))
+                    for phase, phase_times in times.items():
+                        phase_times.append(run_times.get(phase, 0.))
+        finally:
+            klass.tearDownClass()
+    except unittest.SkipTest as err:
+        return {'status': 'skipped', 'message': str(err)}
+    except Exception as err:
+        return {'status': 'failed', 'message': f"{type(err).__name__}: {err}"}
+
+    return {'status': 'ok', 'times': times}
+
+
+def run_benchmarks(benchmarks, warmup=1, repeat=5, reports=False, out_stream=sys.stdout):
+    """
+    Run the given benchmarks, each in its own temporary directory.
+
+    Parameters
+    ----------
+    benchmarks : list of (str, class, str)
+        Id, TestCase class and method name of each benchmark, as returned by find_benchmarks.
+    warmup : int
+        Number of untimed runs of each benchmark before the timed ones.
+    repeat : int
+        Number of timed runs of each benchmark.
+    reports : bool
+        If False, Problem reports are turned off while the benchmarks run.
+    out_stream : file-like or None
+        Where to report progress.  No progress is reported if None.
+
+    Returns
+    -------
+    dict
+        Benchmark results containing run 'metadata' and a 'benchmarks' dict keyed by benchmark id.
+        The times of successful benchmarks are lists of seconds per timed run, keyed by phase.
+    """
+    results = {
+        'metadata': {
+            'openmdao_version': __version__,
+            'python_version': platform.python_version(),
+            'numpy_version': np.__version__,
+            'scipy_version': scipy.__version__,
+            'platform': platform.platform(),
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'warmup': warmup,
+            'repeat': repeat,
+        },
+        'benchmarks': {},
+    }
+
+    timer = _PhaseTimer()
+    cwd = os.getcwd()
+    old_reports = os.environ.get('OPENMDAO_REPORTS')
+    if not reports:
+        os.environ['OPENMDAO_REPORTS'] = '0'
+
+    try:
+        with timer.active():
+            for bid, klass, mname in benchmarks:
+                if out_stream is not None:
+                    print(f"{bid} ...", end=' ', file=out_stream, flush=True)
+
+                tempdir = tempfile.mkdtemp(prefix='om_benchmark_')
+                os.chdir(tempdir)
+                try:
+                    result = _run_benchmark(klass, mname, warmup, repeat, timer)
+                finally:
+                    os.chdir(cwd)
+                    shutil.rmtree(tempdir, ignore_errors=True)
+
+                results['benchmarks'][bid] = result
+
+                if out_stream is not None:
+                    if result['status'] == 'ok':
+                        print(f"{np.median(result['times']['total']):.4f} sec", file=out_stream)
+                    else:
+                        print(f"{result['status']} ({result['message']})", file=out_stream)
+    finally:
+        if old_reports is None:
+            os.environ.pop('OPENMDAO_REPORTS', None)
+        else:
+            os.environ['OPENMDAO_REPORTS'] = old_reports
+
+    return results
+
+
+def compare_results(results, baseline, threshold=0.1, alpha=0.05, min_time=1e-3):
+    """
+    Compare benchmark phase times against those of a baseline run.
+
+    A phase is a regression if its median time grew by more than the threshold and, when both
+    runs have enough samples, a one-sided Mann-Whitney U test finds the new times larger with
+    significance alpha.  Improvements are found the same way.  Phases whose median times are
+    below min_time in both runs are never flagged because they're dominated by timer noise.
+
+    Parameters
+    ----------
+    results : dict
+        Results as returned by run_benchmarks.
+    baseline : dict
+        Baseline results in the same format.
+    threshold : float
+        Relative change in median time needed to flag a phase.
+    alpha : float
+        Significance level of the statistical test.
+    min_time : float
+        Median time in seconds below which a phase is never flagged.
+
+    Returns
+    -------
+    list of dict
+        One entry per benchmark phase found in both runs, containing 'benchmark', 'phase',
+        'baseline' and 'new' median times, relative 'change', 'pvalue' (None if the test
+        wasn't applied) and 'status', which is one of 'ok', 'regression' or 'improvement'.
+    """
+    from scipy.stats import mannwhitneyu
+
+    rows = []
+    base_bms = baseline['benchmarks']
+    for bid, result in results['benchmarks'].items():
+        if result['status'] != 'ok' or base_bms.get(bid, {}).get('status') != 'ok':
+            continue
+
+        base_times = base_bms[bid]['times']
+        for phase, new in result['times'].items():
+            if phase not in base_times:
+                continue
+
+            old = base_times[phase]
+            old_med = float(np.median(old))
+            new_med = float(np.median(new))
+            change = (new_med - old_med) / old_med if old_med > 0. else 0.
+
+            status = 'ok'
+            pvalue = None
+            if max(old_med, new_med) >= min_time and abs(change) > threshold:
+                direction = 'greater' if change > 0. else 'less'
+                if len(old) >= _MIN_STAT_SAMPLES and len(new) >= _MIN_STAT_SAMPLES:
+                    pvalue = float(mannwhitneyu(new, old, alternative=direction).pvalue)
+                if pvalue is None or pvalue < alpha:
+                    status = 'regression' if change > 0. else 'improvement'
+
+            rows.append({'benchmark': bid, 'phase': phase, 'baseline': old_med, 'new': new_med,
+                         'change': change, 'pvalue': pvalue, 'status': status})
+
+    return rows
+
+
+def _print_results(results, out_stream):
+    width = max(len(bid) for bid in results['benchmarks']) + 2
+    print(f"\n{'Benchmark':<{width}}{'Phase':<15} {'Median (s)':>11} {'Min (s)':>11}",
+          file=out_stream)
+    for bid, result in results['benchmarks'].items():
+        if result['status'] != 'ok':
+            print(f"{bid:<{width}}{result['status']}", file=out_stream)
+            continue
+        for phase, times in result['times'].items():
+            print(f"{bid:<{width}}{phase:<15} {np.median(times):>11.4f} {np.min(times):>11.4f}",
+                  file=out_stream)
+
+
+def _print_comparison(rows, out_stream):
+    if not rows:
+        print("\nNo benchmarks in common with the baseline.", file=out_stream)
+        return
+
+    width = max(len(row['benchmark']) for row in rows) + 2
+    print(f"\n{'Benchmark':<{width}}{'Phase':<15} {'Baseline (s)':>12} {'New (s)':>11} "
+          f"{'Change':>8} {'p-value':>8}  Status", file=out_stream)
+    for row in rows:
+        pvalue = '' if row['pvalue'] is None else f"{row['pvalue']:.3g}"
+        print(f"{row['benchmark']:<{width}}{row['phase']:<15} {row['baseline']:>12.4f} "
+              f"{row['new']:>11.4f} {row['change']:>+8.1%} {pvalue:>8}  {row['status']}",
+              file=out_stream)
+
+
+def _benchmark_setup_parser(parser):
+    """
+    Set up the openmdao subparser for the 'openmdao benchmark' command.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('paths', nargs='*', default=['benchmark'],
+                        help="Benchmark files and directories containing 'benchmark_*.py' files. "
+                        "Defaults to the 'benchmark' directory.")
+    parser.add_argument('-k', action='append', dest='patterns', default=None,
+                        help='Only run benchmarks whose id (<file>.<class>.<method>) matches this '
+                        'glob pattern. Can be given multiple times.')
+    parser.add_argument('--warmup', action='store', dest='warmup', type=int, default=1,
+                        help='Number of untimed runs of each benchmark. Defaults to 1.')
+    parser.add_argument('--repeat', action='store', dest='repeat', type=int, default=5,
+                        help='Number of timed runs of each benchmark. Defaults to 5.')
+    parser.add_argument('-o', action='store', dest='outfile', default='benchmark_results.json',
+                        help="Name of the JSON results file. Defaults to "
+                        "'benchmark_results.json'.")
+    parser.add_argument('--baseline', action='store', dest='baseline', default=None,
+                        help='JSON results file of a previous run to compare against. The '
+                        'command exits with status 1 if any phase regressed.')
+    parser.add_argument('--threshold', action='store', dest='threshold', type=float, default=0.1,
+                        help='Relative change in median time needed to flag a regression. '
+                        'Defaults to 0.1.')
+    parser.add_argument('--alpha', action='store', dest='alpha', type=float, default=0.05,
+                        help='Significance level of the Mann-Whitney U test used to confirm '
+                        'regressions. Defaults to 0.05.')
+    parser.add_argument('--min_time', action='store', dest='min_time', type=float, default=1e-3,
+                        help='Median time in seconds below which a phase is never flagged. '
+                        'Defaults to 0.001.')
+    parser.add_argument('--list', action='store_true', dest='list',
+                        help="List the benchmarks that would run and exit.")
+    parser.add_argument('--reports', action='store_true', dest='reports',
+                        help="Don't turn off Problem reports while benchmarking.")
+
+
+def _benchmark_cmd(options, user_args):
+    """
+    Run benchmarks and optionally compare against a baseline.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script (unused).
+    """
+    if options.warmup < 0 or options.repeat < 1:
+        print("--warmup must be >= 0 and --repeat must be >= 1.", file=sys.stderr)
+        sys.exit(-1)
+
+    try:
+        benchmarks = find_benchmarks(options.paths, options.patterns)
+    except FileNotFoundError as err:
+        print(err, file=sys.stderr)
+        sys.exit(-1)
+
+    if options.list:
+        for bid, _, _ in benchmarks:
+            print(bid)
+        return
+
+    if not benchmarks:
+        print("No benchmarks found.")
+        return
+
+    baseline = None
+    if options.baseline is not None:
+        with open(options.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    results = run_benchmarks(benchmarks, warmup=options.warmup, repeat=options.repeat,
+                             reports=options.reports)
+
+    with open(options.outfile, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    _print_results(results, sys.stdout)
+
+    if baseline is not None:
+        rows = compare_results(results, baseline, threshold=options.threshold,
+                               alpha=options.alpha, min_time=options.min_time)
+        _print_comparison(rows, sys.stdout)
+
+        regressions = [r for r in rows if r['status'] == 'regression']
+        if regressions:
+            print(f"\n{len(regressions)} benchmark phase(s) regressed.")
+            sys.exit(1)
@@ -0,0 +1,167 @@
+import os
+import json
+import subprocess
+import unittest
+
+from openmdao.devtools.benchmark import find_benchmarks, run_benchmarks, compare_results
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+_bm_file = """
+import unittest
+
+import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarDerivatives
+
+
+class BMSellar(unittest.TestCase):
+
+    def benchmark_sellar(self):
+        p = om.Problem(SellarDerivatives())
+        p.model.add_design_var('x', lower=0., upper=10.)
+        p.model.add_objective('obj')
+        p.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+        p.setup()
+        p.run_model()
+        p.run_driver()
+        p.compute_totals()
+
+    def benchmark_skip(self):
+        raise unittest.SkipTest('not today')
+
+    def benchmark_fail(self):
+        self.assertLess(2, 1)
+
+    def not_a_benchmark(self):
+        pass
+
+
+class BMParallel(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def benchmark_parallel(self):
+        pass
+"""
+
+
+def _results(times):
+    return {'metadata': {},
+            'benchmarks': {'bm': {'status': 'ok', 'times': {'total': times}}}}
+
+
+@use_tempdirs
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        with open('benchmark_sellar.py', 'w') as f:
+            f.write(_bm_file)
+
+    def test_find(self):
+        bids = [bid for bid, _, _ in find_benchmarks(['.'])]
+        self.assertEqual(bids, ['benchmark_sellar.BMParallel.benchmark_parallel',
+                                'benchmark_sellar.BMSellar.benchmark_fail',
+                                'benchmark_sellar.BMSellar.benchmark_sellar',
+                                'benchmark_sellar.BMSellar.benchmark_skip'])
+
+        bids = [bid for bid, _, _ in find_benchmarks(['benchmark_sellar.py'],
+                                                     ['*.benchmark_s*', '*Parallel*'])]
+        self.assertEqual(bids, ['benchmark_sellar.BMParallel.benchmark_parallel',
+                                'benchmark_sellar.BMSellar.benchmark_sellar',
+                                'benchmark_sellar.BMSellar.benchmark_skip'])
+
+        with self.assertRaises(FileNotFoundError):
+            find_benchmarks(['nonexistent_dir'])
+
+    def test_run(self):
+        results = run_benchmarks(find_benchmarks(['.']), warmup=1, repeat=3, out_stream=None)
+        bms = results['benchmarks']
+
+        self.assertEqual(bms['benchmark_sellar.BMParallel.benchmark_parallel'],
+                         {'status': 'skipped', 'message': 'requires 2 procs'})
+        self.assertEqual(bms['benchmark_sellar.BMSellar.benchmark_skip'],
+                         {'status': 'skipped', 'message': 'not today'})
+        self.assertEqual(bms['benchmark_sellar.BMSellar.benchmark_fail'],
+                         {'status': 'failed', 'message': 'AssertionError: 2 not less than 1'})
+
+        result = bms['benchmark_sellar.BMSellar.benchmark_sellar']
+        self.assertEqual(result['status'], 'ok')
+        times = result['times']
+        self.assertEqual(set(times), {'total', 'setup', 'final_setup', 'run_model', 'run_driver',
+                                      'compute_totals', 'linearize', 'recording'})
+        for phase, phase_times in times.items():
+            self.assertEqual(len(phase_times), 3)
+            self.assertTrue(all(t > 0. for t in phase_times), phase)
+
+        # phases don't overlap, so they add up to no more than the total
+        for i in range(3):
+            self.assertLessEqual(sum(t[i] for p, t in times.items() if p != 'total'),
+                                 times['total'][i])
+
+        # benchmarks run in their own directory and the phase methods are restored
+        self.assertFalse(os.path.exists('cases.sql'))
+        from openmdao.core.problem import Problem
+        self.assertFalse(hasattr(Problem.setup, '__wrapped__'))
+
+    def test_compare(self):
+        baseline = _results([1.0, 1.01, 0.99, 1.02, 0.98])
+
+        rows = compare_results(_results([1.5, 1.51, 1.49, 1.52, 1.48]), baseline)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['status'], 'regression')
+        self.assertAlmostEqual(rows[0]['change'], 0.5)
+        self.assertLess(rows[0]['pvalue'], 0.05)
+
+        rows = compare_results(_results([0.5, 0.51, 0.49, 0.52, 0.48]), baseline)
+        self.assertEqual(rows[0]['status'], 'improvement')
+
+        # within the threshold
+        rows = compare_results(_results([1.05, 1.06, 1.04, 1.07, 1.03]), baseline)
+        self.assertEqual(rows[0]['status'], 'ok')
+        self.assertIsNone(rows[0]['pvalue'])
+
+        # median is above the threshold but the samples overlap too much to be significant
+        rows = compare_results(_results([1.2, 0.9, 1.3, 0.95, 1.25]), baseline)
+        self.assertEqual(rows[0]['status'], 'ok')
+        self.assertGreater(rows[0]['pvalue'], 0.05)
+
+        # too few samples for the statistical test, so only the threshold applies
+        rows = compare_results(_results([1.5, 1.6]), _results([1.0, 1.1]))
+        self.assertEqual(rows[0]['status'], 'regression')
+        self.assertIsNone(rows[0]['pvalue'])
+
+        # too fast to flag
+        rows = compare_results(_results([2e-4] * 5), _results([1e-4] * 5))
+        self.assertEqual(rows[0]['status'], 'ok')
+
+        # benchmarks that aren't in the baseline or that didn't succeed are left out
+        self.assertEqual(compare_results(_results([1.0]), {'benchmarks': {}}), [])
+
+    def test_cmdline(self):
+        cmd = ['openmdao', 'benchmark', 'benchmark_sellar.py', '-k', '*sellar', '--warmup', '0',
+               '--repeat', '2', '-o', 'base.json']
+        subprocess.run(cmd, check=True, capture_output=True)  # nosec: trusted input
+
+        with open('base.json') as f:
+            baseline = json.load(f)
+        self.assertEqual(baseline['metadata']['repeat'], 2)
+        self.assertEqual(list(baseline['benchmarks']),
+                         ['benchmark_sellar.BMSellar.benchmark_sellar'])
+
+        # a baseline that's much faster makes the new run a regression.  Only keep the total so
+        # that noise in the other phases can't add regressions.
+        result = baseline['benchmarks']['benchmark_sellar.BMSellar.benchmark_sellar']
+        result['times'] = {'total': [t / 10. for t in result['times']['total']]}
+        with open('fast.json', 'w') as f:
+            json.dump(baseline, f)
+
+        cmd[-1] = 'new.json'
+        proc = subprocess.run(cmd + ['--baseline', 'fast.json'],  # nosec: trusted input
+                              capture_output=True, text=True)
+        self.assertEqual(proc.returncode, 1, proc.stderr)
+        self.assertIn('1 benchmark phase(s) regressed.', proc.stdout)
+        self.assertTrue(os.path.isfile('new.json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,8 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent import concurrent_eval_pool
+from openmdao.utils.om_warnings import issue_warning
 
 
 class DOEDriver(Driver):
@@ -88,6 +90,12 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc='Number of worker processes used to run cases concurrently '
+                                  'when not running under MPI. Each worker is forked from the '
+                                  'current process after setup and so holds its own copy of '
+                                  'the Problem. Requires a platform that supports forking '
+                                  'processes.')
 
     def _setup_comm(self, comm):
         """
@@ -107,6 +115,9 @@ class DOEDriver(Driver):
 
         if not MPI:
             return comm
+        elif self.options['num_workers'] > 1 and comm.size > 1:
+            raise RuntimeError(f"{self.msginfo}: The 'num_workers' option cannot be used when "
+                               "running under MPI. Use the 'run_parallel' option instead.")
         else:
             procs_per_model = self.options['procs_per_model']
 
@@ -186,12 +197,88 @@ class DOEDriver(Driver):
         else:
             case_gen = self.options['generator']
 
-        for case in case_gen(self._designvars, self._problem().model):
-            self._run_case(case)
-            self.iter_count += 1
+        if self.options['num_workers'] > 1:
+            self._run_cases_pool(case_gen(self._designvars, self._problem().model))
+        else:
+            for case in case_gen(self._designvars, self._problem().model):
+                self._run_case(case)
+                self.iter_count += 1
 
         return False
 
+    def _run_cases_pool(self, cases):
+        """
+        Run cases in a pool of worker processes, recording all results from this process.
+
+        Parameters
+        ----------
+        cases : iter of list
+            Iterator over lists of name, value tuples for the design variables.
+        """
+        model = self._problem().model
+
+        for system in model.system_iter(include_self=True, recurse=True):
+            for obj in (system, system.nonlinear_solver, system.linear_solver):
+                if obj is not None and obj._rec_mgr._recorders:
+                    issue_warning("Only Driver recorders are supported when running cases in "
+                                  f"worker processes, so the recorder(s) attached to {obj.msginfo} "
+                                  "will not record any cases.", prefix=self.msginfo)
+
+        args = (([case], None) for case in cases)
+        for icase, records, err in concurrent_eval_pool(self._run_worker_case, args,
+                                                        self.options['num_workers'],
+                                                        initializer=self._setup_worker):
+            if err is not None:
+                raise RuntimeError(f"{self.msginfo}: Case {icase} failed in a worker process:"
+                                   f"\n{err}")
+
+            # replay the data recorded by the worker through this process's recorders, using
+            # the case index as the iteration count so that iteration coordinates are unique.
+            self._recording_iter.push((self._get_name(), icase))
+            try:
+                for kind, data, metadata in records:
+                    if kind == 'iteration':
+                        self._rec_mgr.record_iteration(self, data, metadata)
+                    else:
+                        self._rec_mgr.record_derivatives(self, data, metadata)
+            finally:
+                self._recording_iter.pop()
+
+            self.iter_count += 1
+
+    def _setup_worker(self):
+        """
+        Prepare a newly forked worker process to run cases.
+
+        Recorded data is collected in the worker and sent back to the parent process so that
+        only the parent writes to the recorders.  Recorders attached to systems and solvers
+        are disabled in the worker.
+        """
+        self._rec_mgr = _WorkerRecordCollector(self._rec_mgr)
+
+        for system in self._problem().model.system_iter(include_self=True, recurse=True):
+            for obj in (system, system.nonlinear_solver, system.linear_solver):
+                if obj is not None:
+                    obj._rec_mgr._recorders = []
+
+    def _run_worker_case(self, case):
+        """
+        Run a single case in a worker process.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        list
+            The (kind, data, metadata) tuples recorded while running the case.
+        """
+        self._rec_mgr._records = []
+        self._run_case(case)
+        return self._rec_mgr._records
+
     def _run_case(self, case):
         """
         Run case, save exception info and mark the metadata if the case fails.
@@ -305,3 +392,62 @@ class DOEDriver(Driver):
         """
         self._metadata['name'] = case_name
         return self._metadata
+
+
+class _WorkerRecordCollector(object):
+    """
+    Stand-in for a Driver's RecordingManager in a DOE worker process.
+
+    Collects the data passed to the recording manager so it can be returned to the parent
+    process and recorded there.
+
+    Parameters
+    ----------
+    rec_mgr : RecordingManager
+        The recording manager being replaced.
+
+    Attributes
+    ----------
+    _recorders : list of CaseRecorder
+        The recorders of the replaced recording manager.  These are never called, but their
+        presence signals that recording data should be gathered.
+    _records : list
+        The (kind, data, metadata) tuples collected for the current case.
+    """
+
+    def __init__(self, rec_mgr):
+        """
+        Initialize.
+        """
+        self._recorders = rec_mgr._recorders
+        self._records = []
+
+    def record_iteration(self, recording_requester, data, metadata):
+        """
+        Collect data for a recorded iteration.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Metadata for iteration coordinate.
+        """
+        self._records.append(('iteration', data, metadata))
+
+    def record_derivatives(self, recording_requester, data, metadata):
+        """
+        Collect derivatives data for a recorded iteration.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Metadata for iteration coordinate.
+        """
+        self._records.append(('derivatives', data, metadata))
@@ -7,6 +7,7 @@ import os
 import os.path
 import glob
 import csv
+import multiprocessing
 
 import numpy as np
 
@@ -16,7 +17,7 @@ from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.paraboloid_distributed import DistParab
 from openmdao.test_suite.groups.parallel_groups import FanInGrouped
 
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.general_utils import run_driver, printoptions
 from openmdao.utils.testing_utils import use_tempdirs
 
@@ -1640,6 +1641,107 @@ class TestDOEDriverListVars(unittest.TestCase):
         prob.list_problem_vars()
 
 
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "requires the 'fork' multiprocessing start method")
+@unittest.skipIf(MPI, "process pool DOE is not used under MPI")
+@use_tempdirs
+class TestDOEDriverProcessPool(unittest.TestCase):
+
+    def setUp(self):
+        self.cases = [[('x', x), ('y', y)] for y in (0., .5, 1.) for x in (0., .5, 1.)]
+
+    def _build_problem(self, comp):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', comp, promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(self.cases, num_workers=3)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        return prob
+
+    def test_pool_recording(self):
+        prob = self._build_problem(Paraboloid())
+        prob.driver.recording_options['record_derivatives'] = True
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.iter_count, 9)
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        # cases are recorded in order of completion, but the iteration coordinates
+        # are based on the index of the case in the generator
+        self.assertEqual(sorted(cases, key=lambda c: int(c.rsplit('|', 1)[-1])),
+                         ['rank0:DOEDriver_List|%d' % i for i in range(9)])
+
+        for name in cases:
+            case = cr.get_case(name)
+            icase = int(name.rsplit('|', 1)[-1])
+            x, y = self.cases[icase][0][1], self.cases[icase][1][1]
+
+            self.assertTrue(case.success)
+            assert_near_equal(case.outputs['x'], x)
+            assert_near_equal(case.outputs['y'], y)
+            assert_near_equal(case.outputs['f_xy'],
+                              (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0, 1e-12)
+            assert_near_equal(case.derivatives['f_xy', 'x'].ravel(), 2.0 * x - 6.0 + y, 1e-6)
+            assert_near_equal(case.derivatives['f_xy', 'y'].ravel(), 2.0 * y + 8.0 + x, 1e-6)
+
+    def test_pool_analysis_error(self):
+
+        class FailingParaboloid(Paraboloid):
+
+            def compute(self, inputs, outputs):
+                if inputs['x'] > .7:
+                    raise om.AnalysisError('x is too large')
+                super().compute(inputs, outputs)
+
+        prob = self._build_problem(FailingParaboloid())
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 9)
+
+        for name in cases:
+            case = cr.get_case(name)
+            if case.outputs['x'] > .7:
+                self.assertFalse(case.success)
+                self.assertIn('AnalysisError: x is too large', case.msg)
+            else:
+                self.assertTrue(case.success)
+                self.assertEqual(case.msg, '')
+
+    def test_pool_system_recorder_warning(self):
+        prob = self._build_problem(Paraboloid())
+        prob.model.add_recorder(om.SqliteRecorder("model_cases.sql"))
+
+        prob.setup()
+
+        msg = "DOEDriver: Only Driver recorders are supported when running cases in worker " \
+              "processes, so the recorder(s) attached to <model> <class Group> will not record any cases."
+        with assert_warning(om.OpenMDAOWarning, msg):
+            prob.run_driver()
+
+        prob.cleanup()
+
+        cr = om.CaseReader("cases.sql")
+        self.assertEqual(len(cr.list_cases('driver', out_stream=None)), 9)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @use_tempdirs
 class TestParallelDOE4Proc(unittest.TestCase):
@@ -45,6 +45,9 @@ class AssembledJacobian(Jacobian):
         Column ranges for inputs.
     _out_ranges : dict
         Row ranges for outputs.
+    _direct_plans : dict
+        Mapping of system pathname to the plans used to write its sub-jacobians directly into
+        the internal and external matrices.
     """
 
     def __init__(self, matrix_class, system):
@@ -64,6 +67,7 @@ class AssembledJacobian(Jacobian):
         self._out_ranges = self._get_ranges(system, 'output')
         self._in_ranges = self._get_ranges(system, 'input')
         self._subjac_iters = defaultdict(lambda: None)
+        self._direct_plans = {}
 
     def _get_ranges(self, system, vtype):
         """
@@ -105,6 +109,7 @@ class AssembledJacobian(Jacobian):
         all_meta = system._var_allprocs_abs2meta
 
         self._int_mtx = int_mtx = self._matrix_class(system.comm, True)
+        self._direct_plans = {}
         ext_mtx = self._matrix_class(system.comm, False)
 
         out_ranges = self._out_ranges
@@ -331,34 +336,77 @@ class AssembledJacobian(Jacobian):
 
         iters, iters_in_ext = self._get_subjac_iters(system)
 
-        int_mtx._pre_update()
-        if ext_mtx is not None:
-            ext_mtx._pre_update()
+        if self._randgen or self._under_complex_step or \
+                not self._update_direct(system, iters, iters_in_ext):
+            int_mtx._pre_update()
+            if ext_mtx is not None:
+                ext_mtx._pre_update()
 
-        if self._randgen:
-            for key in iters:
-                int_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['val'], key))
+            if self._randgen:
+                for key in iters:
+                    int_mtx._update_submat(key,
+                                           self._randomize_subjac(subjacs[key]['val'], key))
 
-            for key in iters_in_ext:
-                ext_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['val'], key))
-        else:
+                for key in iters_in_ext:
+                    ext_mtx._update_submat(key,
+                                           self._randomize_subjac(subjacs[key]['val'], key))
+            else:
 
-            for key in iters:
-                int_mtx._update_submat(key, subjacs[key]['val'])
+                for key in iters:
+                    int_mtx._update_submat(key, subjacs[key]['val'])
 
-            for key in iters_in_ext:
-                ext_mtx._update_submat(key, subjacs[key]['val'])
+                for key in iters_in_ext:
+                    ext_mtx._update_submat(key, subjacs[key]['val'])
 
-        int_mtx._post_update()
+            int_mtx._post_update()
 
-        if ext_mtx is not None:
-            ext_mtx._post_update()
+            if ext_mtx is not None:
+                ext_mtx._post_update()
 
         if self._under_complex_step:
             # If we create a new _int_mtx while under complex step, we need to convert it to a
             # complex data type.
             self._int_mtx.set_complex_step_mode(True)
 
+    def _update_direct(self, system, iters, iters_in_ext):
+        """
+        Write the sub-Jacobians of the given system into the global matrices in one step each.
+
+        The location of every sub-Jacobian entry in the final matrix data is computed on the first
+        call, so later updates are a single vectorized scatter with no per-key work or format
+        conversion.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        iters : list
+            Keys of the sub-Jacobians stored in the internal matrix.
+        iters_in_ext : list
+            Keys of the sub-Jacobians stored in the external matrix.
+
+        Returns
+        -------
+        bool
+            True if the matrices were updated, False if the general update must be used instead.
+        """
+        int_mtx = self._int_mtx
+        ext_mtx = self._ext_mtx[system.pathname]
+
+        try:
+            int_plan, ext_plan = self._direct_plans[system.pathname]
+        except KeyError:
+            int_plan = int_mtx._get_direct_plan(iters)
+            ext_plan = None if ext_mtx is None else ext_mtx._get_direct_plan(iters_in_ext)
+            self._direct_plans[system.pathname] = (int_plan, ext_plan)
+
+        if int_plan is None:
+            return False
+
+        subjacs = system._subjacs_info
+        return int_mtx._update_direct(int_plan, subjacs) and \
+            (ext_plan is None or ext_mtx._update_direct(ext_plan, subjacs))
+
     def _apply(self, system, d_inputs, d_outputs, d_residuals, mode):
         """
         Compute matrix-vector product.
@@ -19,6 +19,9 @@ class DictionaryJacobian(Jacobian):
 
     Attributes
     ----------
+    _fused : _FusedSubjacs, None or False
+        Sparse operators combining all subjacs, None if not built yet, or False if the subjacs
+        can't be combined.
     _iter_keys : list of (vname, vname) tuples
         List of tuples of variable names that match subjacs in the this Jacobian.
     """
@@ -29,6 +32,7 @@ class DictionaryJacobian(Jacobian):
         """
         super().__init__(system, **kwargs)
         self._iter_keys = None
+        self._fused = None
 
     def _iter_abs_keys(self, system):
         """
@@ -60,6 +64,44 @@ class DictionaryJacobian(Jacobian):
 
         return self._iter_keys
 
+    def _get_fused(self, system, d_inputs, d_outputs, d_residuals):
+        """
+        Return sparse operators combining all subjacs, with values from the latest linearization.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        d_residuals : Vector
+            residuals linear vector.
+
+        Returns
+        -------
+        _FusedSubjacs or None
+            The combined operators, or None if the subjacs can't be combined.
+        """
+        count = system._problem_meta['linearize_count']
+        fused = self._fused
+
+        if fused is None or fused.linearize_count != count:
+            subjacs_info = self._subjacs_info
+            keys = self._iter_abs_keys(system)
+
+            if fused is None or not fused.update(subjacs_info):
+                fused = _FusedSubjacs(keys, subjacs_info, d_inputs, d_outputs, d_residuals)
+                if not fused.update(subjacs_info):
+                    self._fused = False  # a subjac is a sparse matrix
+                    return
+
+            fused.linearize_count = count
+            self._fused = fused
+
+        return fused
+
     def _apply(self, system, d_inputs, d_outputs, d_residuals, mode):
         """
         Compute matrix-vector product.
@@ -85,6 +127,13 @@ class DictionaryJacobian(Jacobian):
         if not d_out_names and not d_inp_names:
             return
 
+        if self._randgen is None and not self._under_complex_step and self._fused is not False:
+            fused = self._get_fused(system, d_inputs, d_outputs, d_residuals)
+            if fused is not None:
+                with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                    fused.apply(d_inputs, d_outputs, d_residuals, fwd)
+                return
+
         rflat = d_residuals._abs_get_val
         oflat = d_outputs._abs_get_val
         iflat = d_inputs._abs_get_val
@@ -150,6 +199,217 @@ class DictionaryJacobian(Jacobian):
                             left_vec += subjac.dot(right_vec)
 
 
+class _FusedSubjacs(object):
+    """
+    Sparse operators that multiply all subjacs of a DictionaryJacobian at once.
+
+    Residual rows are combined with output columns in one CSR matrix and with input columns in
+    another, so a matrix-vector product needs only two sparse products regardless of the number
+    of subjacs.
+
+    Parameters
+    ----------
+    keys : list of (str, str)
+        Keys of the subjacs to combine.
+    subjacs_info : dict
+        Subjac metadata keyed by absolute name pairs.
+    d_inputs : Vector
+        inputs linear vector.
+    d_outputs : Vector
+        outputs linear vector.
+    d_residuals : Vector
+        residuals linear vector.
+
+    Attributes
+    ----------
+    keys : list of (str, str)
+        Keys of the combined subjacs, in order of their values in the operators.
+    linearize_count : int or None
+        Problem linearization count when the values were last updated.
+    metas : list of dict
+        Metadata of each combined subjac, in order of their values in the operators.
+    mats : dict
+        Mapping of 'output' and 'input' to their CSR matrix, or None if no subjacs have columns
+        of that type.
+    mats_t : dict
+        Transposes of the matrices in mats, sharing their data.
+    perms : dict
+        Mapping of 'output' and 'input' to the index array that puts the concatenated subjac
+        values into CSR order.
+    rows : list
+        The 'rows' entry of each combined subjac when the operators were built.
+    slices : dict
+        Mapping of 'residual', 'output' and 'input' to var name slices in the vectors.
+    _masks : dict
+        Cache of masks that zero out vars that are excluded from a matrix-vector product.
+    _nkeys : dict
+        Mapping of 'output' and 'input' to the number of subjacs in their matrix.
+    """
+
+    def __init__(self, keys, subjacs_info, d_inputs, d_outputs, d_residuals):
+        """
+        Build the sparsity structure of the combined operators.
+        """
+        self.linearize_count = None
+        self.slices = {
+            'residual': d_residuals.get_slice_dict(),
+            'output': d_outputs.get_slice_dict(),
+            'input': d_inputs.get_slice_dict(),
+        }
+        self._masks = {}
+
+        rslices = self.slices['residual']
+        coo = {'output': ([], [], [], []), 'input': ([], [], [], [])}
+        for key in keys:
+            res_name, other_name = key
+            typ = 'output' if other_name in self.slices['output'] else 'input'
+            meta = subjacs_info[key]
+            rows = meta['rows']
+            if rows is None:
+                nrows, ncols = meta['shape']
+                rows, cols = np.divmod(np.arange(nrows * ncols, dtype=INT_DTYPE), ncols)
+            else:
+                cols = meta['cols']
+
+            typkeys, metas, allrows, allcols = coo[typ]
+            typkeys.append(key)
+            metas.append(meta)
+            allrows.append(rows + rslices[res_name].start)
+            allcols.append(cols + self.slices[typ][other_name].start)
+
+        self.keys = []
+        self.metas = []
+        self.rows = []
+        self.mats = {}
+        self.mats_t = {}
+        self.perms = {}
+        self._nkeys = {}
+        nres = len(d_residuals)
+        for typ, vec in (('output', d_outputs), ('input', d_inputs)):
+            typkeys, metas, allrows, allcols = coo[typ]
+            self._nkeys[typ] = len(metas)
+            self.keys.extend(typkeys)
+            self.metas.extend(metas)
+            self.rows.extend(meta['rows'] for meta in metas)
+            if not metas:
+                self.mats[typ] = self.mats_t[typ] = None
+                continue
+
+            allrows = np.concatenate(allrows)
+            allcols = np.concatenate(allcols)
+            perm = np.argsort(allrows, kind='stable')
+            indptr = np.zeros(nres + 1, dtype=INT_DTYPE)
+            np.cumsum(np.bincount(allrows, minlength=nres), out=indptr[1:])
+            self.perms[typ] = perm
+            self.mats[typ] = sp.csr_matrix((np.zeros(perm.size), allcols[perm], indptr),
+                                           shape=(nres, len(vec)))
+            self.mats_t[typ] = self.mats[typ].T
+
+    def update(self, subjacs_info):
+        """
+        Copy the current subjac values into the combined operators.
+
+        Parameters
+        ----------
+        subjacs_info : dict
+            Subjac metadata keyed by absolute name pairs.
+
+        Returns
+        -------
+        bool
+            False if any subjac or its sparsity structure has changed since the operators were
+            built, or if any subjac is a sparse matrix.
+        """
+        metas = self.metas
+        for key, meta, rows in zip(self.keys, metas, self.rows):
+            if subjacs_info.get(key) is not meta or meta['rows'] is not rows:
+                return False
+
+        vals = [meta['val'] for meta in metas]
+        if any(sp.issparse(val) for val in vals):
+            return False
+
+        start = 0
+        for typ in ('output', 'input'):
+            end = start + self._nkeys[typ]
+            mat = self.mats[typ]
+            if mat is not None:
+                flat = np.concatenate([np.ravel(val) for val in vals[start:end]])
+                if flat.size != mat.data.size:
+                    return False
+                mat.data[:] = flat.real[self.perms[typ]]
+            start = end
+
+        return True
+
+    def _get_mask(self, vec, typ):
+        """
+        Return a mask for the vars of the given vector that are excluded from its product.
+
+        Parameters
+        ----------
+        vec : Vector
+            The vector.
+        typ : str
+            'residual', 'output' or 'input'.
+
+        Returns
+        -------
+        ndarray or None
+            Array that is 1 for included entries and 0 for excluded ones, or None if all vars
+            are included.
+        """
+        slices = self.slices[typ]
+        names = vec._names
+        if len(names) == len(slices):
+            return None
+
+        key = (typ, frozenset(names))
+        if key not in self._masks:
+            mask = np.zeros(len(vec))
+            for name in names:
+                mask[slices[name]] = 1.0
+            self._masks[key] = mask
+
+        return self._masks[key]
+
+    def apply(self, d_inputs, d_outputs, d_residuals, fwd):
+        """
+        Compute the matrix-vector product of all subjacs.
+
+        Parameters
+        ----------
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        d_residuals : Vector
+            residuals linear vector.
+        fwd : bool
+            If True compute the forward product, otherwise the reverse product.
+        """
+        rmask = self._get_mask(d_residuals, 'residual')
+        rarr = d_residuals.asarray()
+
+        for typ, vec in (('output', d_outputs), ('input', d_inputs)):
+            mat = self.mats[typ]
+            if mat is None or not vec._names:
+                continue
+
+            mask = self._get_mask(vec, typ)
+            arr = vec.asarray()
+            if fwd:
+                prod = mat.dot(arr if mask is None else arr * mask)
+                if rmask is not None:
+                    prod *= rmask
+                rarr += prod
+            else:
+                prod = self.mats_t[typ].dot(rarr if rmask is None else rarr * rmask)
+                if mask is not None:
+                    prod *= mask
+                arr += prod
+
+
 class _CheckingJacobian(DictionaryJacobian):
     """
     A special type of Jacobian that we use only inside of check_partials.
@@ -161,6 +421,7 @@ class _CheckingJacobian(DictionaryJacobian):
     def __init__(self, system):
         super().__init__(system)
         self._subjacs_info = self._subjacs_info.copy()
+        self._fused = False
 
         # Convert any scipy.sparse subjacs to OpenMDAO's interal COO specification.
         for key, subjac in self._subjacs_info.items():
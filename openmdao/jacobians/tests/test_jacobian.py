@@ -13,6 +13,7 @@ from openmdao.api import IndepVarComp, Group, Problem, \
                          LinearBlockGS, DirectSolver
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
 from openmdao.utils.array_utils import rand_sparsity
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.api import ScipyOptimizeDriver
 
@@ -1224,5 +1225,162 @@ class MaskingTestCase(unittest.TestCase):
         np.testing.assert_allclose(totals, expected)
 
 
+class FusedApplyComp(ImplicitComponent):
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_input('z', np.ones(2))
+        self.add_output('y', np.ones(3))
+        self.add_output('w', np.ones(2))
+
+        self.declare_partials('y', 'x', rows=[0, 1, 2, 2], cols=[0, 1, 1, 2])
+        self.declare_partials('y', 'y')
+        self.declare_partials('y', 'w', val=np.array([[1., 0.], [2., 3.], [0., 4.]]))
+        self.declare_partials('w', 'z', rows=[0, 1], cols=[0, 1])
+        self.declare_partials('w', ['x', 'w'])
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        pass
+
+    def linearize(self, inputs, outputs, partials):
+        x = inputs['x']
+        partials['y', 'x'] = np.array([1., 2., 3., 4.]) * x[0]
+        partials['y', 'y'] = np.eye(3) * 20. + np.arange(9.).reshape((3, 3)) * x[1]
+        partials['w', 'z'] = [5., 6.]
+        partials['w', 'x'] = np.arange(6.).reshape((2, 3)) * x[2]
+        partials['w', 'w'] = np.eye(2) * 7.
+
+
+@use_tempdirs
+class FusedApplyTestCase(unittest.TestCase):
+
+    def _apply(self, comp, mode, ins, outs, resids, fused, scope_out=None, scope_in=None):
+        jac = comp._jacobian
+        jac._fused = None if fused else False
+        comp._dinputs.set_val(ins)
+        comp._doutputs.set_val(outs)
+        comp._dresiduals.set_val(resids)
+        with comp._matvec_context(scope_out, scope_in, mode, clear=False) as vecs:
+            jac._apply(comp, *vecs, mode)
+
+        return (comp._dinputs.asarray(copy=True), comp._doutputs.asarray(copy=True),
+                comp._dresiduals.asarray(copy=True))
+
+    def test_fused_apply(self):
+        prob = Problem()
+        comp = prob.model.add_subsystem('comp', FusedApplyComp())
+        prob.setup()
+        prob.run_model()
+
+        rng = np.random.default_rng(7)
+        for xval in (np.array([1., 2., 3.]), np.array([-1., .5, 2.])):
+            prob.set_val('comp.x', xval)
+            prob.model.run_linearize()
+
+            for mode in ('fwd', 'rev'):
+                for scope_out, scope_in in ((None, None),
+                                            ({'comp.y'}, {'comp.x'}),
+                                            ({'comp.w'}, set())):
+                    ins = rng.random(5)
+                    outs = rng.random(5)
+                    resids = rng.random(5)
+                    expected = self._apply(comp, mode, ins, outs, resids, False, scope_out,
+                                           scope_in)
+                    actual = self._apply(comp, mode, ins, outs, resids, True, scope_out,
+                                         scope_in)
+                    for a, e in zip(actual, expected):
+                        assert_near_equal(a, e, 1e-15)
+
+            self.assertIsNotNone(comp._jacobian._fused)
+
+    def test_fused_totals(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('comp', FusedApplyComp())
+        model.linear_solver = ScipyKrylov(atol=1e-14, rtol=1e-14)
+        prob.setup()
+        prob.set_val('comp.x', [1., 2., 3.])
+        prob.run_model()
+
+        fused = prob.compute_totals(['comp.y', 'comp.w'], ['comp.x', 'comp.z'],
+                                    return_format='array')
+
+        model.comp._jacobian._fused = False
+        prob.model.run_linearize()
+        expected = prob.compute_totals(['comp.y', 'comp.w'], ['comp.x', 'comp.z'],
+                                       return_format='array')
+        self.assertFalse(model.comp._jacobian._fused)
+
+        assert_near_equal(fused, expected, 1e-10)
+
+
+@use_tempdirs
+class DirectUpdateTestCase(unittest.TestCase):
+
+    def _build(self, jac_type):
+        prob = Problem()
+        model = prob.model
+        ivc = model.add_subsystem('ivc', IndepVarComp())
+        ivc.add_output('x', np.array([1., 2., 3.]), units='m')
+        ivc.add_output('z', np.array([2., 4.]))
+
+        model.add_subsystem('comp', FusedApplyComp())
+        model.add_subsystem('C1', ExecComp('y=3.0*x[0]**3 + 2.0*x[1]**2 * x[2]',
+                                           x={'val': np.zeros(3), 'units': 'cm'}))
+        model.add_subsystem('C2', MySparseComp())
+
+        model.connect('ivc.x', 'comp.x')
+        model.connect('ivc.z', 'comp.z')
+        model.connect('ivc.x', 'C1.x', src_indices=[1, 1, 2])
+        model.connect('comp.w', ('C2.x', 'C2.y'))
+
+        model.options['assembled_jac_type'] = jac_type
+        model.linear_solver = DirectSolver(assemble_jac=True)
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def test_direct_update(self):
+        of = ['C1.y', 'C2.z', 'comp.y']
+        wrt = ['ivc.x', 'ivc.z']
+
+        for jac_type in ('csc', 'dense'):
+            with self.subTest(jac_type=jac_type):
+                prob = self._build(jac_type)
+                model = prob.model
+                jac = model._assembled_jac
+                model.run_linearize()
+                mtx = jac._int_mtx
+                first = mtx._matrix
+
+                for x in ([1., 2., 3.], [-1., .5, 2.]):
+                    prob.set_val('ivc.x', x)
+                    model.run_linearize()
+                    direct = mtx._matrix if jac_type == 'dense' else mtx._matrix.toarray()
+                    direct = direct.copy()
+
+                    # the general update path must assemble the same matrix
+                    jac._update_direct = lambda *args: False
+                    model.run_linearize()
+                    del jac._update_direct
+                    expected = mtx._matrix if jac_type == 'dense' else mtx._matrix.toarray()
+
+                    assert_near_equal(direct, expected, 1e-15)
+
+                # the final matrix is updated in place
+                model.run_linearize()
+                self.assertIs(mtx._matrix, first)
+                self.assertIn('', jac._direct_plans)
+
+                prob.run_model()
+                totals = prob.compute_totals(of, wrt, return_format='array')
+
+                prob = self._build(jac_type)
+                prob.model.linear_solver = DirectSolver(assemble_jac=False)
+                prob.setup()
+                prob.set_val('ivc.x', x)
+                prob.run_model()
+                expected = prob.compute_totals(of, wrt, return_format='array')
+                assert_near_equal(totals, expected, 1e-12)
+
 if __name__ == '__main__':
     unittest.main()
@@ -24,6 +24,11 @@ class COOMatrix(Matrix):
     ----------
     _coo : coo_matrix
         COO matrix. Used as a basis for conversion to CSC, CSR, Dense in inherited classes.
+    _coo2mat : ndarray or None
+        Location of each COO entry in the flattened data of the final matrix, or None if the
+        final matrix is the COO matrix itself.
+    _mat_dups : bool
+        True if more than one COO entry maps to the same entry of the final matrix.
     """
 
     def __init__(self, comm, is_internal):
@@ -32,6 +37,8 @@ class COOMatrix(Matrix):
         """
         super().__init__(comm, is_internal)
         self._coo = None
+        self._coo2mat = None
+        self._mat_dups = False
 
     def _build_coo(self, system):
         """
@@ -178,6 +185,118 @@ class COOMatrix(Matrix):
         if factor is not None:
             self._matrix.data[idxs] *= factor
 
+    def _get_direct_plan(self, keys):
+        """
+        Compute the indices used to write the given sub-jacobians directly into the matrix.
+
+        Parameters
+        ----------
+        keys : list of (str, str)
+            Keys of the sub-jacobians that are updated together.
+
+        Returns
+        -------
+        tuple
+            Keys of ndarray sub-jacobians, keys of sparse sub-jacobians, location of each
+            concatenated sub-jacobian value in the COO data, location of each value in the data of
+            the final matrix (None if entries must be summed) and unit factors (or None).
+        """
+        dense = []
+        sparse = []
+        for key in keys:
+            idxs, jac_type, factor = self._metadata[key]
+            if isinstance(idxs, slice):
+                idxs = np.arange(idxs.start, idxs.stop, dtype=INT_DTYPE)
+            if jac_type is ndarray or jac_type is list:
+                dense.append((key, idxs, factor))
+            else:
+                sparse.append((key, idxs, factor))
+
+        entries = dense + sparse
+        if entries:
+            coo_pos = np.concatenate([idxs for _, idxs, _ in entries])
+        else:
+            coo_pos = np.zeros(0, dtype=INT_DTYPE)
+
+        factors = None
+        if any(factor is not None for _, _, factor in entries):
+            factors = np.concatenate([np.full(idxs.size, 1.0 if factor is None else factor)
+                                      for _, idxs, factor in entries])
+
+        mat_pos = None
+        if self._coo2mat is not None and not self._mat_dups:
+            mat_pos = self._coo2mat[coo_pos]
+
+        return [e[0] for e in dense], [e[0] for e in sparse], coo_pos, mat_pos, factors
+
+    def _update_direct(self, plan, subjacs):
+        """
+        Write sub-jacobian values into the matrix in a single vectorized step.
+
+        Parameters
+        ----------
+        plan : tuple
+            Indices computed by _get_direct_plan.
+        subjacs : dict
+            Sub-jacobian metadata keyed by (of, wrt).
+
+        Returns
+        -------
+        bool
+            True if the matrix was updated, False if the sizes of the sub-jacobians no longer
+            match the plan.
+        """
+        dense_keys, sparse_keys, coo_pos, mat_pos, factors = plan
+
+        vals = [subjacs[key]['val'].ravel() for key in dense_keys]
+        if sparse_keys:
+            vals.extend([subjacs[key]['val'].data for key in sparse_keys])
+
+        if vals:
+            vals = np.concatenate(vals)
+            if vals.size != coo_pos.size:
+                return False
+            if factors is not None:
+                vals *= factors
+            self._coo.data[coo_pos] = vals
+
+        self._update_final(mat_pos, vals)
+        return True
+
+    def _update_final(self, mat_pos, vals):
+        """
+        Update the final matrix after new values have been written into the COO data.
+
+        Parameters
+        ----------
+        mat_pos : ndarray or None
+            Location of each value in the data of the final matrix, or None to recompute
+            all of it from the COO data.
+        vals : ndarray or list
+            The new values.
+        """
+        self._matrix = self._coo
+
+    def _sum_coo_data(self, size):
+        """
+        Return the COO data with entries mapping to the same location of the final matrix summed.
+
+        Parameters
+        ----------
+        size : int
+            Size of the data of the final matrix.
+
+        Returns
+        -------
+        ndarray
+            The summed data.
+        """
+        data = self._coo.data
+        if np.iscomplexobj(data):
+            return (np.bincount(self._coo2mat, data.real, minlength=size) +
+                    1j * np.bincount(self._coo2mat, data.imag, minlength=size))
+        return np.bincount(self._coo2mat, data, minlength=size)
+
     def _prod(self, in_vec, mode, mask=None):
         """
         Perform a matrix vector product.
@@ -3,6 +3,7 @@
 import numpy as np
 from scipy.sparse import csc_matrix
 
+from openmdao.core.constants import INT_DTYPE
 from openmdao.matrices.coo_matrix import COOMatrix
 
 
@@ -16,8 +17,20 @@ class CSCMatrix(COOMatrix):
         Communicator of the top-level system that owns the <Jacobian>.
     is_internal : bool
         If True, this is the int_mtx of an AssembledJacobian.
+
+    Attributes
+    ----------
+    _csc : csc_matrix
+        CSC matrix whose data is updated in place.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(comm, is_internal)
+        self._csc = None
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -32,7 +45,18 @@ class CSCMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols, system)
-        self._coo = self._matrix
+        coo = self._coo = self._matrix
+
+        # compute the structure of the CSC matrix once, along with the location of each COO
+        # entry in its data array, so that updates don't require a COO to CSC conversion.
+        flat = coo.col.astype(np.int64) * num_rows + coo.row
+        uniq, self._coo2mat = np.unique(flat, return_inverse=True)
+        self._mat_dups = uniq.size < flat.size
+
+        indptr = np.zeros(num_cols + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(uniq // max(num_rows, 1), minlength=num_cols), out=indptr[1:])
+        self._csc = csc_matrix((np.zeros(uniq.size), (uniq % max(num_rows, 1)).astype(INT_DTYPE),
+                                indptr), shape=coo.shape)
 
     def _pre_update(self):
         """
@@ -44,12 +68,33 @@ class CSCMatrix(COOMatrix):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        coo = self._coo
-        # this will add any repeated entries together
-        # NOTE: The CSC matrix was created in the following way instead of using self._coo.tocsc()
-        # because on older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the
-        # result is that self._coo.row and self._coo.col get scrambled after csc conversion.
-        self._matrix = csc_matrix((coo.data, (coo.row, coo.col)), shape=coo.shape)
+        self._update_final(None, None)
+
+    def _update_final(self, mat_pos, vals):
+        """
+        Update the final matrix after new values have been written into the COO data.
+
+        Parameters
+        ----------
+        mat_pos : ndarray or None
+            Location of each value in the data of the final matrix, or None to recompute
+            all of it from the COO data.
+        vals : ndarray or list
+            The new values.
+        """
+        csc = self._csc
+        data = csc.data
+        if data.dtype != self._coo.data.dtype or not data.flags.c_contiguous:
+            # complex step mode was changed since the last update
+            data = csc.data = np.empty(data.size, dtype=self._coo.data.dtype)
+            mat_pos = None
+
+        if mat_pos is None:
+            # this will add any repeated entries together
+            data[:] = self._sum_coo_data(data.size)
+        else:
+            data[mat_pos] = vals
+        self._matrix = csc
 
     def _convert_mask(self, mask):
         """
@@ -65,9 +110,7 @@ class CSCMatrix(COOMatrix):
         ndarray
             The converted mask array.
         """
-        coo = self._coo
-        csc = csc_matrix((mask, (coo.row, coo.col)), shape=coo.shape)
-        return csc.data
+        return np.bincount(self._coo2mat, mask, minlength=self._csc.data.size) > 0
 
     def set_complex_step_mode(self, active):
         """
@@ -19,8 +19,20 @@ class DenseMatrix(COOMatrix):
         Communicator of the top-level system that owns the <Jacobian>.
     is_internal : bool
         If True, this is the int_mtx of an AssembledJacobian.
+
+    Attributes
+    ----------
+    _dense : ndarray
+        Dense matrix that is updated in place.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(comm, is_internal)
+        self._dense = None
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -35,7 +47,12 @@ class DenseMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols)
-        self._coo = self._matrix
+        coo = self._coo = self._matrix
+
+        # location of each COO entry in the flattened dense matrix
+        self._coo2mat = coo.row.astype(np.int64) * num_cols + coo.col
+        self._mat_dups = np.unique(self._coo2mat).size < self._coo2mat.size
+        self._dense = np.zeros(coo.shape)
 
     def _prod(self, in_vec, mode, mask=None):
         """
@@ -118,5 +135,29 @@ class DenseMatrix(COOMatrix):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        # this will add any repeated entries together
-        self._matrix = self._coo.toarray()
+        self._update_final(None, None)
+
+    def _update_final(self, mat_pos, vals):
+        """
+        Update the final matrix after new values have been written into the COO data.
+
+        Parameters
+        ----------
+        mat_pos : ndarray or None
+            Location of each value in the flattened dense matrix, or None to recompute
+            all of it from the COO data.
+        vals : ndarray or list
+            The new values.
+        """
+        dense = self._dense
+        if dense.dtype != self._coo.data.dtype:
+            # complex step mode was changed since the last update
+            dense = self._dense = np.zeros(dense.shape, dtype=self._coo.data.dtype)
+            mat_pos = None
+
+        if mat_pos is None:
+            # this will add any repeated entries together
+            dense.reshape(-1)[:] = self._sum_coo_data(dense.size)
+        else:
+            dense.reshape(-1)[mat_pos] = vals
+        self._matrix = dense
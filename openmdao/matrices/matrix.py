@@ -96,6 +96,40 @@ class Matrix(object):
         """
         pass
 
+    def _get_direct_plan(self, keys):
+        """
+        Compute the indices used to write the given sub-jacobians directly into the matrix.
+
+        Parameters
+        ----------
+        keys : list of (str, str)
+            Keys of the sub-jacobians that are updated together.
+
+        Returns
+        -------
+        object or None
+            Implementation-specific plan, or None if direct updates are not supported.
+        """
+        return None
+
+    def _update_direct(self, plan, subjacs):
+        """
+        Write sub-jacobian values into the matrix in a single vectorized step.
+
+        Parameters
+        ----------
+        plan : object
+            Plan returned by _get_direct_plan.
+        subjacs : dict
+            Sub-jacobian metadata keyed by (of, wrt).
+
+        Returns
+        -------
+        bool
+            True if the matrix was updated.
+        """
+        return False
+
     def _prod(self, vec, mode, mask=None):
         """
         Perform a matrix vector product.
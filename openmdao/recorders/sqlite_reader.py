@@ -11,7 +11,7 @@ from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case import Case
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.utils.variable_table import write_source_table
-from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
+from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system, deserialize
 from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 
 from openmdao.recorders.sqlite_recorder import format_version, META_KEY_SEP
@@ -25,6 +25,12 @@ import re
 from json import loads as json_loads
 from io import TextIOBase
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 
 class SqliteCaseReader(BaseCaseReader):
     """
@@ -946,6 +952,143 @@ class SqliteCaseReader(BaseCaseReader):
 
         raise RuntimeError('Case not found:', case_id)
 
+    def _get_case_table(self, source):
+        """
+        Get the case table that holds the cases for the given source.
+
+        Parameters
+        ----------
+        source : str
+            'problem', 'driver', component pathname or solver pathname.
+
+        Returns
+        -------
+        CaseTable
+            The case table containing cases from the source.
+        """
+        if source == 'driver':
+            return self._driver_cases
+        elif source == 'problem':
+            if self._format_version >= 2:
+                return self._problem_cases
+            raise RuntimeError('No problem cases recorded (data format = %d).' %
+                               self._format_version)
+        elif source in self._system_cases.list_sources():
+            return self._system_cases
+        elif source in self._solver_cases.list_sources():
+            return self._solver_cases
+
+        raise RuntimeError('Source not found: %s' % source)
+
+    def iter_var_history(self, names, source='driver', chunk_size=1000):
+        """
+        Iterate over the recorded values of the given variables in chunks of cases.
+
+        Values are read directly from the database without creating a Case object for each
+        case, and only the requested variables are extracted.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Promoted or absolute names of the variables.
+        source : str
+            'problem', 'driver', component pathname or solver pathname.
+        chunk_size : int
+            Maximum number of cases in each chunk.
+
+        Yields
+        ------
+        dict
+            Dictionary mapping each name to a 2-D array containing one flattened value per case.
+        """
+        if self._format_version < 3:
+            raise RuntimeError('Variable history is not available for data format %d.' %
+                               self._format_version)
+
+        if isinstance(names, str):
+            names = [names]
+
+        yield from self._get_case_table(source)._iter_var_history(names, source, chunk_size)
+
+    def get_var_history(self, names, source='driver', chunk_size=1000):
+        """
+        Get the recorded values of the given variables stacked over all cases from a source.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Promoted or absolute names of the variables.
+        source : str
+            'problem', 'driver', component pathname or solver pathname.
+        chunk_size : int
+            Number of cases read from the database at a time.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each name to a 2-D array containing one flattened value per case.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        chunks = {name: [] for name in names}
+        for chunk in self.iter_var_history(names, source, chunk_size):
+            for name, vals in chunk.items():
+                chunks[name].append(vals)
+
+        return {name: np.concatenate(vals) if vals else np.zeros((0, 0))
+                for name, vals in chunks.items()}
+
+    def export_var_history(self, filename, names, source='driver', chunk_size=1000):
+        """
+        Write the recorded values of the given variables to a .npz or .parquet file.
+
+        In a .npz file each variable is stored as a 2-D array with one row per case. In a
+        .parquet file there is one column per variable, holding fixed size lists for variables
+        with more than one element. Writing parquet files requires the 'pyarrow' package.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to write. The format is determined by the extension.
+        names : str or list of str
+            Promoted or absolute names of the variables.
+        source : str
+            'problem', 'driver', component pathname or solver pathname.
+        chunk_size : int
+            Number of cases read from the database at a time.
+        """
+        ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+
+        if ext == 'npz':
+            np.savez(filename, **self.get_var_history(names, source, chunk_size))
+        elif ext == 'parquet':
+            if pyarrow is None:
+                raise RuntimeError("Exporting variable history to a parquet file requires the "
+                                   "'pyarrow' package, which can be installed with:\n"
+                                   "    pip install pyarrow")
+
+            writer = None
+            try:
+                for chunk in self.iter_var_history(names, source, chunk_size):
+                    columns = {}
+                    for name, vals in chunk.items():
+                        if vals.shape[1] == 1:
+                            columns[name] = pyarrow.array(vals[:, 0])
+                        else:
+                            columns[name] = pyarrow.FixedSizeListArray.from_arrays(
+                                pyarrow.array(vals.ravel()), vals.shape[1])
+                    table = pyarrow.table(columns)
+                    if writer is None:
+                        writer = pyarrow.parquet.ParquetWriter(filename, table.schema)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+        else:
+            raise ValueError(f"Can't export variable history to '{filename}'. The file "
+                             "extension must be '.npz' or '.parquet'.")
+
 
 class CaseTable(object):
     """
@@ -1301,6 +1444,133 @@ class CaseTable(object):
         """
         return get_source_system(iteration_coordinate)
 
+    def _get_var_keys(self, name):
+        """
+        Get the keys under which a variable may be found in the recorded values.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        list of str
+            Candidate keys, in order of preference.
+        """
+        prom2abs = self._prom2abs
+        keys = [name]
+
+        if name in prom2abs['output']:
+            keys.append(prom2abs['output'][name][0])
+        elif name in prom2abs['input']:
+            # promoted inputs connected to an auto_ivc may be recorded under the source name
+            abs_in = prom2abs['input'][name][0]
+            keys.append(abs_in)
+            if self._conns and abs_in in self._conns:
+                keys.append(self._conns[abs_in])
+        elif self._conns and name in self._conns:
+            keys.append(self._conns[name])
+
+        for src, target in self._auto_ivc_map.items():
+            if target == name:
+                keys.append(src)
+
+        return keys
+
+    def _iter_var_history(self, names, source, chunk_size):
+        """
+        Iterate over the recorded values of the given variables in chunks of cases.
+
+        Parameters
+        ----------
+        names : list of str
+            Promoted or absolute names of the variables.
+        source : str
+            The source of the cases.
+        chunk_size : int
+            Maximum number of cases in each chunk.
+
+        Yields
+        ------
+        dict
+            Dictionary mapping each name to a 2-D array containing one flattened value per case.
+        """
+        if self._table_name == 'solver_iterations':
+            columns = ('solver_output', 'solver_inputs')
+        else:
+            columns = ('outputs', 'inputs')
+
+        candidates = {name: self._get_var_keys(name) for name in names}
+        args = (self._abs2meta, self._prom2abs, self._conns)
+
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute(f"SELECT {self._index_name}, {columns[0]}, {columns[1]} "  # nosec
+                        f"FROM {self._table_name} ORDER BY id ASC")
+
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+
+                chunk = {name: [] for name in names}
+                for case_id, outputs, inputs in rows:
+                    if source in ('driver', 'problem') or self._get_source(case_id) == source:
+                        values = [outputs, inputs]
+                        for name, keys in candidates.items():
+                            chunk[name].append(self._find_value(values, keys, name, case_id,
+                                                                args))
+
+                if chunk and chunk[names[0]]:
+                    yield {name: np.vstack(vals) for name, vals in chunk.items()}
+
+        con.close()
+
+    def _find_value(self, values, keys, name, case_id, args):
+        """
+        Find the value of a variable in the recorded outputs or inputs of a case.
+
+        The recorded data is only decoded the first time it is searched.
+
+        Parameters
+        ----------
+        values : list
+            The recorded outputs and inputs of the case, replaced in place when decoded.
+        keys : list of str
+            Candidate keys for the variable.
+        name : str
+            Name of the variable, used in error messages.
+        case_id : str
+            Name of the case, used in error messages.
+        args : tuple
+            Additional args needed by deserialize.
+
+        Returns
+        -------
+        ndarray
+            The flattened value of the variable.
+        """
+        for i, data in enumerate(values):
+            if data is None:
+                continue
+            if isinstance(data, (str, bytes)):
+                data = values[i] = deserialize(data, *args)
+                if data is None:
+                    continue
+
+            if isinstance(data, np.ndarray):
+                found = data.dtype.names
+                data = data[0]
+            else:
+                found = data
+
+            for key in keys:
+                if key in found:
+                    return np.asarray(data[key]).ravel()
+
+        raise KeyError(f"Variable '{name}' not found in case '{case_id}'.")
+
     def _get_row_source(self, row_id):
         """
         Get the source of the case at the specified row of this table.
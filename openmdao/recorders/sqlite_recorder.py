@@ -8,6 +8,7 @@ from io import BytesIO
 import os
 import gc
 import sqlite3
+import time
 from itertools import chain
 
 import json
@@ -32,6 +33,9 @@ from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 """
 SQL case database version history.
 ----------------------------------
+15-- OpenMDAO 3.25.1
+     Iteration inputs, outputs and residuals may be stored as binary numpy structured arrays
+     instead of JSON text.
 14-- OpenMDAO 3.8.1
      Metadata pickle and JSON blobs are compressed.
      Save metadata separately for parallel runs.
@@ -64,11 +68,31 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 14
+format_version = 15
 
 # separator, cannot be a legal char for names
 META_KEY_SEP = '!'
 
+# insert statements for the case tables, used when flushing buffered cases
+_INSERT_SQL = {
+    'driver_iterations': "INSERT INTO driver_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?,?)",
+    'driver_derivatives': "INSERT INTO driver_derivatives(id, counter, iteration_coordinate, "
+                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?,?)",
+    'problem_cases': "INSERT INTO problem_cases(id, counter, case_name, timestamp, success, "
+                     "msg, inputs, outputs, residuals, jacobian, abs_err, rel_err) "
+                     "VALUES(?,?,?,?,?,?,?,?,?,?,?,?)",
+    'system_iterations': "INSERT INTO system_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?,?)",
+    'solver_iterations': "INSERT INTO solver_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, abs_err, rel_err, solver_inputs, "
+                         "solver_output, solver_residuals) VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+    'global_iterations': "INSERT INTO global_iterations(record_type, rowid, source) "
+                         "VALUES(?,?,?)",
+}
+
 
 def array_to_blob(array):
     """
@@ -130,6 +154,17 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    buffer_size : int, optional
+        Number of cases to hold in memory before writing them to the database in a single
+        transaction. The default of 1 writes every case as soon as it is recorded. Buffered
+        cases are written when the recorder is shut down, so Problem.cleanup() must be called
+        before reading a file recorded with a buffer_size greater than 1.
+    flush_interval : float or None, optional
+        If not None, buffered cases are also written once this many seconds have passed
+        since the last write.
+    binary_values : bool, optional
+        If True, store iteration inputs, outputs and residuals as binary numpy arrays rather
+        than JSON text whenever all of the values are floating point arrays.
 
     Attributes
     ----------
@@ -156,9 +191,24 @@ class SqliteRecorder(CaseRecorder):
         Flag indicating whether or not the database has been initialized.
     _started : set
         set of recording requesters for which this recorder has been started.
+    _buffer_size : int
+        Number of cases to hold in memory before writing them to the database.
+    _flush_interval : float or None
+        Maximum number of seconds between writes of buffered cases.
+    _binary_values : bool
+        If True, store iteration values as binary numpy arrays when possible.
+    _buffer : dict
+        Rows waiting to be written, keyed by table name.
+    _num_buffered : int
+        Number of cases currently held in the buffer.
+    _last_flush : float
+        Time of the last write of buffered cases to the database.
+    _rowids : dict
+        The id of the last row added to each case table, keyed by table name.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 buffer_size=1, flush_interval=None, binary_values=False):
         """
         Initialize the SqliteRecorder.
         """
@@ -178,6 +228,18 @@ class SqliteRecorder(CaseRecorder):
         self._database_initialized = False
         self._started = set()
 
+        if buffer_size < 1:
+            raise ValueError(f"SqliteRecorder buffer_size must be at least 1, but {buffer_size} "
+                             "was given.")
+
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._binary_values = binary_values
+        self._buffer = {table: [] for table in _INSERT_SQL}
+        self._num_buffered = 0
+        self._last_flush = time.perf_counter()
+        self._rowids = {table: 0 for table in _INSERT_SQL}
+
         super().__init__(record_viewer_data)
 
     def _initialize_database(self, comm):
@@ -465,6 +527,78 @@ class SqliteRecorder(CaseRecorder):
 
         self._started.add(recording_requester)
 
+    def _encode_values(self, values):
+        """
+        Convert a dict of variable values to a form that can be stored in the database.
+
+        Parameters
+        ----------
+        values : dict or None
+            Dictionary mapping variable names to values.
+
+        Returns
+        -------
+        str or blob
+            JSON text, or a blob containing a numpy structured array if binary values are
+            enabled and all values are floating point arrays.
+        """
+        if self._binary_values and values and \
+                all(isinstance(v, np.ndarray) and v.dtype.kind == 'f' for v in values.values()):
+            return array_to_blob(dict_to_structured_array(values))
+
+        if values is not None:
+            # convert to list so this can be dumped as JSON
+            for var in values:
+                values[var] = make_serializable(values[var])
+
+        return json.dumps(values)
+
+    def _add_row(self, table, row, record_type=None, source=None):
+        """
+        Add a row for a case table to the buffer, writing the buffer out if necessary.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table.
+        row : tuple
+            Values of the row, excluding the id.
+        record_type : str or None
+            Record type used in the global_iterations table. If None, no entry is made in the
+            global_iterations table.
+        source : str or None
+            Source used in the global_iterations table.
+        """
+        # row ids are assigned here rather than taken from the cursor so that rows can be
+        # inserted in bulk and still be referenced from the global_iterations table.
+        self._rowids[table] += 1
+        rowid = self._rowids[table]
+        self._buffer[table].append((rowid,) + row)
+
+        if record_type is not None:
+            self._buffer['global_iterations'].append((record_type, rowid, source))
+
+        self._num_buffered += 1
+
+        if self._num_buffered >= self._buffer_size or \
+                (self._flush_interval is not None and
+                 time.perf_counter() - self._last_flush >= self._flush_interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered cases to the database in a single transaction.
+        """
+        if self.connection and self._num_buffered > 0:
+            with self.connection as c:
+                for table, rows in self._buffer.items():
+                    if rows:
+                        c.executemany(_INSERT_SQL[table], rows)
+                        rows.clear()
+
+        self._num_buffered = 0
+        self._last_flush = time.perf_counter()
+
     def record_iteration_driver(self, driver, data, metadata):
         """
         Record data and metadata from a Driver.
@@ -485,33 +619,15 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            outputs = data['output']
-            inputs = data['input']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
+            inputs = self._encode_values(data['input'])
+            outputs = self._encode_values(data['output'])
+            residuals = self._encode_values(data['residual'])
 
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
+            self._add_row('driver_iterations',
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, driver._get_name()))
+                           inputs, outputs, residuals),
+                          'driver', driver._get_name())
 
     def record_iteration_problem(self, problem, data, metadata):
         """
@@ -546,34 +662,15 @@ class SqliteRecorder(CaseRecorder):
             totals_array = dict_to_structured_array(totals)
             totals_blob = array_to_blob(totals_array)
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
             abs_err = data['abs']
             rel_err = data['rel']
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
-                          "abs_err, rel_err ) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+            self._add_row('problem_cases',
                           (self._counter, metadata['name'],
                            metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text, totals_blob,
-                           abs_err, rel_err))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('problem', c.lastrowid, metadata['name']))
+                           self._encode_values(inputs), self._encode_values(outputs),
+                           self._encode_values(residuals), totals_blob, abs_err, rel_err),
+                          'problem', metadata['name'])
 
     def record_iteration_system(self, system, data, metadata):
         """
@@ -595,36 +692,20 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
+            inputs = self._encode_values(data['input'])
+            outputs = self._encode_values(data['output'])
+            residuals = self._encode_values(data['residual'])
 
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                for var, dat in i_o_r.items():
-                    i_o_r[var] = make_serializable(dat)
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            # get the pathname of the source system
+            source_system = system.pathname
+            if source_system == '':
+                source_system = 'root'
 
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
+            self._add_row('system_iterations',
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = system.pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('system', c.lastrowid, source_system))
+                           inputs, outputs, residuals),
+                          'system', source_system)
 
     def record_iteration_solver(self, solver, data, metadata):
         """
@@ -648,49 +729,30 @@ class SqliteRecorder(CaseRecorder):
         if self.connection:
             abs = data['abs']
             rel = data['rel']
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = make_serializable(i_o_r[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+            inputs = self._encode_values(data['input'])
+            outputs = self._encode_values(data['output'])
+            residuals = self._encode_values(data['residual'])
+
+            # get the pathname of the source system
+            source_system = solver._system().pathname
+            if source_system == '':
+                source_system = 'root'
+
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = solver.SOLVER[0:2]
+            if solver_type == 'NL':
+                source_solver = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source_solver = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % solver.SOLVER)
 
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
+            self._add_row('solver_iterations',
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = solver._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = solver.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % solver.SOLVER)
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('solver', c.lastrowid, source_solver))
+                           abs, rel, inputs, outputs, residuals),
+                          'solver', source_solver)
 
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
@@ -815,11 +877,7 @@ class SqliteRecorder(CaseRecorder):
             data_array = dict_to_structured_array(data)
             data_blob = array_to_blob(data_array)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
+            self._add_row('driver_derivatives',
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
                            data_blob))
@@ -828,6 +886,9 @@ class SqliteRecorder(CaseRecorder):
         """
         Shut down the recorder.
         """
+        # write out any buffered cases
+        self.flush()
+
         # close database connection
         if self._record_metadata and self.metadata_connection and \
                 self.metadata_connection != self.connection:
@@ -846,6 +907,10 @@ class SqliteRecorder(CaseRecorder):
         """
         Delete all the recordings.
         """
+        for rows in self._buffer.values():
+            rows.clear()
+        self._num_buffered = 0
+
         if self.connection:
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
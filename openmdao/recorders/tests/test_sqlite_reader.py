@@ -49,6 +49,12 @@ try:
 except ImportError:
     PETScVector = None
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 
 def count_keys(d):
     """
@@ -3522,6 +3528,92 @@ class TestSqliteCaseReader(unittest.TestCase):
         assert_near_equal(cons['ALIAS_TEST'], con_vals['ALIAS_TEST'])
         assert_near_equal(cons['con|with->scaling'], con_vals['con|with->scaling'])
 
+    def _record_sellar(self, binary_values=False):
+        prob = SellarProblem(SellarDerivativesGrouped)
+
+        driver = prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        driver.recording_options['includes'] = ['*']
+
+        recorder = om.SqliteRecorder(self.filename, binary_values=binary_values)
+        driver.add_recorder(recorder)
+
+        prob.setup()
+        prob.model.mda.nonlinear_solver.add_recorder(recorder)
+
+        prob.run_driver()
+        prob.cleanup()
+
+    def test_get_var_history(self):
+        for binary_values in (False, True):
+            with self.subTest(binary_values=binary_values):
+                self._record_sellar(binary_values)
+
+                cr = om.CaseReader(self.filename)
+
+                names = ['x', 'z', 'obj', 'y1', 'mda.d2.y2', 'con1']
+                history = cr.get_var_history(names, chunk_size=4)
+
+                cases = cr.get_cases('driver', recurse=False)
+                for name in names:
+                    expected = np.array([case[name].ravel() for case in cases])
+                    self.assertEqual(history[name].shape, expected.shape)
+                    assert_near_equal(history[name], expected)
+
+                # solver source
+                source = 'root.mda.nonlinear_solver'
+                history = cr.get_var_history('y1', source=source)
+                cases = cr.get_cases(source, recurse=False)
+                expected = np.array([case['y1'] for case in cases])
+                assert_near_equal(history['y1'], expected)
+
+                # chunks
+                chunks = list(cr.iter_var_history(['x', 'z'], chunk_size=10))
+                self.assertEqual([len(c['z']) for c in chunks[:-1]], [10] * (len(chunks) - 1))
+                assert_near_equal(np.vstack([c['z'] for c in chunks]),
+                                  cr.get_var_history('z')['z'])
+
+    def test_get_var_history_errors(self):
+        self._record_sellar()
+
+        cr = om.CaseReader(self.filename)
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_var_history(['x', 'foo'])
+        self.assertEqual(str(cm.exception),
+                         '"Variable \'foo\' not found in case \'rank0:ScipyOptimize_SLSQP|0\'."')
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_var_history(['x'], source='bar')
+        self.assertEqual(str(cm.exception), 'Source not found: bar')
+
+        with self.assertRaises(ValueError) as cm:
+            cr.export_var_history('history.csv', ['x'])
+        self.assertEqual(str(cm.exception), "Can't export variable history to 'history.csv'. "
+                                            "The file extension must be '.npz' or '.parquet'.")
+
+    def test_export_var_history_npz(self):
+        self._record_sellar()
+
+        cr = om.CaseReader(self.filename)
+        cr.export_var_history('history.npz', ['x', 'z', 'obj'])
+
+        history = cr.get_var_history(['x', 'z', 'obj'])
+        exported = np.load('history.npz')
+        for name in history:
+            assert_near_equal(exported[name], history[name])
+
+    @unittest.skipUnless(pyarrow, "requires 'pyarrow'")
+    def test_export_var_history_parquet(self):
+        self._record_sellar()
+
+        cr = om.CaseReader(self.filename)
+        cr.export_var_history('history.parquet', ['x', 'z'], chunk_size=5)
+
+        table = pyarrow.parquet.read_table('history.parquet')
+        history = cr.get_var_history(['x', 'z'])
+        assert_near_equal(np.asarray(table['x']), history['x'][:, 0])
+        assert_near_equal(np.array(table['z'].to_pylist()), history['z'])
+
 
 @use_tempdirs
 class TestFeatureSqliteReader(unittest.TestCase):
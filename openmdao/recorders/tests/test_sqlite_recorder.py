@@ -439,9 +439,13 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem : root",
             "        assembled_jac_type: csc",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "    Subsystem : p1",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -457,6 +461,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : p2",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -472,14 +478,19 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : comp",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "    Subsystem : con",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "        has_diag_partials: False",
             "        units: None",
             "        shape: None",
             "        shape_by_conn: False",
             "        do_coloring: False",
+            "        derivs_method: cs",
             ""
         ]
 
@@ -496,6 +507,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 1",
             "    Subsystem : root",
             "        assembled_jac_type: dense",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             ""
         ]
 
@@ -535,9 +548,13 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem : root",
             "        assembled_jac_type: csc",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "    Subsystem : p1",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -553,6 +570,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : p2",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -568,14 +587,19 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : comp",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "    Subsystem : con",
             "        distributed: False",
             "        run_root_only: False",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             "        has_diag_partials: False",
             "        units: None",
             "        shape: None",
             "        shape_by_conn: False",
             "        do_coloring: False",
+            "        derivs_method: cs",
             ""
         ]
 
@@ -592,6 +616,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 1",
             "    Subsystem : root",
             "        assembled_jac_type: dense",
+            "        skip_if_inputs_unchanged: False",
+            "        skip_inputs_tol: 0.0",
             ""
         ]
 
@@ -2812,6 +2838,80 @@ class TestSqliteRecorder(unittest.TestCase):
         self.assertTrue(all([case.startswith('foo_') for case in driver_cases]),
                         msg='One or more cases do not start with the expected prefix.')
 
+    def _run_sellar_recorded(self, filename, **kwargs):
+        prob = SellarProblem(SellarDerivativesGrouped)
+
+        driver = prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        driver.recording_options['includes'] = ['*']
+        driver.add_recorder(om.SqliteRecorder(filename, **kwargs))
+
+        prob.setup()
+
+        solver = prob.model.mda.nonlinear_solver
+        solver.add_recorder(om.SqliteRecorder(filename + '_solver', **kwargs))
+
+        prob.model.add_recorder(om.SqliteRecorder(filename + '_system', **kwargs))
+
+        prob.run_driver()
+
+        return prob
+
+    def test_buffered_binary_recording(self):
+        prob = self._run_sellar_recorded('unbuffered.sql')
+        prob.cleanup()
+
+        prob = self._run_sellar_recorded('buffered.sql', buffer_size=1000, binary_values=True)
+
+        # nothing has been written to the case tables yet
+        with sqlite3.connect('buffered.sql') as con:
+            self.assertEqual(con.execute("SELECT COUNT(*) FROM driver_iterations").fetchone()[0], 0)
+            self.assertEqual(con.execute("SELECT COUNT(*) FROM global_iterations").fetchone()[0], 0)
+
+        prob.cleanup()
+
+        with sqlite3.connect('buffered.sql') as con:
+            outputs = con.execute("SELECT outputs FROM driver_iterations").fetchone()[0]
+            self.assertTrue(isinstance(outputs, bytes))
+
+        for suffix, source in (('', 'driver'), ('_solver', 'root.mda.nonlinear_solver'),
+                               ('_system', 'root')):
+            expected_cr = om.CaseReader('unbuffered.sql' + suffix)
+            actual_cr = om.CaseReader('buffered.sql' + suffix)
+
+            expected_cases = expected_cr.get_cases(source)
+            actual_cases = actual_cr.get_cases(source)
+
+            self.assertEqual([c.name for c in actual_cases], [c.name for c in expected_cases])
+            self.assertEqual(actual_cr.list_sources(out_stream=None),
+                             expected_cr.list_sources(out_stream=None))
+
+            for actual, expected in zip(actual_cases, expected_cases):
+                self.assertEqual(actual.outputs.keys(), expected.outputs.keys())
+                for name in expected.outputs:
+                    assert_near_equal(actual.outputs[name], expected.outputs[name], 1e-12)
+                if expected.residuals is not None:
+                    for name in expected.residuals:
+                        assert_near_equal(actual.residuals[name], expected.residuals[name],
+                                          1e-12)
+
+    def test_flush_interval(self):
+        prob = self._run_sellar_recorded('cases.sql', buffer_size=1000, flush_interval=0.)
+
+        # with an interval of 0, every case is written as soon as it is recorded
+        cr = om.CaseReader('cases.sql')
+        num_cases = len(cr.list_cases('driver', out_stream=None))
+        self.assertEqual(num_cases, prob.driver.iter_count)
+
+        prob.cleanup()
+
+    def test_bad_buffer_size(self):
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('cases.sql', buffer_size=0)
+
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder buffer_size must be at least 1, but 0 was given.")
+
+
 @use_tempdirs
 class TestFeatureSqliteRecorder(unittest.TestCase):
 
@@ -2920,7 +3020,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
                                                'invalid_desvar_behavior': 'warn',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'num_workers': 1})
 
         # Optimization
         driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-3)
@@ -170,6 +170,57 @@ def format_nan_error(system, matrix):
     return msg.format(system.msginfo, ', '.join(varnames))
 
 
+class _PermutedSuperLU(object):
+    """
+    Sparse LU factorization of a matrix whose columns were permuted before factoring.
+
+    Parameters
+    ----------
+    lu : SuperLU
+        Factorization of the column permuted matrix.
+    perm : ndarray
+        Column permutation, so that the factored matrix is A[:, perm].
+
+    Attributes
+    ----------
+    _lu : SuperLU
+        Factorization of the column permuted matrix.
+    _perm : ndarray
+        Column permutation, so that the factored matrix is A[:, perm].
+    """
+
+    def __init__(self, lu, perm):
+        """
+        Initialize attributes.
+        """
+        self._lu = lu
+        self._perm = perm
+
+    def solve(self, rhs, trans='N'):
+        """
+        Solve the linear system using the factorization of the permuted matrix.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right hand side.
+        trans : str
+            'N' to solve A x = rhs, 'T' to solve A^T x = rhs.
+
+        Returns
+        -------
+        ndarray
+            Solution vector.
+        """
+        perm = self._perm
+        if trans == 'N':
+            x = np.empty_like(rhs, dtype=np.result_type(rhs, self._lu.U.dtype))
+            x[perm] = self._lu.solve(rhs, trans)
+            return x
+        else:
+            return self._lu.solve(rhs[perm], trans)
+
+
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
@@ -178,10 +229,47 @@ class DirectSolver(LinearSolver):
     ----------
     **kwargs : dict
         Options dictionary.
+
+    Attributes
+    ----------
+    _lu : SuperLU, _PermutedSuperLU or None
+        Sparse LU factorization of the assembled jacobian.
+    _lup : tuple or None
+        Dense LU factorization and pivots of the jacobian.
+    _factored_data : ndarray or None
+        Copy of the jacobian values at the last factorization, used with the 'refactor_tol'
+        option.
+    _col_perm : ndarray or None
+        Fill-reducing column permutation of the sparse assembled jacobian, reused for every
+        factorization when the 'reuse_ordering' option is True.
+    _perm_pattern : tuple or None
+        The (indptr, indices) sparsity pattern of the jacobian for which _col_perm was computed.
+    _perm_data_idx : ndarray or None
+        Indices that gather the data of the jacobian into the data of the column permuted
+        jacobian.
+    _perm_indptr : ndarray or None
+        indptr array of the column permuted jacobian.
+    _perm_indices : ndarray or None
+        indices array of the column permuted jacobian.
     """
 
     SOLVER = 'LN: Direct'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize attributes.
+        """
+        super().__init__(**kwargs)
+
+        self._lu = None
+        self._lup = None
+        self._factored_data = None
+        self._col_perm = None
+        self._perm_pattern = None
+        self._perm_data_idx = None
+        self._perm_indptr = None
+        self._perm_indices = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -190,6 +278,26 @@ class DirectSolver(LinearSolver):
 
         self.options.declare('err_on_singular', types=bool, default=True,
                              desc="Raise an error if LU decomposition is singular.")
+        self.options.declare('reuse_ordering', types=bool, default=False,
+                             desc="If True, compute the fill-reducing column ordering of a sparse "
+                                  "assembled jacobian at the first factorization and reuse it "
+                                  "for later factorizations as long as the sparsity pattern does "
+                                  "not change.")
+        self.options.declare('max_rhs_block', types=int, default=1, lower=1,
+                             desc="Maximum number of right hand sides solved together when "
+                                  "computing total derivatives. Each block allocates dense "
+                                  "arrays of the size of the linear system times the block "
+                                  "size. The default of 1 solves them one at a time.")
+        self.options.declare('refactor_tol', types=float, default=None, allow_none=True,
+                             lower=0.0,
+                             desc="If not None, skip the factorization when the norm of the change "
+                                  "in the jacobian since the last factorization is less than "
+                                  "this tolerance times the norm of the jacobian, and reuse the "
+                                  "old factors instead. Linear solves are then only approximate, "
+                                  "which is usually acceptable inside a Newton solve, but it "
+                                  "also affects derivatives computed with this solver.")
+
+        self.supports['multi_rhs'] = True
 
         # this solver does not iterate
         self.options.undeclare("maxiter")
@@ -215,6 +323,10 @@ class DirectSolver(LinearSolver):
         super()._setup_solvers(system, depth)
         self._disallow_distrib_solve()
 
+        self._lu = self._lup = None
+        self._factored_data = None
+        self._col_perm = self._perm_pattern = None
+
     def _linearize_children(self):
         """
         Return a flag that is True when we need to call linearize on our subsystems' solvers.
@@ -282,12 +394,21 @@ class DirectSolver(LinearSolver):
 
             # Perform dense or sparse lu factorization.
             elif isinstance(matrix, csc_matrix):
+                if self._skip_refactor(matrix.data, self._lu):
+                    return
+
                 try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
+                    if self.options['reuse_ordering']:
+                        self._lu = self._splu_reuse_ordering(matrix)
+                    else:
+                        self._lu = scipy.sparse.linalg.splu(matrix)
                 except RuntimeError as err:
                     raise RuntimeError(format_singular_error(system, matrix))
 
             elif isinstance(matrix, np.ndarray):  # dense
+                if self._skip_refactor(matrix, self._lup):
+                    return
+
                 # During LU decomposition, detect singularities and warn user.
                 with warnings.catch_warnings():
                     if self.options['err_on_singular']:
@@ -314,6 +435,9 @@ class DirectSolver(LinearSolver):
 
             mtx = self._build_mtx()
 
+            if self._skip_refactor(mtx, self._lup):
+                return
+
             # During LU decomposition, detect singularities and warn user.
             with warnings.catch_warnings():
 
@@ -330,6 +454,75 @@ class DirectSolver(LinearSolver):
                 except ValueError as err:
                     raise RuntimeError(format_nan_error(system, mtx))
 
+    def _skip_refactor(self, data, factors):
+        """
+        Return True if the jacobian is close enough to the last factored one to reuse its factors.
+
+        If the factorization is not skipped, the jacobian values are saved for the next check.
+
+        Parameters
+        ----------
+        data : ndarray
+            Values of the jacobian (dense matrix or data array of a sparse matrix).
+        factors : object or None
+            The current factorization.
+
+        Returns
+        -------
+        bool
+            True if the factorization should be skipped.
+        """
+        tol = self.options['refactor_tol']
+        if tol is None or self._system().under_complex_step:
+            return False
+
+        old = self._factored_data
+        if factors is not None and old is not None and old.shape == data.shape and \
+                np.linalg.norm(data - old) <= tol * np.linalg.norm(data):
+            return True
+
+        self._factored_data = data.copy()
+        return False
+
+    def _splu_reuse_ordering(self, matrix):
+        """
+        Factor a sparse matrix, reusing a previously computed fill-reducing column ordering.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to factor.
+
+        Returns
+        -------
+        SuperLU or _PermutedSuperLU
+            The factorization.
+        """
+        pattern = self._perm_pattern
+        if pattern is None or not (np.array_equal(pattern[0], matrix.indptr) and
+                                   np.array_equal(pattern[1], matrix.indices)):
+            # (re)compute the ordering using the default COLAMD ordering of SuperLU
+            lu = scipy.sparse.linalg.splu(matrix)
+
+            # SuperLU factors Pr A Pc, and (A Pc)[:, j] = A[:, perm[j]]
+            self._col_perm = perm = np.argsort(lu.perm_c)
+            self._perm_pattern = (matrix.indptr.copy(), matrix.indices.copy())
+
+            # find the mapping from the data of matrix to the data of the permuted matrix
+            idx = csc_matrix((np.arange(1, matrix.nnz + 1), matrix.indices, matrix.indptr),
+                             shape=matrix.shape)[:, perm]
+            self._perm_data_idx = idx.data - 1
+            self._perm_indptr = idx.indptr
+            self._perm_indices = idx.indices
+
+            return lu
+
+        permuted = csc_matrix((matrix.data[self._perm_data_idx], self._perm_indices,
+                               self._perm_indptr), shape=matrix.shape)
+
+        return _PermutedSuperLU(scipy.sparse.linalg.splu(permuted, permc_spec='NATURAL'),
+                                self._col_perm)
+
     def _inverse(self):
         """
         Return the inverse Jacobian.
@@ -451,3 +644,60 @@ class DirectSolver(LinearSolver):
         # matrix-vector-product generated jacobians are scaled.
         else:
             x_vec[:] = scipy.linalg.lu_solve(self._lup, b_vec, trans=trans_lu)
+
+    def _solve_multi_rhs(self, mode, rhs):
+        """
+        Solve the linear system for several right hand sides at once.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            Array with one scaled right hand side per column.
+
+        Returns
+        -------
+        ndarray
+            Array with the scaled solution for each right hand side in its columns.
+        """
+        system = self._system()
+
+        d_residuals = system._dresiduals
+        d_outputs = system._doutputs
+
+        if mode == 'fwd':
+            x_vec = d_outputs
+            b_vec = d_residuals
+            trans_lu = 0
+            trans_splu = 'N'
+        else:  # rev
+            x_vec = d_residuals
+            b_vec = d_outputs
+            trans_lu = 1
+            trans_splu = 'T'
+
+        # matrix-vector-product generated jacobians are scaled.
+        if self._assembled_jac is None:
+            return scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+
+        # AssembledJacobians are unscaled, so find the diagonal scaling of both vectors by
+        # unscaling a vector of ones.
+        scaled = system._has_output_scaling or system._has_resid_scaling
+        if scaled:
+            x_vec.set_val(1.0)
+            b_vec.set_val(1.0)
+            with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                x_scale = x_vec.asarray().copy()
+                b_scale = b_vec.asarray().copy()
+            rhs = rhs * b_scale[:, np.newaxis]
+
+        if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
+            sol = scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+        else:
+            sol = self._lu.solve(rhs, trans_splu)
+
+        if scaled:
+            sol /= x_scale[:, np.newaxis]
+
+        return sol
@@ -40,6 +40,56 @@ class LinearRunOnce(LinearBlockGS):
         # reset after solve is done
         self._scope_in = self._scope_out = _UNDEFINED
 
+    def _single_iteration(self):
+        """
+        Perform the operations in the iteration loop.
+        """
+        system = self._system()
+        if getattr(system, '_thread_pool', None) is None:
+            super()._single_iteration()
+            return
+
+        # The subsystems are run concurrently, so do all of the transfers at once.  Otherwise
+        # this is the same as a Gauss-Seidel iteration over independent subsystems.
+        mode = self._mode
+        subs = [s for s in system._subsystems_myproc
+                if self._rel_systems is None or s.pathname in self._rel_systems]
+        scopes = {}
+        for subsys in subs:
+            scope_out, scope_in = system._get_matvec_scope(subsys)
+            scopes[subsys.pathname] = (self._vars_union(self._scope_out, scope_out),
+                                       self._vars_union(self._scope_in, scope_in))
+
+        def apply_linear(subsys):
+            if subsys._iter_call_apply_linear():
+                subsys._apply_linear(None, self._rel_systems, mode, *scopes[subsys.pathname])
+            elif mode == 'fwd':
+                subsys._dresiduals.set_val(0.0)
+            else:
+                subsys._doutputs.set_val(0.0)
+
+        def solve_linear(subsys):
+            subsys._solve_linear(mode, self._rel_systems, *scopes[subsys.pathname])
+
+        if mode == 'fwd':
+            system._transfer('linear', mode)
+            system._map_subsystems(apply_linear, subs)
+
+            system._dresiduals *= -1.0
+            system._dresiduals += self._rhs_vec
+
+            system._map_subsystems(solve_linear, subs)
+
+        else:  # rev
+            system._doutputs.set_val(0.0)
+            system._transfer('linear', mode)
+
+            system._doutputs *= -1.0
+            system._doutputs += self._rhs_vec
+
+            system._map_subsystems(solve_linear, subs)
+            system._map_subsystems(apply_linear, subs)
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -905,6 +905,102 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
         with self.assertRaisesRegex(Exception, msg):
             prob.run_model()
 
+    def _run_sellar_newton(self, assemble_jac, **options):
+        prob = om.Problem()
+        model = prob.model = SellarDerivatives()
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=30)
+        model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac, **options)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        J = prob.compute_totals(of=['obj'], wrt=['z'], return_format='flat_dict')
+
+        return prob, model.nonlinear_solver._iter_count, J['obj', 'z']
+
+    def test_reuse_ordering(self):
+        _, base_iters, base_J = self._run_sellar_newton(True)
+        prob, iters, J = self._run_sellar_newton(True, reuse_ordering=True)
+
+        self.assertEqual(iters, base_iters)
+        assert_near_equal(J, base_J, 1e-10)
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['y2'], 12.05848819, .00001)
+
+        # later factorizations are done on the column permuted matrix
+        solver = prob.model.linear_solver
+        self.assertIsNotNone(solver._col_perm)
+        self.assertEqual(type(solver._lu).__name__, '_PermutedSuperLU')
+
+        # check the solves against a dense solve in both modes
+        mtx = prob.model._assembled_jac._int_mtx._matrix.toarray()
+        b = np.arange(1., mtx.shape[0] + 1)
+        assert_near_equal(solver._lu.solve(b, 'N'), np.linalg.solve(mtx, b), 1e-12)
+        assert_near_equal(solver._lu.solve(b, 'T'), np.linalg.solve(mtx.T, b), 1e-12)
+
+    def test_refactor_tol(self):
+        for assemble_jac in (True, False):
+            with self.subTest(assemble_jac=assemble_jac):
+                _, base_iters, base_J = self._run_sellar_newton(assemble_jac)
+                prob, iters, J = self._run_sellar_newton(assemble_jac, refactor_tol=0.5)
+
+                # a lagged jacobian still converges, just not quadratically
+                self.assertGreater(iters, base_iters)
+                assert_near_equal(prob['y1'], 25.58830273, .00001)
+                assert_near_equal(prob['y2'], 12.05848819, .00001)
+
+                # totals are computed with the lagged factors, so they are only approximate
+                self.assertFalse(np.allclose(J, base_J))
+
+                # a zero tolerance only skips factorizations of an unchanged jacobian
+                prob, iters, J = self._run_sellar_newton(assemble_jac, refactor_tol=0.)
+                self.assertEqual(iters, base_iters)
+                assert_near_equal(J, base_J, 1e-10)
+
+    def test_multi_rhs_totals(self):
+        def compute_totals(mode, assemble_jac, jac_type, max_rhs_block):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('px', om.IndepVarComp('x', np.arange(1., 6.)))
+            model.add_subsystem('comp', om.ExecComp('y = A.dot(x)**2 + 3*x',
+                                                    A=np.random.RandomState(11).rand(5, 5),
+                                                    x=np.ones(5), y=np.ones(5)))
+            model.add_subsystem('bal', om.BalanceComp('z', val=np.ones(5), rhs_name='y',
+                                                      lhs_name='lz', ref=3., res_ref=7.))
+            model.add_subsystem('cube', om.ExecComp('lz = z**3 + z', lz=np.ones(5),
+                                                    z=np.ones(5)))
+            model.connect('px.x', 'comp.x')
+            model.connect('comp.y', 'bal.y')
+            model.connect('bal.z', 'cube.z')
+            model.connect('cube.lz', 'bal.lz')
+
+            model.add_design_var('px.x', ref=2.)
+            model.add_constraint('bal.z', lower=0., ref=5.)
+            model.add_objective('comp.y', index=2, ref=.3)
+
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac,
+                                                  max_rhs_block=max_rhs_block)
+            model.options['assembled_jac_type'] = jac_type
+
+            prob.setup(mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            return prob.driver._compute_totals(return_format='array')
+
+        for mode in ('fwd', 'rev'):
+            for assemble_jac in (True, False):
+                for jac_type in ('csc', 'dense'):
+                    with self.subTest(mode=mode, assemble_jac=assemble_jac, jac_type=jac_type):
+                        expected = compute_totals(mode, assemble_jac, jac_type, 1)
+                        # a block size that doesn't divide the number of seeds
+                        J = compute_totals(mode, assemble_jac, jac_type, 4)
+                        assert_near_equal(J, expected, 1e-12)
+
 
 @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 class TestDirectSolverRemoteErrors(unittest.TestCase):
@@ -1,6 +1,7 @@
 """Define the NonlinearBlockJac class."""
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.solver import NonlinearSolver
+from openmdao.solvers.nonlinear.nonlinear_runonce import _run_solve_nonlinear
 from openmdao.utils.mpi import multi_proc_fail_check
 
 
@@ -29,11 +30,9 @@ class NonlinearBlockJac(NonlinearSolver):
             # If this is a parallel group, check for analysis errors and reraise.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    system._map_subsystems(_run_solve_nonlinear, system._subsystems_myproc)
             else:
-                for subsys in system._subsystems_myproc:
-                    subsys._solve_nonlinear()
+                system._map_subsystems(_run_solve_nonlinear, system._subsystems_myproc)
 
             rec.abs = 0.0
             rec.rel = 0.0
@@ -8,6 +8,10 @@ from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.mpi import multi_proc_fail_check
 
 
+def _run_solve_nonlinear(subsys):
+    subsys._solve_nonlinear()
+
+
 class NonlinearRunOnce(NonlinearSolver):
     """
     Simple solver that runs the containing system once.
@@ -33,12 +37,12 @@ class NonlinearRunOnce(NonlinearSolver):
 
         with Recording('NLRunOnce', 0, self) as rec:
             # If this is a parallel group, transfer all at once then run each subsystem.
-            if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
+            if len(system._subsystems_myproc) != len(system._subsystems_allprocs) or \
+                    getattr(system, '_thread_pool', None) is not None:
                 system._transfer('nonlinear', 'fwd')
 
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    system._map_subsystems(_run_solve_nonlinear, system._subsystems_myproc)
 
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
@@ -905,6 +905,7 @@ class LinearSolver(Solver):
                              desc='Activates use of assembled jacobian by this solver.')
 
         self.supports.declare('assembled_jac', types=bool, default=True)
+        self.supports.declare('multi_rhs', types=bool, default=False)
 
     def _setup_solvers(self, system, depth):
         """
@@ -935,6 +936,30 @@ class LinearSolver(Solver):
         """
         raise NotImplementedError("class %s does not implement solve()." % (type(self).__name__))
 
+    def _solve_multi_rhs(self, mode, rhs):
+        """
+        Solve the linear system for several right hand sides at once.
+
+        Only solvers that declare the 'multi_rhs' capability in their supports dictionary
+        implement this, and they must also declare a 'max_rhs_block' option giving the maximum
+        number of right hand sides per call. The vectors of the owning system are left in an
+        undefined state.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            Array with one scaled right hand side per column.
+
+        Returns
+        -------
+        ndarray
+            Array with the scaled solution for each right hand side in its columns.
+        """
+        raise NotImplementedError("class %s does not implement _solve_multi_rhs()." %
+                                  (type(self).__name__))
+
     def _solve(self):
         """
         Run the iterative solver.
@@ -10,6 +10,82 @@ from openmdao.utils.om_warnings import issue_warning, CacheWarning
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
+# Maximum number of elements in the temporary arrays created for one block of evaluation points.
+_MAX_BLOCK_SIZE = 2 ** 20
+
+
+def _point_blocks(n_points, point_size):
+    """
+    Return slices that split evaluation points into blocks of bounded size.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of evaluation points.
+    point_size : int
+        Number of temporary array elements needed for each point.
+
+    Returns
+    -------
+    list of slice
+        Slice of the points in each block.
+    """
+    block = max(1, _MAX_BLOCK_SIZE // max(1, point_size))
+    return [slice(lo, min(lo + block, n_points)) for lo in range(0, n_points, block)]
+
+
+def _correlation(thetas, X1, X2):
+    """
+    Compute the Gaussian correlation between two sets of normalized points.
+
+    Parameters
+    ----------
+    thetas : ndarray
+        Input correlation coefficients.
+    X1 : ndarray
+        First set of points, with shape (n1, n_dims).
+    X2 : ndarray
+        Second set of points, with shape (n2, n_dims).
+
+    Returns
+    -------
+    ndarray
+        Correlation matrix of shape (n1, n2).
+    """
+    # Accumulate one dimension at a time to avoid an (n1, n_dims, n2) array.
+    R = np.zeros((X1.shape[0], X2.shape[0]), dtype=np.result_type(X1, X2))
+    for k in range(X1.shape[1]):
+        R -= thetas[k] * np.square(X1[:, k, np.newaxis] - X2[:, k])
+    return np.exp(R, out=R)
+
+
+def _jittered_cholesky(R):
+    """
+    Compute the lower Cholesky factor of R, adding diagonal jitter if R is not numerically SPD.
+
+    Parameters
+    ----------
+    R : ndarray
+        Symmetric matrix to factor. Its diagonal is modified if jitter is needed.
+
+    Returns
+    -------
+    ndarray
+        Lower triangular Cholesky factor.
+    """
+    jitter = 0.
+    diag = np.diag_indices_from(R)
+    while True:
+        try:
+            return linalg.cholesky(R, lower=True, check_finite=False)
+        except linalg.LinAlgError:
+            if jitter >= 1e-4:
+                raise ValueError('KrigingSurrogate: correlation matrix is not positive '
+                                 f'definite, even with a diagonal jitter of {jitter}.')
+            new_jitter = 1e-10 if jitter == 0. else 10. * jitter
+            R[diag] += new_jitter - jitter
+            jitter = new_jitter
+
 
 class KrigingSurrogate(SurrogateModel):
     """
@@ -28,7 +104,7 @@ class KrigingSurrogate(SurrogateModel):
     alpha : ndarray
         Reduced likelihood parameter: alpha
     L : ndarray
-        Reduced likelihood parameter: L
+        Lower Cholesky factor of the correlation matrix, when training_method is 'cholesky'.
     n_dims : int
         Number of independents in the surrogate
     n_samples : int
@@ -104,6 +180,14 @@ class KrigingSurrogate(SurrogateModel):
                                   "it to the given file. If the specified file exists, it will be "
                                   "used to load the weights")
 
+        self.options.declare('training_method', values=['svd', 'cholesky'], default='svd',
+                             desc="Factorization of the correlation matrix used during training. "
+                                  "'svd' uses a regularized pseudo-inverse and a gradient-free "
+                                  "search for the hyper-parameters. 'cholesky' uses a Cholesky "
+                                  "factorization with diagonal jitter and optimizes the "
+                                  "hyper-parameters using analytic likelihood gradients, which "
+                                  "is much faster for large numbers of training points.")
+
     def train(self, x, y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -141,9 +225,12 @@ class KrigingSurrogate(SurrogateModel):
                     self.Y_std = np.array(data['Y_std'])
                     self.thetas = np.array(data['thetas'])
                     self.alpha = np.array(data['alpha'])
-                    self.U = np.array(data['U'])
-                    self.S_inv = np.array(data['S_inv'])
-                    self.Vh = np.array(data['Vh'])
+                    if self.options['training_method'] == 'cholesky':
+                        self.L = np.array(data['L'])
+                    else:
+                        self.U = np.array(data['U'])
+                        self.S_inv = np.array(data['S_inv'])
+                        self.Vh = np.array(data['Vh'])
                     self.sigma2 = np.array(data['sigma2'])
                     cache_hash = str(data['hash'])
                 except KeyError as e:
@@ -178,33 +265,55 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
-        def _calcll(thetas):
-            """Calculate loglike (callback function)."""
-            loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
-            return -loglike
+        cholesky = self.options['training_method'] == 'cholesky'
 
-        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
+        if cholesky:
+            def _calcll(thetas):
+                """Calculate loglike and its gradient (callback function)."""
+                loglike, _, grad = self._calculate_cholesky_likelihood_params(np.exp(thetas),
+                                                                              gradient=True)
+                return -loglike, -grad
+
+            method = 'L-BFGS-B'
+            options = {}
+        else:
+            def _calcll(thetas):
+                """Calculate loglike (callback function)."""
+                loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
+                return -loglike
+
+            method = 'slsqp'
+            options = {'eps': 1e-3}
 
-        options = {'eps': 1e-3}
+        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
 
         if cache:
             # Enable logging since we expect the model to take long to train
             options['disp'] = True
-            options['iprint'] = 2
+            if not cholesky:
+                options['iprint'] = 2
 
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
+        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method=method,
+                             jac=cholesky,
                              options=options,
                              bounds=bounds)
 
-        if not optResult.success:
+        # For ill-conditioned data the likelihood is only accurate to within the noise of the
+        # factorization, so an L-BFGS-B line search failure (status 2) just means that no further
+        # progress can be made from the current point.
+        if not optResult.success and not (cholesky and optResult.status == 2):
             raise ValueError(f'Kriging Hyper-parameter optimization failed: {optResult.message}')
 
         self.thetas = np.exp(optResult.x)
-        _, params = self._calculate_reduced_likelihood_params()
+        if cholesky:
+            _, params = self._calculate_cholesky_likelihood_params()
+            self.L = params['L']
+        else:
+            _, params = self._calculate_reduced_likelihood_params()
+            self.U = params['U']
+            self.S_inv = params['S_inv']
+            self.Vh = params['Vh']
         self.alpha = params['alpha']
-        self.U = params['U']
-        self.S_inv = params['S_inv']
-        self.Vh = params['Vh']
         self.sigma2 = params['sigma2']
 
         # Save data to cache if specified
@@ -220,17 +329,112 @@ class KrigingSurrogate(SurrogateModel):
                 'Y_std': self.Y_std,
                 'thetas': self.thetas,
                 'alpha': self.alpha,
-                'U': self.U,
-                'S_inv': self.S_inv,
-                'Vh': self.Vh,
                 'sigma2': self.sigma2,
                 'hash': training_data_hash
             }
+            if cholesky:
+                data['L'] = self.L
+            else:
+                data['U'] = self.U
+                data['S_inv'] = self.S_inv
+                data['Vh'] = self.Vh
 
             if not os.path.exists(cache) or cache_hash != training_data_hash:
                 with open(cache, 'wb') as f:
                     np.savez_compressed(f, **data)
 
+    def update(self, x, y, nugget=None):
+        """
+        Add training points to the trained model without repeating the hyper-parameter search.
+
+        The hyper-parameters and the normalization of the data are kept from the last call to
+        train. When training_method is 'cholesky', the Cholesky factor of the correlation matrix
+        is extended with the new rows, which costs O(n^2 k) for k new points instead of the
+        O(n^3) of a new factorization.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        nugget : float or array-like or None
+            Nugget for the new training points. If given, the nugget option becomes an array
+            covering all of the training points. If None and the nugget option is an array, the
+            option must already have been extended to the combined number of training points.
+        """
+        if not self.trained:
+            raise RuntimeError(f"{type(self).__name__} has not been trained, so it can't be "
+                               "updated.")
+
+        x, y = np.atleast_2d(x, y)
+        X_new = (x - self.X_mean) / self.X_std
+        Y_new = (y - self.Y_mean) / self.Y_std
+
+        n_old = self.n_samples
+        n_total = n_old + x.shape[0]
+        old_nugget = self.options['nugget']
+        if nugget is not None:
+            self.options['nugget'] = np.concatenate((np.broadcast_to(old_nugget, n_old),
+                                                     np.broadcast_to(nugget, x.shape[0])))
+        elif np.ndim(old_nugget) > 0 and np.size(old_nugget) != n_total:
+            raise ValueError(f"{type(self).__name__}: nugget has {np.size(old_nugget)} entries "
+                             f"but there are {n_total} training points after the update. Pass "
+                             "the nugget for the new points to update, or extend the nugget "
+                             "option to cover all of the training points.")
+
+        self.X = np.vstack((self.X, X_new))
+        self.Y = np.vstack((self.Y, Y_new))
+        self.n_samples = n_samples = self.X.shape[0]
+
+        if self.options['training_method'] == 'cholesky':
+            nugget = self.options['nugget']
+            if np.ndim(nugget) > 0:
+                nugget = np.asarray(nugget)[n_old:]
+
+            # Bordered Cholesky update: [[L, 0], [L21, L22]]
+            L21 = linalg.solve_triangular(self.L, _correlation(self.thetas, self.X[:n_old], X_new),
+                                          lower=True, check_finite=False).T
+            C = _correlation(self.thetas, X_new, X_new)
+            C[np.diag_indices_from(C)] = 1. + nugget
+            C -= np.dot(L21, L21.T)
+
+            L = np.zeros((n_samples, n_samples))
+            L[:n_old, :n_old] = self.L
+            L[n_old:, :n_old] = L21
+            L[n_old:, n_old:] = _jittered_cholesky(C)
+            self.L = L
+
+            alpha = linalg.cho_solve((L, True), self.Y, check_finite=False)
+            self.alpha = alpha
+            self.sigma2 = np.dot(self.Y.T, alpha).sum(axis=0) / n_samples * np.square(self.Y_std)
+        else:
+            _, params = self._calculate_reduced_likelihood_params()
+            self.U = params['U']
+            self.S_inv = params['S_inv']
+            self.Vh = params['Vh']
+            self.alpha = params['alpha']
+            self.sigma2 = params['sigma2']
+
+    def _correlation_matrix(self, thetas):
+        """
+        Compute the correlation matrix between all of the training points.
+
+        Parameters
+        ----------
+        thetas : ndarray
+            Input correlation coefficients.
+
+        Returns
+        -------
+        ndarray
+            Correlation matrix of shape (n_samples, n_samples), including the nugget.
+        """
+        R = _correlation(thetas, self.X, self.X)
+        R[np.diag_indices_from(R)] = 1. + self.options['nugget']
+
+        return R
+
     def _calculate_reduced_likelihood_params(self, thetas=None):
         """
         Calculate quantity with same maximum location as the log-likelihood for a given theta.
@@ -252,17 +456,11 @@ class KrigingSurrogate(SurrogateModel):
         if thetas is None:
             thetas = self.thetas
 
-        X, Y = self.X, self.Y
+        Y = self.Y
         params = {}
 
         # Correlation Matrix
-        distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
-        for i in range(self.n_samples):
-            distances[i, :, i + 1:] = np.abs(X[i, ...] - X[i + 1:, ...]).T
-            distances[i + 1:, :, i] = distances[i, :, i + 1:].T
-
-        R = np.exp(-thetas.dot(np.square(distances)))
-        R[np.diag_indices_from(R)] = 1. + self.options['nugget']
+        R = self._correlation_matrix(thetas)
 
         [U, S, Vh] = linalg.svd(R, lapack_driver=self.options['lapack_driver'])
 
@@ -288,6 +486,66 @@ class KrigingSurrogate(SurrogateModel):
 
         return reduced_likelihood, params
 
+    def _calculate_cholesky_likelihood_params(self, thetas=None, gradient=False):
+        """
+        Calculate the reduced likelihood using a Cholesky factorization of the correlation matrix.
+
+        Parameters
+        ----------
+        thetas : ndarray, optional
+            Given input correlation coefficients. If none given, uses self.thetas
+            from training.
+        gradient : bool
+            If True, also return the gradient of the reduced likelihood with respect to
+            the log of thetas.
+
+        Returns
+        -------
+        ndarray
+            Calculated reduced_likelihood
+        dict
+            Dictionary containing the parameters.
+        ndarray, optional (if gradient is True)
+            Gradient of the reduced likelihood with respect to log(thetas).
+        """
+        if thetas is None:
+            thetas = self.thetas
+
+        X, Y = self.X, self.Y
+        n_samples = self.n_samples
+        params = {}
+
+        R = self._correlation_matrix(thetas)
+        L = _jittered_cholesky(R)
+
+        alpha = linalg.cho_solve((L, True), Y, check_finite=False)
+        logdet = 2. * np.sum(np.log(np.diag(L)))
+        sigma2 = np.dot(Y.T, alpha).sum(axis=0) / n_samples
+        sigma2_sum = np.sum(sigma2)
+        reduced_likelihood = -(np.log(sigma2_sum) + logdet / n_samples)
+
+        params['alpha'] = alpha
+        params['sigma2'] = sigma2 * np.square(self.Y_std)
+        params['L'] = L
+
+        if not gradient:
+            return reduced_likelihood, params
+
+        # With a = R^-1 sum(Y), the derivative wrt any entry of R is
+        # (a a^T / sum(sigma2) - R^-1) / n_samples, and dR/dlog(theta_k) = -theta_k d_k^2 * R.
+        a = alpha.sum(axis=1)
+        M = linalg.cho_solve((L, True), np.eye(n_samples), check_finite=False)
+        M *= -1.
+        M += np.outer(a, a / sigma2_sum)
+        M *= R
+
+        grad = np.empty(self.n_dims)
+        for k in range(self.n_dims):
+            grad[k] = -thetas[k] * np.sum(np.square(X[:, k, np.newaxis] - X[:, k]) * M)
+        grad /= n_samples
+
+        return reduced_likelihood, params, grad
+
     def predict(self, x):
         """
         Calculate predicted value of the response based on the current trained model.
@@ -315,19 +573,33 @@ class KrigingSurrogate(SurrogateModel):
         # Normalize input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        dtype = np.result_type(x_n, self.alpha)
+        y = np.empty((n_eval, self.Y.shape[1]), dtype=dtype)
+        if self.options['eval_rmse']:
+            mse = np.empty((n_eval, 1), dtype=dtype)
+
+        for blk in _point_blocks(n_eval, self.n_samples):
+            # Correlation with all training points
+            r = _correlation(thetas, x_n[blk], self.X)
 
-        # Scaled Predictor
-        y_t = np.dot(r, self.alpha)
+            # Scaled Predictor
+            y_t = np.dot(r, self.alpha)
 
-        # Predictor
-        y = self.Y_mean + self.Y_std * y_t
+            # Predictor
+            y[blk] = self.Y_mean + self.Y_std * y_t
+
+            if self.options['eval_rmse']:
+                # only the diagonal of r R^-1 r^T is needed
+                if self.options['training_method'] == 'cholesky':
+                    rt = linalg.solve_triangular(self.L, r.T, lower=True, check_finite=False)
+                    mse[blk] = (1. - np.einsum('ji,ji->i', rt, rt))[:, np.newaxis]
+                else:
+                    r_inv = np.einsum('j,kj,lk->lj', self.S_inv, self.U, r)
+                    mse[blk] = (1. - np.einsum('ij,ij->i', np.dot(r, self.Vh.T),
+                                               r_inv))[:, np.newaxis]
 
         if self.options['eval_rmse']:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+            mse = mse * self.sigma2
 
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
@@ -335,6 +607,25 @@ class KrigingSurrogate(SurrogateModel):
 
         return y
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at several points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_dims) containing the points at which the surrogate
+            is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Kriging prediction for each point.
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction error for each point.
+        """
+        return self.predict(x)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -349,17 +640,40 @@ class KrigingSurrogate(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
+        return self.vectorized_linearize(np.atleast_2d(x))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the Kriging surface at each of the requested points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_dims) containing the points at which the surrogate
+            Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_dims).
+        """
         thetas = self.thetas
 
         # Normalize Input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+        n_points = x_n.shape[0]
+        jac = np.empty((n_points, self.Y.shape[1], self.n_dims),
+                       dtype=np.result_type(x_n, self.alpha))
+        scale = np.outer(self.Y_std, 1. / self.X_std)
+
+        for blk in _point_blocks(n_points, self.n_samples * self.n_dims):
+            diff = x_n[blk, np.newaxis, :] - self.X
+            r = np.exp(-np.einsum('k,ijk->ij', thetas, np.square(diff)))
+
+            # derivative of r[i, j] wrt input k of point i is -2 r[i, j] thetas[k] diff[i, j, k]
+            diff *= (-2. * r)[:, :, np.newaxis]
+            diff *= thetas
+            jac[blk] = np.einsum('ijk,jl->ilk', diff, self.alpha) * scale
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # i.e., Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
         return jac
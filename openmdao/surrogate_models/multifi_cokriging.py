@@ -88,6 +88,45 @@ def linear_regression(x):
     return f
 
 
+def _regression_gradient(regr, x, step=1e-7):
+    """
+    Compute the derivatives of a regression model with respect to its inputs.
+
+    Parameters
+    ----------
+    regr : callable
+        Regression function.
+    x : array_like
+        An array with shape (n_eval, n_features) of input data.
+    step : float
+        Step size of the central differences used for user supplied regression functions.
+
+    Returns
+    -------
+    ndarray
+        An array with shape (n_eval, p, n_features) where p is the size of the regression
+        functional basis.
+    """
+    n_eval, n_features = x.shape
+
+    if regr is constant_regression:
+        return np.zeros((n_eval, 1, n_features))
+
+    if regr is linear_regression:
+        grad = np.zeros((n_eval, n_features + 1, n_features))
+        grad[:, 1:, :] = np.eye(n_features)
+        return grad
+
+    # user supplied regression function
+    grads = []
+    for k in range(n_features):
+        dx = np.zeros(x.shape)
+        dx[:, k] = step
+        grads.append((regr(x + dx) - regr(x - dx)) / (2. * step))
+
+    return np.stack(grads, axis=-1)
+
+
 def squared_exponential_correlation(theta, d):
     """
     Squared exponential correlation model (Radial Basis Function).
@@ -763,6 +802,65 @@ class MultiFiCoKriging(object):
         else:
             return mu[:, -1].reshape((n_eval, 1))
 
+    def linearize(self, X):
+        """
+        Compute the derivatives of the kriging prediction with respect to X.
+
+        Parameters
+        ----------
+        X : array_like
+            An array with shape (n_eval, n_features) giving the point(s) at
+            which the derivatives should be computed.
+
+        Returns
+        -------
+        ndarray
+            An array with shape (n_eval, n_features) with the derivatives of the Best Linear
+            Unbiased Prediction at X.
+        """
+        X = array2d(X)
+        nlevel = self.nlevel
+
+        # Normalize
+        if self.normalize:
+            X = (X - self.X_mean) / self.X_std
+
+        f0 = self.regr(X)
+        df0 = _regression_gradient(self.regr, X)
+
+        # Propagate the scaled predictor and its derivatives from level 0 to the last level.
+        for i in range(nlevel):
+            C = self.C[i]
+            Ft = solve_triangular(C, self.F[i], lower=True)
+            yt = solve_triangular(C, self.y[i], lower=True)
+            beta = self.beta[i]
+            gamma = solve_triangular(C.T, yt - np.dot(Ft, beta), lower=False)
+
+            theta = self.theta[i].ravel()
+            diff = X[:, np.newaxis, :] - self.X[i]
+            r_ = np.exp(-np.sum(theta * diff ** 2, axis=2))
+            dr = -2. * theta * diff * r_[..., np.newaxis]
+
+            dmu_i = np.einsum('ijk,j->ik', dr, gamma[:, 0])
+            mu_i = np.dot(r_, gamma[:, 0])
+
+            if i == 0:
+                mu_i += np.dot(f0, beta[:, 0])
+                dmu_i += np.einsum('ijk,j->ik', df0, beta[:, 0])
+            else:
+                q = self.q[i]
+                g = self.rho_regr(X)
+                dg = _regression_gradient(self.rho_regr, X)
+                rho = np.dot(g, beta[:q, 0])
+
+                mu_i += rho * mu + np.dot(f0, beta[q:, 0])
+                dmu_i += np.einsum('ijk,j->ik', dg, beta[:q, 0]) * mu[:, np.newaxis] + \
+                    rho[:, np.newaxis] * dmu + np.einsum('ijk,j->ik', df0, beta[q:, 0])
+
+            mu, dmu = mu_i, dmu_i
+
+        return self.y_std * dmu / self.X_std
+
     def _check_list_structure(self, X, y):
         """
         Transform floats and arrays in the training data lists to have a multifidelity structure.
@@ -989,6 +1087,59 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
         Y_pred, MSE = self.model.predict([new_x])
         return Y_pred, np.sqrt(np.abs(MSE))
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at several points.
+
+        Parameters
+        ----------
+        x : array_like
+            An array with shape (n_eval, n_features) giving the points at which the
+            predictions should be made.
+
+        Returns
+        -------
+        array_like
+            An array with shape (n_eval, 1) with the Best Linear Unbiased Prediction at x.
+        array_like
+            An array with shape (n_eval, 1) with the square root of the Mean Squared Error at x.
+        """
+        Y_pred, MSE = self.model.predict(x)
+        return Y_pred, np.sqrt(np.abs(MSE))
+
+    def linearize(self, x):
+        """
+        Calculate the jacobian of the surrogate at the requested point.
+
+        Parameters
+        ----------
+        x : array_like
+            Point at which the surrogate Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs.
+        """
+        return self.model.linearize(np.atleast_2d(x))[:1]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the surrogate at each of the requested points.
+
+        Parameters
+        ----------
+        x : array_like
+            An array with shape (n_eval, n_features) giving the points at which the surrogate
+            Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_eval, 1, n_features).
+        """
+        return self.model.linearize(x)[:, np.newaxis, :]
+
     def train_multifi(self, X, Y):
         """
         Train the surrogate model with the given set of inputs and outputs.
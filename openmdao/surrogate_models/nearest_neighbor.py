@@ -5,6 +5,9 @@ https://github.com/SMarone/NDInterp
 """
 
 from collections import OrderedDict
+
+import numpy as np
+
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 from openmdao.surrogate_models.nn_interpolators.linear_interpolator import \
     LinearInterpolator
@@ -76,6 +79,22 @@ class NearestNeighbor(SurrogateModel):
         self.interpolant = _interpolators[self.options['interpolant_type']](
             x, y, **self.interpolant_init_args)
 
+    def update(self, x, y):
+        """
+        Add training points to the trained interpolant.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        """
+        if not self.trained:
+            raise RuntimeError(f"{type(self).__name__} has not been trained, so it can't be "
+                               "updated.")
+        self.interpolant.update(np.atleast_2d(x), np.atleast_2d(y))
+
     def predict(self, x, **kwargs):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -95,6 +114,26 @@ class NearestNeighbor(SurrogateModel):
         super().predict(x)
         return self.interpolant(x, **kwargs)
 
+    def vectorized_predict(self, x, **kwargs):
+        """
+        Calculate predicted values of the response at several points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_dims) containing the points at which the surrogate
+            is evaluated.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Predicted values, with shape (n_points, n_outputs).
+        """
+        super().predict(x)
+        return self.interpolant(np.atleast_2d(x), **kwargs)
+
     def linearize(self, x, **kwargs):
         """
         Calculate the jacobian of the interpolant at the requested point.
@@ -115,3 +154,22 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def vectorized_linearize(self, x, **kwargs):
+        """
+        Calculate the jacobian of the interpolant at each of the requested points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_dims) containing the points at which the surrogate
+            Jacobian is evaluated.
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_dims).
+        """
+        return self.interpolant.gradient(np.atleast_2d(x), **kwargs)
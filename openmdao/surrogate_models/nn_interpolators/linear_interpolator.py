@@ -106,7 +106,7 @@ class LinearInterpolator(NNBase):
 
         # Check to see if there are any collinear points and replace them
         n0 = np.where(normal[:, -1, :] == 0)
-        predictions[n0, :] = self._tv[nloc[0, n0], :]
+        predictions[n0] = self._tv[nloc[n0[0], 0], n0[1]]
 
         # Finish computation for the good normals
         n = np.where(normal[:, -1, :] != 0)
@@ -152,9 +152,14 @@ class LinearInterpolator(NNBase):
             ndist, nloc = self._KData.query(normPredPts.real, dims)
 
         normal, pc = self._find_hyperplane(nloc)
-        if np.any(normal[:, -1, :]) == 0:
-            return gradient
-        gradient[:] = (-normal[:, :-1, :] / normal[:, -1, :]).squeeze().T
+
+        # The gradient is zero wherever the hyperplane is degenerate.
+        last = normal[:, -1, :]
+        good = last != 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            grad_t = np.where(good[:, np.newaxis, :], -normal[:, :-1, :] / last[:, np.newaxis, :],
+                              0.)
+        gradient[:] = grad_t.transpose((0, 2, 1))
 
         grad = gradient * (self._tvr[:, np.newaxis] / self._tpr)
 
@@ -49,6 +49,8 @@ class NNBase(object):
         KDTree used for finding the nearest neighbors.
     _pt_cache : tuple(ndarray, ndarray, ndarray)
         Internal cache of the last found neighbors.
+    _num_leaves : int
+        How many leaves the tree should have.
     """
 
     def __init__(self, training_points, training_values, num_leaves=2):
@@ -77,8 +79,32 @@ class NNBase(object):
         self._ntpts = training_points.shape[0]
 
         # Make training data into a Tree
+        self._num_leaves = num_leaves
         leavesz = ceil(self._ntpts / float(num_leaves))
         self._KData = KDTree(self._tp, leafsize=leavesz)
 
         # Cache for gradients
         self._pt_cache = None
+
+    def update(self, training_points, training_values):
+        """
+        Add training points to the interpolant.
+
+        The new points are scaled using the normalization of the original training data.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            Ndarray of shape (num_new_points x independent dims) containing new training
+            input locations.
+        training_values : ndarray
+            Ndarray of shape (num_new_points x dependent dims) containing new training
+            output values.
+        """
+        self._tp = np.vstack((self._tp, (training_points - self._tpm) / self._tpr))
+        self._tv = np.vstack((self._tv, (training_values - self._tvm) / self._tvr))
+        self._ntpts = self._tp.shape[0]
+
+        leavesz = ceil(self._ntpts / float(self._num_leaves))
+        self._KData = KDTree(self._tp, leafsize=leavesz)
+        self._pt_cache = None
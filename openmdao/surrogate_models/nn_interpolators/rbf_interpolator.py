@@ -53,36 +53,60 @@ class RBFInterpolator(NNBase):
         # rbf_family is an arbitrary value that picks a function to use
         self.rbf_family = rbf_family
 
+        self.N = num_neighbors
+        self.weights = self._compute_weights()
+
+    def _compute_weights(self):
+        """
+        Compute the RBF weights of the training points.
+
+        Returns
+        -------
+        ndarray
+            Weights for each interpolation point.
+        """
         # For weights, first find the training points radial neighbors
-        tdist, tloc = self._KData.query(self._tp, num_neighbors)
+        tdist, tloc = self._KData.query(self._tp, self.N)
         Tt = tdist[:, :-1] / tdist[:, -1:]
-        # Next determine weight matrix
-        Rt = self._find_R(self._ntpts, Tt, tloc)
-        weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
 
-        self.N = num_neighbors
-        self.weights = weights
+        # Next determine weight matrix. Each row only has entries for the neighbors of
+        # that point, so it is assembled directly in sparse form.
+        rows = np.repeat(np.arange(self._ntpts), self.N - 1)
+        Rt = csc_matrix((self._find_R(Tt).ravel(), (rows, tloc[:, :-1].ravel())),
+                        shape=(self._ntpts, self._ntpts))
+
+        return (spsolve(Rt, self._tv))[..., np.newaxis]
 
-    def _find_R(self, npp, T, neighbor_idx):
+    def update(self, training_points, training_values):
         """
-        Evaluate RBF polynomial.
+        Add training points to the interpolant and recompute the weights.
 
         Parameters
         ----------
-        npp : int
-            Number of prediction points
-        T : int
-            Radial distance
-        neighbor_idx : ndarray
-            Int array of neighbor indices.
+        training_points : ndarray
+            Ndarray of shape (num_new_points x independent dims) containing new training
+            input locations.
+        training_values : ndarray
+            Ndarray of shape (num_new_points x dependent dims) containing new training
+            output values.
+        """
+        super().update(training_points, training_values)
+        self.weights = self._compute_weights()
+
+    def _find_R(self, T):
+        """
+        Evaluate RBF polynomial at the neighbors of each point.
+
+        Parameters
+        ----------
+        T : ndarray
+            Radial distance to each neighbor, normalized by the distance to the farthest one.
 
         Returns
         -------
         ndarray
-            Evaluation of RBF polynomial.
+            Evaluation of RBF polynomial, with the same shape as T.
         """
-        R = np.zeros((npp, self._ntpts), dtype="float")
-
         # Choose type of CRBF R matrix
         if self.rbf_family == -1:
             # Comp #1 - a
@@ -204,10 +228,7 @@ class RBFInterpolator(NNBase):
 
         Cb = np.polyval(cb_poly, T)
 
-        for i in range(npp):
-            R[i, neighbor_idx[i, :-1]] = Cf[i, :] * Cb[i, :]
-
-        return R
+        return Cf * Cb
 
     def _find_dR(self, prediction_points, neighbor_idx, neighbor_dists):
         """
@@ -391,9 +412,11 @@ class RBFInterpolator(NNBase):
         # Take farthest distance of each point
         Tp = ndist[:, :-1] / ndist[:, -1:]
 
-        Rp = self._find_R(nppts, Tp, nloc)
-        predz = ((np.dot(Rp, self.weights[..., 0]) * self._tvr) +
-                 self._tvm).reshape(nppts, self._dep_dims)
+        # Only the neighbors contribute, so gather their weights rather than forming the
+        # full (nppts x ntpts) R matrix.
+        Rp = self._find_R(Tp)
+        weights = self.weights[..., 0].reshape((self._ntpts, self._dep_dims))
+        predz = (np.einsum('ij,ijk->ik', Rp, weights[nloc[:, :-1]]) * self._tvr) + self._tvm
 
         self._pt_cache = (normalized_pts, ndist, nloc)
 
@@ -153,19 +153,19 @@ class WeightedInterpolator(NNBase):
             ndist.shape = (1, ndist.shape[0])
             nloc.shape = (1, nloc.shape[0])
 
-        dimdiff = normalized_pts - self._tp[nloc]
+        dimdiff = normalized_pts[:, np.newaxis, :] - self._tp[nloc]
 
         weights = np.power(ndist, -dist_eff)
         dweights = -dist_eff * \
             np.power(ndist[..., np.newaxis], -(dist_eff + 2)) * dimdiff
 
-        weight_sum = np.sum(weights, axis=1)
+        weight_sum = np.sum(weights, axis=1)[:, np.newaxis, np.newaxis]
 
         vals = self._tv[nloc]
 
         gradient = (weight_sum * np.einsum('ikj,ikl->ilj', dweights, vals)
                     - (np.einsum('ij,ijk->ik', weights, vals)[..., np.newaxis]
-                       * np.sum(dweights, axis=1))) / np.power(weight_sum, 2)
+                       * np.sum(dweights, axis=1)[:, np.newaxis, :])) / np.power(weight_sum, 2)
 
         grad = gradient * (self._tvr[..., np.newaxis] / self._tpr)
 
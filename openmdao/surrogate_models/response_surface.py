@@ -114,6 +114,36 @@ class ResponseSurface(SurrogateModel):
         # Predict new_y using X and betas
         return X.dot(self.betas)
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at several points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_dims) containing the points at which the surrogate
+            is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Predicted response for each point.
+        """
+        super().predict(x)
+
+        x = np.atleast_2d(x)
+        n = self.n
+        upper_i, upper_j = np.triu_indices(n)
+
+        X = zeros((x.shape[0], ((n + 1) * (n + 2)) // 2), dtype=np.result_type(x, float))
+
+        # Constant, linear, squared and cross terms, in the same order as in train.
+        X[:, 0] = 1.0
+        X[:, 1:n + 1] = x
+        X[:, n + 1:] = x[:, upper_i] * x[:, upper_j]
+
+        return X.dot(self.betas)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -141,3 +171,30 @@ class ResponseSurface(SurrogateModel):
             beta_offset = beta_offset[n - i:, :]
 
         return jac.T
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the response surface at each of the requested points.
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_dims) containing the points at which the surrogate
+            Jacobian is evaluated.
+
+        Returns
+        -------
+        ndarray
+            Jacobian of surrogate output wrt inputs, with shape (n_points, n_outputs, n_dims).
+        """
+        x = np.atleast_2d(x)
+        n = self.n
+        betas = self.betas
+        upper_i, upper_j = np.triu_indices(n)
+
+        # The quadratic terms form x^T A x for each output, so their gradient is (A + A^T) x.
+        A = zeros((betas.shape[1], n, n))
+        A[:, upper_i, upper_j] = betas[n + 1:, :].T
+        A += A.transpose((0, 2, 1))
+
+        return betas[1:n + 1, :].T + einsum('lkm,pm->plk', A, x)
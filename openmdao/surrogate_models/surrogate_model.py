@@ -44,6 +44,22 @@ class SurrogateModel(object):
         """
         self.trained = True
 
+    def update(self, x, y):
+        """
+        Add training points to an already trained surrogate, without retraining from scratch.
+
+        Surrogates that support incremental training override this method.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations.
+        y : array-like
+            Model responses at the new inputs.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental "
+                                  "updates. Call train with the full training data instead.")
+
     def predict(self, x):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -65,7 +81,22 @@ class SurrogateModel(object):
         Parameters
         ----------
         x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate
+            is evaluated.
+        """
+        pass
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobian of the interpolant at each of the requested points.
+
+        The returned array should have shape (n_points, n_outputs, n_inputs).
+
+        Parameters
+        ----------
+        x : array-like
+            Array of shape (n_points, n_inputs) containing the points at which the surrogate
+            Jacobian is evaluated.
         """
         pass
 
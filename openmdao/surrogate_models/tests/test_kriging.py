@@ -5,8 +5,10 @@ import unittest
 import itertools
 import numpy as np
 import os
+from unittest import mock
 
 from openmdao.api import KrigingSurrogate
+from openmdao.surrogate_models import kriging
 from openmdao.utils.assert_utils import assert_near_equal
 
 
@@ -149,6 +151,51 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_near_equal(jac, np.array([[1, 1], [1, -1], [1, 2]]), 1e-3)
 
+    def test_vectorized(self):
+        surrogate = KrigingSurrogate(eval_rmse=True)
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(-5, 10, 6), np.linspace(0, 15, 6))])
+        y = np.array([[branin(case), branin(case[::-1])] for case in x])
+        surrogate.train(x, y)
+
+        test_x = np.array([[1.5, 2.5], [-3., 12.], [7.2, 0.4], [9.1, 14.3]])
+        mu, sigma = surrogate.vectorized_predict(test_x)
+        jac = surrogate.vectorized_linearize(test_x)
+
+        self.assertEqual(mu.shape, (4, 2))
+        self.assertEqual(sigma.shape, (4, 2))
+        self.assertEqual(jac.shape, (4, 2, 2))
+
+        for i, x0 in enumerate(test_x):
+            mu0, sigma0 = surrogate.predict(x0)
+            assert_near_equal(mu[i], mu0[0], 1e-12)
+            assert_near_equal(sigma[i], sigma0[0], 1e-10)
+            assert_near_equal(jac[i], surrogate.linearize(x0), 1e-12)
+
+    def test_vectorized_blocks(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(-5, 10, 6), np.linspace(0, 15, 6))])
+        y = np.array([[branin(case), branin(case[::-1])] for case in x])
+        test_x = np.random.RandomState(7).rand(25, 2) * [15., 15.] + [-5., 0.]
+
+        for method in ('svd', 'cholesky'):
+            with self.subTest(training_method=method):
+                surrogate = KrigingSurrogate(eval_rmse=True, training_method=method)
+                surrogate.train(x, y)
+
+                mu, sigma = surrogate.vectorized_predict(test_x)
+                jac = surrogate.vectorized_linearize(test_x)
+
+                # evaluate a few points at a time, with blocks that don't divide the points evenly
+                with mock.patch.object(kriging, '_MAX_BLOCK_SIZE', 150):
+                    self.assertEqual(len(kriging._point_blocks(25, surrogate.n_samples)), 7)
+                    mu_blk, sigma_blk = surrogate.vectorized_predict(test_x)
+                    jac_blk = surrogate.vectorized_linearize(test_x)
+
+                assert_near_equal(mu_blk, mu, 1e-10)
+                assert_near_equal(sigma_blk, sigma, 1e-10)
+                assert_near_equal(jac_blk, jac, 1e-10)
+
     def test_cache(self):
         x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
                       [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
@@ -173,6 +220,178 @@ class TestKrigingSurrogate(unittest.TestCase):
 
         os.unlink('test_cache.npz')
 
+    def test_cholesky_training(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(-5, 10, 6), np.linspace(0, 15, 6))])
+        y = np.array([[branin(case)] for case in x])
+
+        surrogate = KrigingSurrogate(eval_rmse=True, training_method='cholesky')
+        surrogate.train(x, y)
+
+        # jitter may be added to the diagonal, so training points are matched only approximately
+        for x0, y0 in zip(x, y):
+            mu, sigma = surrogate.predict(x0)
+            assert_near_equal(mu, [y0], 1e-3)
+            assert_near_equal(sigma, [[0]], 1e-1)
+
+        svd_surrogate = KrigingSurrogate(training_method='svd')
+        svd_surrogate.train(x, y)
+        assert_near_equal(surrogate.predict([5., 5.])[0], svd_surrogate.predict([5., 5.]), 5e-2)
+
+        # analytic likelihood gradient wrt log(thetas)
+        thetas = np.array([0.3, 2.])
+        like, _, grad = surrogate._calculate_cholesky_likelihood_params(thetas, gradient=True)
+        fd = np.zeros(2)
+        for k in range(2):
+            step = np.zeros(2)
+            step[k] = 1e-6
+            fd[k] = (surrogate._calculate_cholesky_likelihood_params(thetas * np.exp(step))[0] -
+                     like) / 1e-6
+        assert_near_equal(grad, fd, 1e-5)
+
+    def test_cholesky_ill_conditioned(self):
+        x = np.array([[case] for case in np.linspace(0., 1., 40)])
+        y = np.sin(x)
+        surrogate = KrigingSurrogate(eval_rmse=True, training_method='cholesky')
+        surrogate.train(x, y)
+        mu, sigma = surrogate.predict(np.array([0.5]))
+        self.assertTrue(sigma < 1.e-5)
+        assert_near_equal(mu, [[np.sin(0.5)]], 1e-5)
+
+    def test_cholesky_cache(self):
+        x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
+                      [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
+                      [10., 12.], [7., 13.5], [2.5, 15.]])
+        y = np.array([[branin(case)] for case in x])
+
+        surrogate_before = KrigingSurrogate(eval_rmse=True, training_method='cholesky',
+                                            training_cache='test_chol_cache.npz')
+        surrogate_before.train(x, y)
+
+        surrogate = KrigingSurrogate(eval_rmse=True, training_method='cholesky',
+                                     training_cache='test_chol_cache.npz')
+        surrogate.train(x, y)
+
+        mu0, sigma0 = surrogate_before.predict([5., 5.])
+        mu, sigma = surrogate.predict([5., 5.])
+        assert_near_equal(mu, mu0, 1e-12)
+        assert_near_equal(sigma, sigma0, 1e-12)
+
+        os.unlink('test_chol_cache.npz')
+
+    def test_update(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(-5, 10, 6), np.linspace(0, 15, 6))])
+        y = np.array([[branin(case), branin(case[::-1])] for case in x])
+        x_new = np.array([[1.5, 2.5], [-3., 12.], [7.2, 0.4]])
+        y_new = np.array([[branin(case), branin(case[::-1])] for case in x_new])
+        test_x = np.array([[5., 5.], [9.1, 14.3]])
+
+        for method in ('svd', 'cholesky'):
+            with self.subTest(training_method=method):
+                surrogate = KrigingSurrogate(eval_rmse=True, training_method=method)
+                surrogate.train(x, y)
+                thetas = surrogate.thetas.copy()
+                surrogate.update(x_new, y_new)
+
+                # hyper-parameters are kept, so the result must match a full factorization
+                # of the combined data with the same thetas.
+                expected = KrigingSurrogate(eval_rmse=True, training_method=method)
+                expected.train(x, y)
+                expected.X = np.vstack((expected.X, (x_new - expected.X_mean) / expected.X_std))
+                expected.Y = np.vstack((expected.Y, (y_new - expected.Y_mean) / expected.Y_std))
+                expected.n_samples = expected.X.shape[0]
+                if method == 'cholesky':
+                    _, params = expected._calculate_cholesky_likelihood_params()
+                    expected.L = params['L']
+                else:
+                    _, params = expected._calculate_reduced_likelihood_params()
+                    expected.U = params['U']
+                    expected.S_inv = params['S_inv']
+                    expected.Vh = params['Vh']
+                expected.alpha = params['alpha']
+                expected.sigma2 = params['sigma2']
+
+                assert_near_equal(surrogate.thetas, thetas, 1e-15)
+                mu, sigma = surrogate.predict(test_x)
+                mu0, sigma0 = expected.predict(test_x)
+                assert_near_equal(mu, mu0, 1e-9)
+                assert_near_equal(sigma, sigma0, 1e-6)
+                assert_near_equal(surrogate.linearize(test_x[0]),
+                                  expected.linearize(test_x[0]), 1e-9)
+
+                # new points are interpolated
+                assert_near_equal(surrogate.predict(x_new)[0], y_new, 1e-3)
+
+    def test_update_array_nugget(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(-5, 10, 5), np.linspace(0, 15, 5))])
+        y = np.array([[branin(case)] for case in x])
+        x_new = np.array([[1.5, 2.5], [-3., 12.], [7.2, 0.4]])
+        y_new = np.array([[branin(case)] for case in x_new])
+        nugget = np.linspace(1e-8, 1e-6, x.shape[0])
+        nugget_new = np.array([1e-3, 1e-7, 1e-4])
+        test_x = np.array([[5., 5.], [9.1, 14.3]])
+
+        for method in ('svd', 'cholesky'):
+            with self.subTest(training_method=method):
+                surrogate = KrigingSurrogate(eval_rmse=True, training_method=method,
+                                             nugget=nugget)
+                surrogate.train(x, y)
+
+                # without a nugget for the new points, the old one doesn't cover all points
+                with self.assertRaises(ValueError) as cm:
+                    surrogate.update(x_new, y_new)
+                self.assertEqual(str(cm.exception),
+                                 "KrigingSurrogate: nugget has 25 entries but there are 28 "
+                                 "training points after the update. Pass the nugget for the new "
+                                 "points to update, or extend the nugget option to cover all of "
+                                 "the training points.")
+                self.assertEqual(surrogate.n_samples, 25)
+
+                surrogate.update(x_new, y_new, nugget=nugget_new)
+                assert_near_equal(surrogate.options['nugget'],
+                                  np.concatenate((nugget, nugget_new)), 1e-15)
+
+                # same result when the nugget option is extended instead
+                extended = KrigingSurrogate(eval_rmse=True, training_method=method,
+                                            nugget=nugget)
+                extended.train(x, y)
+                extended.options['nugget'] = np.concatenate((nugget, nugget_new))
+                extended.update(x_new, y_new)
+
+                # and when the combined data is factorized from scratch with the same thetas
+                expected = KrigingSurrogate(eval_rmse=True, training_method=method,
+                                            nugget=nugget)
+                expected.train(x, y)
+                expected.options['nugget'] = np.concatenate((nugget, nugget_new))
+                expected.X = np.vstack((expected.X, (x_new - expected.X_mean) / expected.X_std))
+                expected.Y = np.vstack((expected.Y, (y_new - expected.Y_mean) / expected.Y_std))
+                expected.n_samples = expected.X.shape[0]
+                if method == 'cholesky':
+                    _, params = expected._calculate_cholesky_likelihood_params()
+                    expected.L = params['L']
+                else:
+                    _, params = expected._calculate_reduced_likelihood_params()
+                    expected.U = params['U']
+                    expected.S_inv = params['S_inv']
+                    expected.Vh = params['Vh']
+                expected.alpha = params['alpha']
+                expected.sigma2 = params['sigma2']
+
+                mu, sigma = surrogate.predict(test_x)
+                for other in (extended, expected):
+                    mu0, sigma0 = other.predict(test_x)
+                    assert_near_equal(mu, mu0, 1e-9)
+                    assert_near_equal(sigma, sigma0, 1e-6)
+
+    def test_update_untrained(self):
+        surrogate = KrigingSurrogate()
+        with self.assertRaises(RuntimeError) as cm:
+            surrogate.update(np.ones((1, 2)), np.ones((1, 1)))
+        self.assertEqual(str(cm.exception),
+                         "KrigingSurrogate has not been trained, so it can't be updated.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -170,6 +170,44 @@ class CoKrigingSurrogateTest(unittest.TestCase):
         else:
             self.fail("ValueError Expected")
 
+    def test_vectorized(self):
+        def f_hi(x):
+            return np.sin(3. * x[:, 0]) * x[:, 1] + x[:, 0] ** 2
+
+        def f_lo(x):
+            return .7 * f_hi(x) + x[:, 1]
+
+        rng = np.random.RandomState(0)
+        x_hi = rng.rand(8, 2)
+        x_lo = np.vstack([rng.rand(12, 2), x_hi])
+        test_x = rng.rand(4, 2)
+
+        for regr in ('constant', 'linear'):
+            for normalize in (True, False):
+                cokrig = MultiFiCoKrigingSurrogate(regr=regr, rho_regr=regr, theta=2.,
+                                                   normalize=normalize)
+                cokrig.train_multifi([x_hi, x_lo], [f_hi(x_hi), f_lo(x_lo)])
+
+                mu, sigma = cokrig.vectorized_predict(test_x)
+                jac = cokrig.vectorized_linearize(test_x)
+
+                for i, x0 in enumerate(test_x):
+                    mu0, sigma0 = cokrig.predict(x0)
+                    assert_near_equal(mu[i], mu0[0], 1e-10)
+                    assert_near_equal(sigma[i], sigma0[0], 1e-6)
+                    assert_near_equal(jac[i], cokrig.linearize(x0), 1e-12)
+
+                # check the analytic derivatives with central differences
+                step = 1e-6
+                jac_fd = np.zeros(jac.shape)
+                for k in range(2):
+                    dx = np.zeros(2)
+                    dx[k] = step
+                    jac_fd[:, 0, k] = (cokrig.vectorized_predict(test_x + dx)[0] -
+                                       cokrig.vectorized_predict(test_x - dx)[0])[:, 0] / (2 * step)
+
+                assert_near_equal(jac, jac_fd, 1e-6)
+
     def test_normalization(self):
         # This dataset is ill conditioned if not normalized.
         np.random.seed(1)
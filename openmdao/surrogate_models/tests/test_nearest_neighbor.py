@@ -5,6 +5,16 @@ from openmdao.api import NearestNeighbor
 from openmdao.utils.assert_utils import assert_near_equal
 
 
+def check_vectorized(surrogate, test_x):
+    # vectorized predictions and jacobians must match the ones computed one point at a time
+    mu = surrogate.vectorized_predict(test_x)
+    jac = surrogate.vectorized_linearize(test_x)
+
+    for i, x0 in enumerate(test_x):
+        assert_near_equal(mu[i], surrogate.predict(x0.copy())[0], 1e-12)
+        assert_near_equal(jac[i], surrogate.linearize(x0.copy()), 1e-12)
+
+
 class TestNearestNeighbor(unittest.TestCase):
 
     def test_unrecognized_type(self):
@@ -16,6 +26,31 @@ class TestNearestNeighbor(unittest.TestCase):
         self.assertEqual(expected_msg, str(cm.exception))
 
 
+    def test_update(self):
+        rng = np.random.RandomState(11)
+        x = np.vstack([[0., 0.], [1., 0.], [0., 1.], [1., 1.], rng.rand(20, 2)])
+        y = np.hstack([np.sin(3. * x[:, :1]) + x[:, 1:], x[:, :1] * x[:, 1:]])
+
+        # new points inside the original bounds, so the normalization is unchanged
+        x_new = rng.rand(6, 2)
+        y_new = np.hstack([np.sin(3. * x_new[:, :1]) + x_new[:, 1:], x_new[:, :1] * x_new[:, 1:]])
+        test_x = rng.rand(5, 2)
+
+        for itype, kwargs in (('linear', {}), ('weighted', {}), ('rbf', {'num_neighbors': 6})):
+            with self.subTest(interpolant_type=itype):
+                surrogate = NearestNeighbor(interpolant_type=itype, **kwargs)
+                surrogate.train(x, y)
+                surrogate.update(x_new, y_new)
+
+                expected = NearestNeighbor(interpolant_type=itype, **kwargs)
+                expected.train(np.vstack((x, x_new)), np.vstack((y, y_new)))
+
+                assert_near_equal(surrogate.predict(test_x.copy()),
+                                  expected.predict(test_x.copy()), 1e-10)
+                assert_near_equal(surrogate.vectorized_linearize(test_x.copy()),
+                                  expected.vectorized_linearize(test_x.copy()), 1e-10)
+
+
 class TestLinearInterpolator1D(unittest.TestCase):
     def setUp(self):
         self.surrogate = NearestNeighbor(interpolant_type='linear')
@@ -135,6 +170,10 @@ class TestLinearInterpolatorND(unittest.TestCase):
             mu = self.surrogate.linearize(x0)
             assert_near_equal(mu, y0, 1e-9)
 
+    def test_vectorized(self):
+        test_x = np.array([[1., 0.5], [0.5, 1.0], [1.0, 1.5], [1.5, 1.], [.3, .7], [1.6, .2]])
+        check_vectorized(self.surrogate, test_x)
+
 
 class TestWeightedInterpolator1D(unittest.TestCase):
     def setUp(self):
@@ -281,6 +320,10 @@ class TestWeightedInterpolatorND(unittest.TestCase):
             mu = self.surrogate.linearize(x0)
             assert_near_equal(mu, y0, 1e-6)
 
+    def test_vectorized(self):
+        test_x = np.array([[1., 0.5], [0.5, 1.0], [1.0, 1.5], [1.5, 1.], [.3, .7], [1.6, .2]])
+        check_vectorized(self.surrogate, test_x)
+
 
 class TestRBFInterpolator1D(unittest.TestCase):
     def setUp(self):
@@ -426,3 +469,7 @@ class TestRBFInterpolatorND(unittest.TestCase):
         for x0, y0 in zip(test_x, expected_deriv):
             mu = self.surrogate.linearize(x0)
             assert_near_equal(mu, y0, 1e-6)
+
+    def test_vectorized(self):
+        test_x = np.array([[1., 0.5], [0.5, 1.0], [1.0, 1.5], [1.5, 1.], [.3, .7], [1.6, .2]])
+        check_vectorized(self.surrogate, test_x)
@@ -2,11 +2,12 @@
 Routines to compute coloring for use with simultaneous derivatives.
 """
 import os
+import hashlib
 import time
 import pickle
+import multiprocessing
 import traceback
 import pathlib
-from itertools import combinations
 from contextlib import contextmanager
 from pprint import pprint
 from itertools import groupby
@@ -21,6 +22,7 @@ from openmdao.utils.general_utils import _src_or_alias_dict, \
     _src_name_iter, _src_or_alias_item_iter
 import openmdao.utils.hooks as hooks
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent import concurrent_eval_pool, _fork_supported
 from openmdao.utils.file_utils import _load_and_exec, image2html
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning
 from openmdao.utils.reports_system import register_report
@@ -1155,12 +1157,13 @@ def _order_by_ID(col_adj_matrix):
         Boolean array that's True where the column matches nzcols.
     """
     ncols = col_adj_matrix.shape[1]
+    indptr, indices = col_adj_matrix.indptr, col_adj_matrix.indices
     colored_degrees = np.zeros(ncols, dtype=INT_DTYPE)
-    colored_degrees[col_adj_matrix.indices] = 1  # make sure zero cols aren't considered
+    colored_degrees[indices] = 1  # make sure zero cols aren't considered
 
     for i in range(np.nonzero(colored_degrees)[0].size):
         col = colored_degrees.argmax()
-        colnzrows = col_adj_matrix.getcol(col).indices
+        colnzrows = indices[indptr[col]:indptr[col + 1]]
         colored_degrees[colnzrows] += 1
         colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
         yield col, colnzrows
@@ -1180,31 +1183,50 @@ def _2col_adj_rows_cols(J):
     csc_matrix
         Sparse column adjacency matrix.
     """
-    nrows, ncols = J.shape
-    nzrows, nzcols = J.row, J.col
+    # columns are dependent when they have a nonzero in the same row, i.e., where J^T J is nonzero
+    return _col_intersection_matrix(J.row, J.col, J.shape, include_diag=True)
 
-    adjrows = []
-    adjcols = []
 
-    csr = csr_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+def _col_intersection_matrix(nzrows, nzcols, shape, include_diag):
+    """
+    Compute the boolean column intersection matrix J^T J of a sparsity pattern.
 
-    # mark col_matrix entries as True when nonzero row entries make them dependent
-    for row in np.unique(nzrows):
-        row_nzcols = csr.getrow(row).indices
+    Parameters
+    ----------
+    nzrows : ndarray
+        Nonzero rows of the sparsity pattern.
+    nzcols : ndarray
+        Nonzero columns of the sparsity pattern.
+    shape : tuple
+        Shape of the sparsity pattern.
+    include_diag : bool
+        If False, diagonal entries are only kept for columns that are the only nonzero in
+        some row.
 
-        if row_nzcols.size > 0:
-            for c in row_nzcols:
-                adjrows.append(row_nzcols)
-                adjcols.append(np.full(row_nzcols.size, c))
+    Returns
+    -------
+    csc_matrix
+        Sparse boolean column intersection matrix, in canonical format.
+    """
+    # use integer counts to avoid relying on boolean sparse matrix products
+    J = csr_matrix((np.ones(nzrows.size, dtype=INT_DTYPE), (nzrows, nzcols)), shape=shape)
+    J.data[:] = 1  # in case of duplicate entries
+    adj = (J.T @ J).tocoo()
 
-    if adjrows:
-        adjrows = np.hstack(adjrows)
-        adjcols = np.hstack(adjcols)
+    if include_diag:
+        keep = adj.data > 0
     else:
-        adjrows = np.zeros(0, dtype=INT_DTYPE)
-        adjcols = np.zeros(0, dtype=INT_DTYPE)
+        # keep the diagonal only for columns that are alone in a row
+        single = np.zeros(shape[1], dtype=bool)
+        row_nnz = np.diff(J.indptr)
+        single[J.indices[np.repeat(row_nnz == 1, row_nnz)]] = True
+        keep = (adj.row != adj.col) | single[adj.col]
 
-    return csc_matrix((np.ones(adjrows.size, dtype=bool), (adjrows, adjcols)), shape=(ncols, ncols))
+    ncols = shape[1]
+    adj = csc_matrix((np.ones(np.count_nonzero(keep), dtype=bool), (adj.row[keep], adj.col[keep])),
+                     shape=(ncols, ncols))
+    adj.sort_indices()
+    return adj
 
 
 def _Jc2col_matrix_direct(Jrows, Jcols, shape):
@@ -1230,48 +1252,9 @@ def _Jc2col_matrix_direct(Jrows, Jcols, shape):
     tuple
         (nzrows, nzcols, shape) of column adjacency matrix.
     """
-    nrows, ncols = shape
-
-    allnzr = []
-    allnzc = []
-
-    Jrow = np.zeros(ncols, dtype=bool)
-    csr = csr_matrix((np.ones(Jrows.size, dtype=bool), (Jrows, Jcols)), shape=shape)
-
-    # mark col_matrix[col1, col2] as True when Jpart[row, col1] is True OR Jpart[row, col2] is True
-    for row in np.unique(Jrows):
-        nzr = []
-        nzc = []
-        row_nzcols = csr.getrow(row).indices
-
-        if row_nzcols.size == 1:
-            # if there's only 1 nonzero column in a row, include it
-            nzr.append(row_nzcols[0])
-            nzc.append(row_nzcols[0])
-        else:
-            Jrow[:] = False
-            Jrow[row_nzcols] = True
-            for col1, col2 in combinations(row_nzcols, 2):
-                if Jrow[col1] or Jrow[col2]:
-                    nzr.append(col1)
-                    nzc.append(col2)
-        if nzr:
-            allnzr.append(nzr)
-            allnzc.append(nzc)
-
-    csr = Jrow = None  # free up memory
-
-    if allnzr:
-        # matrix is symmetric, so duplicate
-        rows = np.hstack(allnzr + allnzc)
-        cols = np.hstack(allnzc + allnzr)
-    else:
-        rows = np.zeros(0, dtype=INT_DTYPE)
-        cols = np.zeros(0, dtype=INT_DTYPE)
-
-    allnzr = allnzc = None
-
-    return csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(ncols, ncols))
+    # mark col_matrix[col1, col2] as True when col1 and col2 share a nonzero row of Jpart. If
+    # there's only 1 nonzero column in a row, include that column on the diagonal.
+    return _col_intersection_matrix(Jrows, Jcols, shape, include_diag=False)
 
 
 def _get_full_disjoint_cols(J):
@@ -1311,15 +1294,22 @@ def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
     # -1 indicates that a column has not been colored
     colors = np.full(ncols, -1, dtype=INT_DTYPE)
 
+    # marks the colors of the neighbors of the current column
+    used = np.zeros(ncols + 1, dtype=bool)
+
     for icol, colnzrows in _order_by_ID(col_adj_matrix):
         neighbor_colors = colors[colnzrows]
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(icol)
-                colors[icol] = color
-                break
+        neighbor_colors = neighbor_colors[neighbor_colors >= 0]
+
+        # use the lowest color not used by any neighbor
+        used[neighbor_colors] = True
+        color = used.argmin()
+        used[neighbor_colors] = False
+
+        colors[icol] = color
+        if color < len(color_groups):
+            color_groups[color].append(icol)
         else:
-            colors[icol] = len(color_groups)
             color_groups.append([icol])
 
     return color_groups
@@ -1358,9 +1348,11 @@ def _color_partition(Jprows, Jpcols, shape):
         col_groups[i] = sorted(group)
 
     csc = csc_matrix((np.ones(Jprows.size), (Jprows, Jpcols)), shape=shape)
+    csc.sort_indices()
+    indptr, indices = csc.indptr, csc.indices
     col2row = [None] * ncols
     for col in np.unique(Jpcols):
-        col2row[col] = csc.getcol(col).indices
+        col2row[col] = indices[indptr[col]:indptr[col + 1]]
 
     return [col_groups, col2row]
 
@@ -1388,20 +1380,26 @@ def MNCO_bidir(J):
 
     coloring = Coloring(sparsity=J)
 
-    M_col_nonzeros = np.zeros(ncols, dtype=INT_DTYPE)
-    M_row_nonzeros = np.zeros(nrows, dtype=INT_DTYPE)
+    M_col_nonzeros = np.bincount(nzcols, minlength=ncols).astype(INT_DTYPE)
+    M_row_nonzeros = np.bincount(nzrows, minlength=nrows).astype(INT_DTYPE)
 
-    sparse = csc_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+    # nonzero cols of each row and nonzero rows of each col, in the order they appear in J
+    row_order = np.argsort(nzrows, kind='stable')
+    row_ptr = np.zeros(nrows + 1, dtype=INT_DTYPE)
+    np.cumsum(M_row_nonzeros, out=row_ptr[1:])
+    row2cols = nzcols[row_order]
 
-    for c in range(ncols):
-        M_col_nonzeros[c] = sparse.getcol(c).indices.size
-    sparse = sparse.tocsr()
-    for r in range(nrows):
-        M_row_nonzeros[r] = sparse.getrow(r).indices.size
+    col_order = np.argsort(nzcols, kind='stable')
+    col_ptr = np.zeros(ncols + 1, dtype=INT_DTYPE)
+    np.cumsum(M_col_nonzeros, out=col_ptr[1:])
+    col2rows = nzrows[col_order]
 
-    sparse = None
+    row_order = col_order = None
 
-    M_rows, M_cols = nzrows, nzcols
+    # rows and cols of J that have been moved into Jf or Jr, i.e., removed from M
+    removed_rows = np.zeros(nrows, dtype=bool)
+    removed_cols = np.zeros(ncols, dtype=bool)
+    M_nnz = nzrows.size
 
     Jf_rows = [None] * nrows
     Jr_cols = [None] * ncols
@@ -1424,7 +1422,7 @@ def MNCO_bidir(J):
     Jf_nz_max = 0   # max row nonzeros in Jf
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    while M_rows.size > 0:
+    while M_nnz > 0:
         # what the algorithm is doing is basically minimizing the total of the max number of nonzero
         # columns in Jf + the max number of nonzero rows in Jr, so it's basically minimizing
         # the upper bound of the number of colors that will be needed.
@@ -1433,38 +1431,39 @@ def MNCO_bidir(J):
         # different sides of the inequality in order to prevent bad colorings when we have
         # matrices that have many more rows than columns or many more columns than rows.
         if ncols + Jr_nz_max + max(Jf_nz_max, nnz_r) < (nrows + Jf_nz_max + max(Jr_nz_max, nnz_c)):
-            Jf_rows[r] = M_cols[M_rows == r]
+            cols = row2cols[row_ptr[r]:row_ptr[r + 1]]
+            Jf_rows[r] = cols = cols[~removed_cols[cols]]
             Jf_nz_max = max(nnz_r, Jf_nz_max)
 
             M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
-            M_col_nonzeros[Jf_rows[r]] -= 1
+            M_col_nonzeros[cols] -= 1
 
             # remove row r
-            keep = M_rows != r
+            removed_rows[r] = True
+            M_nnz -= cols.size
             r = M_row_nonzeros.argmin()
             c = M_col_nonzeros.argmin()
             nnz_r = M_row_nonzeros[r]
 
             row_i += 1
         else:
-            Jr_cols[c] = M_rows[M_cols == c]
+            rows = col2rows[col_ptr[c]:col_ptr[c + 1]]
+            Jr_cols[c] = rows = rows[~removed_rows[rows]]
             Jr_nz_max = max(nnz_c, Jr_nz_max)
 
             M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
-            M_row_nonzeros[Jr_cols[c]] -= 1
+            M_row_nonzeros[rows] -= 1
 
             # remove column c
-            keep = M_cols != c
+            removed_cols[c] = True
+            M_nnz -= rows.size
             r = M_row_nonzeros.argmin()
             c = M_col_nonzeros.argmin()
             nnz_c = M_col_nonzeros[c]
 
             col_i += 1
 
-        M_rows = M_rows[keep]
-        M_cols = M_cols[keep]
-
-    M_row_nonzeros = M_col_nonzeros = None
+    M_row_nonzeros = M_col_nonzeros = row2cols = col2rows = None
 
     nnz_Jf = nnz_Jr = 0
 
@@ -1597,27 +1596,77 @@ def _compute_total_coloring_context(top):
             raise RuntimeError("%s: simultaneous coloring does not currently work with matrix free "
                                "components." % system.pathname)
 
+    _set_jac_randgens(top, 41)  # set seed for consistency
+
+    try:
+        yield
+    finally:
+        _set_jac_randgens(top, None)
+
+
+def _set_jac_randgens(top, seed):
+    """
+    Set the random generators used to fill the jacobians of all systems in the given tree.
+
+    Parameters
+    ----------
+    top : System
+        Top of the system hierarchy.
+    seed : int, sequence of int or None
+        Seed of the new generators.  If None, the jacobians stop generating random values.
+    """
+    for system in top.system_iter(recurse=True, include_self=True):
         jac = system._assembled_jac
         if jac is None:
             jac = system._jacobian
         if jac is not None:
-            jac._randgen = np.random.default_rng(41)  # set seed for consistency
+            jac._randgen = None if seed is None else np.random.default_rng(seed)
 
-    try:
-        yield
-    finally:
-        for system in top.system_iter(recurse=True, include_self=True):
-            jac = system._assembled_jac
-            if jac is None:
-                jac = system._jacobian
-            if jac is not None:
-                jac._randgen = None
+
+def _pool_total_jac_iter(model, compute_jac, num_full_jacs, num_workers):
+    """
+    Compute the total jacobians of a sparsity computation in a pool of forked worker processes.
+
+    Parameters
+    ----------
+    model : System
+        The model of the Problem being analyzed.
+    compute_jac : function
+        Function (taking no args) that returns a total jacobian as a sparse matrix.
+    num_full_jacs : int
+        Number of total jacobians to compute.
+    num_workers : int
+        Number of worker processes.
+
+    Yields
+    ------
+    csr_matrix
+        The absolute value of each total jacobian, in order of completion.
+    """
+    def run_case(i):
+        # workers inherit identical random generators, so each jacobian needs its own seed
+        _set_jac_randgens(model, [41, i])
+        return compute_jac()
+
+    def setup_worker():
+        # nothing computed in the workers is recorded
+        for s in model.system_iter(include_self=True, recurse=True):
+            for obj in (s, s.nonlinear_solver, s.linear_solver):
+                if obj is not None:
+                    obj._rec_mgr._recorders = []
+
+    cases = [((i,), None) for i in range(num_full_jacs)]
+    for i, J, err in concurrent_eval_pool(run_case, cases, num_workers, initializer=setup_worker):
+        if err is not None:
+            raise RuntimeError(f"Total jacobian {i} of the sparsity computation failed in a "
+                               f"worker process:\n{err}")
+        yield J
 
 
 def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                         tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                         orders=_DEF_COMP_SPARSITY_ARGS['orders'], setup=False, run_model=False,
-                        of=None, wrt=None, use_abs_names=True):
+                        of=None, wrt=None, use_abs_names=True, num_workers=1):
     """
     Return a boolean version of the total jacobian.
 
@@ -1650,6 +1699,9 @@ def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_ja
         Names of design variables.
     use_abs_names : bool
         Set to True when passing in absolute names to skip some translation steps.
+    num_workers : int
+        Number of forked worker processes used to compute the total jacobians concurrently.
+        Only used when running on a single process.
 
     Returns
     -------
@@ -1679,37 +1731,53 @@ def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_ja
     else:
         use_driver = False
 
+    def compute_jac():
+        if use_driver:
+            J = prob.driver._compute_totals(of=of, wrt=wrt, return_format='array',
+                                            use_abs_names=use_abs_names)
+        else:
+            J = prob.compute_totals(of=of, wrt=wrt, return_format='array',
+                                    use_abs_names=use_abs_names)
+        return csr_matrix(np.abs(J))
+
     with _compute_total_coloring_context(prob.model):
         start_time = time.perf_counter()
+
+        if num_workers > 1 and num_full_jacs > 1 and prob.comm.size == 1 and \
+                _fork_supported() and not multiprocessing.current_process().daemon:
+            jacs = _pool_total_jac_iter(prob.model, compute_jac, num_full_jacs, num_workers)
+        else:
+            jacs = (compute_jac() for i in range(num_full_jacs))
+
+        # accumulate in sparse form so only one dense jacobian is alive at a time
         fullJ = None
-        for i in range(num_full_jacs):
-            if use_driver:
-                Jabs = prob.driver._compute_totals(of=of, wrt=wrt, return_format='array',
-                                                   use_abs_names=use_abs_names)
-            else:
-                Jabs = prob.compute_totals(of=of, wrt=wrt, return_format='array',
-                                           use_abs_names=use_abs_names)
+        for J in jacs:
             if fullJ is None:
-                fullJ = np.abs(Jabs)
+                fullJ = J
             else:
-                fullJ += np.abs(Jabs)
+                fullJ += J
 
-        Jabs = None
         elapsed = time.perf_counter() - start_time
 
-    fullJ *= (1.0 / np.max(fullJ))
-
-    info = _tol_sweep(fullJ, tol, orders)
+    shape = fullJ.shape
+    fullJ = fullJ.tocoo()
+    if fullJ.data.size > 0:
+        fullJ.data *= (1.0 / np.max(fullJ.data))
+
+    # only the nonzero values take part in the tolerance sweep, zeros are below any tolerance
+    info = _tol_sweep(fullJ.data, tol, orders)
+    info['zero_entries'] += shape[0] * shape[1] - fullJ.data.size
+    info['J_size'] = shape[0] * shape[1]
     info['num_full_jacs'] = num_full_jacs
     info['sparsity_time'] = elapsed
     info['type'] = 'total'
 
     print("Full total jacobian was computed %d times, taking %f seconds." % (num_full_jacs,
                                                                              elapsed))
-    print("Total jacobian shape:", fullJ.shape, "\n")
+    print("Total jacobian shape:", shape, "\n")
 
-    nzrows, nzcols = np.nonzero(fullJ > info['good_tol'])
-    shape = fullJ.shape
+    nz = fullJ.data > info['good_tol']
+    nzrows, nzcols = fullJ.row[nz], fullJ.col[nz]
     fullJ = None
 
     return coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape), info
@@ -1838,15 +1906,13 @@ def _compute_coloring(J, mode):
 
     col2rows = [None] * ncols  # will contain list of nonzero rows for each column
 
-    for r, c in zip(nzrows, nzcols):
-        if col2rows[c] is None:
-            col2rows[c] = [r]
-        else:
-            col2rows[c].append(r)
+    order = np.lexsort((nzrows, nzcols))
+    sorted_rows = nzrows[order].tolist()
+    col_ptr = np.zeros(ncols + 1, dtype=INT_DTYPE)
+    np.cumsum(np.bincount(nzcols, minlength=ncols), out=col_ptr[1:])
 
-    for c, rows in enumerate(col2rows):
-        if rows is not None:
-            col2rows[c] = sorted(rows)
+    for c in np.unique(nzcols):
+        col2rows[c] = sorted_rows[col_ptr[c]:col_ptr[c + 1]]
 
     if rev:
         coloring._rev = (col_groups, col2rows)
@@ -1864,7 +1930,8 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
                            num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
-                           setup=False, run_model=False, fname=None, use_abs_names=False):
+                           setup=False, run_model=False, fname=None, use_abs_names=False,
+                           num_workers=1):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -1892,6 +1959,9 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         File where output coloring info will be written. If None, no info will be written.
     use_abs_names : bool
         If True, use absolute naming for of and wrt variables unless they are aliases.
+    num_workers : int
+        Number of forked worker processes used to compute the total jacobians of the sparsity
+        computation concurrently.
 
     Returns
     -------
@@ -1936,7 +2006,7 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         J, sparsity_info = _get_bool_total_jac(problem, num_full_jacs=num_full_jacs, tol=tol,
                                                orders=orders, setup=setup,
                                                run_model=run_model, of=ofs, wrt=wrts,
-                                               use_abs_names=True)
+                                               use_abs_names=True, num_workers=num_workers)
         coloring = _compute_coloring(J, mode)
         if coloring is not None:
             coloring._row_vars = ofs
@@ -1998,10 +2068,30 @@ def dynamic_total_coloring(driver, run_model=True, fname=None):
                                               _DEF_COMP_SPARSITY_ARGS['num_full_jacs'])
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
+    num_workers = driver._coloring_info.get('num_workers', 1)
+
+    coloring = cache_fname = None
+    if driver._coloring_info.get('use_cache'):
+        cache_fname = _get_total_coloring_cache_fname(driver)
+        if os.path.isfile(cache_fname):
+            if run_model:
+                problem.run_model(reset_iter_counts=False)
+            print("loading cached total coloring from file %s" % cache_fname)
+            coloring = Coloring.load(cache_fname)
+            driver._coloring_info.update(coloring._meta)
+            cache_fname = None
 
-    coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol, orders=orders,
-                                      setup=False, run_model=run_model, fname=fname,
-                                      use_abs_names=False)
+    if coloring is None:
+        coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol,
+                                          orders=orders, setup=False, run_model=run_model,
+                                          fname=fname, use_abs_names=False,
+                                          num_workers=num_workers)
+
+        if cache_fname is not None and coloring is not None:
+            model = problem.model
+            if ((model._full_comm is not None and model._full_comm.rank == 0) or
+                    (model._full_comm is None and model.comm.rank == 0)):
+                coloring.save(cache_fname)
 
     if coloring is not None:
         if driver._coloring_info['show_sparsity']:
@@ -2016,6 +2106,64 @@ def dynamic_total_coloring(driver, run_model=True, fname=None):
     return coloring
 
 
+def _get_total_coloring_cache_fname(driver):
+    """
+    Return the name of the file where the cached total coloring of the driver is stored.
+
+    The name contains a hash of the model structure, the variable sizes, the declared partial
+    derivative sparsity, the expressions of ExecComps, the driver's design variables and
+    responses, the derivative mode and the sparsity computation settings.  Changes to a model
+    that alter its total sparsity without altering any of those, e.g. a component that stops
+    computing some of its dense partials, are not detected, so the cache file must be removed in
+    that case.
+
+    Parameters
+    ----------
+    driver : <Driver>
+        The driver performing the optimization.
+
+    Returns
+    -------
+    str
+        The cache file name.
+    """
+    from openmdao.components.exec_comp import ExecComp
+
+    problem = driver._problem()
+    model = problem.model
+    info = driver._coloring_info
+
+    # the declared sparsity of the partials and the ExecComp expressions change the total
+    # sparsity without changing the model structure
+    partials_hash = hashlib.md5()  # nosec: content not sensitive
+    for system in model.system_iter(include_self=True, recurse=True):
+        if isinstance(system, ExecComp):
+            partials_hash.update(str((system.pathname, system._exprs)).encode())
+        for key, meta in sorted(system._subjacs_info.items()):
+            partials_hash.update(str((key, meta['shape'])).encode())
+            for name in ('rows', 'cols'):
+                if meta.get(name) is not None:
+                    partials_hash.update(np.ascontiguousarray(meta[name]).tobytes())
+    partials_hash = partials_hash.hexdigest()
+    if model.comm.size > 1:
+        partials_hash = model.comm.allgather(partials_hash)
+
+    data = [
+        model._generate_md5_hash(),
+        partials_hash,
+        [(n, meta['global_size']) for n, meta in model._var_allprocs_abs2meta['output'].items()],
+        [(n, meta['source'], meta['size'], str(meta['indices']))
+         for n, meta in driver._designvars.items()],
+        [(n, driver._responses[n]['size'], str(driver._responses[n]['indices']))
+         for n in driver._get_ordered_nl_responses()],
+        problem._orig_mode,
+        info['num_full_jacs'], info['tol'], info['orders'],
+    ]
+    key = hashlib.md5(str(data).encode()).hexdigest()  # nosec: content not sensitive
+
+    return os.path.join(problem.options['coloring_dir'], f'total_coloring_{key}.pkl')
+
+
 def _run_total_coloring_report(driver):
     coloring = driver._coloring_info['coloring']
     if coloring is not None:
@@ -2415,18 +2563,86 @@ class _ColSparsityJac(object):
         # record only the nonzero part of the column.
         # Depending on user specified tolerance, the number of nonzeros may be further reduced later
         nzs = np.nonzero(column)[0]
+        self._add_col_nonzeros(i, nzs, column[nzs])
+
+    def _add_col_nonzeros(self, i, nzs, vals):
         if self._col_list[i] is None:
-            self._col_list[i] = [nzs, np.abs(column[nzs])]
+            self._col_list[i] = [nzs, np.abs(vals)]
         else:
             oldnzs, olddata = self._col_list[i]
             if oldnzs.size == nzs.size and np.all(nzs == oldnzs):
-                olddata += np.abs(column[nzs])
-            else:  # nonzeros don't match
-                scratch = np.zeros(column.size)
-                scratch[oldnzs] = olddata
-                scratch[nzs] += np.abs(column[nzs])
-                newnzs = np.nonzero(scratch)[0]
-                self._col_list[i] = [newnzs, scratch[newnzs]]
+                olddata += np.abs(vals)
+            else:  # nonzeros don't match, so merge them without allocating a full column
+                newnzs = np.union1d(oldnzs, nzs)
+                newdata = np.zeros(newnzs.size)
+                newdata[np.searchsorted(newnzs, oldnzs)] = olddata
+                newdata[np.searchsorted(newnzs, nzs)] += np.abs(vals)
+                self._col_list[i] = [newnzs, newdata]
+
+    def probe(self, system, jvp, rounds):
+        """
+        Collect nonzero jacobian entries by probing with random directional derivatives.
+
+        In each round the columns are randomly split into groups and every group is probed
+        with a single directional derivative having random positive weights.  A row hit in
+        every round by the group containing a given column is a candidate nonzero for that
+        column, so the intersection of the candidates over all rounds is a superset of the
+        actual sparsity.  That superset is then colored and one more probe per color
+        recovers the values of all candidate entries.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns this jacobian.
+        jvp : function
+            Function that takes a direction array (one entry per column) and returns the
+            corresponding jacobian-vector product.
+        rounds : int
+            Number of random grouping rounds used to find the candidate nonzeros.
+        """
+        nrows, ncols = self._nrows, self._ncols
+        ngroups = min(ncols, max(1, int(np.sqrt(ncols))))
+        direction = np.zeros(ncols)
+        candidates = None
+
+        for _ in range(rounds):
+            perm = np.random.permutation(ncols)
+            weights = 1.0 + np.random.random(ncols)
+            hit_rows = []
+            hit_groups = []
+            for g in range(ngroups):
+                cols = perm[g::ngroups]
+                direction[cols] = weights[cols]
+                nzs = np.nonzero(jvp(direction))[0]
+                direction[cols] = 0.
+                hit_rows.append(nzs)
+                hit_groups.append(np.full(nzs.size, g, dtype=INT_DTYPE))
+
+            hit_rows = np.hstack(hit_rows)
+            hits = csr_matrix((np.ones(hit_rows.size), (hit_rows, np.hstack(hit_groups))),
+                              shape=(nrows, ngroups))
+            col2group = csr_matrix((np.ones(ncols), (np.arange(ncols) % ngroups, perm)),
+                                   shape=(ngroups, ncols))
+            found = hits @ col2group
+            candidates = found if candidates is None else candidates.multiply(found).tocsr()
+
+        candidates = candidates.tocoo()
+        if candidates.nnz == 0:
+            return
+
+        sparsity = coo_matrix((np.ones(candidates.nnz, dtype=bool),
+                               (candidates.row, candidates.col)), shape=(nrows, ncols))
+
+        # columns sharing a color have no candidate rows in common, so each candidate entry
+        # of a probe's result belongs to exactly one column.
+        for cols, nzrows in _compute_coloring(sparsity, 'fwd').color_nonzero_iter('fwd'):
+            direction[cols] = 1.0
+            result = jvp(direction)
+            direction[cols] = 0.
+            for col, rows in zip(cols, nzrows):
+                vals = result[rows]
+                mask = vals != 0.
+                self._add_col_nonzeros(col, np.asarray(rows)[mask], vals[mask])
 
     def set_dense_jac(self, system, jac):
         """
@@ -2483,6 +2699,9 @@ class _ColSparsityJac(object):
             data *= (1. / np.max(data))
 
             info = _tol_sweep(data, color_info['tol'], color_info['orders'])
+            # entries that were never recorded are zero, so account for them here
+            info['zero_entries'] += self._nrows * self._ncols - data.size
+            info['J_size'] = self._nrows * self._ncols
             data = data > info['good_tol']  # data is now a bool
             rows = rows[data]
             cols = cols[data]
@@ -2497,8 +2716,8 @@ class _ColSparsityJac(object):
                 'good_tol': color_info['tol'],
                 'nz_matches': 0,
                 'n_tested': 0,
-                'zero_entries': 0,
-                'J_size': 0,
+                'zero_entries': self._nrows * self._ncols,
+                'J_size': self._nrows * self._ncols,
             }
 
         return coo_matrix((data, (rows, cols)), shape=(self._nrows, self._ncols)), info
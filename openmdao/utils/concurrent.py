@@ -1,8 +1,9 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or in a process pool.
 """
 import os
 import traceback
+import multiprocessing
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
@@ -252,3 +253,120 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+# state shared with forked pool workers.  Because workers are forked, the function they
+# evaluate (and everything it references, e.g. a fully set up Problem) is inherited by the
+# child process rather than being pickled and sent to it.
+_pool_state = {}
+
+
+def _fork_supported():
+    """
+    Return True if worker processes can be created by forking on this platform.
+
+    Returns
+    -------
+    bool
+        True if the 'fork' multiprocessing start method is available.
+    """
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _get_fork_context():
+    """
+    Return a multiprocessing context that creates worker processes by forking.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        The 'fork' multiprocessing context.
+    """
+    if not _fork_supported():
+        raise RuntimeError("Process pool evaluation requires a platform that supports the "
+                           "'fork' multiprocessing start method.")
+    return multiprocessing.get_context('fork')
+
+
+def _pool_worker_init(initializer):
+    """
+    Initialize a forked pool worker.
+
+    Parameters
+    ----------
+    initializer : function or None
+        Function (taking no args) that will be called once in each worker after it starts.
+    """
+    if initializer is not None:
+        initializer()
+
+
+def _pool_worker_eval(task):
+    """
+    Evaluate a single case in a pool worker.
+
+    Parameters
+    ----------
+    task : tuple
+        Tuple of the form (case_index, args, kwargs).
+
+    Returns
+    -------
+    tuple
+        Tuple of the form (case_index, retval, err).
+    """
+    icase, args, kwargs = task
+    func = _pool_state['func']
+    try:
+        if kwargs:
+            retval = func(*args, **kwargs)
+        else:
+            retval = func(*args)
+    except Exception:
+        err = traceback.format_exc()
+        retval = None
+    else:
+        err = None
+
+    return icase, retval, err
+
+
+def concurrent_eval_pool(func, cases, num_workers, initializer=None):
+    """
+    Evaluate function in a pool of forked worker processes with load balancing.
+
+    Each worker is given a new case as soon as it has finished its last one, so
+    cases with uneven run times are spread evenly over the workers.  Workers are
+    forked from the current process, so func and any objects it refers to do not
+    have to be picklable, but the case args and the return values do.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    cases : iter of function args
+        Entries are assumed to be of the form (args, kwargs) where
+        kwargs are allowed to be None and args should be a list or tuple.
+    num_workers : int
+        Number of worker processes.
+    initializer : function or None
+        Function (taking no args) that will be called once in each worker after it starts.
+
+    Yields
+    ------
+    tuple
+        Tuple of the form (case_index, retval, err) for each case, in order of completion.
+    """
+    ctx = _get_fork_context()
+
+    if 'func' in _pool_state:
+        raise RuntimeError("concurrent_eval_pool cannot be nested.")
+
+    _pool_state['func'] = func
+    try:
+        tasks = ((i, args, kwargs) for i, (args, kwargs) in enumerate(cases))
+        with ctx.Pool(num_workers, initializer=_pool_worker_init,
+                      initargs=(initializer,)) as pool:
+            yield from pool.imap_unordered(_pool_worker_eval, tasks, chunksize=1)
+    finally:
+        del _pool_state['func']
@@ -1,7 +1,6 @@
 """
 Various graph related utilities.
 """
-import networkx as nx
 
 
 def get_sccs_topo(graph):
@@ -18,6 +17,8 @@ def get_sccs_topo(graph):
     list of sets of str
         A list of strongly connected components in topological order.
     """
+    import networkx as nx
+
     # Tarjan's algorithm returns SCCs in reverse topological order, so
     # the list returned here is reversed.
     sccs = list(nx.strongly_connected_components(graph))
@@ -3,15 +3,45 @@ import sys
 import importlib
 import inspect
 
-try:
-    from IPython.display import display, HTML, IFrame, Code
-    from IPython import get_ipython
-    ipy = get_ipython() is not None
-except ImportError:
-    ipy = display = HTML = IFrame = None
-
 from openmdao.utils.om_warnings import issue_warning
 
+
+def _lazy_ipython_display(name):
+    """
+    Return a function that imports and calls the named IPython.display object on first use.
+
+    Parameters
+    ----------
+    name : str
+        Name of the object in IPython.display.
+
+    Returns
+    -------
+    function
+        The wrapper function.
+    """
+    def _wrapper(*args, **kwargs):
+        import IPython.display
+        return getattr(IPython.display, name)(*args, **kwargs)
+
+    _wrapper.__name__ = name
+    return _wrapper
+
+
+if 'IPython' in sys.modules:
+    try:
+        from IPython.display import display, HTML, IFrame, Code
+        from IPython import get_ipython
+        ipy = get_ipython() is not None
+    except ImportError:
+        ipy = display = HTML = IFrame = None
+else:
+    # We can't be running inside of an IPython shell if IPython hasn't been imported, so don't
+    # pay the cost of importing it until something is actually displayed.
+    ipy = False
+    display, HTML, IFrame, Code = [_lazy_ipython_display(n)
+                                   for n in ('display', 'HTML', 'IFrame', 'Code')]
+
 colab = 'google.colab' in sys.modules
 
 
@@ -50,6 +50,7 @@ from openmdao.devtools.iprofile import _iprof_totals_exec, _iprof_totals_setup_p
 from openmdao.devtools.iprof_mem import _mem_prof_exec, _mem_prof_setup_parser, \
     _mempost_exec, _mempost_setup_parser
 from openmdao.devtools.iprof_utils import _Options
+from openmdao.devtools.benchmark import _benchmark_setup_parser, _benchmark_cmd
 from openmdao.error_checking.check_config import _check_config_cmd, _check_config_setup_parser
 from openmdao.utils.mpi import MPI
 from openmdao.utils.find_cite import print_citations
@@ -423,6 +424,8 @@ def _get_deps(dep_dict: dict, package_name: str) -> None:
 # this dict should contain names mapped to tuples of the form:
 #   (setup_parser_func, executor, description)
 _command_map = {
+    'benchmark': (_benchmark_setup_parser, _benchmark_cmd,
+                  'Run benchmarks, time their phases and compare against a baseline.'),
     'call_tree': (_calltree_setup_parser, _calltree_exec,
                   "Display the call tree for the specified class method and all 'self' class "
                   "methods it calls."),
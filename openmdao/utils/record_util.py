@@ -2,6 +2,7 @@
 Utility functions related to recording or execution metadata.
 """
 from fnmatch import fnmatchcase
+from io import BytesIO
 import os
 import re
 import json
@@ -169,15 +170,15 @@ def check_path(path, includes, excludes, include_all_path=False):
 
 def deserialize(json_data, abs2meta, prom2abs, conns):
     """
-    Deserialize recorded data from a JSON formatted string.
+    Deserialize recorded data from a JSON formatted string or a binary numpy array.
 
     If all data values are arrays then a numpy structured array will be returned,
     otherwise a dictionary mapping variable names to values will be returned.
 
     Parameters
     ----------
-    json_data : str
-        JSON encoded data.
+    json_data : str or bytes
+        JSON encoded data, or a numpy structured array saved in binary form.
     abs2meta : dict
         Dictionary mapping absolute variable names to variable metadata.
     prom2abs : dict
@@ -191,6 +192,9 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
     array or dict
         Variable names and values parsed from the JSON string.
     """
+    if isinstance(json_data, bytes):
+        return np.load(BytesIO(json_data))
+
     values = json.loads(json_data)
     if values is None:
         return None
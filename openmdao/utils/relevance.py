@@ -0,0 +1,374 @@
+"""Compiled relevance index for design variables and responses."""
+from collections import defaultdict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import breadth_first_order
+
+from openmdao.core.constants import INT_DTYPE
+
+# node types
+_SYS = 0
+_IN = 1
+_OUT = 2
+
+
+class RelevanceGraph(object):
+    """
+    Integer indexed graph of systems and connected variables.
+
+    Each connection adds edges source system -> source -> target -> target system, so a
+    variable depends on another if there is a path between them.  Reachability from a set of
+    start nodes is computed with compiled breadth first searches and stored as rows of a sparse
+    boolean matrix.
+
+    Parameters
+    ----------
+    conns : dict
+        Mapping of absolute input name to connected source name.
+    outputs : iter of str
+        Additional output names (design variables and responses) that must be in the graph.
+
+    Attributes
+    ----------
+    names : list of str
+        Name of each node, indexed by node id.
+    ids : dict
+        Mapping of node name to node id.
+    types : ndarray
+        Type of each node (system, input or output).
+    _graphs : dict
+        Adjacency matrix of the graph keyed by direction ('fwd' or 'rev').
+    """
+
+    def __init__(self, conns, outputs=()):
+        """
+        Initialize all attributes.
+        """
+        self.names = names = []
+        self.ids = ids = {}
+        types = []
+
+        def add_node(name, typ):
+            try:
+                i = ids[name]
+            except KeyError:
+                i = ids[name] = len(names)
+                names.append(name)
+                types.append(typ)
+            else:
+                if typ != _SYS:
+                    types[i] = typ
+            return i
+
+        edges = []
+        for tgt, src in conns.items():
+            isrc = ids[src] if src in ids else add_node(src, _OUT)
+            itgt = add_node(tgt, _IN)
+            edges.append((add_node(src.rpartition('.')[0], _SYS), isrc))
+            edges.append((itgt, add_node(tgt.rpartition('.')[0], _SYS)))
+            edges.append((isrc, itgt))
+
+        for name in outputs:
+            if name not in ids:
+                edges.append((add_node(name.rpartition('.')[0], _SYS), add_node(name, _OUT)))
+
+        self.types = np.array(types, dtype=np.int8)
+
+        n = len(names)
+        if edges:
+            rows, cols = np.array(edges, dtype=INT_DTYPE).T
+        else:
+            rows = cols = np.zeros(0, dtype=INT_DTYPE)
+
+        fwd = csr_matrix((np.ones(rows.size), (rows, cols)), shape=(n, n))
+        fwd.sum_duplicates()
+        self._graphs = {'fwd': fwd, 'rev': fwd.T.tocsr()}
+
+    def reach(self, starts, direction):
+        """
+        Return the nodes reachable from each of the given start nodes.
+
+        Parameters
+        ----------
+        starts : list of str
+            Names of the start nodes.
+        direction : str
+            'fwd' to follow edges downstream, 'rev' to follow them upstream.
+
+        Returns
+        -------
+        csr_matrix
+            Boolean matrix with a row for each start node, with sorted column indices.  Each start
+            node is reachable from itself.
+        """
+        graph = self._graphs[direction]
+        ids = self.ids
+
+        rows = [breadth_first_order(graph, ids[name], directed=True,
+                                    return_predecessors=False) for name in starts]
+        indptr = np.zeros(len(rows) + 1, dtype=INT_DTYPE)
+        if rows:
+            np.cumsum([r.size for r in rows], out=indptr[1:])
+            indices = np.concatenate(rows).astype(INT_DTYPE)
+        else:
+            indices = np.zeros(0, dtype=INT_DTYPE)
+
+        mat = csr_matrix((np.ones(indices.size, dtype=bool), indices, indptr),
+                         shape=(len(rows), len(self.names)))
+        mat.sort_indices()
+        return mat
+
+    def deps(self, nodes):
+        """
+        Return the relevance entry for the given set of common nodes.
+
+        Parameters
+        ----------
+        nodes : ndarray
+            Ids of the nodes.
+
+        Returns
+        -------
+        tuple
+            ({'input': input_deps, 'output': output_deps}, sys_deps).
+        """
+        names = self.names
+        types = self.types[nodes]
+        input_deps = {names[i] for i in nodes[types == _IN]}
+        output_deps = {names[i] for i in nodes[types == _OUT]}
+
+        # walk up the tree from each variable, stopping at the first system already found.
+        # This includes the top level Group, which is always relevant.
+        sys_deps = set()
+        for name in input_deps.union(output_deps):
+            system = name.rpartition('.')[0]
+            while system not in sys_deps:
+                sys_deps.add(system)
+                system = system.rpartition('.')[0]
+
+        return {'input': input_deps, 'output': output_deps}, sys_deps
+
+
+class _NodeSets(object):
+    """
+    Sets of node ids stored as the rows of a boolean CSR matrix.
+
+    The sets are pickled as packed bits, which is much more compact than the node ids when the
+    sets are large.
+
+    Parameters
+    ----------
+    indices : ndarray
+        Sorted node ids of all sets, concatenated.
+    indptr : ndarray
+        Start index of each set in indices, plus the total number of ids.
+    nnodes : int
+        Total number of nodes in the graph.
+    """
+
+    def __init__(self, indices, indptr, nnodes):
+        """
+        Initialize all attributes.
+        """
+        self._indices = indices
+        self._indptr = indptr
+        self._nnodes = nnodes
+
+    def __getitem__(self, row):
+        return self._indices[self._indptr[row]:self._indptr[row + 1]]
+
+    def __reduce__(self):
+        nrows = self._indptr.size - 1
+        bits = np.zeros((nrows, (self._nnodes + 7) // 8), dtype=np.uint8)
+        mask = np.zeros(self._nnodes, dtype=bool)
+        for i in range(nrows):
+            mask[:] = False
+            mask[self[i]] = True
+            bits[i] = np.packbits(mask)
+        return (_unpack_node_sets, (bits, self._nnodes))
+
+
+def _unpack_node_sets(bits, nnodes):
+    rows = [np.flatnonzero(np.unpackbits(b, count=nnodes)).astype(INT_DTYPE) for b in bits]
+    return _make_node_sets(rows, nnodes)
+
+
+def _make_node_sets(rows, nnodes):
+    indptr = np.zeros(len(rows) + 1, dtype=INT_DTYPE)
+    if rows:
+        np.cumsum([r.size for r in rows], out=indptr[1:])
+        indices = np.concatenate(rows).astype(INT_DTYPE)
+    else:
+        indices = np.zeros(0, dtype=INT_DTYPE)
+    return _NodeSets(indices, indptr, nnodes)
+
+
+class _RelevantPairs(dict):
+    """
+    Relevance entries of one variable of interest, keyed by the variables it is relevant to.
+
+    Entries are only computed the first time they are accessed.
+
+    Parameters
+    ----------
+    graph : RelevanceGraph
+        The relevance graph.
+    pending : dict
+        Mapping of key to a tuple of (node_sets, row) pairs, where node_sets is a _NodeSets.
+        The entry is computed from the intersection of the given node sets.
+    """
+
+    def __init__(self, graph, pending):
+        """
+        Initialize all attributes.
+        """
+        super().__init__()
+        self._graph = graph
+        self._pending = pending
+
+    def __missing__(self, key):
+        nodes = None
+        for node_sets, row in self._pending.pop(key):
+            row_nodes = node_sets[row]
+            if nodes is None:
+                nodes = row_nodes
+            else:
+                nodes = np.intersect1d(nodes, row_nodes, assume_unique=True)
+        val = self[key] = self._graph.deps(nodes)
+        return val
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._pending
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._pending)
+
+    def _materialize(self):
+        for key in list(self._pending):
+            self[key]
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self._materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        self._materialize()
+        return super().__repr__()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        self._materialize()
+        return super().keys()
+
+    def values(self):
+        self._materialize()
+        return super().values()
+
+    def items(self):
+        self._materialize()
+        return super().items()
+
+    def copy(self):
+        self._materialize()
+        return dict(super().items())
+
+    def __reduce__(self):
+        # keep pending entries pending so a pickled relevance dict stays cheap to load
+        return (_RelevantPairs, (self._graph, self._pending), None, None,
+                iter(dict(super().items()).items()))
+
+
+def get_relevance(conns, desvars, responses, mode):
+    """
+    Return the relevance dictionary for the given design variables and responses.
+
+    Parameters
+    ----------
+    conns : dict
+        Mapping of absolute input name to connected source name.
+    desvars : iter of str
+        Design variable names.
+    responses : iter of str
+        Response names.
+    mode : str
+        Direction of derivatives, either 'fwd', 'rev' or 'auto'.
+
+    Returns
+    -------
+    dict
+        Dict of ({'input': dep_inputs, 'output': dep_outputs}, dep_systems) keyed by design
+        vars and responses (or responses and design vars in rev mode), plus an '@all' entry
+        for each variable of interest combining all of its dependencies.
+    """
+    desvars = list(desvars)
+    responses = list(responses)
+
+    graph = RelevanceGraph(conns, desvars + responses)
+    nnodes = len(graph.names)
+    dv_reach = graph.reach(desvars, 'fwd')
+    res_reach = graph.reach(responses, 'rev')
+    dv_sets = _NodeSets(dv_reach.indices, dv_reach.indptr, nnodes)
+    res_sets = _NodeSets(res_reach.indices, res_reach.indptr, nnodes)
+
+    def src(name):
+        return conns[name] if name in conns else name
+
+    relevant = defaultdict(dict)
+    all_masks = defaultdict(lambda: np.zeros(nnodes, dtype=bool))
+
+    roles = []
+    if mode != 'rev':
+        roles.append((desvars, dv_reach, dv_sets, responses, res_reach, res_sets))
+    if mode != 'fwd':
+        roles.append((responses, res_reach, res_sets, desvars, dv_reach, dv_sets))
+
+    for inputs, in_reach, in_sets, outputs, out_reach, out_sets in roles:
+        out_ids = np.array([graph.ids[name] for name in outputs], dtype=INT_DTYPE)
+
+        # an output is relevant to an input if it's reachable from that input.  This is the case
+        # whenever the two reachable sets have any nodes in common.
+        pairs = in_reach[:, out_ids].tocsr() if out_ids.size else None
+
+        # union of the nodes reachable from all outputs
+        out_union = np.zeros(nnodes, dtype=bool)
+        out_union[out_reach.indices] = True
+
+        for i, inp in enumerate(inputs):
+            nodes = in_sets[i]
+            name = src(inp)
+
+            pending = {}
+            if pairs is not None:
+                for j in pairs.indices[pairs.indptr[i]:pairs.indptr[i + 1]]:
+                    pending[src(outputs[j])] = ((in_sets, i), (out_sets, j))
+
+            if name not in relevant:
+                relevant[name] = _RelevantPairs(graph, {})
+            relevant[name]._pending.update(pending)
+
+            if pending:
+                all_masks[name][nodes[out_union[nodes]]] = True
+            else:
+                all_masks[name]  # make sure an entry exists
+
+    # combined entries of all variables of interest share a single _NodeSets
+    all_names = [name for name, mask in all_masks.items() if mask.any()]
+    all_sets = _make_node_sets([np.flatnonzero(all_masks[n]) for n in all_names], nnodes)
+    for i, name in enumerate(all_names):
+        relevant[name]._pending['@all'] = ((all_sets, i),)
+
+    for name, mask in all_masks.items():
+        if not mask.any():
+            relevant[name]['@all'] = ({'input': set(), 'output': set()}, set())
+
+    return relevant
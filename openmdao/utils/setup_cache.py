@@ -0,0 +1,139 @@
+"""Persistent cache of data computed during Problem setup."""
+
+import hashlib
+import os
+import pickle
+
+from openmdao import __version__
+from openmdao.utils.om_warnings import issue_warning
+
+
+def _get_setup_cache_key(model, desvars, responses, mode):
+    """
+    Return a hash of everything the cached setup data depends on.
+
+    The hash covers the model hierarchy, all variable names and connections, the global shapes
+    and src_indices of all variables, the design variables and responses, the derivative mode
+    and the OpenMDAO version.
+
+    Parameters
+    ----------
+    model : <System>
+        The top level System.
+    desvars : dict
+        Design variable metadata keyed by name.
+    responses : dict
+        Response metadata keyed by name.
+    mode : str
+        Derivative direction, either 'fwd', 'rev' or 'auto'.
+
+    Returns
+    -------
+    str
+        The hash string.
+    """
+    h = hashlib.md5()  # nosec: content not sensitive
+    h.update(str((__version__, mode, model._generate_md5_hash())).encode())
+
+    for io in ('input', 'output'):
+        for name, meta in model._var_allprocs_abs2meta[io].items():
+            h.update(str((name, meta['global_shape'], meta['distributed'])).encode())
+
+    for name, meta in model._var_abs2meta['input'].items():
+        if meta['src_indices'] is not None:
+            h.update(name.encode())
+            h.update(meta['src_indices'].shaped_array().tobytes())
+
+    for voi in (desvars, responses):
+        h.update(str([(n, meta['source'], meta['parallel_deriv_color'])
+                      for n, meta in voi.items()]).encode())
+
+    return h.hexdigest()
+
+
+class SetupCache(object):
+    """
+    On-disk cache of setup data for a model whose structure has not changed.
+
+    Entries are stored in a single pickle file whose name contains a hash of the model structure
+    (see _get_setup_cache_key), so a changed model never sees entries computed for a different
+    one.  A file that can't be read is ignored and rewritten.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where cache files are stored.
+    key : str
+        Hash of the model structure.
+
+    Attributes
+    ----------
+    fname : str
+        Name of the cache file.
+    key : str
+        Hash of the model structure.
+    _data : dict
+        Cached entries keyed by name.
+    _modified : bool
+        True if entries were added since the cache was loaded.
+    """
+
+    def __init__(self, cache_dir, key):
+        """
+        Initialize all attributes and load the cache file if it exists.
+        """
+        self.fname = os.path.join(cache_dir, f'setup_cache_{key}.pkl')
+        self.key = key
+        self._data = {}
+        self._modified = False
+
+        if os.path.isfile(self.fname):
+            try:
+                with open(self.fname, 'rb') as f:
+                    data = pickle.load(f)
+                if data.get('key') == key:
+                    self._data = data['entries']
+            except Exception as err:
+                issue_warning(f"Ignoring setup cache file '{self.fname}' because it couldn't be "
+                              f"loaded: {err}")
+
+    def get(self, name):
+        """
+        Return the cached entry with the given name.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the entry.
+
+        Returns
+        -------
+        object or None
+            The cached entry, or None if there isn't one.
+        """
+        return self._data.get(name)
+
+    def set(self, name, val):
+        """
+        Add an entry to the cache.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the entry.
+        val : object
+            The value to cache.  It must be picklable.
+        """
+        self._data[name] = val
+        self._modified = True
+
+    def save(self):
+        """
+        Write the cache file if any entries were added.
+        """
+        if self._modified:
+            os.makedirs(os.path.dirname(self.fname), exist_ok=True)
+            with open(self.fname, 'wb') as f:
+                pickle.dump({'key': self.key, 'entries': self._data}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            self._modified = False
@@ -0,0 +1,146 @@
+import unittest
+import pickle
+
+import networkx as nx
+
+import openmdao.api as om
+from openmdao.utils.general_utils import all_ancestors
+from openmdao.utils.relevance import get_relevance, _RelevantPairs
+
+
+def _build_model():
+    p = om.Problem(reports=False)
+    model = p.model
+    model.add_subsystem('indep1', om.IndepVarComp('x', 1.0))
+    G1 = model.add_subsystem('G1', om.Group())
+    G1.add_subsystem('C1', om.ExecComp(['x=2.0*a', 'y=2.0*b', 'z=2.0*b']))
+    G1.add_subsystem('C2', om.ExecComp(['x=2.0*a', 'y=2.0*b', 'z=2.0*b']))
+    model.add_subsystem('C3', om.ExecComp(['x=2.0*a', 'y=2.0*b+3.0*c']))
+    model.add_subsystem('C4', om.ExecComp(['x=2.0*a', 'y=2.0*b']))
+    model.add_subsystem('indep2', om.IndepVarComp('x', 1.0))
+    G2 = model.add_subsystem('G2', om.Group())
+    G2.add_subsystem('C5', om.ExecComp(['x=2.0*a', 'y=2.0*b+3.0*c']))
+    G2.add_subsystem('C6', om.ExecComp(['x=2.0*a', 'y=2.0*b+3.0*c']))
+    G2.add_subsystem('C7', om.ExecComp(['x=2.0*a', 'y=2.0*b']))
+    model.add_subsystem('C8', om.ExecComp(['y=1.5*a+2.0*b']))
+    model.add_subsystem('Unconnected', om.ExecComp('y=99.*x'))
+
+    model.connect('indep1.x', 'G1.C1.a')
+    model.connect('indep2.x', 'G2.C6.a')
+    model.connect('G1.C1.x', 'G1.C2.b')
+    model.connect('G1.C2.z', 'C4.b')
+    model.connect('G1.C1.z', ('C3.b', 'C3.c', 'G2.C5.a'))
+    model.connect('C3.y', 'G2.C5.b')
+    model.connect('C3.x', 'C4.a')
+    model.connect('G2.C6.y', 'G2.C7.b')
+    model.connect('G2.C5.x', 'C8.b')
+    model.connect('G2.C7.x', 'C8.a')
+    # cycle
+    model.connect('C4.y', 'G1.C1.b')
+
+    p.setup()
+    return p
+
+
+def _brute_force(conns, desvars, responses):
+    # straightforward networkx version of the relevance computation
+    graph = nx.DiGraph()
+    types = {}
+    for tgt, src in conns.items():
+        types.setdefault(src, 'output')
+        types[tgt] = 'input'
+        graph.add_edge(src.rpartition('.')[0], src)
+        graph.add_edge(tgt, tgt.rpartition('.')[0])
+        graph.add_edge(src, tgt)
+    for name in desvars + responses:
+        if name not in graph:
+            types[name] = 'output'
+            graph.add_edge(name.rpartition('.')[0], name)
+
+    expected = {}
+    for dv in desvars:
+        for res in responses:
+            common = (nx.descendants(graph, dv) | {dv}) & (nx.ancestors(graph, res) | {res})
+            if common:
+                ins = {n for n in common if types.get(n) == 'input'}
+                outs = {n for n in common if types.get(n) == 'output'}
+                systems = {''}
+                for n in ins | outs:
+                    systems.update(all_ancestors(n.rpartition('.')[0]))
+                expected[dv, res] = ({'input': ins, 'output': outs}, systems)
+    return expected
+
+
+class TestRelevance(unittest.TestCase):
+
+    def test_against_brute_force(self):
+        p = _build_model()
+        conns = p.model._conn_global_abs_in2out
+        desvars = ['indep1.x', 'indep2.x', 'G1.C1.y']
+        responses = ['C8.y', 'C4.x', 'Unconnected.y', 'G2.C7.x', 'G1.C1.y']
+        expected = _brute_force(conns, desvars, responses)
+
+        for mode in ('fwd', 'rev', 'auto'):
+            with self.subTest(mode=mode):
+                relevant = get_relevance(conns, desvars, responses, mode)
+
+                for dv in desvars:
+                    for res in responses:
+                        if mode != 'rev':
+                            if (dv, res) in expected:
+                                self.assertIn(res, relevant[dv])
+                                self.assertEqual(relevant[dv][res], expected[dv, res])
+                            elif dv != res:
+                                self.assertNotIn(res, relevant[dv])
+                        if mode != 'fwd':
+                            if (dv, res) in expected:
+                                self.assertIn(dv, relevant[res])
+                                self.assertEqual(relevant[res][dv], expected[dv, res])
+                            elif dv != res:
+                                self.assertNotIn(dv, relevant[res])
+
+                if mode == 'fwd':
+                    for dv in desvars:
+                        dct, systems = relevant[dv]['@all']
+                        ins, outs, syss = set(), set(), set()
+                        for (d, r), (edct, esys) in expected.items():
+                            if d == dv:
+                                ins |= edct['input']
+                                outs |= edct['output']
+                                syss |= esys
+                        self.assertEqual(dct, {'input': ins, 'output': outs})
+                        self.assertEqual(systems, syss)
+
+                if mode != 'fwd':
+                    self.assertEqual(relevant['Unconnected.y']['@all'],
+                                     ({'input': set(), 'output': set()}, set()))
+
+    def test_lazy_pairs(self):
+        p = _build_model()
+        conns = p.model._conn_global_abs_in2out
+        relevant = get_relevance(conns, ['indep1.x', 'indep2.x'], ['C8.y', 'C4.x'], 'fwd')
+
+        pairs = relevant['indep1.x']
+        self.assertIsInstance(pairs, _RelevantPairs)
+        self.assertEqual(len(pairs._pending), 3)  # includes '@all'
+        self.assertEqual(len(pairs), 3)
+
+        self.assertIn('C8.y', pairs)
+        self.assertNotIn('Unconnected.y', pairs)
+        self.assertEqual(len(pairs._pending), 3)
+
+        pairs['C8.y']
+        self.assertEqual(len(pairs._pending), 2)
+
+        self.assertEqual(sorted(pairs), ['@all', 'C4.x', 'C8.y'])
+        self.assertEqual(len(pairs._pending), 0)
+
+        with self.assertRaises(KeyError):
+            pairs['Unconnected.y']
+
+        self.assertIsNone(pairs.get('Unconnected.y'))
+        self.assertEqual(pickle.loads(pickle.dumps(pairs)), dict(pairs.items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+def _build_problem(mode='rev', extra_conn=False):
+    p = om.Problem(reports=False, setup_cache_dir='setup_cache')
+    model = p.model
+    model.add_subsystem('ivc', om.IndepVarComp('x', np.ones(3)))
+    G = model.add_subsystem('G', om.Group())
+    G.add_subsystem('C1', om.ExecComp('y=2.0*x', x=np.ones(3), y=np.ones(3)))
+    G.add_subsystem('C2', om.ExecComp('y=3.0*x**2', x=np.ones(2), y=np.ones(2)))
+    model.add_subsystem('C3', om.ExecComp('y=sum(a)+b', a=np.ones(2)))
+
+    model.connect('ivc.x', 'G.C1.x')
+    model.connect('G.C1.y', 'G.C2.x', src_indices=[0, 2])
+    model.connect('G.C2.y', 'C3.a')
+    if extra_conn:
+        model.connect('ivc.x', 'C3.b', src_indices=[1])
+
+    model.add_design_var('ivc.x')
+    model.add_objective('C3.y')
+    model.add_constraint('G.C2.y', upper=10.)
+
+    p.setup(mode=mode)
+    return p
+
+
+def _cache_files():
+    return sorted(os.listdir('setup_cache'))
+
+
+@use_tempdirs
+class TestSetupCache(unittest.TestCase):
+
+    def check_totals(self, p):
+        p.run_model()
+        J = p.compute_totals()
+        assert_near_equal(J['C3.y', 'ivc.x'], np.array([[24., 0., 24.]]))
+        assert_near_equal(J['G.C2.y', 'ivc.x'], np.array([[24., 0., 0.], [0., 0., 24.]]))
+
+    def test_reuse(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                p = _build_problem(mode)
+                cache = p._metadata['setup_cache']
+                self.assertIsNone(cache.get(('transfer_indices', '')))
+                self.check_totals(p)
+                self.assertTrue(os.path.isfile(cache.fname))
+                mtime = os.path.getmtime(cache.fname)
+
+                p = _build_problem(mode)
+                cache = p._metadata['setup_cache']
+                self.assertFalse(cache._modified)  # loaded from the file
+                self.assertIsNotNone(cache.get(('transfer_indices', '')))
+                self.check_totals(p)
+                self.assertFalse(cache._modified)
+                self.assertEqual(os.path.getmtime(cache.fname), mtime)
+
+        self.assertEqual(len(_cache_files()), 2)
+
+    def test_changed_model(self):
+        p = _build_problem()
+        self.check_totals(p)
+        fname = p._metadata['setup_cache'].fname
+
+        p = _build_problem(extra_conn=True)
+        self.assertNotEqual(p._metadata['setup_cache'].fname, fname)
+        self.assertTrue(p._metadata['setup_cache']._modified)
+        p.run_model()
+        J = p.compute_totals()
+        assert_near_equal(J['C3.y', 'ivc.x'], np.array([[24., 1., 24.]]))
+
+        self.assertEqual(len(_cache_files()), 2)
+
+    def test_bad_file(self):
+        p = _build_problem()
+        self.check_totals(p)
+        fname = p._metadata['setup_cache'].fname
+        with open(fname, 'w') as f:
+            f.write('not a pickle')
+
+        with assert_warning(om.OpenMDAOWarning,
+                            f"Ignoring setup cache file '{fname}' because it couldn't be loaded: "
+                            "invalid load key, 'n'."):
+            p = _build_problem()
+
+        self.assertTrue(p._metadata['setup_cache']._modified)
+        self.check_totals(p)
+
+        p = _build_problem()
+        self.assertFalse(p._metadata['setup_cache']._modified)
+
+    def test_no_design_vars(self):
+        def build(derivatives):
+            p = om.Problem(reports=False, setup_cache_dir='setup_cache')
+            p.model.add_subsystem('C1', om.ExecComp('y=2.0*x', x=np.ones(3), y=np.ones(3)))
+            p.model.add_subsystem('C2', om.ExecComp('y=3.0*x', x=np.ones(2), y=np.ones(2)))
+            p.model.connect('C1.y', 'C2.x', src_indices=[0, 2])
+            p.setup(derivatives=derivatives)
+            p.set_val('C1.x', [1., 2., 3.])
+            return p
+
+        for derivatives in (True, False):
+            with self.subTest(derivatives=derivatives):
+                p = build(derivatives)
+                p.run_model()
+                assert_near_equal(p.get_val('C2.y'), [6., 18.])
+                self.assertTrue(os.path.isfile(p._metadata['setup_cache'].fname))
+
+                p = build(derivatives)
+                cache = p._metadata['setup_cache']
+                self.assertIsNotNone(cache.get(('transfer_indices', '')))
+                p.run_model()
+                assert_near_equal(p.get_val('C2.y'), [6., 18.])
+                self.assertFalse(cache._modified)
+
+    def test_disabled(self):
+        p = om.Problem(reports=False)
+        p.model.add_subsystem('C1', om.ExecComp('y=2.0*x'))
+        p.setup()
+        p.final_setup()
+        self.assertIsNone(p._metadata['setup_cache'])
+        self.assertFalse(os.path.exists('setup_cache'))
+
+
+if __name__ == '__main__':
+    unittest.main()
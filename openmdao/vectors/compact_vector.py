@@ -0,0 +1,256 @@
+"""Define the CompactVector class."""
+from collections.abc import Mapping
+
+import numpy as np
+
+from openmdao.core.constants import INT_DTYPE
+from openmdao.vectors.default_vector import DefaultVector
+
+
+class _VarViews(Mapping):
+    """
+    Mapping of absolute variable names to views of a data array, created on first access.
+
+    Only the most recently created views are kept.  Equality and hashing are by identity, like
+    the sets of names that vectors use to track the variables relevant to a matvec product.
+
+    Parameters
+    ----------
+    data : ndarray
+        The data array of the vector.
+    names : dict
+        Metadata of the variables in the vector keyed by absolute name.
+    offsets : ndarray
+        Start index of each variable in the table owner's data array, indexed by variable id,
+        with the total size appended.
+    abs2idx : dict
+        Mapping of absolute variable name to variable id.
+    start : int
+        Start index of data in the table owner's data array.
+    flat : bool
+        If True, the views are flat.
+    maxsize : int
+        Maximum number of views to keep.
+    """
+
+    def __init__(self, data, names, offsets, abs2idx, start, flat, maxsize):
+        """
+        Initialize all attributes.
+        """
+        self._data = data
+        self._names = names
+        self._offsets = offsets
+        self._abs2idx = abs2idx
+        self._start = start
+        self._flat = flat
+        self._maxsize = maxsize
+        self._cache = {}
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __getitem__(self, name):
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        meta = self._names[name]
+        start = self._offsets[self._abs2idx[name]] - self._start
+        view = self._data[start:start + meta['size']]
+        if not self._flat and meta['shape'] != view.shape:
+            view = view.view()
+            view.shape = meta['shape']
+
+        cache = self._cache
+        if len(cache) >= self._maxsize:
+            del cache[next(iter(cache))]
+        cache[name] = view
+
+        return view
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+class _RelVarViews(Mapping):
+    """
+    Mapping of relative variable names to views, based on a mapping of absolute names to views.
+
+    Parameters
+    ----------
+    views : _VarViews
+        Views keyed by absolute name.
+    prefix : str
+        Prefix that turns a relative name into an absolute name.
+    """
+
+    def __init__(self, views, prefix):
+        """
+        Initialize all attributes.
+        """
+        self._views = views
+        self._prefix = prefix
+
+    def __getitem__(self, name):
+        return self._views[self._prefix + name]
+
+    def __contains__(self, name):
+        return self._prefix + name in self._views
+
+    def __iter__(self):
+        start = len(self._prefix)
+        return (name[start:] for name in self._views)
+
+    def __len__(self):
+        return len(self._views)
+
+
+class CompactVector(DefaultVector):
+    """
+    NumPy vector that creates views of its variables on demand.
+
+    DefaultVector stores a view object of every variable in every System of the tree, which in
+    deep models with many variables takes a lot of memory.  This vector instead finds variables
+    in a table of offsets that is shared by all vectors below the root vector, and only keeps a
+    limited number of recently used views.
+
+    Parameters
+    ----------
+    name : str
+        The name of the vector: 'nonlinear' or 'linear'.
+    kind : str
+        The kind of vector, 'input', 'output', or 'residual'.
+    system : <System>
+        Pointer to the owning system.
+    root_vector : <Vector>
+        Pointer to the vector owned by the root system.
+    alloc_complex : bool
+        Whether to allocate any imaginary storage to perform complex step. Default is False.
+
+    Attributes
+    ----------
+    _var_offsets : ndarray
+        Start index of each variable in the data array of the vector owning the table, indexed
+        by variable id, with the total size appended.
+    _var_abs2idx : dict
+        Mapping of absolute variable name to variable id.
+    _table_start : int
+        Start index of our data in the data array of the vector owning the table.
+    """
+
+    # maximum number of views kept by each vector
+    view_cache_size = 128
+
+    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False):
+        """
+        Initialize all attributes.
+        """
+        self._var_offsets = None
+        self._var_abs2idx = None
+        self._table_start = 0
+        super().__init__(name, kind, system, root_vector=root_vector, alloc_complex=alloc_complex)
+
+    def _initialize_data(self, root_vector):
+        """
+        Internally allocate data array and find the offsets table of our variables.
+
+        Parameters
+        ----------
+        root_vector : Vector or None
+            the root's vector instance or None, if we are at the root.
+        """
+        if isinstance(root_vector, CompactVector):
+            self._var_offsets = root_vector._var_offsets
+            self._var_abs2idx = root_vector._var_abs2idx
+        else:
+            # we own the table, either because we're the root or because the root vector is of
+            # a different class.
+            system = self._system()
+            sizes = system._var_sizes[self._typ]
+            offsets = np.zeros(sizes.shape[1] + 1, dtype=INT_DTYPE)
+            if sizes.size > 0:
+                np.cumsum(sizes[system.comm.rank], out=offsets[1:])
+            self._var_offsets = offsets
+            self._var_abs2idx = system._var_allprocs_abs2idx
+
+        super()._initialize_data(root_vector)
+
+        if isinstance(root_vector, CompactVector):
+            self._table_start = self._root_offset
+
+    def _get_root_slice(self):
+        """
+        Return the slice of the root vector's data array that contains our variables.
+
+        Returns
+        -------
+        slice
+            The slice of the root data array.
+        """
+        if not isinstance(self._root_vector, CompactVector):
+            return super()._get_root_slice()
+
+        names = self._system()._var_abs2meta[self._typ]
+        if names:
+            abs2idx = self._var_abs2idx
+            offsets = self._var_offsets
+            return slice(offsets[abs2idx[next(iter(names))]],
+                         offsets[abs2idx[next(reversed(names))] + 1])
+
+        return slice(0, 0)
+
+    def _initialize_views(self):
+        """
+        Internally assemble the mappings that create views onto the vectors.
+        """
+        system = self._system()
+        names = system._var_abs2meta[self._typ]
+        args = (self._data, names, self._var_offsets, self._var_abs2idx, self._table_start)
+
+        self._views = views = _VarViews(*args, False, self.view_cache_size)
+        self._views_flat = _VarViews(*args, True, self.view_cache_size)
+        if system._has_fast_rel_lookup():
+            self._views_rel = _RelVarViews(views, system.pathname + '.' if system.pathname else '')
+        else:
+            self._views_rel = None
+
+        self._names = views
+        self._len = self._data.size
+
+        if self._do_scaling:
+            self._initialize_scaling()
+
+    def _copy_views(self):
+        """
+        Return a dictionary containing copies of the views.
+
+        Returns
+        -------
+        dict
+            Dictionary containing copies of the _views.
+        """
+        return {name: view.copy() for name, view in self._views.items()}
+
+    def get_slice_dict(self):
+        """
+        Return a dict of var names mapped to their slice in the local data array.
+
+        Returns
+        -------
+        dict
+            Mapping of var name to slice.
+        """
+        if self._slices is None:
+            offsets = self._var_offsets - self._table_start
+            abs2idx = self._var_abs2idx
+            self._slices = {name: slice(offsets[abs2idx[name]], offsets[abs2idx[name] + 1])
+                            for name in self._views}
+
+        return self._slices
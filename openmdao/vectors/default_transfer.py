@@ -47,27 +47,89 @@ class DefaultTransfer(Transfer):
         group : <Group>
             Parent group.
         """
-        iproc = group.comm.rank
         rev = group._mode == 'rev' or group._mode == 'auto'
 
         for subsys in group._subgroups_myproc:
             subsys._setup_transfers()
 
-        abs2meta = group._var_abs2meta
-
         group._transfers = transfers = {}
         vectors = group._vectors
+
+        cache = group._problem_meta['setup_cache']
+        cache_key = ('transfer_indices', group.pathname)
+        indices = None if cache is None else cache.get(cache_key)
+        if indices is None:
+            indices = DefaultTransfer._get_transfer_indices(group, rev)
+            if cache is not None:
+                cache.set(cache_key, indices)
+
+        fwd_xfer_in, fwd_xfer_out, rev_xfer_in, rev_xfer_out = indices
+
+        if sum(inds.size for inds in fwd_xfer_in.values()) > 0:
+            try:
+                xfer_in = np.concatenate(list(fwd_xfer_in.values()))
+                xfer_out = np.concatenate(list(fwd_xfer_out.values()))
+            except ValueError:
+                xfer_in = xfer_out = np.zeros(0, dtype=INT_DTYPE)
+
+            xfer_all = DefaultTransfer(vectors['input']['nonlinear'],
+                                       vectors['output']['nonlinear'], xfer_in, xfer_out,
+                                       group.comm)
+        else:
+            xfer_all = None
+
+        transfers['fwd'] = xfwd = {}
+        xfwd[None] = xfer_all
+        if rev:
+            transfers['rev'] = xrev = {}
+            xrev[None] = xfer_all
+
+        for sname, inds in fwd_xfer_in.items():
+            if inds.size > 0:
+                xfwd[sname] = DefaultTransfer(vectors['input']['nonlinear'],
+                                              vectors['output']['nonlinear'],
+                                              inds, fwd_xfer_out[sname], group.comm)
+            else:
+                xfwd[sname] = None
+
+        if rev:
+            for sname, inds in rev_xfer_out.items():
+                if inds.size > 0:
+                    xrev[sname] = DefaultTransfer(vectors['input']['nonlinear'],
+                                                  vectors['output']['nonlinear'],
+                                                  rev_xfer_in[sname], inds, group.comm)
+                else:
+                    xrev[sname] = None
+
+    @staticmethod
+    def _get_transfer_indices(group, rev):
+        """
+        Compute the input and output indices of all transfers owned by the given group.
+
+        Parameters
+        ----------
+        group : <Group>
+            Parent group.
+        rev : bool
+            If True, also compute the indices of the reverse transfers.
+
+        Returns
+        -------
+        tuple of dict
+            Input and output indices of the forward transfers and input and output indices of
+            the reverse transfers (empty if rev is False), all keyed by subsystem name.
+        """
+        iproc = group.comm.rank
+        abs2meta = group._var_abs2meta
+
         offsets = _global2local_offsets(group._get_var_offsets())
         mypathlen = len(group.pathname + '.' if group.pathname else '')
 
         # Initialize empty lists for the transfer indices
-        xfer_in = []
-        xfer_out = []
         fwd_xfer_in = defaultdict(list)
         fwd_xfer_out = defaultdict(list)
-        if rev:
-            rev_xfer_in = defaultdict(list)
-            rev_xfer_out = defaultdict(list)
+        rev_xfer_in = defaultdict(list)
+        rev_xfer_out = defaultdict(list)
 
         allprocs_abs2idx = group._var_allprocs_abs2idx
         sizes_in = group._var_sizes['input']
@@ -118,52 +180,15 @@ class DefaultTransfer(Transfer):
                     rev_xfer_in[sub_out].append(input_inds)
                     rev_xfer_out[sub_out].append(output_inds)
 
-        tot_size = 0
         for sname, inds in fwd_xfer_in.items():
-            fwd_xfer_in[sname] = arr = _merge(inds)
+            fwd_xfer_in[sname] = _merge(inds)
             fwd_xfer_out[sname] = _merge(fwd_xfer_out[sname])
-            tot_size += arr.size
-
-        if rev:
-            for sname, inds in rev_xfer_in.items():
-                rev_xfer_in[sname] = _merge(inds)
-                rev_xfer_out[sname] = _merge(rev_xfer_out[sname])
-
-        if tot_size > 0:
-            try:
-                xfer_in = np.concatenate(list(fwd_xfer_in.values()))
-                xfer_out = np.concatenate(list(fwd_xfer_out.values()))
-            except ValueError:
-                xfer_in = xfer_out = np.zeros(0, dtype=INT_DTYPE)
-
-            xfer_all = DefaultTransfer(vectors['input']['nonlinear'],
-                                       vectors['output']['nonlinear'], xfer_in, xfer_out,
-                                       group.comm)
-        else:
-            xfer_all = None
 
-        transfers['fwd'] = xfwd = {}
-        xfwd[None] = xfer_all
-        if rev:
-            transfers['rev'] = xrev = {}
-            xrev[None] = xfer_all
-
-        for sname, inds in fwd_xfer_in.items():
-            if inds.size > 0:
-                xfwd[sname] = DefaultTransfer(vectors['input']['nonlinear'],
-                                              vectors['output']['nonlinear'],
-                                              inds, fwd_xfer_out[sname], group.comm)
-            else:
-                xfwd[sname] = None
+        for sname, inds in rev_xfer_in.items():
+            rev_xfer_in[sname] = _merge(inds)
+            rev_xfer_out[sname] = _merge(rev_xfer_out[sname])
 
-        if rev:
-            for sname, inds in rev_xfer_out.items():
-                if inds.size > 0:
-                    xrev[sname] = DefaultTransfer(vectors['input']['nonlinear'],
-                                                  vectors['output']['nonlinear'],
-                                                  rev_xfer_in[sname], inds, group.comm)
-                else:
-                    xrev[sname] = None
+        return dict(fwd_xfer_in), dict(fwd_xfer_out), dict(rev_xfer_in), dict(rev_xfer_out)
 
     @staticmethod
     def _setup_discrete_transfers(group):
@@ -125,17 +125,8 @@ class DefaultVector(Vector):
         ndarray
             zeros array of correct size.
         """
-        system = self._system()
-        type_ = self._typ
         root_vec = self._root_vector
-
-        slices = root_vec.get_slice_dict()
-
-        mynames = list(system._var_abs2meta[type_])
-        if mynames:
-            myslice = slice(slices[mynames[0]].start, slices[mynames[-1]].stop)
-        else:
-            myslice = slice(0, 0)
+        myslice = self._get_root_slice()
 
         data = root_vec._data[myslice]
         self._root_offset = myslice.start
@@ -151,6 +142,23 @@ class DefaultVector(Vector):
 
         return data, scaling
 
+    def _get_root_slice(self):
+        """
+        Return the slice of the root vector's data array that contains our variables.
+
+        Returns
+        -------
+        slice
+            The slice of the root data array.
+        """
+        slices = self._root_vector.get_slice_dict()
+
+        mynames = list(self._system()._var_abs2meta[self._typ])
+        if mynames:
+            return slice(slices[mynames[0]].start, slices[mynames[-1]].stop)
+
+        return slice(0, 0)
+
     def _initialize_data(self, root_vector):
         """
         Internally allocate data array.
@@ -191,15 +199,9 @@ class DefaultVector(Vector):
         """
         system = self._system()
         io = self._typ
-        kind = self._kind
         islinear = self._name == 'linear'
         rel_lookup = system._has_fast_rel_lookup()
 
-        do_scaling = self._do_scaling
-        if do_scaling:
-            factors = system._scale_factors
-            scaling = self._scaling
-
         self._views = views = {}
         self._views_flat = views_flat = {}
         if rel_lookup:
@@ -221,36 +223,53 @@ class DefaultVector(Vector):
             if rel_lookup:
                 views_rel[abs_name[relstart:]] = v
 
-            if do_scaling:
-                factor_tuple = factors[abs_name][kind]
+            start = end
+
+        self._names = frozenset(views) if islinear else views
+        self._len = end
+
+        if self._do_scaling:
+            self._initialize_scaling()
 
-                if len(factor_tuple) == 4:
-                    # Only input vectors can have 4 factors. Linear input vectors need to be able
-                    # to handle the unit and solver scaling in opposite directions in reverse mode.
-                    a0, a1, factor, offset = factor_tuple
+    def _initialize_scaling(self):
+        """
+        Set the scaling factors of our variables in the scaling arrays.
+        """
+        system = self._system()
+        kind = self._kind
+        islinear = self._name == 'linear'
+        factors = system._scale_factors
+        scaling = self._scaling
 
-                    if islinear:
-                        scale0 = None
-                        scale1 = factor / a1
-                    else:
-                        scale0 = (a0 + offset) * factor
-                        scale1 = a1 * factor
+        start = end = 0
+        for abs_name, meta in system._var_abs2meta[self._typ].items():
+            end = start + meta['size']
+            factor_tuple = factors[abs_name][kind]
+
+            if len(factor_tuple) == 4:
+                # Only input vectors can have 4 factors. Linear input vectors need to be able
+                # to handle the unit and solver scaling in opposite directions in reverse mode.
+                a0, a1, factor, offset = factor_tuple
+
+                if islinear:
+                    scale0 = None
+                    scale1 = factor / a1
                 else:
-                    if self._name == 'linear' and self._typ == 'input':
-                        scale0 = None
-                        scale1 = 1.0 / factor_tuple[1]
-                    else:
-                        scale0, scale1 = factor_tuple
+                    scale0 = (a0 + offset) * factor
+                    scale1 = a1 * factor
+            else:
+                if self._name == 'linear' and self._typ == 'input':
+                    scale0 = None
+                    scale1 = 1.0 / factor_tuple[1]
+                else:
+                    scale0, scale1 = factor_tuple
 
-                if scaling[0] is not None:
-                    scaling[0][start:end] = scale0
-                scaling[1][start:end] = scale1
+            if scaling[0] is not None:
+                scaling[0][start:end] = scale0
+            scaling[1][start:end] = scale1
 
             start = end
 
-        self._names = frozenset(views) if islinear else views
-        self._len = end
-
     def _in_matvec_context(self):
         """
         Return True if this vector is inside of a matvec_context.
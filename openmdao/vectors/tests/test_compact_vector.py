@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+class _SmallCacheVector(om.CompactVector):
+    view_cache_size = 2
+
+
+def _build_problem(vector_class, mode):
+    p = om.Problem(reports=False)
+    model = p.model
+
+    model.add_subsystem('ivc', om.IndepVarComp('x', np.array([1., 2., 3.]), units='m'),
+                        promotes=['x'])
+
+    G1 = model.add_subsystem('G1', om.Group(), promotes_inputs=['x'])
+    G2 = G1.add_subsystem('G2', om.Group(), promotes_inputs=['x'])
+    G2.add_subsystem('C1', om.ExecComp('y=2.0*x**2', x={'val': np.ones(3), 'units': 'cm'},
+                                       y={'val': np.ones(3), 'ref': 10.}),
+                     promotes_inputs=['x'])
+    G2.add_subsystem('C2', om.ExecComp('y=3.0*a', a=np.ones((2, 2)), y=np.ones((2, 2))))
+    G2.connect('C1.y', 'C2.a', src_indices=[0, 1, 2, 0], flat_src_indices=True)
+
+    model.add_subsystem('C3', om.ExecComp('z=sum(b)+c', b=np.ones((2, 2))))
+    model.connect('G1.G2.C2.y', 'C3.b')
+    model.connect('G1.G2.C1.y', 'C3.c', src_indices=[1])
+
+    model.add_design_var('x')
+    model.add_objective('C3.z', ref=100.)
+    model.add_constraint('G1.G2.C2.y', upper=1000.)
+
+    p.setup(mode=mode, local_vector_class=vector_class)
+    p.run_model()
+    return p
+
+
+@use_tempdirs
+class TestCompactVector(unittest.TestCase):
+
+    def test_matches_default_vector(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                expected = _build_problem(om.DefaultVector, mode)
+                expected_J = expected.compute_totals()
+
+                for vector_class in (om.CompactVector, _SmallCacheVector):
+                    p = _build_problem(vector_class, mode)
+                    self.assertIsInstance(p.model.G1.G2.C1._outputs, vector_class)
+
+                    for name in ('G1.G2.C1.y', 'G1.G2.C2.y', 'C3.z'):
+                        assert_near_equal(p.get_val(name), expected.get_val(name))
+                    assert_near_equal(p.get_val('G1.G2.C1.x'), expected.get_val('G1.G2.C1.x'))
+
+                    J = p.compute_totals()
+                    for key, val in expected_J.items():
+                        assert_near_equal(J[key], val, 1e-12)
+
+    def test_shared_table(self):
+        p = _build_problem(_SmallCacheVector, 'rev')
+        root = p.model._outputs
+
+        for system in p.model.system_iter(recurse=True):
+            for kind in ('input', 'output', 'residual'):
+                for vec in system._vectors[kind].values():
+                    root_vec = p.model._vectors[kind][vec._name]
+                    self.assertIs(vec._var_offsets, root_vec._var_offsets)
+                    self.assertLessEqual(len(vec._views._cache), 2)
+                    self.assertLessEqual(len(vec._views_flat._cache), 2)
+
+        # all variables are still accessible after views have been dropped
+        names = list(root._views)
+        self.assertEqual(len(names), 4)
+        self.assertEqual(len(root._views._cache), 2)
+        for name in names:
+            self.assertTrue(np.shares_memory(root._views[name], root._data))
+
+        C2 = p.model.G1.G2.C2
+        self.assertEqual(C2._outputs._views_rel['y'].shape, (2, 2))
+        assert_near_equal(C2._outputs['y'], p.get_val('G1.G2.C2.y'))
+        self.assertEqual(root.get_slice_dict()['G1.G2.C2.y'], slice(6, 10))
+
+    def test_set_val(self):
+        p = _build_problem(_SmallCacheVector, 'fwd')
+        p.set_val('x', np.array([4., 5., 6.]))
+        p.run_model()
+        assert_near_equal(p.get_val('G1.G2.C1.y'), 2.0 * np.array([400., 500., 600.])**2)
+
+
+if __name__ == '__main__':
+    unittest.main()